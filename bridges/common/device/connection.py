@@ -21,7 +21,6 @@ from loguru import logger
 
 from bridges.common.device.atx_health import check_atx_health as perform_atx_health_check
 from bridges.common.device.screen import DEFAULT_SCREEN_SIZE, read_screen_size
-from taktik.core.shared.device.manager import DeviceManager
 
 
 class ConnectionService:
@@ -58,6 +57,10 @@ class ConnectionService:
 
         logger.info(f"Connecting to device: {self.device_id}")
         try:
+            # uiautomator2 (and adbutils / requests behind it) is imported on the
+            # first connection, not by every bridge that imports `bridges.common`.
+            from taktik.core.shared.device.manager import DeviceManager
+
             self._device_manager = DeviceManager(device_id=self.device_id)
 
             if not self._device_manager.connect():
@@ -24,8 +24,8 @@ def scroll_down(a, p):
 @action("scroll.feed_next")
 def scroll_feed_next(a, p):
     """ONE decisive human gesture to reveal the next post (flick / continuous drag),
-    real OS fling coast — not a burst of mini-scrolls. One dump measures the landing; one nudge
-    if the post lands low. Surface-safe (never taps a reel/link/story); recovers if off-feed."""
+    real OS fling coast — not a burst of mini-scrolls. The predicted landing is confirmed by a
+    targeted probe (one dump only when unsure); one nudge if the post lands low. Surface-safe (never taps a reel/link/story); recovers if off-feed."""
     skip_ads = str(p.get("skip_ads", "1")).lower() not in ("0", "false", "no")
     skip_sugg = str(p.get("skip_suggested", "1")).lower() not in ("0", "false", "no")
     res = a.scroll.scroll_feed_to_next_post(skip_ads=skip_ads, skip_suggested=skip_sugg)
@@ -58,7 +58,8 @@ def scroll_feed_next(a, p):
     style_suffix = f", style={style}" if style else ""
     if energy is not None:
         style_suffix += f", energy={energy}"
-    return {"success": True, "message": f"scroll feed [{mode}] {g} geste(s){style_suffix}, {tail} — {badge}, {d} dumps",
+    probes = f", {res['probes']} probe(s)" if res.get("probes") else ""
+    return {"success": True, "message": f"scroll feed [{mode}] {g} geste(s){style_suffix}, {tail} — {badge}, {d} dumps{probes}",
             "details": res}
 
 
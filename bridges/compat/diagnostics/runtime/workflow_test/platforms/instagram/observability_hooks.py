@@ -47,7 +47,7 @@ def _patch_instagram_ipc_emitter(ipc, heartbeat: Callable[[str], None]) -> None:
             heartbeat(f"{action_type} @{username}")
 
         @staticmethod
-        def emit_profile_captured(username, profile_data=None, profile_pic_base64=None):
+        def emit_profile_captured(username, profile_data=None, profile_pic_base64=None, profile_pic_path=None):
             ipc.send(
                 "action_event",
                 action="profile_captured",
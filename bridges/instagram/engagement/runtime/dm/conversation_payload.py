@@ -189,6 +189,18 @@ def build_answered_conversation(*, real_username: str, inbox_username: str) -> d
     }
 
 
+def merge_with_history(history: list, messages: list, known_text: Optional[str], limit: int) -> list:
+    """Context of a delta re-read: the stored ``history`` followed by the messages read after
+    ``known_text``, the newest message on record (its last occurrence: "ok" can repeat), the
+    ``limit`` newest kept. Both lists are oldest-first. A read that never reached
+    ``known_text`` is returned as is: where it meets the history is unknown.
+    """
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].get("text") == known_text:
+            return (list(history) + list(messages[index + 1:]))[-limit:]
+    return messages
+
+
 def build_conversation_payload(
     *,
     real_username: str,
@@ -218,6 +230,7 @@ __all__ = [
     "is_already_processed",
     "is_outgoing_last_message",
     "masked_preview",
+    "merge_with_history",
     "normalize_inbox_username",
     "sort_threads_by_top",
 ]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import time
+from typing import Optional
 
 from taktik.core.shared.behavior.gesture_primitives import human_scroll_raw
 from taktik.core.social_media.instagram.ui.selectors.surfaces.direct_messages import DM_SELECTORS
@@ -28,6 +29,7 @@ class DMMessageExtractionMixin:
         self,
         max_messages: int = _MAX_HISTORY_MESSAGES,
         max_scrolls: int = _MAX_HISTORY_SCROLLS,
+        stop_at: Optional[str] = None,
     ) -> list:
         """Collect the recent messages of the open conversation, chronological order.
 
@@ -38,12 +40,17 @@ class DMMessageExtractionMixin:
         last item remains the newest (``last_message_is_ours`` and the reply context rely
         on this). Sequence-overlap (not per-message dedup) is what lets two messages with
         identical text — "ok", "merci", ... — survive without being conflated.
+
+        ``stop_at`` is the newest message text already on record for the thread (delta sync):
+        once it is on screen, everything above it is stored too, so no older screen is read.
         """
         collected = self._collect_current_screen()
 
         for _ in range(max_scrolls):
             if len(collected) >= max_messages:
                 break
+            if stop_at and any(message["text"] == stop_at for message in collected):
+                break  # reached the messages already on record
             self._scroll_to_older_messages()
             older = self._collect_current_screen()
             merged = self._merge_older(older, collected)
@@ -13,7 +13,7 @@ from typing import Any, Dict, List, Optional
 
 from bridges.instagram.runtime.ipc import logger
 from taktik.core.database import configure_db_service, get_db_service
-from taktik.core.database.messaging import DmConversationService
+from taktik.core.database.messaging import DmConversationService, inbox_fingerprint
 
 _PLATFORM = "instagram"
 
@@ -137,7 +137,12 @@ def _messages_payload(conv: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 
 def record_conversations(account_id: Optional[int], conversations: List[Dict[str, Any]]) -> None:
-    """Persist the read conversations + their messages. Best-effort."""
+    """Persist the read conversations + their messages. Best-effort.
+
+    A conversation flagged ``delta`` was re-read only down to its newest stored message: its
+    messages are the stored history plus what the read added, so the thread's count grows
+    by the messages added instead of being replaced by the length of that window.
+    """
     if not account_id or not conversations:
         return
     try:
@@ -146,10 +151,16 @@ def record_conversations(account_id: Optional[int], conversations: List[Dict[str
         pass
 
     saved = 0
+    # Threads found up to date without a re-read: only their inbox fingerprint moves.
+    up_to_date: Dict[str, str] = {}
     for conv in conversations:
         # Same identifier the front uses to reply (open_conversation) -> thread key matches send.
         username = (conv.get("username") or conv.get("inbox_username") or "").strip()
         messages = _messages_payload(conv)
+        fingerprint = conv.get("inbox_fingerprint")
+        if fingerprint and conv.get("up_to_date") and not messages:
+            up_to_date[conv.get("inbox_username") or username] = fingerprint
+            continue
         # Skip non-conversations (e.g. the "your note" row at the top of the IG inbox has no messages).
         if not username or not messages:
             continue
@@ -169,12 +180,52 @@ def record_conversations(account_id: Optional[int], conversations: List[Dict[str
                 is_group=bool(conv.get("is_group")),
                 can_reply=bool(conv.get("can_reply", True)),
                 last_message_is_ours=bool(conv.get("last_message_is_ours")),
+                inbox_fingerprint=fingerprint,
+                delta=bool(conv.get("delta")),
             )
             saved += 1
         except Exception as exc:
             logger.warning(f"[DM] Failed to persist conversation @{username}: {exc}")
     if saved:
         logger.info(f"[DM] Persisted {saved} conversation(s)")
+    if up_to_date:
+        DmConversationService.save_inbox_fingerprints(_PLATFORM, account_id, up_to_date)
+
+
+def load_inbox_state(account_id: Optional[int]) -> Dict[str, Dict[str, Any]]:
+    """Every known thread of the account, keyed by lowercased inbox username / partner handle:
+    ``thread_answer_state``'s dict + ``sync_id`` + the stored inbox ``fingerprint``. Loaded ONCE
+    per read (one connection) instead of a lookup per inbox row. Best-effort; empty on failure
+    (=> every row is treated as unknown and opened)."""
+    if not account_id:
+        return {}
+    try:
+        return DmConversationService.inbox_state(_PLATFORM, account_id)
+    except Exception as exc:
+        logger.warning(f"[DM] inbox state preload failed: {exc}")
+        return {}
+
+
+def stored_history(sync_id: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    """The ``limit`` newest stored messages of a thread, oldest first, shaped like the messages
+    the reader collects (``{type, text, is_sent}``). Best-effort; empty on failure."""
+    if not sync_id:
+        return []
+    try:
+        history = DmConversationService.thread_history(_PLATFORM, sync_id, limit)
+    except Exception as exc:
+        logger.warning(f"[DM] thread history lookup failed: {exc}")
+        return []
+    return [
+        {"type": message["msg_type"] or "text", "text": message["text"], "is_sent": message["direction"] == "sent"}
+        for message in history
+    ]
+
+
+def inbox_row_fingerprint(username: str, content_desc: str) -> str:
+    """Fingerprint of an inbox row. The IG row content-desc already carries the last-message
+    preview AND its time label ("user, preview, 2h"), so it stands for both."""
+    return inbox_fingerprint(username, content_desc)
 
 
 def last_known_message(account_id: Optional[int], inbox_username: str) -> Optional[Dict[str, Any]]:
@@ -248,9 +299,12 @@ __all__ = [
     "account_id_from_inbox_header",
     "resolve_account_id",
     "account_id_for_send",
+    "inbox_row_fingerprint",
     "last_known_message",
+    "load_inbox_state",
     "mark_thread_answered",
     "record_conversations",
     "record_reply",
+    "stored_history",
     "thread_answer_state",
 ]
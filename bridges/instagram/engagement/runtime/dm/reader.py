@@ -14,15 +14,21 @@ from bridges.instagram.engagement.runtime.dm.conversation_payload import (
     is_already_processed,
     is_outgoing_last_message,
     masked_preview,
+    merge_with_history,
     normalize_inbox_username,
     sort_threads_by_top,
 )
 from bridges.instagram.engagement.runtime.dm.conversation_state import DMConversationStateMixin
 from bridges.instagram.engagement.runtime.dm.events import emit_dm_json
-from bridges.instagram.engagement.runtime.dm.message_extraction import DMMessageExtractionMixin
+from bridges.instagram.engagement.runtime.dm.message_extraction import (
+    _MAX_HISTORY_MESSAGES,
+    DMMessageExtractionMixin,
+)
 from bridges.instagram.engagement.runtime.dm.persistence import (
+    inbox_row_fingerprint,
+    load_inbox_state,
     mark_thread_answered,
-    thread_answer_state,
+    stored_history,
 )
 from bridges.instagram.runtime.ipc import logger
 from taktik.core.shared.behavior.gesture_primitives import human_scroll_raw
@@ -42,6 +48,14 @@ class DMConversationReaderMixin(DMConversationStateMixin, DMMessageExtractionMix
         scroll_count = 0
         read_all = limit <= 0
         max_scrolls = 30 if read_all else 10
+        # Delta sync: every known thread's state (recorded messages + last inbox fingerprint),
+        # loaded once for the whole read instead of a DB lookup per inbox row.
+        account_id = getattr(self, "_dm_account_id", None)
+        inbox_state = load_inbox_state(account_id)
+        unknown_state = {
+            "has_sent": False, "received_texts": [], "recent_texts": [], "last_direction": None,
+            "fingerprint": None,
+        }
 
         while (read_all or conversations_read < limit) and scroll_count < max_scrolls:
             threads = self.device.xpath(DM_SELECTORS.thread_container).all()
@@ -90,25 +104,27 @@ class DMConversationReaderMixin(DMConversationStateMixin, DMMessageExtractionMix
                         logger.info(f"Skipping (already answered, we sent last): {username}")
                         continue
 
-                    # Early-exit (no new activity): if the inbox row's last message is the same
-                    # one already on record for this thread (received OR sent), there is nothing
-                    # new — skip opening/scrolling and move on. The front restores the full
-                    # history from the DB. The match is conservative (see
-                    # inbox_preview_matches_known): it never skips a genuine new reply.
-                    account_id = getattr(self, "_dm_account_id", None)
-                    answer_state = thread_answer_state(account_id, username)
+                    # Early-exit (no new activity): if the inbox row is the one we saw when the
+                    # thread was last recorded (same fingerprint), or its last message is one
+                    # already on record (received OR sent), there is nothing new — skip
+                    # opening/scrolling and move on. The front restores the full history from
+                    # the DB. The preview match is conservative (see inbox_preview_matches_known):
+                    # it never skips a genuine new reply.
+                    answer_state = inbox_state.get(username_lower) or unknown_state
+                    fingerprint = inbox_row_fingerprint(username, content_desc)
+                    unchanged = answer_state["fingerprint"] == fingerprint
                     # Match the inbox-row preview against the messages we ACTUALLY have on record
                     # (dm_messages, both directions) — far more reliable than the denormalised
                     # dm_threads.last_message_text, which can be stale/clobbered. If the visible last
                     # message is one we already stored, there is no new activity.
-                    matched = any(
+                    matched = unchanged or any(
                         inbox_preview_matches_known(content_desc, username, text)
                         for text in answer_state["recent_texts"]
                     )
                     # Safe diagnostic (masked = no DM content): why does the early-exit skip or not?
                     logger.info(
                         f"[DM] pre-open {username_lower}: in_db={answer_state['last_direction'] is not None} "
-                        f"skip={matched} shape='{masked_preview(content_desc)}'"
+                        f"skip={matched} unchanged={unchanged} shape='{masked_preview(content_desc)}'"
                     )
                     if matched:
                         processed_usernames.add(username_lower)
@@ -124,6 +140,9 @@ class DMConversationReaderMixin(DMConversationStateMixin, DMMessageExtractionMix
                             inbox_username=username,
                             last_is_ours=answered,
                         )
+                        if not unchanged:
+                            # Remember this row so the next read skips it without matching.
+                            conv["inbox_fingerprint"] = fingerprint
                         conversations.append(conv)
                         conversations_read += 1
                         new_conversations_in_scroll += 1
@@ -175,15 +194,32 @@ class DMConversationReaderMixin(DMConversationStateMixin, DMMessageExtractionMix
                     processed_real_usernames.add(real_username_lower)
 
                     is_group, can_reply = self._detect_conversation_reply_state(real_username)
-                    messages = self._collect_messages()
+                    # Stop scrolling up once the newest message on record is on screen: what
+                    # lies above it is already stored. Such a read is only the thread's tail,
+                    # so the front and the reply context get the stored history plus what it
+                    # added, and the record grows the thread's count instead of resetting it.
+                    recent = answer_state["recent_texts"]
+                    known_text = recent[0] if recent else None
+                    messages = self._collect_messages(stop_at=known_text)
+                    context = messages
+                    if known_text:
+                        context = merge_with_history(
+                            stored_history(answer_state.get("sync_id"), _MAX_HISTORY_MESSAGES),
+                            messages,
+                            known_text,
+                            _MAX_HISTORY_MESSAGES,
+                        )
 
                     conv = build_conversation_payload(
                         real_username=real_username,
                         inbox_username=username,
-                        messages=messages,
+                        messages=context,
                         is_group=is_group,
                         can_reply=can_reply,
                     )
+                    conv["inbox_fingerprint"] = fingerprint
+                    if known_text:
+                        conv["delta"] = True
                     if conv["last_message_is_ours"]:
                         logger.info(f"Dernier message de @{real_username} est de NOUS -> can_reply=False")
 
@@ -205,6 +241,7 @@ class DMConversationReaderMixin(DMConversationStateMixin, DMMessageExtractionMix
                                 inbox_username=username,
                                 last_is_ours=True,
                             )
+                            conv["inbox_fingerprint"] = fingerprint
 
                     conversations.append(conv)
                     conversations_read += 1
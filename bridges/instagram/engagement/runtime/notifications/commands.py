@@ -10,12 +10,14 @@ from bridges.instagram.engagement.runtime.notifications.bridge import Notificati
 from bridges.instagram.engagement.runtime.notifications.events import emit_notif_error, emit_notif_json, emit_notif_step
 from bridges.instagram.engagement.runtime.notifications.persistence import (
     batch_identity_hash,
+    build_high_water_mark,
     build_known_checker,
     count_actions_today,
     load_actioned_hashes,
     record_notification_action,
     record_scan_notifications,
     resolve_account_id,
+    save_high_water_mark,
 )
 from bridges.instagram.runtime.ipc import logger
 from taktik.core.social_media.instagram.actions.business.workflows.common.suggestion_session import suggestion_session
@@ -205,10 +207,14 @@ def cmd_scan(device_id: str, limit: int, account_username: str = None,
     account_username = _refresh_own_account(bridge, account_username)
     # `limit` is interpreted as how many extra screens to scroll (0 = visible only).
     workflow = bridge.build_workflow()
-    # Early-stop: recognise notifications already recorded for this account (loaded once) so the
-    # scan stops scrolling once it reaches already-seen territory instead of re-scraping history.
+    # Incremental: stop at the newest notifications the previous scan read (one dump when
+    # nothing is new). The early-stop on notifications already recorded (loaded once) stays
+    # armed behind it: an account never scanned that way, or a mark whose rows were all
+    # regrouped or deleted since, must not read the whole feed.
+    high_water = build_high_water_mark(account_username)
     known_checker = build_known_checker(account_username)
-    result = workflow.scan(max_scrolls=max(0, limit), known_checker=known_checker)
+    result = workflow.scan(max_scrolls=max(0, limit), known_checker=known_checker,
+                           high_water=high_water)
     items = result.get("items", [])
 
     # Persist + dedup (best-effort): annotate each item with `is_new` so the front can
@@ -228,6 +234,8 @@ def cmd_scan(device_id: str, limit: int, account_username: str = None,
             elif new_count:
                 emit_notif_step(step="result", status="running",
                                 message=f"{new_count} new notification(s)", new_count=new_count)
+        if result.get("success"):
+            save_high_water_mark(account_username, items)
     except Exception as exc:  # never break the scan on persistence
         logger.warning(f"notifications persistence skipped: {exc}")
 
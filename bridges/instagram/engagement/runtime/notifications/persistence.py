@@ -12,8 +12,9 @@ attribution is deferred to a later step (this module only dedups + flags is_new)
 
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from bridges.instagram.runtime.ipc import logger
 from taktik.core.database import configure_db_service, get_db_service
@@ -187,12 +188,81 @@ def build_known_checker(account_username: Optional[str]):
     return _is_known
 
 
+# How many of the newest notifications the scan mark remembers. More than one: the top
+# row can be regrouped or deleted between two polls, and the scan must still stop.
+SCAN_MARK_DEPTH = 5
+
+
+def _mark_hash(account_id: int, item: Dict[str, Any]) -> str:
+    """Stable hash of a row AS PARSED from the dump (before any expansion or emoji re-read,
+    kept under ``parsed_text``), so the mark saved from one scan's items matches the rows
+    the next scan parses.
+
+    The whole row counts, minus its relative time: ``content_hash`` keeps only the quoted
+    part, so it folds every follow / post-like of one actor into one identity - right for
+    dedup, but it made a repeat actor's NEW row look like the mark.
+    """
+    actor = (item.get("username") or "").strip().lower() or None
+    text = " ".join((item.get("parsed_text") or item.get("text") or "").split())
+    rt = " ".join(str(item.get("time") or "").split())
+    if rt and rt in text:
+        head, _, tail = text.rpartition(rt)
+        text = " ".join((head + tail).split())
+    raw = f"{_PLATFORM}\n{account_id}\n{item.get('type') or ''}\n{actor or ''}\n{text.lower()}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def build_high_water_mark(account_username: Optional[str]):
+    """Predicate ``(row, below) -> bool`` = "at or below the newest notifications of the previous
+    scan", for the scan's incremental mode; ``below`` are the rows under ``row`` on the same
+    screen. None when the account is unknown or was never scanned (=> the scan relies on
+    ``build_known_checker`` alone). Best-effort: never raises into the scan.
+
+    A row reaches the mark only when the row right below it is also marked, AND older in the
+    mark: two identical rows (the same actor liking two posts) cannot both be the newest of
+    the previous scan in that order. The mark's oldest entry, and a row at the bottom of
+    the screen, have nothing left to check.
+    """
+    account_id = resolve_account_id(account_username or "")
+    if account_id is None:
+        return None
+    head = NotificationService.scan_mark(_PLATFORM, account_id)
+    if not head:
+        return None
+    position = {mark: index for index, mark in enumerate(head)}
+
+    def _reached(row: Dict[str, Any], below: Sequence[Dict[str, Any]] = ()) -> bool:
+        at = position.get(_mark_hash(account_id, row))
+        if at is None:
+            return False
+        if at == len(head) - 1 or not below:
+            return True
+        return position.get(_mark_hash(account_id, below[0]), -1) > at
+
+    return _reached
+
+
+def save_high_water_mark(account_username: Optional[str], items: List[Dict[str, Any]]) -> bool:
+    """Move the scan mark to the newest of ``items`` (top first). A scan that found fewer
+    new rows than ``SCAN_MARK_DEPTH`` keeps the older marks behind them. Best-effort."""
+    account_id = resolve_account_id(account_username or "")
+    if account_id is None or not items:
+        return False
+    newest = [_mark_hash(account_id, item) for item in items[:SCAN_MARK_DEPTH]]
+    older = NotificationService.scan_mark(_PLATFORM, account_id)
+    head = list(dict.fromkeys(newest + older))[:SCAN_MARK_DEPTH]
+    return NotificationService.save_scan_mark(_PLATFORM, account_id, head)
+
+
 __all__ = [
+    "SCAN_MARK_DEPTH",
     "batch_identity_hash",
+    "build_high_water_mark",
     "build_known_checker",
     "count_actions_today",
     "load_actioned_hashes",
     "record_notification_action",
     "record_scan_notifications",
     "resolve_account_id",
+    "save_high_water_mark",
 ]
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from bridges.common.runtime.bridge_base import _ipc
 
 
-def send_profile_captured(username: str, profile_data: dict = None, profile_pic_base64: str = None):
-    """Send captured profile data (with optional base64 image) to desktop app."""
+def send_profile_captured(username: str, profile_data: dict = None, profile_pic_base64: str = None,
+                          profile_pic_path: str = None):
+    """Send captured profile data to desktop app.
+
+    The picture is sent by reference when it is in the blob store: `profile_pic_url` is
+    then a ``file://`` URL and `profile_pic_blob` its digest. A base64 data URL is only
+    sent when no stored file exists.
+    """
     data = {"username": username}
     if profile_data:
         data.update({
@@ -18,7 +26,10 @@ def send_profile_captured(username: str, profile_data: dict = None, profile_pic_
             "is_verified": profile_data.get("is_verified", False),
             "biography": profile_data.get("biography"),
         })
-    if profile_pic_base64:
+    if profile_pic_path:
+        data["profile_pic_url"] = Path(profile_pic_path).resolve().as_uri()
+        data["profile_pic_blob"] = Path(profile_pic_path).name
+    elif profile_pic_base64:
         data["profile_pic_url"] = profile_pic_base64
     _ipc.send("profile_captured", **data)
 
@@ -1,15 +1,35 @@
-"""TikTok bridges package."""
+"""TikTok bridges package.
+
+The workflow entry points are resolved on first access (module `__getattr__`): each
+bridge imports only the workflow it runs, not all five.
+"""
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'send_message': ('.runtime.ipc', 'send_message'),
+    'send_status': ('.runtime.ipc', 'send_status'),
+    'send_stats': ('.runtime.ipc', 'send_stats'),
+    'send_video_info': ('.runtime.ipc', 'send_video_info'),
+    'send_action': ('.runtime.ipc', 'send_action'),
+    'send_pause': ('.runtime.ipc', 'send_pause'),
+    'send_dm_conversation': ('.runtime.ipc', 'send_dm_conversation'),
+    'send_dm_progress': ('.runtime.ipc', 'send_dm_progress'),
+    'send_dm_stats': ('.runtime.ipc', 'send_dm_stats'),
+    'send_dm_sent': ('.runtime.ipc', 'send_dm_sent'),
+    'send_error': ('.runtime.ipc', 'send_error'),
+    'send_log': ('.runtime.ipc', 'send_log'),
+    'signal_handler': ('.runtime.ipc', 'signal_handler'),
+    'run_for_you_workflow': ('.workflows.automation.for_you', 'run_for_you_workflow'),
+    'run_search_workflow': ('.workflows.automation.search', 'run_search_workflow'),
+    'run_followers_workflow': ('.workflows.automation.followers', 'run_followers_workflow'),
+    'run_dm_read_workflow': ('.workflows.engagement.dm_read', 'run_dm_read_workflow'),
+    'run_dm_send_workflow': ('.workflows.engagement.dm_send', 'run_dm_send_workflow'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-from .runtime.ipc import (
-    send_message, send_status, send_stats, send_video_info, send_action,
-    send_pause, send_dm_conversation, send_dm_progress, send_dm_stats,
-    send_dm_sent, send_error, send_log, signal_handler
-)
-from .workflows.automation.for_you import run_for_you_workflow
-from .workflows.automation.search import run_search_workflow
-from .workflows.automation.followers import run_followers_workflow
-from .workflows.engagement.dm_read import run_dm_read_workflow
-from .workflows.engagement.dm_send import run_dm_send_workflow
 
 __all__ = [
     'run_for_you_workflow',
@@ -2,9 +2,24 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from bridges.common.runtime.bridge_base import _ipc
 
 
+def _author_pic_reference(author: str, author_pic: str = None) -> str:
+    """Swap a base64 author picture for the ``file://`` URL of its blob-store copy.
+
+    Keeps the data URL when it cannot be stored: a picture is never lost over this.
+    """
+    if not author_pic or not author_pic.startswith("data:"):
+        return author_pic
+    from taktik.core.database.profile_avatars import ProfileAvatarService
+
+    path = ProfileAvatarService.store_avatar(author, author_pic, platform="tiktok")
+    return Path(path).resolve().as_uri() if path else author_pic
+
+
 def send_stats(
     videos_watched: int = 0,
     videos_liked: int = 0,
@@ -36,7 +51,8 @@ def send_video_info(
     author_pic: str = None,
     watch_time: float = None,
 ) -> None:
-    """Send current video info to desktop app."""
+    """Send current video info to desktop app (the author picture by reference)."""
+    author_pic = _author_pic_reference(author, author_pic)
     _ipc.video_info(
         author,
         description,
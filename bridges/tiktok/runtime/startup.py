@@ -40,14 +40,33 @@ def tiktok_startup(device_id: str, fetch_profile: bool = True):
         logger.warning(f"Could not navigate to Home: {e}")
 
     try:
-        from taktik.core.social_media.tiktok.ui.language import detect_and_optimize
-
-        detected_lang = detect_and_optimize(manager.device_manager.device)
+        from taktik.core.compat.selectors.catalog import resolve_selectors
+        from taktik.core.social_media.tiktok.ui.language import detect_language, optimize_for_language
+
+        # No version override nor clone rewrite on this path: the catalog key is the
+        # language alone, and a hit skips the in-place filter.
+        detected_lang = detect_language(manager.device_manager.device)
+        resolve_selectors(
+            "tiktok",
+            lang=detected_lang,
+            version=None,
+            package=None,
+            resolve=lambda: optimize_for_language(detected_lang),
+        )
         logger.info(f"🌐 TikTok language detected: {detected_lang.upper()}")
         send_log("info", f"App language detected: {detected_lang.upper()}")
     except Exception as e:
         logger.warning(f"Language detection failed (non-fatal): {e}")
 
+    from bridges.common.device.app_inspection import get_installed_app_version
+    from taktik.core.clone.packages import get_original_package
+    from taktik.core.shared.device.selector_order import activate_selector_ordering
+
+    # Keyed on the installed build: an alternative dead on one TikTok version may be
+    # the only one that matches on the next.
+    app_version = get_installed_app_version(device_id, manager.package_name, "TikTok")
+    activate_selector_ordering("tiktok", app_version, get_original_package("tiktok"))
+
     bot_username = None
     if fetch_profile:
         try:
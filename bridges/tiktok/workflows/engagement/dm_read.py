@@ -6,6 +6,11 @@ from typing import Any, Dict
 from bridges.tiktok.runtime.ipc import logger, send_dm_stats, send_error, send_status, set_workflow
 from bridges.tiktok.runtime.startup import tiktok_startup
 from bridges.tiktok.workflows.engagement.runtime.dm_callbacks import wire_dm_read_callbacks
+from bridges.tiktok.workflows.engagement.runtime.dm_persistence import (
+    load_known_threads,
+    record_conversations,
+    resolve_account_id,
+)
 
 
 def run_dm_read_workflow(config: Dict[str, Any]):
@@ -24,7 +29,9 @@ def run_dm_read_workflow(config: Dict[str, Any]):
             DMWorkflow,
         )
 
-        manager, _ = tiktok_startup(device_id, fetch_profile=True)
+        manager, bot_username = tiktok_startup(device_id, fetch_profile=True)
+        # Delta sync: the recorded threads let the workflow skip unchanged conversations.
+        account_id = resolve_account_id(bot_username)
 
         workflow_config = DMConfig(
             max_conversations=config.get("maxConversations", 20),
@@ -40,9 +47,11 @@ def run_dm_read_workflow(config: Dict[str, Any]):
         workflow = DMWorkflow(manager.device_manager.device, workflow_config)
         set_workflow(workflow)
         wire_dm_read_callbacks(workflow)
+        workflow.set_known_threads(load_known_threads(account_id))
 
         logger.info("â–¶ï¸ Reading conversations...")
         conversations = workflow.read_conversations()
+        record_conversations(account_id, conversations)
 
         stats = workflow.get_stats()
         send_dm_stats(stats.to_dict())
@@ -0,0 +1,98 @@
+"""DM persistence wiring for the TikTok DM read bridge (delta sync).
+
+Best-effort: loading or persisting must NEVER break the read flow.
+Source of truth = Bot (records into dm_threads / dm_messages via DmConversationService).
+Security (AGENTS): never log DM content — only names / counts.
+
+The read loads every recorded thread of the account once, so the workflow can skip the
+inbox rows whose fingerprint did not move and stop reading a thread at its newest known
+message; the conversations it did read are then recorded one transaction per thread.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from bridges.tiktok.runtime.ipc import logger
+from taktik.core.database.messaging import DmConversationService
+
+_PLATFORM = "tiktok"
+
+
+def resolve_account_id(bot_username: Optional[str]) -> Optional[int]:
+    """Map the logged-in TikTok username to an account id (created if needed), or None."""
+    username = (bot_username or "").strip().lstrip("@").lower()
+    if not username:
+        return None
+    try:
+        from taktik.core.database.local.service import get_local_database
+
+        account_id, _ = get_local_database().get_or_create_tiktok_account(username)
+        return account_id
+    except Exception as exc:
+        logger.warning(f"[DM] Could not resolve TikTok account @{username}: {exc}")
+        return None
+
+
+def load_known_threads(account_id: Optional[int]) -> Dict[str, Dict[str, Any]]:
+    """Recorded state of every thread of the account, keyed by lowercased name. Empty on
+    failure (=> the workflow opens every conversation, as before)."""
+    if not account_id:
+        return {}
+    try:
+        return DmConversationService.inbox_state(_PLATFORM, account_id)
+    except Exception as exc:
+        logger.warning(f"[DM] TikTok inbox state preload failed: {exc}")
+        return {}
+
+
+def record_conversations(account_id: Optional[int], conversations: List[Any]) -> int:
+    """Persist the read conversations (``ConversationData``); return how many were recorded.
+
+    Messages without text (stickers) are left out: the content-hash dedup would fold them
+    all into one row. So are the ones whose direction the reader could not tell
+    (``is_sent`` None): recorded as received, our own replies would read as unanswered. A
+    conversation read without any new text message still moves its inbox fingerprint, so
+    the next read skips it. The read is a delta, so the thread's count grows by the
+    messages added.
+    """
+    if not account_id or not conversations:
+        return 0
+    saved = 0
+    unchanged: Dict[str, str] = {}
+    for conv in conversations:
+        messages = [
+            {
+                "direction": "sent" if message["is_sent"] else "received",
+                "text": message.get("text"),
+                "msg_type": message.get("type", "text"),
+            }
+            for message in conv.messages
+            if message.get("text") and message.get("is_sent") is not None
+        ]
+        if not messages:
+            if conv.inbox_fingerprint:
+                unchanged[conv.name] = conv.inbox_fingerprint
+            continue
+        if DmConversationService.record_conversation(
+            platform=_PLATFORM,
+            account_id=account_id,
+            partner_username=conv.name,
+            messages=messages,
+            external_thread_id=conv.name,
+            is_group=conv.is_group,
+            can_reply=conv.can_reply,
+            unread_count=conv.unread_count,
+            last_message_is_ours=messages[-1]["direction"] == "sent",
+            inbox_fingerprint=conv.inbox_fingerprint,
+            delta=True,
+        ):
+            saved += 1
+    if unchanged:
+        DmConversationService.save_inbox_fingerprints(_PLATFORM, account_id, unchanged)
+    if saved:
+        logger.info(f"[DM] Persisted {saved} TikTok conversation(s)")
+    return saved
+
+
+__all__ = ["load_known_threads", "record_conversations", "resolve_account_id"]
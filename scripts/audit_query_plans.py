@@ -0,0 +1,290 @@
+"""Audit the query plans of every SQL statement in the database repositories.
+
+Collects each SQL string literal under ``taktik/core/database/repositories/**`` and
+runs ``EXPLAIN QUERY PLAN`` on it against a base of realistic size (built by
+``gen_synthetic_local_db.py`` unless ``--db`` points at one). A statement is flagged
+when its plan reads one of the large tables without a selective index:
+
+- ``full-scan``: ``SCAN <table>`` - every row (or every index entry) is visited;
+- ``weak-index``: ``SEARCH`` whose only constraint is a low-cardinality column such
+  as ``platform`` - an index is used, but it narrows ~90% of the table down to ~90%.
+
+Small tables (settings, identity rows, per-account lists) are scanned cheaply and are
+not reported; neither are SQL fragments and f-strings the plan cannot be built for
+(they are counted as skipped). Known, accepted scans are allowlisted with a reason.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import re
+import sqlite3
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+ROOT = Path(__file__).resolve().parents[1]
+SCAN_ROOT = ROOT / "taktik" / "core" / "database" / "repositories"
+
+# Tables that grow without bound on a long-running account.
+LARGE_TABLES = frozenset({
+    "interactions",
+    "filtered_profiles",
+    "social_graph_sync",
+    "social_profiles",
+    "sessions_unified",
+    "scraped_profiles",
+    "profile_following",
+    "posted_comments",
+    "notifications",
+    "dm_messages",
+})
+# Columns whose handful of values cannot make an index selective on their own.
+LOW_SELECTIVITY_COLUMNS = frozenset({"platform", "direction", "success", "is_bot", "status"})
+
+SQL_START = re.compile(r"^\s*(SELECT|WITH|UPDATE|DELETE|INSERT|REPLACE)\b", re.IGNORECASE)
+TABLE_REF = re.compile(r"\b(?:FROM|JOIN|UPDATE|INTO)\s+([A-Za-z_]\w*)(?:\s+(?:AS\s+)?([A-Za-z_]\w*))?", re.IGNORECASE)
+NOT_ALIASES = frozenset({
+    "where", "join", "left", "inner", "cross", "on", "group", "order", "limit", "set", "values",
+    "using", "natural", "outer", "union", "select", "as", "having", "default",
+})
+PLAN_TARGET = re.compile(r"^(SCAN|SEARCH) (?:TABLE )?(\w+)(?: AS (\w+))?(.*)$")
+CONSTRAINT = re.compile(r"\(([^()]*)\)\s*$")
+
+
+@dataclass(frozen=True)
+class Statement:
+    path: Path
+    line: int
+    sql: str
+
+    @property
+    def relative_path(self) -> str:
+        return self.path.relative_to(ROOT).as_posix()
+
+
+@dataclass(frozen=True)
+class Finding:
+    statement: Statement
+    rule: str
+    table: str
+    detail: str
+
+
+@dataclass(frozen=True)
+class AllowedPlan:
+    """An accepted full read, matched by file and a fragment of the statement."""
+
+    path: str
+    sql_contains: str
+    reason: str
+
+    def matches(self, finding: Finding) -> bool:
+        return (
+            finding.statement.relative_path.endswith(self.path)
+            and self.sql_contains in " ".join(finding.statement.sql.split())
+        )
+
+
+KNOWN_FULL_READS: tuple[AllowedPlan, ...] = (
+    AllowedPlan(
+        "instagram/profile/profile_repository.py",
+        "LIKE ?",
+        "operator search box: substring LIKE cannot use an index, bounded by LIMIT",
+    ),
+    AllowedPlan(
+        "profile/profile_repository.py",
+        "COALESCE((SELECT MAX(legacy_profile_id) FROM social_profiles WHERE platform=",
+        "MAX() over the (platform, legacy_profile_id) index prefix reads a single entry",
+    ),
+    AllowedPlan(
+        "instagram/profile/profile_repository.py",
+        "SELECT username FROM instagram_profiles LIMIT ?",
+        "known-usernames snapshot, bounded by LIMIT",
+    ),
+    AllowedPlan(
+        "instagram/profile/profile_repository.py",
+        "WHERE is_business = 1 ORDER BY followers_count DESC",
+        "operator listing, not on the automation path",
+    ),
+    AllowedPlan(
+        "instagram/profile/profile_repository.py",
+        "SELECT COUNT(*) as count FROM instagram_profiles",
+        "whole-table count, read from the narrowest covering index",
+    ),
+)
+
+
+def iter_python_files(root: Path = SCAN_ROOT) -> Iterable[Path]:
+    return sorted(p for p in root.rglob("*.py") if "__pycache__" not in p.parts)
+
+
+def _literal_sql(node: ast.AST) -> str | None:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        # f-string: the interpolated parts are placeholder lists (`IN ({marks})`) in the
+        # repositories; a single `?` keeps the statement plannable.
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.Constant):
+                parts.append(str(value.value))
+            else:
+                parts.append("?")
+        return "".join(parts)
+    return None
+
+
+def collect_statements(root: Path = SCAN_ROOT) -> list[Statement]:
+    statements = []
+    for path in iter_python_files(root):
+        tree = ast.parse(path.read_text(encoding="utf-8-sig"), filename=str(path))
+        for node in ast.walk(tree):
+            sql = _literal_sql(node)
+            if sql and SQL_START.match(sql):
+                statements.append(Statement(path, getattr(node, "lineno", 0), sql.strip()))
+    # f-string parts are also visited as Constants: keep the widest statement per line.
+    unique: dict[tuple[Path, int], Statement] = {}
+    for statement in statements:
+        key = (statement.path, statement.line)
+        if key not in unique or len(statement.sql) > len(unique[key].sql):
+            unique[key] = statement
+    return sorted(unique.values(), key=lambda s: (s.relative_path, s.line))
+
+
+def _bind_params(sql: str):
+    named = re.findall(r"(?<![:\w]):([A-Za-z_]\w*)", sql)
+    if named:
+        return {name: None for name in named}
+    return (None,) * sql.count("?")
+
+
+def _aliases(sql: str) -> dict[str, str]:
+    aliases = {}
+    for table, alias in TABLE_REF.findall(sql):
+        aliases[table] = table
+        if alias and alias.lower() not in NOT_ALIASES:
+            aliases[alias] = table
+    return aliases
+
+
+def explain(conn: sqlite3.Connection, statement: Statement) -> list[str] | None:
+    """Plan detail lines, or None when the statement cannot be planned as written."""
+    try:
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {statement.sql}", _bind_params(statement.sql)).fetchall()
+    except sqlite3.Error:
+        return None
+    return [row[-1] for row in rows]
+
+
+def plan_findings(statement: Statement, plan: list[str], row_counts: dict[str, int], min_rows: int) -> list[Finding]:
+    aliases = _aliases(statement.sql)
+    findings = []
+    for detail in plan:
+        match = PLAN_TARGET.match(detail)
+        if not match:
+            continue
+        op, name, alias, rest = match.groups()
+        table = aliases.get(alias or name, aliases.get(name, name))
+        if table not in LARGE_TABLES or row_counts.get(table, 0) < min_rows:
+            continue
+        if op == "SCAN":
+            findings.append(Finding(statement, "full-scan", table, detail))
+            continue
+        constraint = CONSTRAINT.search(rest)
+        if constraint:
+            columns = {part.split("=")[0].split(">")[0].split("<")[0].strip()
+                       for part in constraint.group(1).split(" AND ")}
+            if columns and columns <= LOW_SELECTIVITY_COLUMNS:
+                findings.append(Finding(statement, "weak-index", table, detail))
+    return findings
+
+
+def table_row_counts(conn: sqlite3.Connection) -> dict[str, int]:
+    counts = {}
+    for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'"):
+        if name in LARGE_TABLES:
+            counts[name] = conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+    return counts
+
+
+def audit(conn: sqlite3.Connection, statements: list[Statement], min_rows: int = 10_000):
+    """(findings, skipped statements) for `statements` planned on `conn`."""
+    counts = table_row_counts(conn)
+    findings: list[Finding] = []
+    skipped: list[Statement] = []
+    for statement in statements:
+        plan = explain(conn, statement)
+        if plan is None:
+            skipped.append(statement)
+            continue
+        findings.extend(plan_findings(statement, plan, counts, min_rows))
+    return findings, skipped
+
+
+def is_allowlisted(finding: Finding) -> bool:
+    return any(entry.matches(finding) for entry in KNOWN_FULL_READS)
+
+
+def format_finding(finding: Finding) -> str:
+    sql = " ".join(finding.statement.sql.split())
+    if len(sql) > 120:
+        sql = f"{sql[:117]}..."
+    return (
+        f"{finding.statement.relative_path}:{finding.statement.line}: {finding.rule}: "
+        f"{finding.detail}\n     {sql}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", help="audit this base instead of generating a synthetic one")
+    parser.add_argument("--interactions", type=int, default=2_000_000, help="size of the generated base")
+    parser.add_argument("--min-rows", type=int, default=10_000, help="ignore tables smaller than this")
+    parser.add_argument("--show-allowed", action="store_true", help="print allowlisted reads and skipped SQL too")
+    args = parser.parse_args()
+
+    if args.db:
+        db_path = Path(args.db)
+    else:
+        sys.path.insert(0, str(Path(__file__).resolve().parent))
+        from gen_synthetic_local_db import build_synthetic_db
+
+        db_path = Path(tempfile.mkdtemp()) / "synthetic.db"
+        print(f"Building synthetic base ({args.interactions} interactions) at {db_path} ...")
+        build_synthetic_db(db_path, interactions=args.interactions)
+
+    statements = collect_statements()
+    conn = sqlite3.connect(str(db_path))
+    try:
+        findings, skipped = audit(conn, statements, args.min_rows)
+    finally:
+        conn.close()
+
+    blocking = [finding for finding in findings if not is_allowlisted(finding)]
+    allowed = [finding for finding in findings if is_allowlisted(finding)]
+    summary = (
+        f"{len(statements)} statement(s), {len(skipped)} skipped (fragments / dynamic SQL), "
+        f"{len(allowed)} allowlisted full read(s)"
+    )
+    if blocking:
+        print("Query plan audit failed:")
+        for finding in blocking:
+            print(f" - {format_finding(finding)}")
+        print(summary)
+        return 1
+
+    print(f"Query plan audit OK ({summary})")
+    if args.show_allowed:
+        for finding in allowed:
+            print(f" - {format_finding(finding)}")
+        for statement in skipped:
+            print(f" - skipped {statement.relative_path}:{statement.line}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,6 +9,7 @@ from __future__ import annotations
 import json
 import os
 import shutil
+import subprocess
 import sys
 from pathlib import Path
 
@@ -119,7 +120,10 @@ def main() -> None:
         shutil.rmtree(DIST_DIR)
     DIST_DIR.mkdir(parents=True, exist_ok=True)
 
-    print("\n[1/1] Building taktik_launcher.exe...")
+    print("\n[1/2] Building selector catalogs...")
+    subprocess.run([sys.executable, str(SCRIPT_DIR / "build_selector_catalogs.py")], check=True)
+
+    print("\n[2/2] Building taktik_launcher.exe...")
     build_launcher()
 
     print("\n" + "=" * 50)
@@ -0,0 +1,85 @@
+"""Prebuild the selector catalogs shipped with the app.
+
+Resolves the selector singletons once per (platform, language, app version) with the
+original package - the same three passes a workflow runs at start-up: version overrides
+from `compat/data/overrides/<app>.yaml`, then the language filter - and writes each
+outcome to `taktik/core/compat/data/catalogs/` (see
+`taktik/core/compat/selectors/catalog.py`). Versions are the baseline plus every version
+listed in the override file. Clone packages are not prebuilt: the first run on a clone
+builds its own catalog in the runtime directory.
+
+Usage:
+    python scripts/build_selector_catalogs.py
+    python scripts/build_selector_catalogs.py --platform instagram --out /tmp/catalogs
+"""
+
+import argparse
+import os
+import sys
+from importlib import import_module
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger  # noqa: E402
+
+from taktik.core.compat.selectors.catalog import (  # noqa: E402
+    BUNDLED_CATALOG_DIR,
+    restore,
+    snapshot,
+    store_catalog,
+)
+
+LANGUAGES = ("en", "fr", "unknown")
+
+
+def build_platform(platform: str, out: Path) -> int:
+    from taktik.core.compat.selectors.setup import _load_yaml_overrides, apply_version_overrides
+
+    optimize_for_language = import_module(f"taktik.core.social_media.{platform}.ui.language").optimize_for_language
+    versions = [None] + sorted(str(v) for v in (_load_yaml_overrides(platform).get("versions") or {}))
+    pristine = snapshot(platform)
+    built = 0
+    for version in versions:
+        for lang in LANGUAGES:
+            restore(platform, pristine)
+            if version:
+                try:
+                    apply_version_overrides(platform, version)
+                except Exception as exc:
+                    # Same as at run time: a failing override leaves the others applied.
+                    print(f"  {platform} v{version}: override failed ({exc})")
+            optimize_for_language(lang)
+            path = store_catalog(platform, lang, version, None, directory=out)
+            if path is None:
+                print(f"  {platform} v{version or 'baseline'} {lang}: could not write")
+                continue
+            print(f"  {path.name} ({path.stat().st_size // 1024} KB)")
+            built += 1
+    restore(platform, pristine)
+    return built
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--platform', choices=('instagram', 'tiktok'), action='append',
+                        help='platform to build (default: both)')
+    parser.add_argument('--out', type=Path, default=BUNDLED_CATALOG_DIR, help='output directory')
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    for stale in args.out.glob("*.json"):
+        stale.unlink()
+    total = 0
+    for platform in args.platform or ('instagram', 'tiktok'):
+        print(f"{platform}:")
+        total += build_platform(platform, args.out)
+    print(f"{total} catalog(s) written to {args.out}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
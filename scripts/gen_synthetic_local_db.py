@@ -0,0 +1,193 @@
+"""Generate a synthetic local database of realistic size for query-plan audits.
+
+The developer base is usually young and small, so every repository query looks fast
+on it; the bases that matter are the long-running accounts with millions of
+`interactions` rows. This builds one: the real schema and migrations (so it carries
+exactly the indexes a user's base has), then bulk-generated accounts, profiles,
+interactions, filtered profiles, follow-graph rows and sessions with a realistic
+shape - a few accounts, a long tail of profiles, a year of activity.
+
+Kept as the fixture of `audit_query_plans.py` (and reusable for perf regressions):
+
+    python scripts/gen_synthetic_local_db.py /tmp/synthetic.db --interactions 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from taktik.core.database.local.migrations import run_migrations  # noqa: E402
+from taktik.core.database.local.schema import create_schema  # noqa: E402
+
+INSTAGRAM_TYPES = ("LIKE", "LIKE", "LIKE", "PROFILE_VISIT", "FOLLOW", "STORY_VIEW", "COMMENT", "UNFOLLOW")
+TIKTOK_TYPES = ("LIKE", "FOLLOW", "FAVORITE", "WATCH")
+FILTER_REASONS = ("private account", "0 posts", "too many followers", "not enough posts", "business")
+CHUNK = 50_000
+HISTORY_DAYS = 365
+
+
+def _stamp(now: datetime, rng: random.Random) -> str:
+    return (now - timedelta(seconds=rng.randrange(HISTORY_DAYS * 86400))).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _chunks(rows: Iterator[Tuple], size: int = CHUNK) -> Iterator[list]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def build_synthetic_db(
+    path: str | Path,
+    *,
+    accounts: int = 3,
+    profiles: int = 200_000,
+    interactions: int = 2_000_000,
+    filtered: int = 300_000,
+    graph: int = 150_000,
+    sessions: int = 5_000,
+    seed: int = 7,
+) -> Path:
+    """Create (or replace) a schema-complete base at `path` and fill it. Returns the path."""
+    path = Path(path)
+    if path.exists():
+        path.unlink()
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+
+    conn = sqlite3.connect(str(path))
+    try:
+        create_schema(conn)
+        run_migrations(conn)
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+
+        conn.executemany(
+            "INSERT INTO accounts (platform, legacy_account_id, username, is_bot, sync_id) VALUES (?, ?, ?, 1, ?)",
+            [(platform, i, f"{platform}_bot_{i}", f"acc-{platform}-{i}")
+             for platform in ("instagram", "tiktok") for i in range(1, accounts + 1)],
+        )
+        for platform in ("instagram", "tiktok"):
+            share = profiles if platform == "instagram" else profiles // 10
+            for batch in _chunks(
+                (platform, i, f"user_{i}", rng.randrange(50_000), rng.randrange(2_000), rng.randrange(500),
+                 _stamp(now, rng), f"sp-{platform}-{i}")
+                for i in range(1, share + 1)
+            ):
+                conn.executemany(
+                    "INSERT INTO social_profiles (platform, legacy_profile_id, username, followers_count, "
+                    "following_count, posts_count, created_at, sync_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    batch,
+                )
+
+        session_rows = [
+            ("instagram", i, rng.randint(1, accounts), f"Auto_{i}", "HASHTAG", f"tag{i % 50}", _stamp(now, rng),
+             "COMPLETED", f"ses-{i}")
+            for i in range(1, sessions + 1)
+        ]
+        conn.executemany(
+            "INSERT INTO sessions_unified (platform, legacy_session_id, account_id, session_name, target_type, "
+            "target, start_time, status, sync_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            session_rows,
+        )
+
+        def interaction_rows():
+            for i in range(interactions):
+                if rng.random() < 0.9:
+                    platform, kind, pool = "instagram", rng.choice(INSTAGRAM_TYPES), profiles
+                else:
+                    platform, kind, pool = "tiktok", rng.choice(TIKTOK_TYPES), max(1, profiles // 10)
+                # A long tail: a fifth of the profiles draw most of the activity.
+                profile_id = int(pool * rng.random() ** 2) + 1
+                stamp = _stamp(now, rng)
+                yield (platform, rng.randint(1, sessions), rng.randint(1, accounts), profile_id, kind,
+                       1 if rng.random() < 0.97 else 0, stamp, stamp, f"{i:032x}")
+
+        for batch in _chunks(interaction_rows()):
+            conn.executemany(
+                "INSERT INTO interactions (platform, session_id, account_id, profile_id, interaction_type, "
+                "success, interaction_time, created_at, sync_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+
+        seen = set()
+
+        def filtered_rows():
+            while len(seen) < min(filtered, profiles * accounts):
+                key = (rng.randint(1, profiles), rng.randint(1, accounts))
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield ("instagram", key[0], key[1], f"user_{key[0]}", _stamp(now, rng), rng.choice(FILTER_REASONS),
+                       "HASHTAG", f"tag{key[0] % 50}", f"fp-{len(seen)}")
+
+        for batch in _chunks(filtered_rows()):
+            conn.executemany(
+                "INSERT INTO filtered_profiles (platform, profile_id, account_id, username, filtered_at, reason, "
+                "source_type, source_name, sync_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+
+        def graph_rows():
+            for i in range(graph):
+                account_id = i % accounts + 1
+                direction = "following" if i % 2 else "follower"
+                yield ("instagram", account_id, f"user_{i // 2 + 1}", direction, rng.random() < 0.3,
+                       rng.random() < 0.5, _stamp(now, rng), "sync")
+
+        for batch in _chunks(graph_rows()):
+            conn.executemany(
+                "INSERT OR IGNORE INTO social_graph_sync (platform, account_id, username, direction, "
+                "is_reciprocal, followed_by_bot, first_seen_at, source) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+
+        # No ANALYZE: user bases carry no sqlite_stat1, so plans are audited as they run there.
+        conn.commit()
+    finally:
+        conn.close()
+    return path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="database file to create (replaced if it exists)")
+    parser.add_argument("--accounts", type=int, default=3)
+    parser.add_argument("--profiles", type=int, default=200_000)
+    parser.add_argument("--interactions", type=int, default=2_000_000)
+    parser.add_argument("--filtered", type=int, default=300_000)
+    parser.add_argument("--graph", type=int, default=150_000)
+    parser.add_argument("--sessions", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    path = build_synthetic_db(
+        args.path,
+        accounts=args.accounts,
+        profiles=args.profiles,
+        interactions=args.interactions,
+        filtered=args.filtered,
+        graph=args.graph,
+        sessions=args.sessions,
+        seed=args.seed,
+    )
+    print(f"Synthetic database written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
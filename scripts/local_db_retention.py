@@ -0,0 +1,62 @@
+"""Report, then apply, the local database retention policies.
+
+Prints what every policy of `taktik/core/database/local/retention.py` would reclaim -
+rows and bytes per table, plus the pages already on the freelist - without writing.
+`--apply` then runs the same batched deletes the bot schedules in the background once
+`database_retention.enabled` is set in the automation config.
+
+Usage:
+    python scripts/local_db_retention.py                       # dry run
+    python scripts/local_db_retention.py --apply --max-seconds 600
+    python scripts/local_db_retention.py --enable-incremental-vacuum
+
+`--enable-incremental-vacuum` rewrites the whole file (full VACUUM) so that an older
+base can shrink afterwards: close the desktop app and the bot first.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taktik.core.database.local.retention import (  # noqa: E402
+    RetentionEngine,
+    enable_incremental_vacuum,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db', default=os.environ.get('TAKTIK_DB_PATH') or os.path.join(
+        os.environ.get('APPDATA', ''), 'taktik-desktop', 'taktik-data.db'))
+    parser.add_argument('--apply', action='store_true', help='delete / clear the expired rows (default: dry run)')
+    parser.add_argument('--max-seconds', type=float, default=300.0, help='time budget of --apply')
+    parser.add_argument('--enable-incremental-vacuum', action='store_true',
+                        help='convert the base to auto_vacuum=INCREMENTAL (full VACUUM, offline)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database not found: {args.db}")
+        return 1
+
+    engine = RetentionEngine(args.db)
+    print(engine.report().format())
+
+    if args.enable_incremental_vacuum:
+        print("Converting to auto_vacuum=INCREMENTAL (full VACUUM) ...")
+        enable_incremental_vacuum(args.db)
+    if not args.apply:
+        return 0
+
+    result = engine.run(max_seconds=args.max_seconds)
+    for name, count in result.affected.items():
+        print(f"{name}: {count} row(s)")
+    print(f"{result.rolled_up_days} day(s) rolled up, {result.vacuumed_pages} page(s) vacuumed")
+    if not result.complete:
+        print("Stopped on the time budget or a busy base: run again to continue.")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
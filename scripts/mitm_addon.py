@@ -9,6 +9,7 @@ forwarding relevant data to the desktop bridge via stdout JSON messages.
 import json
 import re
 import hashlib
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional, Dict, Any
 from mitmproxy import http, ctx
@@ -17,6 +18,9 @@ from mitmproxy import http, ctx
 class InstagramCDNCapture:
     """Capture Instagram profile pics, post images, and API data."""
     
+    # How many CDN URL hashes are remembered for deduplication (oldest forgotten first)
+    MAX_CAPTURED_HASHES = 5000
+    
     # CDN patterns for Instagram media
     CDN_PATTERNS = [
         r'scontent.*\.cdninstagram\.com',
@@ -33,7 +37,9 @@ class InstagramCDNCapture:
     ]
     
     def __init__(self):
-        self.captured_media = {}
+        self._cdn_re = [re.compile(p) for p in self.CDN_PATTERNS]
+        self._api_re = [re.compile(p) for p in self.API_PATTERNS]
+        self.captured_media: "OrderedDict[str, bool]" = OrderedDict()
         self.current_profile = None
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     
@@ -49,11 +55,11 @@ class InstagramCDNCapture:
     
     def _is_cdn_url(self, url: str) -> bool:
         """Check if URL is an Instagram CDN URL."""
-        return any(re.search(p, url) for p in self.CDN_PATTERNS)
+        return any(p.search(url) for p in self._cdn_re)
     
     def _is_api_url(self, url: str) -> bool:
         """Check if URL is an Instagram API endpoint."""
-        return any(re.search(p, url) for p in self.API_PATTERNS)
+        return any(p.search(url) for p in self._api_re)
     
     def _detect_image_type(self, url: str, content_length: int = 0) -> str:
         """Detect the type of image based on URL patterns."""
@@ -215,11 +221,14 @@ class InstagramCDNCapture:
             image_type = self._detect_image_type(url, content_length)
             url_hash = self._hash_url(url)
             
-            # Deduplicate
+            # Deduplicate (bounded: a long session must not grow this forever)
             if url_hash in self.captured_media:
+                self.captured_media.move_to_end(url_hash)
                 return
             
             self.captured_media[url_hash] = True
+            if len(self.captured_media) > self.MAX_CAPTURED_HASHES:
+                self.captured_media.popitem(last=False)
             
             # Send capture notification
             self._send_message(
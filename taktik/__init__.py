@@ -7,13 +7,28 @@ import os
 # Use AppData folder for logs to avoid permission issues
 _app_data = os.environ.get('APPDATA', os.path.expanduser('~'))
 _logs_dir = os.path.join(_app_data, 'taktik-desktop', 'logs')
-os.makedirs(_logs_dir, exist_ok=True)
+
+
+class _DeferredFileHandler(logging.FileHandler):
+    """File handler that creates the log directory and opens the file on first record.
+
+    Importing `taktik` used to create the directory and open `taktik.log` right away,
+    for every entry point - including the ones that never log through `logging`.
+    """
+
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
 
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(os.path.join(_logs_dir, 'taktik.log'), encoding='utf-8'),
+        _DeferredFileHandler(os.path.join(_logs_dir, 'taktik.log'), encoding='utf-8'),
         logging.StreamHandler()
     ]
 )
@@ -0,0 +1,246 @@
+"""Precompiled selector catalogs: the resolved selector singletons, cached per key.
+
+Before a workflow touches the screen, three passes rewrite the selector singletons in
+place: the version overrides of `compat/data/overrides/<app>.yaml`
+(`setup.apply_version_overrides`), the clone package rewrite (`clone/selectors/patcher`)
+and the language filter (`ui/language.optimize_for_language`). Their outcome depends
+only on (platform, language, app version, package) and on the files they read, yet every
+start parsed the YAML again and classified every XPath against both vocabularies again.
+
+A catalog is that outcome, serialised once: every `str` / `List[str]` field of every
+selector singleton of the platform, as final XPath strings, in one compact JSON file:
+
+    <data dir>/selector-catalogs/instagram-fr-417.0.0.0-com.instagram.android.json
+
+`resolve_selectors` loads it with one read and writes the fields back onto the
+singletons; on a miss it runs the passes and stores what they produced. Every file
+carries the hash of the sources the passes read (selector modules, locale overlays,
+vocabularies, override YAML, this module) and is ignored as soon as one of them changes,
+so an edited selector is never shadowed by a stale catalog.
+
+`scripts/build_selector_catalogs.py` is the build step: it prebuilds the common keys
+(baseline and every override version, each language, original package) into
+`compat/data/catalogs/`, which ships with the app and is searched after the runtime
+directory. A clone package is built on its first run instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import fields as dc_fields, is_dataclass
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+log = logger.bind(module="compat-selector-catalog")
+
+CATALOG_FORMAT = 1
+
+_TAKTIK_ROOT = Path(__file__).resolve().parents[3]
+BUNDLED_CATALOG_DIR = Path(__file__).resolve().parent.parent / "data" / "catalogs"
+
+# Everything the three passes read, per platform (globs relative to the `taktik` package).
+_SOURCES: Dict[str, List[str]] = {
+    platform: [
+        f"core/social_media/{platform}/ui/selectors/**/*.py",
+        f"core/social_media/{platform}/ui/language.py",
+        f"core/compat/data/overrides/{platform}.yaml",
+        "core/shared/ui/language_engine.py",
+        "core/compat/selectors/setup.py",
+        "core/compat/selectors/catalog.py",
+        "core/clone/selectors/patcher.py",
+        "core/clone/packages/package_map.py",
+    ]
+    for platform in ("instagram", "tiktok")
+}
+
+_UNSAFE = re.compile(r"[^\w.-]")
+
+
+def runtime_catalog_dir() -> Path:
+    """Where catalogs built at run time live (next to the local database)."""
+    override = os.environ.get("TAKTIK_SELECTOR_CATALOG_DIR")
+    if override:
+        return Path(override)
+    from taktik.core.database.local.paths import get_default_database_path
+
+    return Path(get_default_database_path()).parent / "selector-catalogs"
+
+
+@lru_cache(maxsize=None)
+def source_hash(platform: str) -> str:
+    """SHA-256 over the platform's selector sources (computed once per process)."""
+    digest = hashlib.sha256(f"format={CATALOG_FORMAT}".encode())
+    for pattern in _SOURCES.get(platform, ()):
+        for path in sorted(_TAKTIK_ROOT.glob(pattern)):
+            digest.update(path.relative_to(_TAKTIK_ROOT).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def catalog_name(platform: str, lang: Optional[str], version: Optional[str], package: Optional[str]) -> str:
+    """File name of the catalog for a key; no version means the baseline selectors."""
+    from taktik.core.clone.packages.package_map import ORIGINAL_PACKAGES
+
+    parts = (platform, lang or "unknown", version or "baseline", package or ORIGINAL_PACKAGES[platform])
+    return "-".join(_UNSAFE.sub("_", str(part)) for part in parts) + ".json"
+
+
+def selector_singletons(platform: str) -> Dict[str, Any]:
+    """Every `*_SELECTORS` dataclass instance exported by the platform's selectors package."""
+    module = import_module(f"taktik.core.social_media.{platform}.ui.selectors")
+    return {
+        name: value
+        for name in dir(module)
+        if name.endswith("_SELECTORS")
+        for value in (getattr(module, name),)
+        if is_dataclass(value) and not isinstance(value, type)
+    }
+
+
+def snapshot(platform: str) -> Dict[str, Dict[str, Any]]:
+    """The current XPath fields of every singleton: `{singleton: {field: str | [str]}}`."""
+    result: Dict[str, Dict[str, Any]] = {}
+    for name, singleton in selector_singletons(platform).items():
+        values: Dict[str, Any] = {}
+        for field in dc_fields(singleton):
+            value = getattr(singleton, field.name)
+            if isinstance(value, str):
+                values[field.name] = value
+            elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+                values[field.name] = list(value)
+        result[name] = values
+    return result
+
+
+def restore(platform: str, data: Dict[str, Dict[str, Any]]) -> int:
+    """Write a snapshot back onto the singletons. Returns the number of fields written."""
+    singletons = selector_singletons(platform)
+    written = 0
+    for name, values in data.items():
+        singleton = singletons.get(name)
+        if singleton is None:
+            continue
+        for field_name, value in values.items():
+            setattr(singleton, field_name, list(value) if isinstance(value, list) else value)
+            written += 1
+    return written
+
+
+def _candidates(name: str, directories: Optional[Iterable[Path]]) -> List[Path]:
+    dirs = list(directories) if directories is not None else [runtime_catalog_dir(), BUNDLED_CATALOG_DIR]
+    return [Path(directory) / name for directory in dirs]
+
+
+def load_catalog(
+    platform: str,
+    lang: Optional[str],
+    version: Optional[str],
+    package: Optional[str],
+    directories: Optional[Iterable[Path]] = None,
+) -> bool:
+    """Apply the catalog of this key onto the singletons. False when none is current."""
+    name = catalog_name(platform, lang, version, package)
+    expected = source_hash(platform)
+    for path in _candidates(name, directories):
+        try:
+            payload = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            continue
+        if payload.get("format") != CATALOG_FORMAT or payload.get("source_hash") != expected:
+            log.debug(f"Selector catalog {path} is stale, ignored")
+            continue
+        written = restore(platform, payload.get("singletons") or {})
+        log.debug(f"Selector catalog {path.name} applied ({written} fields)")
+        return True
+    return False
+
+
+def store_catalog(
+    platform: str,
+    lang: Optional[str],
+    version: Optional[str],
+    package: Optional[str],
+    directory: Optional[Path] = None,
+) -> Optional[Path]:
+    """Save the singletons' current state as the catalog of this key. None on failure."""
+    target_dir = Path(directory) if directory is not None else runtime_catalog_dir()
+    target = target_dir / catalog_name(platform, lang, version, package)
+    payload = {
+        "format": CATALOG_FORMAT,
+        "source_hash": source_hash(platform),
+        "platform": platform,
+        "lang": lang or "unknown",
+        "version": version,
+        "package": package,
+        "singletons": snapshot(platform),
+    }
+    try:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target_dir, prefix=".tmp-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, target)
+        return target
+    except OSError as exc:
+        log.debug(f"Could not store selector catalog {target}: {exc}")
+        return None
+
+
+def _activate_locale(platform: str, lang: Optional[str]) -> None:
+    locales = import_module(f"taktik.core.social_media.{platform}.ui.selectors.locales")
+    locales.set_active_locale(lang if lang and lang != "unknown" else None)
+
+
+def resolve_selectors(
+    platform: str,
+    *,
+    lang: Optional[str],
+    version: Optional[str],
+    package: Optional[str],
+    resolve: Callable[[], Any],
+) -> bool:
+    """Bring the selector singletons to their resolved state for this key.
+
+    A current catalog is applied (and the locale overlay activated) without running
+    anything else. Otherwise `resolve` runs the in-place passes and their outcome is
+    stored for the next start. Returns True on a catalog hit.
+
+    Must be called on pristine singletons - once per process, before any other pass -
+    since a miss snapshots whatever state `resolve` leaves behind.
+    """
+    try:
+        if load_catalog(platform, lang, version, package):
+            _activate_locale(platform, lang)
+            return True
+    except Exception as exc:
+        log.debug(f"Selector catalog unavailable for {platform}: {exc}")
+    resolve()
+    try:
+        store_catalog(platform, lang, version, package)
+    except Exception as exc:
+        log.debug(f"Could not snapshot {platform} selectors: {exc}")
+    return False
+
+
+__all__ = [
+    "BUNDLED_CATALOG_DIR",
+    "CATALOG_FORMAT",
+    "catalog_name",
+    "load_catalog",
+    "resolve_selectors",
+    "restore",
+    "runtime_catalog_dir",
+    "selector_singletons",
+    "snapshot",
+    "source_hash",
+    "store_catalog",
+]
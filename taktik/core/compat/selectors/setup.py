@@ -185,14 +185,23 @@ def _patch_singleton(
             continue
 
         current = getattr(singleton, field_name)
-        if isinstance(current, list):
-            setattr(singleton, field_name, xpaths)
-        elif isinstance(current, str):
-            setattr(singleton, field_name, xpaths[0] if xpaths else current)
-        else:
+        try:
+            if isinstance(current, list):
+                setattr(singleton, field_name, xpaths)
+            elif isinstance(current, str):
+                setattr(singleton, field_name, xpaths[0] if xpaths else current)
+            else:
+                logger.warning(
+                    f"[Compat] Override {action_key}: unexpected type "
+                    f"{type(current).__name__}, skipping"
+                )
+                continue
+        except AttributeError:
+            # A read-only property (a locale-composed selector): it has to be overridden
+            # through the fields it is built from. Skipping it keeps the other overrides.
             logger.warning(
-                f"[Compat] Override {action_key}: unexpected type "
-                f"{type(current).__name__}, skipping"
+                f"[Compat] Override {action_key}: '{field_name}' is read-only on "
+                f"{type(singleton).__name__}, skipping"
             )
             continue
 
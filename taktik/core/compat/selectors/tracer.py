@@ -5,6 +5,8 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from loguru import logger
 
+from taktik.core.shared.device.selector_order import get_selector_ordering
+
 
 @dataclass
 class XPathCall:
@@ -39,6 +41,28 @@ class SelectorTracer:
         self._active = False
         self._on_xpath_call = on_xpath_call
         self._current_screen: str = "unknown"
+        self._ordering_baseline = self._ordering_snapshot()
+
+    @staticmethod
+    def _ordering_snapshot():
+        ordering = get_selector_ordering()
+        return ordering, (ordering.stats() if ordering is not None else {})
+
+    def _ordering_report(self) -> Dict[str, Any]:
+        """What adaptive selector ordering saved since this tracer started (or was reset)."""
+        ordering, current = self._ordering_snapshot()
+        if ordering is None:
+            return {"active": False, "observations": 0, "probes_saved": 0, "lists_reordered": 0}
+        start_ordering, start = self._ordering_baseline
+        if start_ordering is not ordering:
+            start = {}
+        return {
+            "active": True,
+            "key": list(ordering.key),
+            "observations": current["observations"] - start.get("observations", 0),
+            "probes_saved": current["probes_saved"] - start.get("probes_saved", 0),
+            "lists_reordered": current["lists_reordered"],
+        }
 
     def attach(self, device_facade) -> None:
         if self._active:
@@ -47,6 +71,7 @@ class SelectorTracer:
         self._attached_device = device_facade
         self._original_xpath = device_facade.xpath
         self._active = True
+        self._ordering_baseline = self._ordering_snapshot()
 
         tracer = self
 
@@ -203,6 +228,7 @@ class SelectorTracer:
             "xpath_stats": sorted(xpath_stats.values(), key=lambda x: x["xpath"]),
             "never_found_xpaths": sorted(never_found),
             "errored_xpaths": sorted(errored),
+            "selector_ordering": self._ordering_report(),
         }
 
     def reset(self) -> None:
@@ -210,3 +236,4 @@ class SelectorTracer:
         self._steps.clear()
         self._current_step = None
         self._current_screen = "unknown"
+        self._ordering_baseline = self._ordering_snapshot()
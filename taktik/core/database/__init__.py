@@ -14,9 +14,23 @@ Structure:
     └── repositories/       ← Repository pattern for data access
 """
 
-from .models import InstagramProfile
-from .local.service import LocalDatabaseService, get_local_database
-from .local.client import LocalDatabaseClient, get_database_client
+from typing import TYPE_CHECKING
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .local.client import LocalDatabaseClient
+
+# Public names resolved on first access (module __getattr__): importing the package
+# must not pull in the SQLite service and every repository behind it - most importers
+# only want a submodule such as `database.local.paths`.
+_LAZY_EXPORTS = {
+    'InstagramProfile': ('.models', 'InstagramProfile'),
+    'LocalDatabaseService': ('.local.service', 'LocalDatabaseService'),
+    'get_local_database': ('.local.service', 'get_local_database'),
+    'LocalDatabaseClient': ('.local.client', 'LocalDatabaseClient'),
+    'get_database_client': ('.local.client', 'get_database_client'),
+}
 
 db_service = None
 
@@ -24,17 +38,22 @@ db_service = None
 def configure_db_service(**kwargs):
     """Configure the database service. Returns LocalDatabaseClient."""
     global db_service
+    from .local.client import LocalDatabaseClient
+
     db_service = LocalDatabaseClient()
     return db_service
 
 
-def get_db_service() -> LocalDatabaseClient:
+def get_db_service() -> "LocalDatabaseClient":
     """Get the database service singleton. Call configure_db_service() first."""
     if db_service is None:
         raise ValueError("Database service not configured. Call configure_db_service() first.")
     return db_service
 
 
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
+
 __all__ = [
     'LocalDatabaseService',
     'LocalDatabaseClient',
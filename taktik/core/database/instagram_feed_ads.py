@@ -8,6 +8,11 @@ budget is holding, which is the one signal a competitor cannot fake.
 It also bounds the AI bill: `pending_analysis()` returns creatives, not sightings, so an
 account that meets five hundred ads may only ever pay for sixty analyses.
 
+Screenshots live in the content-addressed blob store next to the base
+(`local/blob_store.py`); the row only holds the digest in `screenshot_blob` and owns one
+reference to it. Rows written before that still carry the bytes inline in `screenshot`
+until `externalize_screenshots()` moves them out.
+
 Never raises. Collecting market intelligence is a side effect of a run; it must never be
 able to cost the run it rides in on.
 """
@@ -31,6 +36,12 @@ class InstagramFeedAdsService:
 
         return get_local_database()
 
+    @staticmethod
+    def _blobs(db):
+        from taktik.core.database.local.blob_store import get_blob_store
+
+        return get_blob_store(db.db_path)
+
     @staticmethod
     def record_sighting(
         *,
@@ -50,12 +61,23 @@ class InstagramFeedAdsService:
         if not creative_hash:
             return None
         try:
-            conn = InstagramFeedAdsService._db()._get_connection()
+            db = InstagramFeedAdsService._db()
+            conn = db._get_connection()
             cursor = conn.cursor()
+            cursor.execute(
+                "SELECT screenshot_blob IS NOT NULL OR screenshot IS NOT NULL FROM feed_ads WHERE creative_hash = ?",
+                (creative_hash,),
+            )
+            known = cursor.fetchone()
+            digest = None
+            if screenshot and not (known and known[0]):
+                # Written before the row: a crash in between leaves an unreferenced
+                # file for the garbage collector, never a row pointing at nothing.
+                digest = InstagramFeedAdsService._blobs(db).put(screenshot)
             cursor.execute(
                 """
                 INSERT INTO feed_ads
-                    (creative_hash, advertiser, account_id, platform, screenshot, ocr_text)
+                    (creative_hash, advertiser, account_id, platform, screenshot_blob, ocr_text)
                 VALUES (?, ?, ?, ?, ?, ?)
                 ON CONFLICT(creative_hash) DO UPDATE SET
                     times_seen = times_seen + 1,
@@ -64,10 +86,12 @@ class InstagramFeedAdsService:
                     -- overwriting what it did.
                     advertiser = COALESCE(feed_ads.advertiser, excluded.advertiser),
                     ocr_text   = COALESCE(feed_ads.ocr_text, excluded.ocr_text),
-                    screenshot = COALESCE(feed_ads.screenshot, excluded.screenshot)
+                    screenshot_blob = COALESCE(feed_ads.screenshot_blob, excluded.screenshot_blob)
                 """,
-                (creative_hash, advertiser, account_id, platform, screenshot, ocr_text),
+                (creative_hash, advertiser, account_id, platform, digest, ocr_text),
             )
+            if digest:
+                InstagramFeedAdsService._blobs(db).incref(conn, digest, len(screenshot))
             conn.commit()
             cursor.execute("SELECT id FROM feed_ads WHERE creative_hash = ?", (creative_hash,))
             row = cursor.fetchone()
@@ -107,11 +131,12 @@ class InstagramFeedAdsService:
         to the ads that are actually running, not to a one-off impression.
         """
         try:
-            conn = InstagramFeedAdsService._db()._get_connection()
+            db = InstagramFeedAdsService._db()
+            conn = db._get_connection()
             cursor = conn.cursor()
             cursor.execute(
                 """
-                SELECT id, creative_hash, advertiser, times_seen, ocr_text, screenshot
+                SELECT id, creative_hash, advertiser, times_seen, ocr_text, screenshot, screenshot_blob
                 FROM feed_ads
                 WHERE platform = ? AND ai_analyzed_at IS NULL
                 ORDER BY times_seen DESC
@@ -120,7 +145,14 @@ class InstagramFeedAdsService:
                 (platform, limit),
             )
             columns = [c[0] for c in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            creatives = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            # Bytes are not loaded here: the blob file IS the image, its path is enough
+            # for the vision call (`screenshot` stays set for rows not yet moved out).
+            blobs = InstagramFeedAdsService._blobs(db)
+            for creative in creatives:
+                digest = creative.pop("screenshot_blob", None)
+                creative["screenshot_path"] = str(blobs.path(digest)) if blobs.exists(digest) else None
+            return creatives
         except Exception as exc:
             log.debug(f"Could not read pending analyses: {exc}")
             return []
@@ -142,3 +174,35 @@ class InstagramFeedAdsService:
         except Exception as exc:
             log.debug(f"Could not save ad analysis: {exc}")
             return False
+
+    @staticmethod
+    def externalize_screenshots(limit: int = 50) -> int:
+        """Move up to `limit` inline screenshots of older rows into the blob store.
+
+        One row per transaction: the file is written first, then the row swaps its bytes
+        for the digest and takes its reference. Returns how many rows were moved.
+        """
+        moved = 0
+        try:
+            db = InstagramFeedAdsService._db()
+            blobs = InstagramFeedAdsService._blobs(db)
+            conn = db._get_connection()
+            rows = conn.execute(
+                "SELECT id, screenshot FROM feed_ads WHERE screenshot IS NOT NULL LIMIT ?", (limit,)
+            ).fetchall()
+            for creative_id, screenshot in rows:
+                digest = blobs.put(bytes(screenshot))
+                with conn:
+                    cursor = conn.execute(
+                        "UPDATE feed_ads SET screenshot = NULL, screenshot_blob = ? "
+                        "WHERE id = ? AND screenshot_blob IS NULL",
+                        (digest, creative_id),
+                    )
+                    if cursor.rowcount:
+                        blobs.incref(conn, digest, len(screenshot))
+                    else:
+                        conn.execute("UPDATE feed_ads SET screenshot = NULL WHERE id = ?", (creative_id,))
+                moved += 1
+        except Exception as exc:
+            log.debug(f"Could not externalize ad screenshots: {exc}")
+        return moved
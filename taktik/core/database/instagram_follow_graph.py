@@ -12,6 +12,7 @@ from typing import Optional
 from loguru import logger
 
 from taktik.core.database.local.service import get_local_database
+from taktik.core.database.target_decision_cache import get_target_decision_cache
 
 log = logger.bind(module="instagram-follow-graph")
 
@@ -33,6 +34,10 @@ class InstagramFollowGraphService:
         if not account_id:
             return False
 
+        cache = get_target_decision_cache(account_id)
+        if cache is not None:
+            return cache.has_bot_follow_record(username)
+
         try:
             return cls._repository().has_bot_follow_record(username=username, account_id=account_id)
         except Exception as exc:
@@ -45,6 +50,10 @@ class InstagramFollowGraphService:
         if not account_id:
             return None
 
+        cache = get_target_decision_cache(account_id)
+        if cache is not None:
+            return cache.get_days_since_follow(username)
+
         try:
             return cls._repository().get_days_since_follow(username=username, account_id=account_id)
         except Exception as exc:
@@ -0,0 +1,124 @@
+"""In-memory index of the hashtag posts an account already worked.
+
+The hashtag walk asks, for every post it opens, whether this account already worked it in
+the last week (`InstagramHashtagPostService.is_processed`). Each answer used to be its own
+query. The index holds, per (account, hashtag), everything those answers need - loaded once
+when the run starts, kept current as the run records posts - so each post is decided in
+memory.
+
+Per hashtag it keeps three views of the same rows:
+
+  * ``(author, caption_hash)`` - the exact match, when the caption could be read;
+  * ``author`` - the repository's deliberate fallback when it could not (any post of the
+    author on that hashtag), a set lookup here rather than a scan;
+  * the `build_post_ref` of the post - the identity `posted_comments` and `post_analysis`
+    use - so a caller holding a ref can ask too. The base stores only the first 100
+    characters of a caption, so a ref is rebuilt for a loaded row only when that preview
+    IS the whole caption; longer posts are still found by their caption hash.
+
+The index is complete for the hashtags it holds: a miss is a real miss. Hashtags it does
+not hold (`covers` is False) go back to the base.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from taktik.core.database.instagram_post_identity import build_post_ref
+from taktik.core.database.repositories.instagram.hashtag import normalize_hashtag
+
+# Same bound as the workflow's `post_caption_preview[:100]`.
+CAPTION_PREVIEW_CHARS = 100
+
+
+def preview_post_ref(post_author: Optional[str], preview: Optional[str]) -> Optional[str]:
+    """The post ref of a stored row, or None when its preview may be a truncated caption."""
+    if not preview or len(preview) >= CAPTION_PREVIEW_CHARS:
+        return None
+    return build_post_ref(post_author, preview)
+
+
+class _HashtagPosts:
+    __slots__ = ("keys", "authors", "refs")
+
+    def __init__(self):
+        self.keys: Set[Tuple[str, Optional[str]]] = set()
+        self.authors: Set[str] = set()
+        self.refs: Set[str] = set()
+
+    def add(self, author: str, caption_hash: Optional[str], post_ref: Optional[str]) -> None:
+        self.keys.add((author, caption_hash))
+        self.authors.add(author)
+        if post_ref:
+            self.refs.add(post_ref)
+
+
+class ProcessedPostIndex:
+    """Processed hashtag posts of one account, within one time window."""
+
+    def __init__(self, account_id: int, hours_limit: int = 168):
+        self.account_id = account_id
+        self.hours_limit = hours_limit
+        self._tags: Dict[str, _HashtagPosts] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return sum(len(posts.keys) for posts in self._tags.values())
+
+    def covers(self, hashtag: str) -> bool:
+        return normalize_hashtag(hashtag) in self._tags
+
+    def missing(self, hashtags: Iterable[str]) -> list:
+        """The hashtags of ``hashtags`` (folded, deduplicated) the index does not hold yet."""
+        return [
+            tag for tag in dict.fromkeys(normalize_hashtag(tag) for tag in hashtags if tag)
+            if tag not in self._tags
+        ]
+
+    def load(self, hashtags: Iterable[str],
+             rows: Iterable[Tuple[str, str, Optional[str], Optional[str]]]) -> int:
+        """Take ``hashtags`` in from `(hashtag, author, caption_hash, preview)` rows, consumed
+        one at a time. A listed hashtag without rows is held too, as empty. Returns the rows taken."""
+        for tag in hashtags:
+            self._tags.setdefault(normalize_hashtag(tag), _HashtagPosts())
+        taken = 0
+        for hashtag, author, caption_hash, preview in rows:
+            posts = self._tags.setdefault(normalize_hashtag(hashtag), _HashtagPosts())
+            posts.add(author, caption_hash, preview_post_ref(author, preview))
+            taken += 1
+        return taken
+
+    def merge(self, other: "ProcessedPostIndex") -> None:
+        """Take over the hashtags ``other`` holds."""
+        self._tags.update(other._tags)
+
+    def add(self, hashtag: str, post_author: str, post_caption_hash: Optional[str] = None,
+            post_caption_preview: Optional[str] = None) -> None:
+        """A post recorded during the run, indexed exactly as a reload would index it."""
+        posts = self._tags.get(normalize_hashtag(hashtag))
+        if posts is not None:
+            posts.add(post_author, post_caption_hash, preview_post_ref(post_author, post_caption_preview))
+
+    def contains(self, hashtag: str, post_author: str, post_caption_hash: Optional[str] = None,
+                 post_ref: Optional[str] = None) -> Optional[bool]:
+        """Was this post worked? None when the index does not hold the hashtag.
+
+        Same matching as the repository: the exact post when the caption hash is known,
+        else the post ref when one is given, else any post of the author on the hashtag.
+        """
+        posts = self._tags.get(normalize_hashtag(hashtag))
+        if posts is None:
+            return None
+        self.lookups += 1
+        if post_caption_hash:
+            found = (post_author, post_caption_hash) in posts.keys
+        elif post_ref and post_ref != post_author:
+            found = post_ref in posts.refs
+        else:
+            found = post_author in posts.authors
+        self.hits += found
+        return found
+
+
+__all__ = ["CAPTION_PREVIEW_CHARS", "ProcessedPostIndex", "preview_post_ref"]
@@ -6,6 +6,8 @@ This facade absorbs the legacy hashtag post bookkeeping that used to live in
 - detect whether a hashtag post was already processed
 - persist the processed-post marker
 - compute the stable caption hash used as part of the dedup key
+- preload the processed posts of every hashtag of a run into a `ProcessedPostIndex`
+  (`preload`), so each post of the run is decided in memory instead of with its own query
 
 The persistence path still goes through `LocalDatabaseService` for now because
 that is where the existing `processed_hashtag_posts` API lives. The ownership of
@@ -16,22 +18,83 @@ defining DB behavior inside the platform package.
 from __future__ import annotations
 
 import hashlib
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 
 from loguru import logger
 
+from taktik.core.database.instagram_hashtag_post_index import ProcessedPostIndex
+
 log = logger.bind(module="database-instagram-hashtag-posts")
 
 
 class InstagramHashtagPostService:
     """Database facade for processed hashtag post bookkeeping."""
 
+    # The processed posts of the running account, for the hashtags preloaded so far.
+    _index: Optional[ProcessedPostIndex] = None
+
     @staticmethod
     def _local_db():
         from taktik.core.database.local.service import get_local_database
 
         return get_local_database()
 
+    @staticmethod
+    def preload(hashtags: Iterable[str], account_id: Optional[int], hours_limit: int = 168) -> int:
+        """Index the processed posts of ``hashtags`` in one streamed query. Returns the posts loaded.
+
+        Adds to the current index when it belongs to the same account and window (only the
+        hashtags it does not hold yet are read), replaces it otherwise. On failure those
+        hashtags stay out of the index and `is_processed` keeps asking the base for them.
+        """
+        if not account_id:
+            InstagramHashtagPostService.clear_preloaded()
+            return 0
+        index = InstagramHashtagPostService._index
+        if index is None or (index.account_id, index.hours_limit) != (account_id, hours_limit):
+            index = ProcessedPostIndex(account_id, hours_limit)
+        tags = index.missing(hashtags)
+        if not tags:
+            InstagramHashtagPostService._index = index
+            return 0
+
+        try:
+            staged = ProcessedPostIndex(account_id, hours_limit)
+            loaded = staged.load(tags, InstagramHashtagPostService._local_db().iter_processed_hashtag_posts(
+                account_id=account_id, hashtags=tags, hours_limit=hours_limit,
+            ))
+        except Exception as exc:
+            log.debug("Could not preload processed hashtag posts: {}", exc)
+            InstagramHashtagPostService._index = index
+            return 0
+        # Merged only once the stream completed: a half-read hashtag would answer false misses.
+        index.merge(staged)
+        InstagramHashtagPostService._index = index
+        log.debug("Indexed {} processed post(s) for {} hashtag(s)", loaded, len(tags))
+        return loaded
+
+    @staticmethod
+    def is_preloaded(hashtag: str, account_id: Optional[int], hours_limit: int = 168) -> bool:
+        return InstagramHashtagPostService._index_for(account_id, hashtag, hours_limit) is not None
+
+    @staticmethod
+    def clear_preloaded() -> None:
+        InstagramHashtagPostService._index = None
+
+    @staticmethod
+    def _index_for(account_id: Optional[int], hashtag: str,
+                   hours_limit: Optional[int]) -> Optional[ProcessedPostIndex]:
+        index = InstagramHashtagPostService._index
+        if (
+            index is None
+            or index.account_id != account_id
+            or index.hours_limit != hours_limit
+            or not index.covers(hashtag)
+        ):
+            return None
+        return index
+
     @staticmethod
     def is_processed(
         hashtag: str,
@@ -39,10 +102,15 @@ class InstagramHashtagPostService:
         post_caption_hash: Optional[str] = None,
         account_id: Optional[int] = None,
         hours_limit: int = 168,
+        post_ref: Optional[str] = None,
     ) -> bool:
         if not account_id:
             return False
 
+        index = InstagramHashtagPostService._index_for(account_id, hashtag, hours_limit)
+        if index is not None:
+            return index.contains(hashtag, post_author, post_caption_hash, post_ref)
+
         try:
             is_processed = InstagramHashtagPostService._local_db().is_hashtag_post_processed(
                 account_id=account_id,
@@ -50,6 +118,7 @@ class InstagramHashtagPostService:
                 post_author=post_author,
                 post_caption_hash=post_caption_hash,
                 hours_limit=hours_limit,
+                post_ref=post_ref,
             )
 
             if is_processed:
@@ -91,6 +160,9 @@ class InstagramHashtagPostService:
 
             if success:
                 log.debug("Processed hashtag post recorded: #{} by @{}", hashtag, post_author)
+                index = InstagramHashtagPostService._index
+                if index is not None and index.account_id == account_id:
+                    index.add(hashtag, post_author, post_caption_hash, post_caption_preview)
 
             return success
         except Exception as exc:
@@ -98,8 +170,12 @@ class InstagramHashtagPostService:
             return False
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def generate_caption_hash(caption: str) -> str:
-        """Generate the dedup hash used by processed hashtag posts."""
+        """Generate the dedup hash used by processed hashtag posts.
+
+        Memoized: the same caption is read several times while a post is on screen.
+        """
         if not caption:
             return "empty"
 
@@ -8,6 +8,9 @@ This module owns small persistence decisions that were historically called from
 - mark a profile as processed
 - combine those checks into a skip decision
 
+During a workflow session the read checks are answered by the session's
+`TargetDecisionCache` (see `target_decision_cache.py`) instead of one query each.
+
 It intentionally uses the public database client returned by
 `taktik.core.database.get_db_service()` so legacy workflows keep their existing
 runtime contract while the ownership moves into the database layer.
@@ -19,6 +22,8 @@ from typing import Optional
 
 from loguru import logger
 
+from taktik.core.database.target_decision_cache import get_target_decision_cache
+
 log = logger.bind(module="database-instagram-workflow-state")
 
 
@@ -76,6 +81,20 @@ class InstagramWorkflowStateService:
             # profil @x" placeholder. Falls back to that placeholder for actions with no
             # content of their own (like, follow, story…).
             row_content = content or f"Action {action_type} sur profil @{username}"
+            # Several rows: one transaction (profile resolved once, one executemany, one
+            # daily-stats bump) instead of a lookup + INSERT + commit per row.
+            record_many = getattr(db, "record_interactions", None)
+            if len(rows) > 1 and callable(record_many):
+                success_count = record_many(
+                    account_id=account_id,
+                    username=username,
+                    interaction_type=action_type,
+                    interaction_times=rows,
+                    success=True,
+                    content=row_content,
+                    session_id=session_id,
+                )
+                rows = []
             for interaction_time in rows:
                 success = db.record_interaction(
                     account_id=account_id,
@@ -124,11 +143,15 @@ class InstagramWorkflowStateService:
             return False
 
         try:
-            is_processed = InstagramWorkflowStateService._db().is_profile_processed(
-                account_id=account_id,
-                username=username,
-                hours_limit=hours_limit,
-            )
+            cache = get_target_decision_cache(account_id)
+            if cache is not None:
+                is_processed = cache.is_processed(username, hours_limit)
+            else:
+                is_processed = InstagramWorkflowStateService._db().is_profile_processed(
+                    account_id=account_id,
+                    username=username,
+                    hours_limit=hours_limit,
+                )
 
             if is_processed:
                 log.debug(
@@ -212,11 +235,15 @@ class InstagramWorkflowStateService:
             return False
 
         try:
-            is_filtered = InstagramWorkflowStateService._db().is_profile_filtered(
-                username,
-                account_id,
-                max_age_days,
-            )
+            cache = get_target_decision_cache(account_id)
+            if cache is not None:
+                is_filtered = cache.is_filtered(username, max_age_days)
+            else:
+                is_filtered = InstagramWorkflowStateService._db().is_profile_filtered(
+                    username,
+                    account_id,
+                    max_age_days,
+                )
             if is_filtered:
                 log.debug("Profile @{} already filtered", username)
             return is_filtered
@@ -281,10 +308,14 @@ class InstagramWorkflowStateService:
             if skip_reason == "already_processed":
                 from datetime import datetime
 
-                info = InstagramWorkflowStateService._db().check_profile_processed(
-                    account_id, username, 24 * 60
-                )
-                ts = (info or {}).get("last_interaction")
+                cache = get_target_decision_cache(account_id)
+                if cache is not None:
+                    ts = cache.last_interaction(username) if cache.is_processed(username, 24 * 60) else None
+                else:
+                    info = InstagramWorkflowStateService._db().check_profile_processed(
+                        account_id, username, 24 * 60
+                    )
+                    ts = (info or {}).get("last_interaction")
                 if not ts:
                     return None
                 # Stored as "YYYY-MM-DD HH:MM:SS" (SQLite datetime). A coarse day count is
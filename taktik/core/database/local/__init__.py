@@ -1,10 +1,24 @@
 """
 Local SQLite database module.
 Contains the SQLite service (engine) and the client (public interface).
+
+The service and the client are resolved on first access (module `__getattr__`):
+`local.paths` is imported on its own by the repositories and bridge entry points, and
+must not import the service - which imports every repository - on the way.
 """
 
-from .service import LocalDatabaseService, get_local_database
-from .client import LocalDatabaseClient, get_database_client
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'LocalDatabaseService': ('.service', 'LocalDatabaseService'),
+    'get_local_database': ('.service', 'get_local_database'),
+    'LocalDatabaseClient': ('.client', 'LocalDatabaseClient'),
+    'get_database_client': ('.client', 'get_database_client'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     'LocalDatabaseService',
@@ -0,0 +1,242 @@
+"""Content-addressed store for the media blobs the bot produces.
+
+Feed-ad screenshots used to live inline in `feed_ads.screenshot`, and profile avatars
+travelled as base64 data URLs through profile dicts and IPC messages. A blob in a row
+is copied through the WAL, the page cache and every sync of that row; a data URL is
+re-encoded and re-sent every time the profile is shown. Here each blob is written ONCE,
+as a file named by the SHA-256 of its bytes, next to the database:
+
+    <data dir>/blobs/ab/ab12...ef     (two-character fan-out keeps directories small)
+
+Rows and IPC messages carry only the digest (or the file path / `file://` URL derived
+from it) and load the bytes when they actually need them. Identical bytes land on the
+same file, so the same avatar captured on ten visits costs one file.
+
+Lifetime is reference counted in the `blob_refs` table: whoever stores a digest in a
+row calls `incref` on the SAME connection, inside the same transaction as the row
+write, and `decref` when the row lets it go - so the count can never drift from the
+rows. `collect_garbage` deletes files whose count dropped to zero, and files that never
+got a reference at all (an IPC-only avatar, a crash between the write and the row),
+once they are older than a grace period: a reader that was handed a path a moment ago
+still finds the file.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from .paths import get_default_database_path
+
+log = logger.bind(module="local-blob-store")
+
+BLOB_GC_GRACE_SECONDS = 24 * 3600
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+_DATA_URL = re.compile(r"^data:(?P<media_type>[\w.+-]+/[\w.+-]+)?(?:;[^,]*)?;base64,(?P<payload>.*)$", re.DOTALL)
+
+
+def decode_data_url(data_url: str) -> Optional[Tuple[bytes, str]]:
+    """(bytes, media type) of a base64 `data:` URL, None when it is not one."""
+    match = _DATA_URL.match(data_url or "")
+    if not match:
+        return None
+    try:
+        payload = base64.b64decode(match.group("payload"), validate=False)
+    except (ValueError, TypeError):
+        return None
+    return payload, match.group("media_type") or "application/octet-stream"
+
+
+class BlobStore:
+    """Blob files under `root`, addressed by the SHA-256 hex digest of their bytes."""
+
+    def __init__(self, root: str | os.PathLike):
+        self.root = Path(root)
+
+    @classmethod
+    def for_database(cls, db_path: str) -> "BlobStore":
+        """The store that lives next to the database file at `db_path`."""
+        return cls(Path(db_path).resolve().parent / "blobs")
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def uri(self, digest: str) -> str:
+        """`file://` URL of the blob, for IPC consumers that load it themselves."""
+        return self.path(digest).resolve().as_uri()
+
+    def digest_from_path(self, path: Optional[str]) -> Optional[str]:
+        """The digest when `path` points into this store, else None (a foreign path)."""
+        if not path:
+            return None
+        candidate = Path(path)
+        if not _DIGEST.match(candidate.name):
+            return None
+        try:
+            if candidate.resolve().parent.parent != self.root.resolve():
+                return None
+        except OSError:
+            return None
+        return candidate.name
+
+    def exists(self, digest: str) -> bool:
+        return bool(_DIGEST.match(digest or "")) and self.path(digest).is_file()
+
+    def put(self, data: bytes) -> str:
+        """Store `data` (no-op when the same bytes are already stored). Returns the digest.
+
+        The file is written to a temporary name and renamed into place, so a reader
+        never sees a half-written blob and a crashed write leaves nothing addressable.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        target = self.path(digest)
+        if target.is_file():
+            return digest
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp, target)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        return digest
+
+    def put_data_url(self, data_url: str) -> Optional[str]:
+        """Store the bytes of a base64 `data:` URL. Returns the digest, None if not one."""
+        decoded = decode_data_url(data_url)
+        if decoded is None or not decoded[0]:
+            return None
+        return self.put(decoded[0])
+
+    def read(self, digest: Optional[str]) -> Optional[bytes]:
+        """The blob's bytes, None when the digest is unknown or the file is gone."""
+        if not digest or not _DIGEST.match(digest):
+            return None
+        try:
+            return self.path(digest).read_bytes()
+        except OSError:
+            return None
+
+    def read_data_url(self, digest: Optional[str], media_type: str = "image/jpeg") -> Optional[str]:
+        """The blob re-encoded as a `data:` URL, for consumers that cannot read files."""
+        data = self.read(digest)
+        if data is None:
+            return None
+        return f"data:{media_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+    # ------------------------------------------------------------------
+    # Reference counts (on the caller's connection, inside its transaction)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def incref(conn: sqlite3.Connection, digest: str, size: int = 0) -> None:
+        conn.execute(
+            """
+            INSERT INTO blob_refs (digest, refcount, size) VALUES (?, 1, ?)
+            ON CONFLICT(digest) DO UPDATE SET
+                refcount = refcount + 1,
+                size = MAX(blob_refs.size, excluded.size),
+                updated_at = datetime('now')
+            """,
+            (digest, int(size or 0)),
+        )
+
+    @staticmethod
+    def decref(conn: sqlite3.Connection, digest: Optional[str]) -> None:
+        if not digest:
+            return
+        conn.execute(
+            "UPDATE blob_refs SET refcount = MAX(refcount - 1, 0), updated_at = datetime('now') WHERE digest = ?",
+            (digest,),
+        )
+
+    @staticmethod
+    def refcount(conn: sqlite3.Connection, digest: str) -> int:
+        row = conn.execute("SELECT refcount FROM blob_refs WHERE digest = ?", (digest,)).fetchone()
+        return int(row[0]) if row else 0
+
+    # ------------------------------------------------------------------
+    # Garbage collection
+    # ------------------------------------------------------------------
+
+    def collect_garbage(self, conn: sqlite3.Connection, grace_seconds: float = BLOB_GC_GRACE_SECONDS) -> Tuple[int, int]:
+        """Delete unreferenced blobs older than `grace_seconds`. Returns (files, bytes) freed."""
+        cutoff = time.time() - grace_seconds
+        referenced = {
+            digest: refcount
+            for digest, refcount in conn.execute("SELECT digest, refcount FROM blob_refs")
+        }
+        files = removed_bytes = 0
+        released = []
+        if not self.root.is_dir():
+            return 0, 0
+        for shard in self.root.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry in shard.iterdir():
+                name = entry.name
+                if not _DIGEST.match(name) and not name.startswith(".tmp-"):
+                    continue
+                if referenced.get(name, 0) > 0:
+                    continue
+                try:
+                    stat = entry.stat()
+                    if stat.st_mtime > cutoff:
+                        continue
+                    entry.unlink()
+                except OSError:
+                    continue
+                files += 1
+                removed_bytes += stat.st_size
+                if name in referenced:
+                    released.append(name)
+        if released:
+            with conn:
+                conn.executemany(
+                    "DELETE FROM blob_refs WHERE digest = ? AND refcount <= 0", [(d,) for d in released]
+                )
+        if files:
+            log.info("Blob store: {} unreferenced file(s) removed ({} bytes)", files, removed_bytes)
+        return files, removed_bytes
+
+
+_stores: Dict[Path, BlobStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_blob_store(db_path: Optional[str] = None) -> BlobStore:
+    """The store next to `db_path` (default: the standard database location)."""
+    root = BlobStore.for_database(db_path or get_default_database_path()).root
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = _stores[root] = BlobStore(root)
+        return store
+
+
+__all__ = [
+    "BLOB_GC_GRACE_SECONDS",
+    "BlobStore",
+    "decode_data_url",
+    "get_blob_store",
+]
@@ -191,6 +191,20 @@ class LocalDatabaseClient:
             interaction_time=interaction_time
         )
     
+    def record_interactions(self, account_id: int, username: str, interaction_type: str,
+                            interaction_times: List[Optional[str]], success: bool = True,
+                            content: str = None, session_id: int = None) -> int:
+        """Record several identical interactions in one transaction; returns rows recorded."""
+        return self.local_db.record_interactions(
+            account_id=account_id,
+            target_username=username,
+            interaction_type=interaction_type,
+            interaction_times=interaction_times,
+            success=success,
+            content=content,
+            session_id=session_id,
+        )
+
     def log_interaction(self, account_id: int, profile_id: int, interaction_type: str,
                         success: bool = True, content: Optional[str] = None) -> bool:
         """Legacy method — no-op, kept for backward compat."""
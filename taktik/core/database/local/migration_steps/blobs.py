@@ -0,0 +1,27 @@
+"""Reference counts of the content-addressed blob store (see local/blob_store.py).
+
+The blobs themselves are files under `<data dir>/blobs`; this table only says how many
+rows point at each digest. It is written on the same connection and in the same
+transaction as those rows, so a count never drifts from them.
+
+Local only: the files do not travel with a synced base, so neither do their counts.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def run_blob_store_migrations(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS blob_refs (
+            digest TEXT PRIMARY KEY,              -- sha256 hex of the bytes = the file name
+            refcount INTEGER NOT NULL DEFAULT 0,
+            size INTEGER NOT NULL DEFAULT 0,      -- bytes, for the retention dry-run
+            created_at TEXT DEFAULT (datetime('now')),
+            updated_at TEXT DEFAULT (datetime('now'))
+        )
+    """)
+
+
+__all__ = ["run_blob_store_migrations"]
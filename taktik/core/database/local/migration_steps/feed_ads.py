@@ -21,6 +21,8 @@ from __future__ import annotations
 
 import sqlite3
 
+from loguru import logger
+
 
 def run_feed_ads_migrations(cursor: sqlite3.Cursor) -> None:
     cursor.execute("""
@@ -32,7 +34,8 @@ def run_feed_ads_migrations(cursor: sqlite3.Cursor) -> None:
             advertiser TEXT,
             account_id INTEGER,
             platform TEXT NOT NULL DEFAULT 'instagram',
-            screenshot BLOB,
+            screenshot BLOB,                -- legacy inline copy, moved out to the blob store
+            screenshot_blob TEXT,           -- digest in the blob store (local/blob_store.py)
             ocr_text TEXT,
             -- Filled later, out of the run: the phone must never wait on an AI call.
             ai_analysis TEXT,
@@ -54,3 +57,8 @@ def run_feed_ads_migrations(cursor: sqlite3.Cursor) -> None:
         "CREATE INDEX IF NOT EXISTS idx_feed_ads_pending_ai "
         "ON feed_ads(ai_analyzed_at) WHERE ai_analyzed_at IS NULL"
     )
+    try:
+        cursor.execute("SELECT screenshot_blob FROM feed_ads LIMIT 1")
+    except sqlite3.OperationalError:
+        logger.info("Migration: Adding screenshot_blob to feed_ads")
+        cursor.execute("ALTER TABLE feed_ads ADD COLUMN screenshot_blob TEXT")
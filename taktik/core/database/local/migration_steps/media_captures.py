@@ -0,0 +1,47 @@
+"""Profiles and media read off the wire by the mitm capture (instagram/media/capture).
+
+The capture service used to keep every profile and media item it saw in process memory
+for the whole session. It now keeps only a bounded window in memory and streams the
+rest here in batches, one row per (kind, key): a profile seen twice is updated, not
+appended.
+
+`payload` is the compact JSON of the capture record; the columns next to it are only
+what the reads filter on. `session_id` is the capture service run that last wrote the
+row: the service's reads only fall back to its own session's rows, not to everything
+retained from earlier runs. Local only: this is a cache of what the phone displayed, it
+has nothing to sync.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from loguru import logger
+
+
+def run_media_captures_migrations(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS media_captures (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,                   -- 'profile' | 'media'
+            capture_key TEXT NOT NULL,            -- username for a profile, media_id for a media
+            username TEXT,
+            session_id TEXT,                      -- capture service run that last wrote it
+            payload TEXT NOT NULL,                -- compact JSON of the capture record
+            captured_at TEXT,
+            updated_at TEXT DEFAULT (datetime('now')),
+            UNIQUE(kind, capture_key)
+        )
+    """)
+    try:
+        cursor.execute("SELECT session_id FROM media_captures LIMIT 1")
+    except sqlite3.OperationalError:
+        logger.info("Migration: Adding session_id to media_captures")
+        cursor.execute("ALTER TABLE media_captures ADD COLUMN session_id TEXT")
+    # `get_media_by_username` once the items have left the in-memory window.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_media_captures_username ON media_captures(username, kind)"
+    )
+
+
+__all__ = ["run_media_captures_migrations"]
@@ -0,0 +1,47 @@
+"""Covering indexes for the per-profile repository reads.
+
+Found by ``scripts/audit_query_plans.py`` on a synthetic base of 2M interactions
+(``scripts/gen_synthetic_local_db.py``). The existing indexes were built for the
+per-account and per-session aggregates; the per-profile checks run before touching each
+target fell back on a weak prefix:
+
+- ``interactions``: "did this account interact with / follow this profile lately"
+  searched ``(platform, profile_id)`` and filtered every row of the profile, or
+  ``(platform, account_id, interaction_type)`` and filtered every FOLLOW of the account.
+  ``(platform, account_id, profile_id, interaction_time, interaction_type, success)``
+  answers all of them - and the per-profile session snapshot - from the index alone.
+- ``filtered_profiles``: per-account reads used ``(account_id)`` or ``(username)``
+  alone; ``(platform, account_id, username, filtered_at)`` covers the "is filtered",
+  expiry, batch and count reads.
+- ``social_profiles``: ``username = ? COLLATE NOCASE`` (bot-follow lookups) could not
+  use the binary-collated username index and visited every Instagram profile.
+
+Additive and idempotent; the indexes are built once on the next boot.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from loguru import logger
+
+QUERY_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_interactions_account_profile_time "
+    "ON interactions(platform, account_id, profile_id, interaction_time, interaction_type, success)",
+    "CREATE INDEX IF NOT EXISTS idx_filtered_account_username "
+    "ON filtered_profiles(platform, account_id, username, filtered_at)",
+    "CREATE INDEX IF NOT EXISTS idx_social_profiles_username_nocase "
+    "ON social_profiles(platform, username COLLATE NOCASE)",
+)
+
+
+def run_query_index_migrations(cursor: sqlite3.Cursor) -> None:
+    """Create the covering indexes for the hot per-profile reads."""
+    for stmt in QUERY_INDEXES:
+        try:
+            cursor.execute(stmt)
+        except sqlite3.OperationalError as exc:
+            logger.debug(f"query index skipped: {exc}")
+
+
+__all__ = ["QUERY_INDEXES", "run_query_index_migrations"]
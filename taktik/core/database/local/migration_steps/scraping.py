@@ -134,3 +134,22 @@ def run_scraped_profile_migrations(cursor: sqlite3.Cursor) -> None:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_scraped_profiles_post_url ON scraped_profiles(source_post_url)")
     except sqlite3.OperationalError:
         pass
+
+
+def run_scraping_checkpoint_migrations(cursor: sqlite3.Cursor) -> None:
+    """Resume points of long list scrapes (followers / following of one target).
+
+    One row per list, overwritten as the scrape advances and deleted once the list is done,
+    so a run that died half way can pick up near where it stopped. Keyed by the list, not
+    by the session: the resumed run is a NEW session. Local only.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scraping_checkpoints (
+            source_type TEXT NOT NULL,            -- FOLLOWERS | FOLLOWING
+            source_name TEXT NOT NULL,            -- target username
+            scraping_id INTEGER,                  -- session that wrote it last
+            payload TEXT NOT NULL,                -- JSON ScrapeCheckpoint
+            updated_at TEXT DEFAULT (datetime('now')),
+            PRIMARY KEY (source_type, source_name)
+        )
+    """)
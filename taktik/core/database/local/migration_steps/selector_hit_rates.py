@@ -0,0 +1,34 @@
+"""Which alternative of a selector list matches on a given app build (shared/device/selector_order).
+
+Selector lists are ordered fallbacks: on an app version where the fifth alternative is
+the one that matches, every probe of the list pays four misses first. The hit-rate store
+learns that per (platform, app version, package, list) and reorders the list at run time;
+this table is what carries the learning across runs.
+
+`hits` and `probes` are decayed counts (each new observation ages the older ones), so
+they are REAL, not integers. Local only: it describes this device's install, not the
+account.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def run_selector_hit_rates_migrations(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS selector_hit_rates (
+            platform TEXT NOT NULL,
+            app_version TEXT NOT NULL,            -- '' when the version is unknown
+            package TEXT NOT NULL,
+            list_id TEXT NOT NULL,                -- digest of the list's XPaths, in source order
+            xpath TEXT NOT NULL,
+            hits REAL NOT NULL DEFAULT 0,
+            probes REAL NOT NULL DEFAULT 0,
+            updated_at TEXT DEFAULT (datetime('now')),
+            PRIMARY KEY (platform, app_version, package, list_id, xpath)
+        )
+    """)
+
+
+__all__ = ["run_selector_hit_rates_migrations"]
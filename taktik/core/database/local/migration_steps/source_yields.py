@@ -0,0 +1,32 @@
+"""How much each source (hashtag, post URL) gave the last times it was worked.
+
+A multi-source run splits one budget across its sources, and asks the best ones first (see
+`common/distribution.py`). "Best" is this table: per account and workflow, the quota each
+source was allotted and the profiles it actually processed, both decayed at every run so the
+ranking follows the source's recent life rather than its whole history. `processed /
+allotted` is the expected fill rate of the source's next share.
+
+Local only: it steers the scheduling of this device's runs.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def run_source_yields_migrations(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS source_yields (
+            account_id INTEGER NOT NULL,
+            workflow TEXT NOT NULL,               -- hashtag | post_url
+            source TEXT NOT NULL,                 -- bare hashtag, or the post URL
+            allotted REAL NOT NULL DEFAULT 0,
+            processed REAL NOT NULL DEFAULT 0,
+            runs INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT DEFAULT (datetime('now')),
+            PRIMARY KEY (account_id, workflow, source)
+        )
+    """)
+
+
+__all__ = ["run_source_yields_migrations"]
@@ -13,6 +13,7 @@ from .migration_steps.scraping import (
     drop_scraped_comments,
     drop_scraping_sessions_discovery_campaign_id,
     run_scraped_profile_migrations,
+    run_scraping_checkpoint_migrations,
     run_scraping_session_migrations,
 )
 from .migration_steps.identifiers import _validate_sql_identifier
@@ -22,6 +23,10 @@ from .migration_steps.instagram import (
     run_instagram_profile_core_migrations,
 )
 from .migration_steps.feed_ads import run_feed_ads_migrations
+from .migration_steps.blobs import run_blob_store_migrations
+from .migration_steps.media_captures import run_media_captures_migrations
+from .migration_steps.selector_hit_rates import run_selector_hit_rates_migrations
+from .migration_steps.source_yields import run_source_yields_migrations
 from .migration_steps.content_relays import run_content_relays_migrations
 from .migration_steps.legacy import drop_legacy_discovery_tables
 from .migration_steps.social_graph import (
@@ -42,6 +47,7 @@ from .migration_steps.messaging import run_messaging_migrations
 from .migration_steps.notifications import run_notifications_migrations
 from .migration_steps.account_restrictions import run_account_restriction_migrations
 from .migration_steps.posted_comments import run_posted_comments_migrations
+from .migration_steps.query_indexes import run_query_index_migrations
 
 
 def run_migrations(conn: sqlite3.Connection) -> None:
@@ -53,6 +59,7 @@ def run_migrations(conn: sqlite3.Connection) -> None:
     run_instagram_profile_core_migrations(cursor)
     run_scraping_session_migrations(cursor)
     run_scraped_profile_migrations(cursor)
+    run_scraping_checkpoint_migrations(cursor)  # additive: resume points of long list scrapes (local-only)
     run_legacy_tiktok_scraped_profiles_migration(cursor)
     run_scraped_profiles_unification_migrations(cursor)
     run_profile_following_migrations(cursor)
@@ -72,7 +79,12 @@ def run_migrations(conn: sqlite3.Connection) -> None:
     run_account_restriction_migrations(cursor)  # additive: observable platform-flag signals per account
     run_posted_comments_migrations(cursor)  # additive: kind ('comment' | 'reply') + reply_to_*
     run_feed_ads_migrations(cursor)  # additive: sponsored creatives met in the feed (local-only corpus)
+    run_blob_store_migrations(cursor)  # additive: refcounts of the content-addressed media blobs (local-only)
+    run_media_captures_migrations(cursor)  # additive: mitm profile/media captures streamed out of memory (local-only)
+    run_selector_hit_rates_migrations(cursor)  # additive: which selector alternative matches per app build (local-only)
+    run_source_yields_migrations(cursor)  # additive: per-source yields steering the multi-source scheduler (local-only)
     run_content_relays_migrations(cursor)  # additive: what one account already re-shared from another
+    run_query_index_migrations(cursor)  # additive: covering indexes for the per-profile reads (runs after the unified tables exist)
     drop_legacy_discovery_tables(cursor)
     # Lot 4 (audit): runs last so every scraping_sessions column-add (platform) is already
     # applied; only acts on front-touched DBs that still carry the dead discovery column.
@@ -0,0 +1,651 @@
+"""Retention and compaction of the local tables that grow without bound.
+
+The base keeps every interaction, filtered profile, profile stats snapshot, feed-ad
+screenshot, DM message and mitm capture forever; on a long-running account that is
+millions of rows, and every scan over them gets slower. This module trims them by policy:
+
+- **age** (`max_age_days`): rows older than N days on `time_column`;
+- **count** (`keep_latest`): only the N newest rows per `partition_by` group are kept;
+  combined with an age, a row must be both old AND outside the newest N to go;
+- **clear** (`clear_column`): the row stays, a heavy column (a screenshot BLOB) is NULLed;
+  when the column holds blob-store digests (`releases_blob_refs`), the row's reference is
+  released in the same transaction and the file goes at the next garbage collection;
+- **roll-up** (`rollup`): before old `interactions` rows are deleted, every local day they
+  cover that has NO `daily_stats_unified` row gets one computed from them. Days that
+  already have a row keep it untouched - the live counters are the truth for those,
+  so a roll-up can never double-count.
+
+Two kinds of rows are never candidates: successful FOLLOW interactions (the unfollow
+workflows and `has_bot_follow_record` read them, whatever their age) and ads whose AI
+analysis has not run yet (the screenshot is its input). `filtered_profiles` is not in the
+defaults at all: filters never expire unless the operator set an expiry
+(`is_filtered(max_age_days=None)`), so `FILTERED_PROFILES_POLICY` is opt-in.
+
+The base is shared with Electron, so nothing here holds the write lock for long: the
+engine uses its own connection with a short busy timeout, deletes `batch_size` rowids
+per transaction, pauses between batches, stops at its time budget and simply resumes
+on the next run. A lock it cannot get ends the run early; it is not an error.
+
+Each run ends with a garbage collection of the blob store (`local/blob_store.py`).
+
+Deleted pages go to the freelist. They are only given back to the filesystem when the
+base is in `auto_vacuum=INCREMENTAL` mode (new bases are created that way), by
+`PRAGMA incremental_vacuum` steps scheduled after the deletes. An older base has to be
+converted once with a full VACUUM (`enable_incremental_vacuum`), offline.
+
+Always look at the dry-run first:
+
+    engine = RetentionEngine(db_path)
+    print(engine.report().format())   # rows and bytes each policy would reclaim
+    engine.run(max_seconds=60)
+
+The bot schedules it from the session start (`start_background_retention`), at most once
+per interval across every process (the last start is a row of `retention_state`, not a
+module global: each workflow is its own process). Nothing is deleted there until the
+operator enables it in the automation config; until then the scheduled run is a dry run
+that only logs what it would reclaim.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from ..repositories.instagram.stats.stats_repository import StatsRepository
+from .blob_store import BlobStore
+
+log = logger.bind(module="local-db-retention")
+
+AUTO_VACUUM_INCREMENTAL = 2
+
+# interaction_type -> daily_stats_unified column, per platform: the same mapping the
+# live counters use (`StatsRepository` for Instagram, the TikTok stats repository).
+_ROLLUP_COLUMNS: Dict[str, Dict[str, str]] = {
+    'instagram': StatsRepository._INTERACTION_COLUMN_MAP,
+    'tiktok': {
+        'LIKE': 'total_likes',
+        'FOLLOW': 'total_follows',
+        'FAVORITE': 'total_favorites',
+        'COMMENT': 'total_comments',
+        'SHARE': 'total_shares',
+        'PROFILE_VISIT': 'total_profile_visits',
+        'POST_WATCH': 'total_posts_watched',
+    },
+}
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Which rows of one table expire, and what happens to them."""
+
+    name: str
+    table: str
+    time_column: str
+    max_age_days: Optional[int] = None
+    keep_latest: Optional[int] = None
+    partition_by: Optional[str] = None
+    # SQL predicate the candidates must ALSO match (what must never expire is excluded here).
+    extra_where: Optional[str] = None
+    clear_column: Optional[str] = None
+    releases_blob_refs: bool = False
+    rollup: bool = False
+
+    def where_clause(self, ranked: bool = True) -> Tuple[str, tuple]:
+        """(predicate, params) selecting the expired rows of `table`.
+
+        `ranked=False` leaves out the `keep_latest` window: the cheap per-row part, used to
+        re-check candidates whose rank was computed once for the whole run.
+        """
+        clauses: List[str] = []
+        params: list = []
+        if self.max_age_days is not None:
+            clauses.append(f"{self.time_column} < datetime('now', ?)")
+            params.append(f"-{int(self.max_age_days)} days")
+        if self.keep_latest is not None and ranked:
+            clauses.append(
+                f"rowid IN (SELECT rid FROM (SELECT rowid AS rid, ROW_NUMBER() OVER ("
+                f"PARTITION BY {self.partition_by} ORDER BY {self.time_column} DESC, rowid DESC) AS rn "
+                f"FROM {self.table}) WHERE rn > ?)"
+            )
+            params.append(int(self.keep_latest))
+        if self.extra_where:
+            clauses.append(f"({self.extra_where})")
+        if self.clear_column:
+            clauses.append(f"{self.clear_column} IS NOT NULL")
+        if not clauses:
+            if not ranked:
+                return "1", tuple(params)
+            raise ValueError(f"retention policy {self.name!r} selects every row")
+        return " AND ".join(clauses), tuple(params)
+
+
+# Opt-in only: an operator who filters permanently reads these rows with no expiry, and
+# deleting one would silently let the profile back in. Pass it explicitly when the
+# account's filters expire anyway (`filtered_max_age_days` of the revisit policy shorter
+# than the age below).
+FILTERED_PROFILES_POLICY = RetentionPolicy(
+    name="filtered_profiles",
+    table="filtered_profiles",
+    time_column="filtered_at",
+    max_age_days=730,
+)
+
+DEFAULT_POLICIES: Tuple[RetentionPolicy, ...] = (
+    RetentionPolicy(
+        name="interactions",
+        table="interactions",
+        time_column="interaction_time",
+        max_age_days=400,
+        extra_where="NOT (interaction_type = 'FOLLOW' AND success = 1)",
+        rollup=True,
+    ),
+    RetentionPolicy(
+        name="profile_stats_history",
+        table="profile_stats_history",
+        time_column="recorded_at",
+        max_age_days=90,
+        keep_latest=20,
+        partition_by="profile_id",
+    ),
+    RetentionPolicy(
+        name="feed_ad_screenshots",
+        table="feed_ads",
+        time_column="last_seen_at",
+        max_age_days=90,
+        extra_where="ai_analyzed_at IS NOT NULL",
+        clear_column="screenshot",
+    ),
+    RetentionPolicy(
+        name="feed_ad_screenshot_blobs",
+        table="feed_ads",
+        time_column="last_seen_at",
+        max_age_days=90,
+        extra_where="ai_analyzed_at IS NOT NULL",
+        clear_column="screenshot_blob",
+        releases_blob_refs=True,
+    ),
+    RetentionPolicy(
+        name="dm_messages",
+        table="dm_messages",
+        time_column="sent_at",
+        max_age_days=180,
+        keep_latest=500,
+        partition_by="thread_sync_id",
+    ),
+    RetentionPolicy(
+        name="media_captures",
+        table="media_captures",
+        time_column="updated_at",
+        max_age_days=60,
+    ),
+    RetentionPolicy(
+        name="scraping_checkpoints",
+        table="scraping_checkpoints",
+        time_column="updated_at",
+        max_age_days=30,
+    ),
+    RetentionPolicy(
+        name="selector_hit_rates",
+        table="selector_hit_rates",
+        time_column="updated_at",
+        max_age_days=90,
+    ),
+    RetentionPolicy(
+        name="source_yields",
+        table="source_yields",
+        time_column="updated_at",
+        max_age_days=90,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class PolicyEstimate:
+    policy: RetentionPolicy
+    rows: int
+    bytes: int
+
+
+@dataclass(frozen=True)
+class RetentionReport:
+    """Dry-run result: what `run()` would remove, and what the freelist already holds."""
+
+    estimates: Tuple[PolicyEstimate, ...]
+    page_size: int
+    freelist_pages: int
+    auto_vacuum: int
+
+    @property
+    def reclaimable_bytes(self) -> int:
+        return sum(e.bytes for e in self.estimates) + self.freelist_bytes
+
+    @property
+    def freelist_bytes(self) -> int:
+        return self.page_size * self.freelist_pages
+
+    def format(self) -> str:
+        lines = ["Retention dry-run (nothing deleted):"]
+        for estimate in self.estimates:
+            action = "clear" if estimate.policy.clear_column else "delete"
+            lines.append(
+                f"  {estimate.policy.name:<24} {action:<6} {estimate.rows:>10} row(s) ~{_mib(estimate.bytes)}"
+            )
+        lines.append(f"  {'freelist':<24} {'':<6} {self.freelist_pages:>10} page(s) {_mib(self.freelist_bytes)}")
+        lines.append(f"  reclaimable: ~{_mib(self.reclaimable_bytes)}")
+        if self.auto_vacuum != AUTO_VACUUM_INCREMENTAL:
+            lines.append(
+                "  auto_vacuum is not INCREMENTAL: freed pages are reused by SQLite but the "
+                "file will not shrink until the base is converted (enable_incremental_vacuum)."
+            )
+        return "\n".join(lines)
+
+
+@dataclass
+class RetentionRun:
+    """What one `run()` did; `complete` is False when it stopped on its budget or a lock."""
+
+    affected: Dict[str, int] = field(default_factory=dict)
+    rolled_up_days: int = 0
+    vacuumed_pages: int = 0
+    blob_files_removed: int = 0
+    complete: bool = True
+
+
+def _mib(n_bytes: int) -> str:
+    return f"{n_bytes / (1024 * 1024):.1f} MiB"
+
+
+def _is_lock_error(exc: sqlite3.OperationalError) -> bool:
+    message = str(exc).lower()
+    return "locked" in message or "busy" in message
+
+
+class RetentionEngine:
+    """Applies `policies` to the base at `db_path`, a small transaction at a time."""
+
+    def __init__(
+        self,
+        db_path: str,
+        policies: Sequence[RetentionPolicy] = DEFAULT_POLICIES,
+        *,
+        batch_size: int = 500,
+        pause_seconds: float = 0.05,
+        busy_timeout: float = 2.0,
+        vacuum_pages: int = 256,
+        blob_store: Optional[BlobStore] = None,
+    ):
+        self.db_path = db_path
+        self.policies = tuple(policies)
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.busy_timeout = busy_timeout
+        self.vacuum_pages = vacuum_pages
+        self.blob_store = blob_store if blob_store is not None else BlobStore.for_database(db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone() is not None
+
+    # ------------------------------------------------------------------
+    # Dry run
+    # ------------------------------------------------------------------
+
+    def report(self) -> RetentionReport:
+        """Rows and payload bytes each policy would reclaim. Read-only."""
+        conn = self._connect()
+        try:
+            estimates = []
+            for policy in self.policies:
+                if not self._table_exists(conn, policy.table):
+                    continue
+                where, params = policy.where_clause()
+                if policy.releases_blob_refs:
+                    size = f"(SELECT size FROM blob_refs WHERE digest = {policy.clear_column})"
+                elif policy.clear_column:
+                    size = f"length({policy.clear_column})"
+                else:
+                    columns = [row[1] for row in conn.execute(f"PRAGMA table_info({policy.table})")]
+                    size = " + ".join(f"COALESCE(length({c}), 0)" for c in columns)
+                rows, n_bytes = conn.execute(
+                    f"SELECT COUNT(*), COALESCE(SUM({size}), 0) FROM {policy.table} WHERE {where}", params
+                ).fetchone()
+                estimates.append(PolicyEstimate(policy, int(rows), int(n_bytes)))
+            return RetentionReport(
+                estimates=tuple(estimates),
+                page_size=conn.execute("PRAGMA page_size").fetchone()[0],
+                freelist_pages=conn.execute("PRAGMA freelist_count").fetchone()[0],
+                auto_vacuum=conn.execute("PRAGMA auto_vacuum").fetchone()[0],
+            )
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Apply
+    # ------------------------------------------------------------------
+
+    def run(self, max_seconds: float = 60.0, *, dry_run: bool = False) -> RetentionRun:
+        """Apply every policy until done or `max_seconds` elapse, then vacuum a step.
+
+        `dry_run=True` writes nothing: `affected` holds the rows each policy would remove
+        or clear (`report()`), and no roll-up, blob collection or vacuum runs.
+        """
+        if dry_run:
+            report = self.report()
+            log.info("\n{}", report.format())
+            return RetentionRun(affected={e.policy.name: e.rows for e in report.estimates})
+        deadline = time.monotonic() + max_seconds
+        result = RetentionRun()
+        conn = self._connect()
+        try:
+            for policy in self.policies:
+                if not self._table_exists(conn, policy.table):
+                    continue
+                if policy.rollup:
+                    result.rolled_up_days += self._rollup(conn, policy, deadline)
+                done, count = self._apply(conn, policy, deadline)
+                result.affected[policy.name] = count
+                if not done:
+                    result.complete = False
+                    break
+            if self._table_exists(conn, "blob_refs"):
+                result.blob_files_removed = self.blob_store.collect_garbage(conn)[0]
+            if time.monotonic() < deadline:
+                result.vacuumed_pages = self._vacuum(conn, deadline)
+        except sqlite3.OperationalError as exc:
+            if not _is_lock_error(exc):
+                raise
+            log.info("Retention paused, base busy: {}", exc)
+            result.complete = False
+        finally:
+            conn.close()
+        log.info(
+            "Retention run: {} | {} day(s) rolled up, {} blob file(s) and {} page(s) freed{}",
+            ", ".join(f"{name}={count}" for name, count in result.affected.items()) or "nothing to do",
+            result.rolled_up_days, result.blob_files_removed, result.vacuumed_pages,
+            "" if result.complete else " (partial)",
+        )
+        return result
+
+    def _apply(self, conn: sqlite3.Connection, policy: RetentionPolicy, deadline: float) -> Tuple[bool, int]:
+        """Delete / clear the candidates batch by batch. (finished, rows affected)."""
+        where, params = policy.where_clause()
+        if policy.keep_latest is not None:
+            return self._apply_ranked(conn, policy, where, params, deadline)
+        select = f"SELECT rowid FROM {policy.table} WHERE {where} LIMIT ?"
+        total = 0
+        while True:
+            if time.monotonic() >= deadline:
+                return False, total
+            rowids = [row[0] for row in conn.execute(select, (*params, self.batch_size))]
+            if not rowids:
+                return True, total
+            self._expire_rowids(conn, policy, rowids)
+            total += len(rowids)
+            if len(rowids) < self.batch_size:
+                return True, total
+            time.sleep(self.pause_seconds)
+
+    def _apply_ranked(
+        self, conn: sqlite3.Connection, policy: RetentionPolicy, where: str, params: tuple, deadline: float
+    ) -> Tuple[bool, int]:
+        """`keep_latest` policies: rank the table ONCE, then expire the candidates in batches.
+
+        The ROW_NUMBER window sorts the whole table; re-running it for every batch made a
+        large trim quadratic. Rows written meanwhile are newer, so they only push the
+        candidates further outside the newest N; the cheap part of the predicate is still
+        re-checked at delete time.
+        """
+        candidates = [row[0] for row in conn.execute(f"SELECT rowid FROM {policy.table} WHERE {where}", params)]
+        recheck = policy.where_clause(ranked=False)
+        total = 0
+        for start in range(0, len(candidates), self.batch_size):
+            if time.monotonic() >= deadline:
+                return False, total
+            if start:
+                time.sleep(self.pause_seconds)
+            total += self._expire_rowids(conn, policy, candidates[start:start + self.batch_size], recheck)
+        return True, total
+
+    @staticmethod
+    def _expire_rowids(
+        conn: sqlite3.Connection,
+        policy: RetentionPolicy,
+        rowids: List[int],
+        recheck: Tuple[str, tuple] = ("1", ()),
+    ) -> int:
+        """Delete / clear one batch of rowids in one transaction; returns the rows affected."""
+        marks = ",".join("?" * len(rowids))
+        condition = f"rowid IN ({marks}) AND {recheck[0]}"
+        args = (*rowids, *recheck[1])
+        with conn:
+            if policy.releases_blob_refs:
+                for (digest,) in conn.execute(
+                    f"SELECT {policy.clear_column} FROM {policy.table} WHERE {condition}", args
+                ).fetchall():
+                    BlobStore.decref(conn, digest)
+            if policy.clear_column:
+                cursor = conn.execute(
+                    f"UPDATE {policy.table} SET {policy.clear_column} = NULL WHERE {condition}", args
+                )
+            else:
+                cursor = conn.execute(f"DELETE FROM {policy.table} WHERE {condition}", args)
+        return max(cursor.rowcount, 0)
+
+    def _rollup(self, conn: sqlite3.Connection, policy: RetentionPolicy, deadline: float) -> int:
+        """Give every expiring day without a daily_stats_unified row one, from its detail rows."""
+        where, params = policy.where_clause()
+        # Days are local, like the live counters (`datetime.now()` date).
+        days = conn.execute(
+            f"""
+            SELECT DISTINCT i.platform, i.account_id, date(i.interaction_time, 'localtime') AS day
+            FROM interactions i
+            WHERE {where} AND i.account_id IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM daily_stats_unified d
+                  WHERE d.platform = i.platform AND d.account_id = i.account_id
+                    AND d.date = date(i.interaction_time, 'localtime')
+              )
+            ORDER BY day
+            """,
+            params,
+        ).fetchall()
+
+        inserted = 0
+        for start in range(0, len(days), 30):
+            if time.monotonic() >= deadline:
+                break
+            with conn:
+                for platform, account_id, day in days[start:start + 30]:
+                    inserted += self._rollup_day(conn, platform, account_id, day)
+            time.sleep(self.pause_seconds)
+        return inserted
+
+    @staticmethod
+    def _rollup_day(conn: sqlite3.Connection, platform: str, account_id: int, day: str) -> int:
+        column_map = _ROLLUP_COLUMNS.get(platform, {})
+        by_column: Dict[str, List[str]] = {}
+        for interaction_type, column in column_map.items():
+            by_column.setdefault(column, []).append(interaction_type)
+        if not by_column:
+            return 0
+        columns = list(by_column)
+        sums = ", ".join(
+            "SUM(CASE WHEN interaction_type IN ({}) THEN 1 ELSE 0 END)".format(
+                ", ".join(f"'{t}'" for t in by_column[column])
+            )
+            for column in columns
+        )
+        # The UTC window (a day either side) lets the interaction_time index do the
+        # narrowing; the localtime date picks the exact day inside it.
+        cursor = conn.execute(
+            f"""
+            INSERT INTO daily_stats_unified (platform, account_id, date, {", ".join(columns)})
+            SELECT ?, ?, ?, {sums}
+            FROM interactions
+            WHERE platform = ? AND account_id = ?
+              AND interaction_time >= datetime(?, '-1 day') AND interaction_time < datetime(?, '+2 days')
+              AND date(interaction_time, 'localtime') = ?
+            ON CONFLICT(platform, account_id, date) DO NOTHING
+            """,
+            (platform, account_id, day, platform, account_id, day, day, day),
+        )
+        return cursor.rowcount if cursor.rowcount > 0 else 0
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def _vacuum(self, conn: sqlite3.Connection, deadline: float) -> int:
+        """Return freelist pages to the filesystem, `vacuum_pages` per step (INCREMENTAL bases only)."""
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+            return 0
+        released = 0
+        while time.monotonic() < deadline:
+            before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if before == 0:
+                break
+            conn.execute(f"PRAGMA incremental_vacuum({int(self.vacuum_pages)})").fetchall()
+            after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            released += before - after
+            if after >= before:
+                break
+            time.sleep(self.pause_seconds)
+        return released
+
+    def vacuum_step(self) -> int:
+        """One scheduled compaction step outside `run()`; returns the pages released."""
+        conn = self._connect()
+        try:
+            return self._vacuum(conn, time.monotonic() + self.busy_timeout)
+        finally:
+            conn.close()
+
+
+def enable_incremental_vacuum(db_path: str) -> None:
+    """Convert an existing base to `auto_vacuum=INCREMENTAL`.
+
+    Needs a full VACUUM (the whole file is rewritten, under an exclusive lock): run it
+    while neither the bot nor Electron has the base open.
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+
+_STATE_TABLE_SQL = (
+    "CREATE TABLE IF NOT EXISTS retention_state ("
+    "name TEXT PRIMARY KEY, last_started_at TEXT NOT NULL)"
+)
+
+
+def _claim_scheduled_run(db_path: str, name: str, min_interval_hours: float, busy_timeout: float) -> bool:
+    """Record a start of `name` unless one is on record within the interval (any process).
+
+    The check and the write share one IMMEDIATE transaction, so two bots starting together
+    cannot both claim it. A busy base gives the run up; the next session tries again.
+    """
+    conn = sqlite3.connect(db_path, timeout=busy_timeout, isolation_level=None)
+    try:
+        conn.execute(_STATE_TABLE_SQL)
+        conn.execute("BEGIN IMMEDIATE")
+        recent = conn.execute(
+            "SELECT 1 FROM retention_state WHERE name = ? AND last_started_at > datetime('now', ?)",
+            (name, f"-{int(min_interval_hours * 3600)} seconds"),
+        ).fetchone()
+        if recent is None:
+            conn.execute(
+                "INSERT INTO retention_state (name, last_started_at) VALUES (?, datetime('now')) "
+                "ON CONFLICT(name) DO UPDATE SET last_started_at = excluded.last_started_at",
+                (name,),
+            )
+        conn.execute("COMMIT")
+        return recent is None
+    except sqlite3.OperationalError as exc:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        log.info("Retention not scheduled, base busy: {}", exc)
+        return False
+    finally:
+        conn.close()
+
+
+def _scheduled_policies(settings: Dict) -> Tuple[RetentionPolicy, ...]:
+    """The policies `settings["policies"]` names (all defaults when absent)."""
+    names = settings.get("policies")
+    if not names:
+        return DEFAULT_POLICIES
+    known = {policy.name: policy for policy in (*DEFAULT_POLICIES, FILTERED_PROFILES_POLICY)}
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        log.warning("Unknown retention policies ignored: {}", ", ".join(unknown))
+    return tuple(known[name] for name in names if name in known)
+
+
+def start_background_retention(
+    db_path: str,
+    settings: Optional[Dict] = None,
+    *,
+    min_interval_hours: float = 24.0,
+    max_seconds: float = 60.0,
+    busy_timeout: float = 2.0,
+) -> Optional[threading.Thread]:
+    """Run the retention policies in a daemon thread, at most once per `min_interval_hours`.
+
+    `settings` is the automation config's `database_retention` block: `{"enabled": true}`
+    lets the run delete, `"dry_run": true` keeps it reporting anyway, and `"policies"`
+    restricts it to the named policies. Absent or disabled, the run is a dry run. Dry runs
+    and real runs are scheduled independently, so enabling it is not delayed by the last
+    report. Returns the thread, or None when a run of that kind already started within the
+    interval.
+    """
+    settings = settings if isinstance(settings, dict) else {}
+    dry_run = not settings.get("enabled") or bool(settings.get("dry_run"))
+    name = "background_dry_run" if dry_run else "background"
+    if not _claim_scheduled_run(db_path, name, min_interval_hours, busy_timeout):
+        return None
+    policies = _scheduled_policies(settings)
+
+    def _work():
+        try:
+            if not dry_run:
+                from taktik.core.database.instagram_feed_ads import InstagramFeedAdsService
+
+                # Rows from before the blob store give their inline screenshots up first.
+                InstagramFeedAdsService.externalize_screenshots()
+            RetentionEngine(db_path, policies, busy_timeout=busy_timeout).run(
+                max_seconds=max_seconds, dry_run=dry_run
+            )
+        except Exception as exc:
+            log.warning("Retention run failed: {}", exc)
+
+    thread = threading.Thread(target=_work, name="local-db-retention", daemon=True)
+    thread.start()
+    return thread
+
+
+__all__ = [
+    "RetentionPolicy",
+    "DEFAULT_POLICIES",
+    "FILTERED_PROFILES_POLICY",
+    "PolicyEstimate",
+    "RetentionReport",
+    "RetentionRun",
+    "RetentionEngine",
+    "enable_incremental_vacuum",
+    "start_background_retention",
+]
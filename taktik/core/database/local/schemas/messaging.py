@@ -4,6 +4,7 @@ Owner: messaging domain. Source of truth = the Bot (it reads/sends DMs).
 Two tables:
   - ``dm_threads``  : one row per conversation (our account x interlocutor).
   - ``dm_messages`` : the messages of those conversations (append-only).
+Plus ``dm_inbox_fingerprints``, the reader's delta-sync bookkeeping (LOCAL, not Turso-synced).
 
 The shape mirrors the shared spec ``internal docs``
 and must stay aligned with the Electron mirror (``taktik-bot/app/electron/database``) since
@@ -69,6 +70,23 @@ def create_messaging_tables(cursor: sqlite3.Cursor) -> None:
         """
     )
 
+    # Delta sync: the fingerprint of each thread's inbox row (partner + preview + time) as
+    # last seen with its messages on record. A row that still shows the same fingerprint has
+    # no new activity, so the reader skips opening it. LOCAL, not Turso-synced: one row per
+    # inbox thread, keyed by the inbox-row username (lowercased).
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS dm_inbox_fingerprints (
+            platform TEXT NOT NULL DEFAULT 'instagram',
+            account_id INTEGER NOT NULL,            -- accounts.legacy_account_id (our account)
+            inbox_key TEXT NOT NULL,                -- inbox-row username, lowercased
+            fingerprint TEXT NOT NULL,
+            updated_at TEXT DEFAULT (datetime('now')),
+            PRIMARY KEY (platform, account_id, inbox_key)
+        )
+        """
+    )
+
 
 def create_messaging_indexes(cursor: sqlite3.Cursor) -> None:
     """Create supporting indexes for the DM tables."""
@@ -70,6 +70,21 @@ def create_notifications_tables(cursor: sqlite3.Cursor) -> None:
         )
         """
     )
+    # High-water mark of the incremental scan: the stable hashes of the NEWEST rows the
+    # last scan read, top first. The feed is newest-first, so a scan that meets one of
+    # them has read everything new. Several, not one: the top row can vanish (grouped,
+    # deleted) between two polls. LOCAL, not Turso-synced: one row per account.
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS notification_scan_marks (
+            platform TEXT NOT NULL DEFAULT 'instagram',
+            account_id INTEGER NOT NULL,            -- accounts.legacy_account_id (our account)
+            head_hashes TEXT NOT NULL,              -- JSON list of notifications.content_hash, newest first
+            updated_at TEXT DEFAULT (datetime('now')),
+            PRIMARY KEY (platform, account_id)
+        )
+        """
+    )
 
 
 def create_notifications_indexes(cursor: sqlite3.Cursor) -> None:
@@ -8,7 +8,7 @@ import sqlite3
 import os
 import json
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from pathlib import Path
 from loguru import logger
 
@@ -37,6 +37,17 @@ _redact_sensitive = BaseRepository._redact_sensitive
 # Schema DDL and incremental migrations live in their own modules
 from .schema import create_schema
 from .migrations import run_migrations
+from ..target_decision_cache import get_target_decision_cache
+
+# Applied to every connection the service opens on the base (raw sqlite3 and the
+# pinned ORM read connection alike). auto_vacuum only takes effect on a base that has
+# no table yet: new bases are created INCREMENTAL so retention can give pages back
+# (see local/retention.py); on an existing base it is a no-op.
+CONNECTION_PRAGMAS = (
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",
+)
 
 
 class LocalDatabaseService:
@@ -116,7 +127,9 @@ class LocalDatabaseService:
             from taktik.core.database.orm.entities import Account
             from sqlalchemy.orm import Session as _Session
 
-            engine = create_orm_engine(self.db_path)
+            # Pinned: one persistent connection with the raw connection's PRAGMAs, so an
+            # ORM-first read costs a cached statement, not a connection open.
+            engine = create_orm_engine(self.db_path, pinned=True, pragmas=CONNECTION_PRAGMAS)
             with _Session(engine) as session:
                 count = session.query(Account).count()  # boot self-check (read live DB)
             self._orm_engine = engine
@@ -258,9 +271,9 @@ class LocalDatabaseService:
                 check_same_thread=False
             )
             self._connection.row_factory = sqlite3.Row
-            # Enable WAL mode for better concurrency with Electron
-            self._connection.execute("PRAGMA journal_mode=WAL")
-            self._connection.execute("PRAGMA foreign_keys=ON")
+            # WAL for better concurrency with Electron, foreign keys on
+            for pragma in CONNECTION_PRAGMAS:
+                self._connection.execute(pragma)
         return self._connection
     
     def _create_tables(self) -> None:
@@ -378,15 +391,61 @@ class LocalDatabaseService:
                 interaction_time=interaction_time
             )
             self.stats.increment_interaction(account_id, interaction_type)
+            cache = get_target_decision_cache(account_id)
+            if cache is not None and interaction_id is not None:
+                cache.note_interaction(target_username, interaction_type, success, interaction_time)
             logger.debug(f"Recorded {interaction_type} on {target_username}")
             return interaction_id is not None
         except Exception as e:
             logger.error(f"Error recording interaction: {e}")
             return False
     
+    def record_interactions(self, account_id: int, target_username: str,
+                            interaction_type: str, interaction_times: List[Optional[str]],
+                            success: bool = True,
+                            content: Optional[str] = None,
+                            session_id: Optional[int] = None) -> int:
+        """Record N identical interactions with one profile in a single transaction.
+
+        The batched form of `record_interaction` for a profile's likes / stories: the
+        profile is resolved once, the rows go in as one executemany and the daily stats
+        counter is bumped once by N, all committed together (or not at all).
+        Returns the number of rows recorded (0 on failure)."""
+        if not interaction_times:
+            return 0
+        try:
+            profile_id, _ = self.get_or_create_profile({'username': target_username})
+            conn = self._get_connection()
+            with conn:
+                inserted = self.interactions.record_many(
+                    account_id=account_id,
+                    profile_id=profile_id,
+                    interaction_type=interaction_type,
+                    interaction_times=interaction_times,
+                    success=success,
+                    content=content,
+                    session_id=session_id,
+                    commit=False,
+                )
+                self.stats.increment_interaction(
+                    account_id, interaction_type, amount=inserted, commit=False
+                )
+            cache = get_target_decision_cache(account_id)
+            if cache is not None:
+                for interaction_time in interaction_times[:inserted]:
+                    cache.note_interaction(target_username, interaction_type, success, interaction_time)
+            logger.debug(f"Recorded {inserted}x {interaction_type} on {target_username}")
+            return inserted
+        except Exception as e:
+            logger.error(f"Error recording interactions: {e}")
+            return 0
+
     def check_recent_interaction(self, target_username: str, account_id: int, 
                                   days: int = 7) -> bool:
         """Check if there was a recent interaction with a profile."""
+        cache = get_target_decision_cache(account_id)
+        if cache is not None:
+            return cache.has_recent_interaction(target_username, days)
         profile = self.get_profile_by_username(target_username)
         if not profile:
             return False
@@ -463,6 +522,9 @@ class LocalDatabaseService:
                 source_name=source_name,
                 session_id=session_id
             )
+            cache = get_target_decision_cache(account_id)
+            if cache is not None and result:
+                cache.note_filtered(username)
             logger.debug(f"Recorded filtered profile: {username} ({reason})")
             return result
         except Exception as e:
@@ -682,6 +744,45 @@ class LocalDatabaseService:
         """
         return self.scraped_profiles.link_profile_to_session(scraping_id, profile_id, source_post_url)
 
+    def save_scraping_batch(self, scraping_id: Optional[int], total_scraped: int,
+                            links: List[Tuple[int, Optional[str]]],
+                            checkpoint: Optional[Tuple[str, str, str]] = None) -> bool:
+        """Persist one batch of a streaming scrape in ONE transaction.
+
+        Links the batch's `(profile_id, source_post_url)` rows to the session, moves the
+        session count and, when given, overwrites the list's `(source_type, source_name,
+        payload)` resume point. Either all of it lands or none of it does, so a resume
+        point never runs ahead of the links it describes.
+        """
+        conn = self._get_connection()
+        try:
+            if scraping_id:
+                self.scraped_profiles.link_profile_batch(scraping_id, links, commit=False)
+                conn.execute(
+                    "UPDATE scraping_sessions SET total_scraped = ? WHERE scraping_id = ?",
+                    (total_scraped, scraping_id),
+                )
+            if checkpoint is not None:
+                source_type, source_name, payload = checkpoint
+                if not self._scraping_sessions.save_checkpoint(
+                    source_type, source_name, payload, scraping_id, commit=False,
+                ):
+                    raise RuntimeError("checkpoint not written")
+            conn.commit()
+            return True
+        except Exception as e:
+            conn.rollback()
+            logger.debug(f"Error saving scraping batch for session {scraping_id}: {e}")
+            return False
+
+    def get_scraping_checkpoint(self, source_type: str, source_name: str) -> Optional[str]:
+        """The resume point (JSON) of a list scrape that did not reach its end, if any."""
+        return self._scraping_sessions.get_checkpoint(source_type, source_name)
+
+    def clear_scraping_checkpoint(self, source_type: str, source_name: str) -> bool:
+        """Forget a list's resume point once it was walked to its end."""
+        return self._scraping_sessions.clear_checkpoint(source_type, source_name)
+
     def is_post_url_already_scraped(self, post_url: str) -> bool:
         """Check if likers from this Instagram post URL were already scraped in any session.
 
@@ -756,7 +857,8 @@ class LocalDatabaseService:
         hashtag: str, 
         post_author: str, 
         post_caption_hash: Optional[str] = None,
-        hours_limit: int = 168  # 7 days default
+        hours_limit: int = 168,  # 7 days default
+        post_ref: Optional[str] = None,
     ) -> bool:
         """
         Check if a hashtag post has already been processed.
@@ -767,6 +869,7 @@ class LocalDatabaseService:
             post_author: Username of the post author
             post_caption_hash: Hash of the caption (first 100 chars)
             hours_limit: Only consider posts processed within this time window
+            post_ref: `build_post_ref` of the post, matched when the caption hash is unknown
             
         Returns:
             True if post was already processed
@@ -777,8 +880,24 @@ class LocalDatabaseService:
             post_author=post_author,
             post_caption_hash=post_caption_hash,
             hours_limit=hours_limit,
+            post_ref=post_ref,
         )
     
+    def iter_processed_hashtag_posts(
+        self,
+        account_id: int,
+        hashtags: List[str],
+        hours_limit: int = 168,
+    ) -> Iterator[Tuple[str, str, Optional[str], Optional[str]]]:
+        """`(hashtag, post_author, post_caption_hash, post_caption_preview)` of the posts
+        processed within the window for all ``hashtags``, streamed from one query.
+        Raises on a database error."""
+        return self._processed_hashtag_posts.iter_processed(
+            account_id=account_id,
+            hashtags=hashtags,
+            hours_limit=hours_limit,
+        )
+
     def record_processed_hashtag_post(
         self,
         account_id: int,
@@ -0,0 +1,150 @@
+"""Database facade for the profiles and media captured off the wire by the mitm proxy.
+
+The capture service (`instagram/media/capture`) only keeps a bounded window of recent
+captures in memory; everything it sees is streamed here in batches by its
+`CaptureBatchWriter`, so a long session costs rows, not RAM. `save_batch` upserts on
+(kind, key) in ONE transaction per batch - the write lock is taken once per fifty
+captures, not once per message.
+
+The record travels as its compact JSON in `payload`; callers get the dict back and
+rebuild whatever type they need. Rows carry the `session_id` of the capture run that
+last wrote them, and the reads take it to stay within that run.
+
+The batches are written from the proxy reader thread, so the archive has its own
+connection to the base, serialized by a lock: a `with conn:` on the service's shared
+connection would commit (or roll back) whatever another thread had in flight on it.
+
+Never raises. A capture is a by-product of the run; it must not be able to cost it.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+log = logger.bind(module="database-media-captures")
+
+# (kind, key, username, record dict)
+CaptureRow = Tuple[str, str, Optional[str], Dict[str, Any]]
+
+
+class MediaCaptureArchive:
+    """Read/write side of the `media_captures` table."""
+
+    _lock = threading.Lock()
+    _conn: Optional[sqlite3.Connection] = None
+    _conn_path: Optional[str] = None
+
+    @staticmethod
+    def _db():
+        from taktik.core.database.local.service import get_local_database
+
+        return get_local_database()
+
+    @classmethod
+    def _connection(cls) -> sqlite3.Connection:
+        """The archive's own connection to the base (call with `_lock` held)."""
+        db_path = cls._db().db_path
+        if cls._conn is None or cls._conn_path != db_path:
+            from taktik.core.database.local.service import CONNECTION_PRAGMAS
+
+            if cls._conn is not None:
+                cls._conn.close()
+            conn = sqlite3.connect(db_path, timeout=30.0, check_same_thread=False)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            cls._conn, cls._conn_path = conn, db_path
+        return cls._conn
+
+    @classmethod
+    def close(cls) -> None:
+        """Close the archive's connection; the next call opens a new one."""
+        with cls._lock:
+            if cls._conn is not None:
+                cls._conn.close()
+            cls._conn = cls._conn_path = None
+
+    @staticmethod
+    def save_batch(rows: Iterable[CaptureRow], session_id: Optional[str] = None) -> int:
+        """Upsert a batch of captures in one transaction. Returns the number written (0 on failure)."""
+        params = [
+            (
+                kind,
+                key,
+                username,
+                session_id,
+                json.dumps(record, ensure_ascii=False, separators=(",", ":")),
+                record.get("captured_at"),
+            )
+            for kind, key, username, record in rows
+            if kind and key
+        ]
+        if not params:
+            return 0
+        try:
+            with MediaCaptureArchive._lock:
+                conn = MediaCaptureArchive._connection()
+                with conn:
+                    conn.executemany(
+                        """
+                        INSERT INTO media_captures (kind, capture_key, username, session_id, payload, captured_at)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(kind, capture_key) DO UPDATE SET
+                            username = COALESCE(excluded.username, media_captures.username),
+                            session_id = excluded.session_id,
+                            payload = excluded.payload,
+                            captured_at = excluded.captured_at,
+                            updated_at = datetime('now')
+                        """,
+                        params,
+                    )
+            return len(params)
+        except Exception as exc:
+            log.debug(f"Could not save {len(params)} capture(s): {exc}")
+            return 0
+
+    @staticmethod
+    def get(kind: str, key: str, session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """The archived record of one capture (written by `session_id` when given), or None."""
+        sql = "SELECT payload FROM media_captures WHERE kind = ? AND capture_key = ?"
+        params: Tuple[Any, ...] = (kind, key)
+        if session_id is not None:
+            sql += " AND session_id = ?"
+            params += (session_id,)
+        try:
+            with MediaCaptureArchive._lock:
+                row = MediaCaptureArchive._connection().execute(sql, params).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as exc:
+            log.debug(f"Could not read capture {kind}:{key}: {exc}")
+            return None
+
+    @staticmethod
+    def by_username(
+        username: str, kind: str = "media", limit: int = 500, session_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Archived records of one kind for a username (of `session_id` when given), most recent first."""
+        session_clause = "" if session_id is None else "AND session_id = ?"
+        params: Tuple[Any, ...] = (username, kind) + (() if session_id is None else (session_id,))
+        try:
+            with MediaCaptureArchive._lock:
+                rows = MediaCaptureArchive._connection().execute(
+                    f"""
+                    SELECT payload FROM media_captures
+                    WHERE username = ? AND kind = ? {session_clause}
+                    ORDER BY updated_at DESC, id DESC
+                    LIMIT ?
+                    """,
+                    params + (limit,),
+                ).fetchall()
+            return [json.loads(row[0]) for row in rows]
+        except Exception as exc:
+            log.debug(f"Could not read captures of @{username}: {exc}")
+            return []
+
+
+__all__ = ["CaptureRow", "MediaCaptureArchive"]
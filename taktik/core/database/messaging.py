@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import sqlite3
 from typing import Any, Dict, List, Optional
@@ -13,9 +14,20 @@ from taktik.core.database.repositories.messaging import (
     SentDMRepository,
     DmThreadRepository,
     DmMessageRepository,
+    DmInboxFingerprintRepository,
 )
 
 
+def inbox_fingerprint(partner: str, preview: Optional[str], timestamp: Optional[str] = None) -> str:
+    """Fingerprint of a DM inbox row: partner + last-message preview + time label.
+
+    Case- and whitespace-insensitive. A new message moves the preview or the time, so an
+    unchanged fingerprint means the thread has nothing new since it was last read.
+    """
+    parts = [" ".join((value or "").lower().split()) for value in (partner, preview, timestamp)]
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:16]
+
+
 class SentDMService:
     """Compatibility service for bridge DM duplicate prevention."""
 
@@ -102,17 +114,23 @@ class DmConversationService:
         can_reply: bool = True,
         last_message_is_ours: bool = False,
         unread_count: int = 0,
+        inbox_fingerprint: Optional[str] = None,
+        delta: bool = False,
     ) -> Optional[str]:
         """Upsert a read conversation + its messages. Return the thread sync_id.
 
         ``messages`` items: {direction: 'sent'|'received', text, msg_type?, ai_model?, ai_cost_usd?}.
+        One transaction per thread: the thread row, the messages not on record yet and the
+        inbox-row ``inbox_fingerprint`` (delta sync) land together or not at all.
+        ``delta=True``: ``messages`` are only those read since the last record, so the
+        thread's ``message_count`` grows by the ones added instead of being replaced.
         """
         conn = DmConversationService._open()
         if conn is None:
             return None
         try:
             threads = DmThreadRepository(conn)
-            msg_repo = DmMessageRepository(conn)
+            threads.ensure_table()
             last = messages[-1] if messages else {}
             thread_sync_id = threads.upsert(
                 platform=platform,
@@ -127,32 +145,99 @@ class DmConversationService:
                 last_message_at=last.get("displayed_at"),
                 last_message_is_ours=last_message_is_ours,
                 unread_count=unread_count,
-                message_count=len(messages),
+                message_count=None if delta else len(messages),
+                commit=False,
             )
-            for index, message in enumerate(messages):
-                msg_repo.add_message(
-                    platform=platform,
-                    thread_sync_id=thread_sync_id,
-                    account_id=account_id,
-                    partner_username=partner_username,
-                    direction=message.get("direction", "received"),
-                    text=message.get("text"),
-                    msg_type=message.get("msg_type", "text"),
-                    seq=index,
-                    # sent_at left to its insertion-time default (sortable); the raw IG label
-                    # goes to displayed_at for display only.
-                    displayed_at=message.get("displayed_at"),
-                    ai_model=message.get("ai_model"),
-                    ai_cost_usd=message.get("ai_cost_usd"),
+            # sent_at left to its insertion-time default (sortable); the raw IG label goes to
+            # displayed_at for display only.
+            added = DmMessageRepository(conn).add_messages(
+                platform=platform,
+                thread_sync_id=thread_sync_id,
+                messages=messages,
+                account_id=account_id,
+                partner_username=partner_username,
+                commit=False,
+            )
+            if delta and added:
+                threads.add_to_message_count(thread_sync_id, added, commit=False)
+            if inbox_fingerprint:
+                DmInboxFingerprintRepository(conn).save(
+                    platform,
+                    account_id,
+                    {external_thread_id or partner_username: inbox_fingerprint},
+                    commit=False,
                 )
-            logger.info(f"Recorded DM conversation with {partner_username} ({len(messages)} messages)")
+            conn.commit()
+            logger.info(
+                f"Recorded DM conversation with {partner_username} "
+                f"({len(messages)} messages, {added} new)"
+            )
             return thread_sync_id
         except Exception as exc:
+            conn.rollback()
             logger.warning(f"Error recording DM conversation: {exc}")
             return None
         finally:
             conn.close()
 
+    @staticmethod
+    def inbox_state(platform: str, account_id: int, limit: int = 30) -> Dict[str, Dict[str, Any]]:
+        """Everything the DM reader needs to triage its inbox, loaded once per read.
+
+        Keyed by thread key (lowercased ``partner_username`` and ``external_thread_id``, the
+        keys ``thread_answer_state`` matches): ``thread_answer_state``'s dict plus the thread
+        ``sync_id`` and the stored inbox ``fingerprint`` (None when never recorded). Three
+        queries on one connection instead of four per inbox row. Empty on any error (=> every
+        thread reads as unknown and is opened, as before).
+        """
+        conn = DmConversationService._open()
+        if conn is None:
+            return {}
+        try:
+            threads = DmThreadRepository(conn).list_for_account(platform, account_id)
+            summaries = DmMessageRepository(conn).thread_summaries(platform, account_id, limit)
+            fingerprints = DmInboxFingerprintRepository(conn).get_all(platform, account_id)
+        except Exception as exc:
+            logger.warning(f"Error loading DM inbox state: {exc}")
+            return {}
+        finally:
+            conn.close()
+
+        state: Dict[str, Dict[str, Any]] = {}
+        for thread in threads:  # most recent first: the first thread to claim a key keeps it
+            summary = summaries.get(thread["sync_id"]) or {
+                "has_sent": False, "received_texts": [], "recent_texts": [], "last_direction": None,
+            }
+            for key in (thread["partner_username"], thread["external_thread_id"]):
+                key = (key or "").strip().lower()
+                if key and key not in state:
+                    state[key] = {
+                        **summary,
+                        "sync_id": thread["sync_id"],
+                        "fingerprint": fingerprints.get(key),
+                    }
+        return state
+
+    @staticmethod
+    def save_inbox_fingerprints(platform: str, account_id: int, fingerprints: Dict[str, str]) -> bool:
+        """Store ``{inbox_key: fingerprint}`` for threads found up to date without a re-read,
+        in one write. Best-effort: False on any error."""
+        if not fingerprints:
+            return False
+        conn = DmConversationService._open()
+        if conn is None:
+            return False
+        try:
+            repo = DmInboxFingerprintRepository(conn)
+            repo.ensure_table()
+            repo.save(platform, account_id, fingerprints)
+            return True
+        except Exception as exc:
+            logger.warning(f"Error saving DM inbox fingerprints: {exc}")
+            return False
+        finally:
+            conn.close()
+
     @staticmethod
     def lookup_account_id(platform: str, partner_username: str) -> Optional[int]:
         """Return the account that owns an existing thread with this interlocutor, if any."""
@@ -222,6 +307,22 @@ class DmConversationService:
         finally:
             conn.close()
 
+    @staticmethod
+    def thread_history(platform: str, thread_sync_id: str, limit: int = 30) -> List[Dict[str, Any]]:
+        """The ``limit`` newest stored messages of a thread, oldest first (``{direction, text,
+        msg_type}``): what a delta re-read, which stops at the newest message on record, puts
+        in front of the messages it read. Empty on any error."""
+        conn = DmConversationService._open()
+        if conn is None:
+            return []
+        try:
+            return DmMessageRepository(conn).recent_messages(platform, thread_sync_id, limit)
+        except Exception as exc:
+            logger.warning(f"Error reading DM thread history: {exc}")
+            return []
+        finally:
+            conn.close()
+
     @staticmethod
     def mark_thread_answered(platform: str, account_id: int, inbox_username: str) -> bool:
         """Re-assert that WE answered a thread (last_message_is_ours, can_reply=False) when an
@@ -287,4 +388,4 @@ class DmConversationService:
             conn.close()
 
 
-__all__ = ["SentDMService", "DmConversationService"]
+__all__ = ["SentDMService", "DmConversationService", "inbox_fingerprint"]
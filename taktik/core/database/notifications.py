@@ -17,6 +17,7 @@ from taktik.core.database.local.paths import get_default_database_path
 from taktik.core.database.repositories.notifications import (
     NotificationActionRepository,
     NotificationRepository,
+    NotificationScanMarkRepository,
 )
 
 
@@ -66,6 +67,39 @@ class NotificationService:
         finally:
             conn.close()
 
+    @staticmethod
+    def scan_mark(platform: str, account_id: int) -> List[str]:
+        """Hashes of the newest notifications the last scan read, newest first — the
+        incremental scan's stop condition. Best-effort: empty on any error (=> no mark,
+        the scan falls back to its full read)."""
+        conn = NotificationService._open()
+        if conn is None:
+            return []
+        try:
+            return NotificationScanMarkRepository(conn).get(platform, account_id)
+        except Exception as exc:
+            logger.warning(f"Could not load the notifications scan mark: {exc}")
+            return []
+        finally:
+            conn.close()
+
+    @staticmethod
+    def save_scan_mark(platform: str, account_id: int, hashes: List[str]) -> bool:
+        """Move the scan mark to ``hashes`` (newest first). Best-effort: False on any error."""
+        if not hashes:
+            return False
+        conn = NotificationService._open()
+        if conn is None:
+            return False
+        try:
+            NotificationScanMarkRepository(conn).save(platform, account_id, hashes)
+            return True
+        except Exception as exc:
+            logger.warning(f"Could not save the notifications scan mark: {exc}")
+            return False
+        finally:
+            conn.close()
+
     @staticmethod
     def record_notifications(
         *,
@@ -4,19 +4,62 @@ INVARIANTS (shared dual-runtime SQLite + Turso sync):
   - The ORM MAPS existing tables only. NEVER call ``Base.metadata.create_all`` -
     the schema is owned by the physical migrations. (Equivalent of TypeORM's
     ``synchronize: false`` on the front side.)
-  - Not wired into the bot runtime yet. Exercised only by the standalone parity
-    validator (``taktik-bot/core/scripts/orm_pilot/validate_app_config.py``) against a COPY
-    of the real DB.
+  - The bot runtime uses a PINNED engine (see ``create_orm_engine``) for the
+    repositories' ORM-first reads; the standalone parity validator
+    (``taktik-bot/core/scripts/orm_pilot/validate_app_config.py``) uses a plain one
+    against a COPY of the real DB.
 """
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+from typing import Iterable
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+# Prepared statements kept per connection, keyed by SQL text (sqlite3's own cache).
+# The repositories issue a few hundred distinct read statements at most.
+STATEMENT_CACHE_SIZE = 256
 
 
-def create_orm_engine(db_path: str) -> Engine:
+def create_orm_engine(db_path: str, *, pinned: bool = False, pragmas: Iterable[str] = ()) -> Engine:
     """Create a read-mapping SQLAlchemy engine over an existing SQLite file.
 
     The caller must never run DDL through this engine on the shared base.
+
+    `pinned=True` serves every checkout from ONE persistent connection (StaticPool)
+    instead of SQLAlchemy 1.4's file-SQLite default (NullPool), which opened and closed
+    a new sqlite3 connection for each read - ~1 ms per ORM-first read on the live base,
+    and the prepared-statement cache was thrown away with the connection every time.
+    Pinned, a read is a cache hit on an already-prepared statement. `pragmas` are run
+    once on that connection, so it behaves like the raw sqlite3 one it reads next to
+    (WAL, foreign keys). Like the raw connection, it is shared across threads
+    (`check_same_thread=False`); only reads go through it.
     """
-    return create_engine(f"sqlite:///{db_path}", future=False)
+    if not pinned:
+        return create_engine(f"sqlite:///{db_path}", future=False)
+
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        future=False,
+        poolclass=StaticPool,
+        # Reads only: pysqlite opens no transaction for a SELECT, nothing to roll back.
+        pool_reset_on_return=None,
+        connect_args={
+            "check_same_thread": False,
+            "timeout": 30.0,
+            "cached_statements": STATEMENT_CACHE_SIZE,
+        },
+    )
+    statements = tuple(pragmas)
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    return engine
@@ -0,0 +1,115 @@
+"""Profile avatars, kept in the blob store instead of travelling as base64.
+
+The extraction crops an avatar into a `data:image/jpeg;base64,...` URL (tens of KB). It
+used to ride along in the profile dict and be re-sent whole in every `profile_captured`
+IPC message. `store_avatar` writes the bytes once to the content-addressed blob store
+(`local/blob_store.py`) and points the profile row's `profile_pic_path` at the file, so
+the row and the IPC message only carry a path; the desktop loads the image from disk
+when it displays it.
+
+The profile row owns one reference to its avatar: replacing the avatar releases the old
+one in the same transaction, so a profile whose picture changed ten times keeps one file.
+An avatar stored for a profile that has no row yet is still returned (the IPC message
+needs it) and is reclaimed by the garbage collector once its grace period is over.
+
+Never raises: an avatar is decoration, it must not be able to cost a scrape.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from loguru import logger
+
+log = logger.bind(module="database-profile-avatars")
+
+
+class ProfileAvatarService:
+    """Write / read side of the profile avatars kept in the blob store."""
+
+    @staticmethod
+    def _db():
+        from taktik.core.database.local.service import get_local_database
+
+        return get_local_database()
+
+    @staticmethod
+    def _blobs(db):
+        from taktik.core.database.local.blob_store import get_blob_store
+
+        return get_blob_store(db.db_path)
+
+    @staticmethod
+    def store_avatar(username: str, data_url: Optional[str], platform: str = "instagram") -> Optional[str]:
+        """Store a base64 avatar and attach it to the profile row. Returns the file path.
+
+        None when `data_url` is not a base64 data URL or the store is unavailable; the
+        caller then keeps whatever it had.
+        """
+        if not username or not data_url:
+            return None
+        try:
+            db = ProfileAvatarService._db()
+            digest = ProfileAvatarService._blobs(db).put_data_url(data_url)
+            if not digest:
+                return None
+            path = str(ProfileAvatarService._blobs(db).path(digest))
+        except Exception as exc:
+            log.debug(f"Could not store avatar of @{username}: {exc}")
+            return None
+        ProfileAvatarService.attach_avatar(username, path, platform)
+        return path
+
+    @staticmethod
+    def attach_avatar(username: str, path: Optional[str], platform: str = "instagram") -> bool:
+        """Point the profile row at an avatar already in the blob store.
+
+        For a profile saved after its avatar was stored (the scrape saves the row once the
+        filters passed). Idempotent; False when there is no row or `path` is not a blob.
+        """
+        if not username or not path:
+            return False
+        try:
+            db = ProfileAvatarService._db()
+            blobs = ProfileAvatarService._blobs(db)
+            digest = blobs.digest_from_path(path)
+            if not digest or not blobs.exists(digest):
+                return False
+            conn = db._get_connection()
+            with conn:
+                row = conn.execute(
+                    "SELECT profile_pic_path FROM social_profiles WHERE platform = ? AND username = ?",
+                    (platform, username),
+                ).fetchone()
+                if row is None:
+                    return False
+                if row[0] == path:
+                    return True
+                conn.execute(
+                    "UPDATE social_profiles SET profile_pic_path = ?, updated_at = datetime('now') "
+                    "WHERE platform = ? AND username = ?",
+                    (path, platform, username),
+                )
+                blobs.incref(conn, digest, blobs.path(digest).stat().st_size)
+                # The picture it replaces loses this row's reference.
+                blobs.decref(conn, blobs.digest_from_path(row[0]))
+            return True
+        except Exception as exc:
+            log.debug(f"Could not attach avatar of @{username}: {exc}")
+            return False
+
+    @staticmethod
+    def load_avatar_data_url(path: Optional[str]) -> Optional[str]:
+        """Re-encode a stored avatar as a data URL, for a consumer that cannot read files."""
+        if not path:
+            return None
+        try:
+            db = ProfileAvatarService._db()
+            blobs = ProfileAvatarService._blobs(db)
+            return blobs.read_data_url(blobs.digest_from_path(path))
+        except Exception as exc:
+            log.debug(f"Could not load avatar {path}: {exc}")
+            return None
+
+
+__all__ = ["ProfileAvatarService"]
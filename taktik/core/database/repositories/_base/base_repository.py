@@ -41,52 +41,75 @@ class BaseRepository(ABC):
         cursor.execute(sql, params)
         return cursor.fetchone()
 
-    def _orm_rows(self, sql: str, params: Tuple) -> List[Dict[str, Any]]:
+    def _orm_rows(self, sql: str, params: Tuple, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Run the SAME ``?``-parameterised SQL through the SQLAlchemy engine's pooled
         DBAPI connection and return dict rows (column names from the cursor description,
-        so an aliased ``SELECT *, x AS y`` reproduces the raw shape exactly)."""
+        so an aliased ``SELECT *, x AS y`` reproduces the raw shape exactly).
+
+        `limit` stops fetching after that many rows: a single-row read builds one dict,
+        not one per matching row."""
         raw = self._orm_engine.raw_connection()
         try:
             cursor = raw.cursor()
             cursor.execute(sql, params)
             cols = [d[0] for d in cursor.description]
-            return [dict(zip(cols, row)) for row in cursor.fetchall()]
+            fetched = cursor.fetchall() if limit is None else cursor.fetchmany(limit)
+            return [dict(zip(cols, row)) for row in fetched]
         finally:
             raw.close()
 
+    def _orm_read(self, sql: str, params: Tuple, limit: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """ORM-path rows, or None when the caller must read through raw sqlite3.
+
+        A statement that failed once on the ORM path is remembered (per SQL text) and
+        sent straight to sqlite3 afterwards, instead of running twice - failed ORM
+        attempt, then the raw re-run - on every call."""
+        if self._orm_engine is None:
+            return None
+        failed = self.__dict__.setdefault('_orm_failed_sql', set())
+        if sql in failed:
+            return None
+        try:
+            return self._orm_rows(sql, params, limit)
+        except Exception as exc:  # pragma: no cover - defensive
+            failed.add(sql)
+            logger.debug(f"ORM read failed, falling back to sqlite3: {exc}")
+            return None
+
     def query_orm_first(self, sql: str, params: Tuple = ()) -> List[Dict[str, Any]]:
         """ORM-first read (SQLAlchemy engine) with a full fallback to raw sqlite3.
         Returns list[dict]. Same SQL on both paths -> identical results by construction."""
-        if self._orm_engine is not None:
-            try:
-                return self._orm_rows(sql, params)
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.debug(f"ORM read failed, falling back to sqlite3: {exc}")
+        rows = self._orm_read(sql, params)
+        if rows is not None:
+            return rows
         return [dict(row) for row in self.query(sql, params)]
 
     def query_one_orm_first(self, sql: str, params: Tuple = ()) -> Optional[Dict[str, Any]]:
         """Single-row ORM-first read with a full fallback to raw sqlite3."""
-        if self._orm_engine is not None:
-            try:
-                rows = self._orm_rows(sql, params)
-                return rows[0] if rows else None
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.debug(f"ORM read failed, falling back to sqlite3: {exc}")
+        rows = self._orm_read(sql, params, limit=1)
+        if rows is not None:
+            return rows[0] if rows else None
         row = self.query_one(sql, params)
         return dict(row) if row is not None else None
     
-    def execute(self, sql: str, params: Tuple = ()) -> sqlite3.Cursor:
-        """Execute an insert/update/delete and return the cursor"""
+    def execute(self, sql: str, params: Tuple = (), *, commit: bool = True) -> sqlite3.Cursor:
+        """Execute an insert/update/delete and return the cursor.
+
+        `commit=False` leaves the statement in the caller's open transaction, so several
+        writes (possibly across repositories sharing the connection) commit once.
+        """
         cursor = self._conn.cursor()
         cursor.execute(sql, params)
-        self._conn.commit()
+        if commit:
+            self._conn.commit()
         return cursor
     
-    def execute_many(self, sql: str, params_list: List[Tuple]) -> int:
+    def execute_many(self, sql: str, params_list: List[Tuple], *, commit: bool = True) -> int:
         """Execute multiple statements and return affected rows"""
         cursor = self._conn.cursor()
         cursor.executemany(sql, params_list)
-        self._conn.commit()
+        if commit:
+            self._conn.commit()
         return cursor.rowcount
     
     def column_exists(self, table: str, column: str) -> bool:
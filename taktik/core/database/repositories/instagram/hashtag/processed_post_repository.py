@@ -9,7 +9,7 @@ forgetting the `#` and silently never matching anything again. It is applied onc
 the way in and on the way out.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from loguru import logger
 
@@ -32,16 +32,34 @@ class ProcessedHashtagPostRepository(BaseRepository):
         post_author: str,
         post_caption_hash: Optional[str] = None,
         hours_limit: int = 168,  # 7 days
+        post_ref: Optional[str] = None,
     ) -> bool:
         """Has this post already been worked within the window?
 
-        With a caption hash the match is on the exact post; without one it falls back to
-        author + hashtag, which is deliberately broader — re-opening the same author's post
-        twice in a week costs a visit, and the fallback only runs when the caption could
-        not be read.
+        With a caption hash the match is on the exact post. Without one, a `post_ref`
+        (author + caption digest) is matched against the refs rebuilt from the stored
+        caption previews - only the previews that are the whole caption can give one. With
+        neither it falls back to author + hashtag, which is deliberately broader —
+        re-opening the same author's post twice in a week costs a visit, and the fallback
+        only runs when the caption could not be read. `ProcessedPostIndex.contains` answers
+        the same way from memory.
         """
         try:
             tag = normalize_hashtag(hashtag)
+            if not post_caption_hash and post_ref and post_ref != post_author:
+                from taktik.core.database.instagram_hashtag_post_index import preview_post_ref
+
+                rows = self.query(
+                    """
+                    SELECT post_caption_preview FROM processed_hashtag_posts
+                    WHERE account_id = ?
+                    AND hashtag = ?
+                    AND post_author = ?
+                    AND processed_at >= datetime('now', '-' || ? || ' hours')
+                    """,
+                    (account_id, tag, post_author, hours_limit),
+                )
+                return any(preview_post_ref(post_author, row[0]) == post_ref for row in rows)
             if post_caption_hash:
                 row = self.query_one(
                     """
@@ -72,6 +90,36 @@ class ProcessedHashtagPostRepository(BaseRepository):
             logger.error(f"Error checking processed hashtag post: {exc}")
             return False
 
+    def iter_processed(
+        self,
+        account_id: int,
+        hashtags: Iterable[str],
+        hours_limit: int = 168,
+    ) -> Iterator[Tuple[str, str, Optional[str], Optional[str]]]:
+        """`(hashtag, post_author, post_caption_hash, post_caption_preview)` of every post
+        worked within the window, for all ``hashtags`` in ONE query.
+
+        Rows are yielded as the cursor produces them, never fetched as a list: an account
+        that mined a big hashtag for a week has thousands of them, and the caller
+        (`ProcessedPostIndex`) folds each into its own structures as it goes.
+        """
+        tags = list(dict.fromkeys(normalize_hashtag(tag) for tag in hashtags if tag))
+        if not tags:
+            return
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT hashtag, post_author, post_caption_hash, post_caption_preview
+            FROM processed_hashtag_posts
+            WHERE account_id = ?
+            AND hashtag IN ({",".join("?" * len(tags))})
+            AND processed_at >= datetime('now', '-' || ? || ' hours')
+            """,
+            (account_id, *tags, hours_limit),
+        )
+        for row in cursor:
+            yield row[0], row[1], row[2], row[3]
+
     def record(
         self,
         account_id: int,
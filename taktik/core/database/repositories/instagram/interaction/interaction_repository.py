@@ -5,7 +5,7 @@ Reads and writes go through the unified `interactions` table
 (platform='instagram'); the legacy `interaction_history` table is dropped (Vague B).
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from loguru import logger
 from ..._base.base_repository import BaseRepository
 
@@ -53,6 +53,58 @@ class InteractionRepository(BaseRepository):
             logger.error(f"Error recording interaction: {e}")
             return None
     
+    def record_many(
+        self,
+        account_id: int,
+        profile_id: int,
+        interaction_type: str,
+        interaction_times: Sequence[Optional[str]],
+        success: bool = True,
+        content: Optional[str] = None,
+        session_id: Optional[int] = None,
+        *,
+        commit: bool = True,
+    ) -> int:
+        """Record several identical interactions (a profile's likes, its stories) at once.
+
+        Same rows as calling `record` once per entry of `interaction_times` (None = insert
+        time), but as ONE executemany: the device id is read once instead of once per row,
+        and with `commit=False` the caller commits the batch together with its other writes.
+        Returns the number of rows inserted; raises on failure so the caller's transaction
+        can roll back as a whole.
+        """
+        if not interaction_times:
+            return 0
+        device_id = self._origin_device_id()
+        type_upper = interaction_type.upper()
+        rows = [
+            (session_id, account_id, profile_id, type_upper, 1 if success else 0, content,
+             interaction_time, device_id)
+            for interaction_time in interaction_times
+        ]
+        self.execute_many(
+            """INSERT INTO interactions
+               (platform, sync_id, session_id, account_id, profile_id, interaction_type, success, content, interaction_time, created_at, origin_device_id)
+               VALUES ('instagram', lower(hex(randomblob(16))), ?, ?, ?, ?, ?, ?, COALESCE(?, datetime('now')), datetime('now'), ?)""",
+            rows,
+            commit=commit,
+        )
+        return len(rows)
+
+    def _origin_device_id(self) -> Optional[str]:
+        """The single-row `device_identity` id, cached once it exists (it never changes)."""
+        cached = getattr(self, '_device_id_cache', None)
+        if cached is not None:
+            return cached
+        try:
+            row = self.query_one("SELECT device_id FROM device_identity WHERE id = 1")
+        except Exception:
+            return None
+        device_id = row['device_id'] if row else None
+        if device_id is not None:
+            self._device_id_cache = device_id
+        return device_id
+
     def has_recent_interaction(
         self, 
         account_id: int, 
@@ -67,7 +119,27 @@ class InteractionRepository(BaseRepository):
             (account_id, profile_id, days)
         )
         return (row['count'] if row else 0) > 0
-    
+
+    def latest_interaction_times(self, account_id: int) -> List[Dict[str, Any]]:
+        """Per profile of this account: last interaction time and last successful FOLLOW.
+
+        One grouped scan feeding `TargetDecisionCache`, which then answers the "processed",
+        "recent interaction" and "bot follow" checks for every profile of the session from
+        memory instead of one query per profile and per check.
+        """
+        rows = self.query(
+            """SELECT ip.username AS username,
+                      MAX(ih.interaction_time) AS last_interaction,
+                      MAX(CASE WHEN ih.interaction_type = 'FOLLOW' AND ih.success = 1
+                               THEN ih.interaction_time END) AS last_follow
+               FROM interactions ih
+               JOIN instagram_profiles ip ON ih.profile_id = ip.profile_id
+               WHERE ih.platform = 'instagram' AND ih.account_id = ?
+               GROUP BY ih.profile_id""",
+            (account_id,)
+        )
+        return self.rows_to_dicts(rows)
+
     def find_by_account(self, account_id: int, limit: int = 100) -> List[Dict[str, Any]]:
         """Get interactions by account (ORM-first, fallback to raw sqlite3)."""
         rows = self.query_orm_first(
@@ -257,7 +329,16 @@ class InteractionRepository(BaseRepository):
             (account_id,)
         )
         return row['count'] if row else 0
-    
+
+    def latest_filtered_times(self, account_id: int) -> Dict[str, Optional[str]]:
+        """`username -> most recent filtered_at` for every profile filtered by this account."""
+        rows = self.query(
+            "SELECT username, MAX(filtered_at) AS filtered_at FROM filtered_profiles "
+            "WHERE platform = 'instagram' AND account_id = ? GROUP BY username",
+            (account_id,)
+        )
+        return {row['username']: row['filtered_at'] for row in rows}
+
     def _map_interaction_row(self, row) -> Dict[str, Any]:
         """Map database row to dict"""
         row_dict = dict(row)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -34,6 +34,32 @@ class ScrapedProfileRepository(BaseRepository):
             logger.debug(f"Error linking profile {profile_id} to session {scraping_id}: {exc}")
             return False
 
+    def link_profile_batch(
+        self,
+        scraping_id: int,
+        rows: List[Tuple[int, Optional[str]]],
+        *,
+        commit: bool = True,
+    ) -> int:
+        """Link `(profile_id, source_post_url)` rows to a session in one statement batch.
+
+        Same upsert as `link_profile_to_session`; `commit=False` leaves it in the caller's
+        transaction (the streaming scrape commits links, count and checkpoint together).
+        """
+        if not rows:
+            return 0
+        self.execute_many(
+            """
+            INSERT INTO scraped_profiles (platform, scraping_id, profile_id, source_post_url)
+            VALUES ('instagram', ?, ?, ?)
+            ON CONFLICT(scraping_id, profile_id)
+            DO UPDATE SET source_post_url = COALESCE(excluded.source_post_url, source_post_url)
+            """,
+            [(scraping_id, profile_id, source_post_url) for profile_id, source_post_url in rows],
+            commit=commit,
+        )
+        return len(rows)
+
     def link_profiles_to_session(self, scraping_id: int, profile_ids: List[int]) -> int:
         """Link multiple profiles to a scraping session."""
         if not profile_ids:
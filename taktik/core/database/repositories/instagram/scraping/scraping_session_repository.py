@@ -126,6 +126,56 @@ class ScrapingSessionRepository(BaseRepository):
             logger.debug(f"Error updating scraping session count: {exc}")
             return False
 
+    # -- resume points of long list scrapes -------------------------------------------
+    #
+    # `scraping_checkpoints` is local-only and keyed by the LIST (source type + name), not
+    # by the session: the run that resumes is a new session.
+
+    def save_checkpoint(self, source_type: str, source_name: str, payload: str,
+                        scraping_id: Optional[int] = None, *, commit: bool = True) -> bool:
+        """Overwrite the resume point of one list."""
+        try:
+            self.execute(
+                """
+                INSERT INTO scraping_checkpoints (source_type, source_name, scraping_id, payload)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(source_type, source_name) DO UPDATE SET
+                    scraping_id = excluded.scraping_id,
+                    payload = excluded.payload,
+                    updated_at = datetime('now')
+                """,
+                (source_type, source_name, scraping_id, payload),
+                commit=commit,
+            )
+            return True
+        except Exception as exc:
+            logger.debug(f"Error saving scraping checkpoint {source_type}:{source_name}: {exc}")
+            return False
+
+    def get_checkpoint(self, source_type: str, source_name: str) -> Optional[str]:
+        """The stored resume point of one list (JSON), or None."""
+        try:
+            row = self.query_one(
+                "SELECT payload FROM scraping_checkpoints WHERE source_type = ? AND source_name = ?",
+                (source_type, source_name),
+            )
+            return row[0] if row else None
+        except Exception as exc:
+            logger.debug(f"Error reading scraping checkpoint {source_type}:{source_name}: {exc}")
+            return None
+
+    def clear_checkpoint(self, source_type: str, source_name: str) -> bool:
+        """Forget the resume point of a list that was walked to its end."""
+        try:
+            self.execute(
+                "DELETE FROM scraping_checkpoints WHERE source_type = ? AND source_name = ?",
+                (source_type, source_name),
+            )
+            return True
+        except Exception as exc:
+            logger.debug(f"Error clearing scraping checkpoint {source_type}:{source_name}: {exc}")
+            return False
+
     def _finish(self, scraping_id: int, total_scraped: int, status: str,
                 csv_path: Optional[str] = None,
                 error_message: Optional[str] = None) -> bool:
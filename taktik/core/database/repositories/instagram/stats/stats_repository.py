@@ -32,22 +32,34 @@ class StatsRepository(BaseRepository):
         'PROFILE_VISIT': 'total_profile_visits',
     }
 
-    def increment_interaction(self, account_id: int, interaction_type: str) -> bool:
-        """Increment the matching daily_stats counter for an interaction."""
+    def increment_interaction(
+        self,
+        account_id: int,
+        interaction_type: str,
+        amount: int = 1,
+        *,
+        commit: bool = True,
+    ) -> bool:
+        """Increment the matching daily_stats counter for an interaction.
+
+        `amount` folds a batch of identical interactions into one upsert; `commit=False`
+        lets the caller commit it together with the interaction rows themselves.
+        """
         column = self._INTERACTION_COLUMN_MAP.get(interaction_type.upper())
-        if not column:
+        if not column or amount <= 0:
             return False
 
         today = datetime.now().strftime('%Y-%m-%d')
         self.execute(
             f"""
             INSERT INTO daily_stats_unified (platform, account_id, date, {column})
-            VALUES ('instagram', ?, ?, 1)
+            VALUES ('instagram', ?, ?, ?)
             ON CONFLICT(platform, account_id, date) DO UPDATE SET
-                {column} = {column} + 1,
+                {column} = {column} + excluded.{column},
                 updated_at = datetime('now')
             """,
-            (account_id, today),
+            (account_id, today, amount),
+            commit=commit,
         )
         return True
 
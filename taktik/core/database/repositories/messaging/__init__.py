@@ -3,5 +3,11 @@
 from .sent_dm_repository import SentDMRepository
 from .dm_thread_repository import DmThreadRepository
 from .dm_message_repository import DmMessageRepository
+from .dm_inbox_fingerprint_repository import DmInboxFingerprintRepository
 
-__all__ = ["SentDMRepository", "DmThreadRepository", "DmMessageRepository"]
+__all__ = [
+    "SentDMRepository",
+    "DmThreadRepository",
+    "DmMessageRepository",
+    "DmInboxFingerprintRepository",
+]
@@ -0,0 +1,73 @@
+"""Repository for the DM reader's inbox-row fingerprints (delta sync).
+
+One row per (platform, account, inbox thread): the fingerprint of the thread's inbox row
+(partner + preview + time) as last seen with its messages on record. A row that still
+shows it has no new activity, so the reader does not open the thread. LOCAL, not Turso-synced.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping
+
+from taktik.core.database.repositories._base.base_repository import BaseRepository
+from taktik.core.database.local.schemas.messaging import (
+    create_messaging_tables,
+    create_messaging_indexes,
+)
+
+
+class DmInboxFingerprintRepository(BaseRepository):
+    """Read / move the per-thread inbox fingerprints of an account."""
+
+    def ensure_table(self) -> None:
+        """Create the DM tables when the bot runs against a standalone DB."""
+        cursor = self._conn.cursor()
+        create_messaging_tables(cursor)
+        create_messaging_indexes(cursor)
+        self._conn.commit()
+
+    def get_all(self, platform: str, account_id: int) -> Dict[str, str]:
+        """``{inbox_key: fingerprint}`` for every thread of the account seen so far."""
+        self.ensure_table()
+        rows = self.query(
+            "SELECT inbox_key, fingerprint FROM dm_inbox_fingerprints "
+            "WHERE platform = ? AND account_id = ?",
+            (platform, account_id),
+        )
+        return {row["inbox_key"]: row["fingerprint"] for row in rows}
+
+    def save(
+        self,
+        platform: str,
+        account_id: int,
+        fingerprints: Mapping[str, str],
+        *,
+        commit: bool = True,
+    ) -> int:
+        """Upsert ``{inbox_key: fingerprint}`` (keys lowercased); return how many were given.
+
+        No ``ensure_table`` here: with ``commit=False`` the write joins the caller's
+        transaction, which an ``ensure_table`` commit would close early.
+        """
+        params = [
+            (platform, account_id, key.strip().lower(), fingerprint)
+            for key, fingerprint in fingerprints.items()
+            if key and key.strip() and fingerprint
+        ]
+        if not params:
+            return 0
+        self.execute_many(
+            """
+            INSERT INTO dm_inbox_fingerprints (platform, account_id, inbox_key, fingerprint)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(platform, account_id, inbox_key) DO UPDATE SET
+                fingerprint = excluded.fingerprint,
+                updated_at = datetime('now')
+            """,
+            params,
+            commit=commit,
+        )
+        return len(params)
+
+
+__all__ = ["DmInboxFingerprintRepository"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from taktik.core.database.repositories._base.base_repository import BaseRepository
 from taktik.core.database.local.schemas.messaging import (
@@ -74,6 +74,21 @@ class DmMessageRepository(BaseRepository):
         )
         return [row["text"] for row in rows if row["text"]]
 
+    def recent_messages(self, platform: str, thread_sync_id: str, limit: int = 30) -> List[Dict[str, Any]]:
+        """The ``limit`` newest messages of a thread, OLDEST first (``{direction, text, msg_type}``),
+        in insertion order — the stored history a delta re-read is appended to."""
+        self.ensure_table()
+        rows = self.query(
+            "SELECT direction, text, msg_type FROM dm_messages "
+            "WHERE platform = ? AND thread_sync_id = ? "
+            "ORDER BY sent_at DESC, seq DESC LIMIT ?",
+            (platform, thread_sync_id, limit),
+        )
+        return [
+            {"direction": row["direction"], "text": row["text"], "msg_type": row["msg_type"]}
+            for row in reversed(rows)
+        ]
+
     def last_direction(self, platform: str, thread_sync_id: str) -> Optional[str]:
         """Direction ('sent' / 'received') of the latest message on record for a thread, by
         insertion order (``sent_at`` then ``seq``). This is the RELIABLE 'who acted last' signal —
@@ -88,6 +103,128 @@ class DmMessageRepository(BaseRepository):
         )
         return row["direction"] if row else None
 
+    def thread_summaries(
+        self, platform: str, account_id: int, limit: int = 30
+    ) -> Dict[str, Dict[str, Any]]:
+        """``thread_answer_state`` for every thread of an account, in one query, keyed by thread
+        ``sync_id``: ``{has_sent, received_texts, recent_texts, last_direction}`` with the same
+        orderings as the per-thread readers above (window functions rank each thread's messages
+        overall and per direction, so only the ``limit`` newest of each come back)."""
+        self.ensure_table()
+        rows = self.query(
+            """
+            SELECT thread_sync_id, direction, text, rank_all, rank_dir FROM (
+                SELECT thread_sync_id, direction, text,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY thread_sync_id ORDER BY sent_at DESC, seq DESC
+                    ) AS rank_all,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY thread_sync_id, direction ORDER BY seq DESC
+                    ) AS rank_dir
+                FROM dm_messages
+                WHERE platform = ? AND thread_sync_id IN (
+                    SELECT sync_id FROM dm_threads WHERE platform = ? AND account_id = ?
+                )
+            )
+            WHERE rank_all <= ? OR rank_dir <= ?
+            ORDER BY thread_sync_id, rank_all
+            """,
+            (platform, platform, account_id, limit, limit),
+        )
+        summaries: Dict[str, Dict[str, Any]] = {}
+        received_ranks: Dict[str, List[tuple]] = {}
+        for row in rows:
+            summary = summaries.setdefault(
+                row["thread_sync_id"],
+                {"has_sent": False, "received_texts": [], "recent_texts": [], "last_direction": None},
+            )
+            direction, text = row["direction"], row["text"]
+            if row["rank_all"] == 1:
+                summary["last_direction"] = direction
+            if direction == "sent":
+                summary["has_sent"] = True
+            if not text:
+                continue
+            if row["rank_all"] <= limit:
+                summary["recent_texts"].append(text)
+            if direction == "received" and row["rank_dir"] <= limit:
+                received_ranks.setdefault(row["thread_sync_id"], []).append((row["rank_dir"], text))
+        for sync_id, ranked in received_ranks.items():
+            summaries[sync_id]["received_texts"] = [text for _, text in sorted(ranked)]
+        return summaries
+
+    def add_messages(
+        self,
+        *,
+        platform: str,
+        thread_sync_id: str,
+        messages: List[Dict[str, Any]],
+        account_id: Optional[int] = None,
+        partner_username: Optional[str] = None,
+        commit: bool = True,
+    ) -> int:
+        """Append the messages of a read that are not on record yet; return how many.
+
+        A re-read only carries the thread's tail, so new messages take the seqs after the
+        thread's last one (in read order) rather than their index in the read. One
+        ``executemany``; ``commit=False`` leaves it in the caller's transaction — no
+        ``ensure_table`` here, its commit would close that transaction early.
+        ``messages`` items are the ``add_message`` keyword arguments.
+        """
+        known = {
+            row["content_hash"]
+            for row in self.query(
+                "SELECT content_hash FROM dm_messages WHERE platform = ? AND thread_sync_id = ?",
+                (platform, thread_sync_id),
+            )
+        }
+        row = self.query_one(
+            "SELECT MAX(seq) AS max_seq FROM dm_messages "
+            "WHERE platform = ? AND thread_sync_id = ?",
+            (platform, thread_sync_id),
+        )
+        seq = int(row["max_seq"]) + 1 if row and row["max_seq"] is not None else 0
+        partner = partner_username.lower() if partner_username else None
+        fresh = []
+        for message in messages:
+            direction = message.get("direction", "received")
+            text = message.get("text")
+            content_hash = _content_hash(direction, text)
+            if content_hash in known:
+                continue
+            known.add(content_hash)
+            fresh.append(
+                (
+                    platform,
+                    thread_sync_id,
+                    account_id,
+                    partner,
+                    direction,
+                    message.get("msg_type", "text"),
+                    text,
+                    content_hash,
+                    seq,
+                    message.get("sent_at"),
+                    message.get("displayed_at"),
+                    message.get("ai_model"),
+                    message.get("ai_cost_usd"),
+                )
+            )
+            seq += 1
+        if fresh:
+            self.execute_many(
+                """
+                INSERT OR IGNORE INTO dm_messages (
+                    platform, thread_sync_id, account_id, partner_username, direction, msg_type,
+                    text, content_hash, seq, sent_at, displayed_at, ai_model, ai_cost_usd, sync_id
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, datetime('now')), ?, ?, ?, lower(hex(randomblob(16))))
+                """,
+                fresh,
+                commit=commit,
+            )
+        return len(fresh)
+
     def add_message(
         self,
         *,
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
 from taktik.core.database.repositories._base.base_repository import BaseRepository
 from taktik.core.database.local.schemas.messaging import (
@@ -87,6 +87,19 @@ class DmThreadRepository(BaseRepository):
         )
         return row["sync_id"] if row else None
 
+    def list_for_account(self, platform: str, account_id: int) -> List[dict]:
+        """Every thread of an account, ``{sync_id, partner_username, external_thread_id}``, in
+        the order ``find_sync_id_for_inbox`` prefers them (most recent first) — lets the reader
+        resolve all its inbox rows from one query instead of one lookup per row."""
+        self.ensure_table()
+        rows = self.query(
+            "SELECT sync_id, partner_username, external_thread_id FROM dm_threads "
+            "WHERE platform = ? AND account_id = ? "
+            "ORDER BY updated_at DESC, message_count DESC, id DESC",
+            (platform, account_id),
+        )
+        return [dict(row) for row in rows]
+
     def mark_answered(self, platform: str, account_id: int, inbox_username: str) -> bool:
         """Re-assert that WE answered this thread (``last_message_is_ours=1``, ``can_reply=0``)
         without re-reading its body. Used when IG vanish-mode hid our reply so a re-read wrongly
@@ -103,6 +116,14 @@ class DmThreadRepository(BaseRepository):
         )
         return cursor.rowcount > 0
 
+    def add_to_message_count(self, sync_id: str, added: int, commit: bool = True) -> None:
+        """Grow the thread's ``message_count`` by ``added`` (delta reads)."""
+        self.execute(
+            "UPDATE dm_threads SET message_count = COALESCE(message_count, 0) + ? WHERE sync_id = ?",
+            (added, sync_id),
+            commit=commit,
+        )
+
     def upsert(
         self,
         *,
@@ -118,8 +139,13 @@ class DmThreadRepository(BaseRepository):
         last_message_is_ours: bool = False,
         unread_count: int = 0,
         message_count: Optional[int] = None,
+        commit: bool = True,
     ) -> str:
-        """Insert or update the thread; return its ``sync_id`` (stable cross-device key)."""
+        """Insert or update the thread; return its ``sync_id`` (stable cross-device key).
+
+        ``commit=False`` leaves the write in the caller's transaction (the thread and its
+        new messages then land together).
+        """
         self.ensure_table()
         partner = partner_username.lower()
         existing = self.query_one(
@@ -157,6 +183,7 @@ class DmThreadRepository(BaseRepository):
                     message_count,
                     sync_id,
                 ),
+                commit=commit,
             )
             return sync_id
 
@@ -183,6 +210,7 @@ class DmThreadRepository(BaseRepository):
                 unread_count,
                 message_count or 0,
             ),
+            commit=commit,
         )
         row = self.query_one("SELECT sync_id FROM dm_threads WHERE id = ?", (cursor.lastrowid,))
         return row["sync_id"]
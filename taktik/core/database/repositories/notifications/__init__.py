@@ -2,5 +2,6 @@
 
 from .notification_repository import NotificationRepository
 from .notification_action_repository import NotificationActionRepository
+from .notification_scan_mark_repository import NotificationScanMarkRepository
 
-__all__ = ["NotificationRepository", "NotificationActionRepository"]
+__all__ = ["NotificationRepository", "NotificationActionRepository", "NotificationScanMarkRepository"]
@@ -0,0 +1,61 @@
+"""Repository for the high-water mark of the incremental notifications scan.
+
+One row per (platform, account): the stable hashes of the newest notifications the last
+scan read, newest first. A polling scan stops scrolling the moment it meets one of them,
+so a poll with nothing new costs one dump. LOCAL, not Turso-synced.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import List, Sequence
+
+from taktik.core.database.repositories._base.base_repository import BaseRepository
+from taktik.core.database.local.schemas.notifications import (
+    create_notifications_tables,
+    create_notifications_indexes,
+)
+
+
+class NotificationScanMarkRepository(BaseRepository):
+    """Read / move the per-account scan high-water mark."""
+
+    def ensure_table(self) -> None:
+        """Create the notifications tables when the bot runs against a standalone DB."""
+        cursor = self._conn.cursor()
+        create_notifications_tables(cursor)
+        create_notifications_indexes(cursor)
+        self._conn.commit()
+
+    def get(self, platform: str, account_id: int) -> List[str]:
+        """The mark's hashes, newest first; empty when the account was never scanned."""
+        self.ensure_table()
+        row = self.query_one(
+            "SELECT head_hashes FROM notification_scan_marks WHERE platform = ? AND account_id = ?",
+            (platform, account_id),
+        )
+        if row is None:
+            return []
+        try:
+            return [h for h in json.loads(row[0]) if isinstance(h, str)]
+        except (TypeError, ValueError):
+            return []
+
+    def save(self, platform: str, account_id: int, hashes: Sequence[str]) -> None:
+        """Replace the mark (an empty ``hashes`` leaves it untouched)."""
+        if not hashes:
+            return
+        self.ensure_table()
+        self.execute(
+            """
+            INSERT INTO notification_scan_marks (platform, account_id, head_hashes)
+            VALUES (?, ?, ?)
+            ON CONFLICT(platform, account_id) DO UPDATE SET
+                head_hashes = excluded.head_hashes,
+                updated_at = datetime('now')
+            """,
+            (platform, account_id, json.dumps(list(hashes))),
+        )
+
+
+__all__ = ["NotificationScanMarkRepository"]
@@ -0,0 +1,78 @@
+"""Database facade for the learned selector hit rates (shared/device/selector_order.py).
+
+The store loads every list of one (platform, app version, package) key at once, when the
+key is activated, and writes back only the entries an observation touched, in ONE
+transaction per flush.
+
+Never raises. Reordering is an optimisation; a base it cannot reach leaves the source
+order, which is what every probe used before.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Tuple
+
+from loguru import logger
+
+log = logger.bind(module="database-selector-hit-rates")
+
+# (list_id, xpath) -> (hits, probes)
+HitRates = Dict[Tuple[str, str], Tuple[float, float]]
+
+
+class SelectorHitRates:
+    """Read/write side of the `selector_hit_rates` table."""
+
+    @staticmethod
+    def _db():
+        from taktik.core.database.local.service import get_local_database
+
+        return get_local_database()
+
+    @staticmethod
+    def load(platform: str, app_version: str, package: str) -> HitRates:
+        """Every learned entry of one key (empty on failure)."""
+        try:
+            rows = SelectorHitRates._db()._get_connection().execute(
+                """
+                SELECT list_id, xpath, hits, probes FROM selector_hit_rates
+                WHERE platform = ? AND app_version = ? AND package = ?
+                """,
+                (platform, app_version, package),
+            ).fetchall()
+            return {(row[0], row[1]): (float(row[2]), float(row[3])) for row in rows}
+        except Exception as exc:
+            log.debug(f"Could not load selector hit rates for {platform} {app_version}: {exc}")
+            return {}
+
+    @staticmethod
+    def save(platform: str, app_version: str, package: str,
+             entries: Iterable[Tuple[str, str, float, float]]) -> int:
+        """Upsert `(list_id, xpath, hits, probes)` entries in one transaction. Returns the count (0 on failure)."""
+        params = [
+            (platform, app_version, package, list_id, xpath, hits, probes)
+            for list_id, xpath, hits, probes in entries
+        ]
+        if not params:
+            return 0
+        try:
+            conn = SelectorHitRates._db()._get_connection()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO selector_hit_rates (platform, app_version, package, list_id, xpath, hits, probes)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(platform, app_version, package, list_id, xpath) DO UPDATE SET
+                        hits = excluded.hits,
+                        probes = excluded.probes,
+                        updated_at = datetime('now')
+                    """,
+                    params,
+                )
+            return len(params)
+        except Exception as exc:
+            log.debug(f"Could not save {len(params)} selector hit rate(s): {exc}")
+            return 0
+
+
+__all__ = ["HitRates", "SelectorHitRates"]
@@ -0,0 +1,84 @@
+"""Database facade for the per-source yields of multi-source runs (common/distribution.py).
+
+A run reads the yields of all its sources in ONE query before it starts, and writes back
+what each source was allotted and processed in ONE transaction when it ends. Both counts
+are aged by ``decay`` at every write, so a hashtag that dried up last week sinks in the
+ranking within a few runs.
+
+Never raises. The ranking is an optimisation; a base it cannot reach leaves the operator's
+order, which is what every run used before.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Mapping, Optional
+
+from loguru import logger
+
+log = logger.bind(module="database-source-yields")
+
+DEFAULT_DECAY = 0.8
+
+
+class SourceYields:
+    """Read/write side of the `source_yields` table."""
+
+    @staticmethod
+    def _db():
+        from taktik.core.database.local.service import get_local_database
+
+        return get_local_database()
+
+    @staticmethod
+    def load(account_id: Optional[int], workflow: str, sources: Iterable[str]) -> Dict[str, float]:
+        """Expected fill rate (processed / allotted) of each source with a history."""
+        sources = list(dict.fromkeys(sources))
+        if not account_id or not sources:
+            return {}
+        try:
+            placeholders = ",".join("?" * len(sources))
+            rows = SourceYields._db()._get_connection().execute(
+                f"""
+                SELECT source, allotted, processed FROM source_yields
+                WHERE account_id = ? AND workflow = ? AND source IN ({placeholders})
+                """,
+                (account_id, workflow, *sources),
+            ).fetchall()
+            return {row[0]: float(row[2]) / float(row[1]) for row in rows if row[1]}
+        except Exception as exc:
+            log.debug(f"Could not load {workflow} source yields: {exc}")
+            return {}
+
+    @staticmethod
+    def record(account_id: Optional[int], workflow: str, allotted: Mapping[str, int],
+               processed: Mapping[str, int], decay: float = DEFAULT_DECAY) -> int:
+        """Fold one run's `(allotted, processed)` per source in. Returns the count written (0 on failure)."""
+        params = [
+            (account_id, workflow, source, quota, processed.get(source, 0), decay)
+            for source, quota in allotted.items() if quota > 0
+        ]
+        if not account_id or not params:
+            return 0
+        try:
+            conn = SourceYields._db()._get_connection()
+            with conn:
+                # The ON CONFLICT arm ages the stored counts (?6) before adding this run's.
+                conn.executemany(
+                    """
+                    INSERT INTO source_yields (account_id, workflow, source, allotted, processed, runs)
+                    VALUES (?1, ?2, ?3, ?4, ?5, 1)
+                    ON CONFLICT(account_id, workflow, source) DO UPDATE SET
+                        allotted = source_yields.allotted * ?6 + excluded.allotted,
+                        processed = source_yields.processed * ?6 + excluded.processed,
+                        runs = source_yields.runs + 1,
+                        updated_at = datetime('now')
+                    """,
+                    params,
+                )
+            return len(params)
+        except Exception as exc:
+            log.debug(f"Could not record {len(params)} {workflow} source yield(s): {exc}")
+            return 0
+
+
+__all__ = ["SourceYields"]
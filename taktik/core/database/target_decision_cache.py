@@ -0,0 +1,219 @@
+"""Per-session, in-memory answers to the "should we touch this profile?" checks.
+
+Before touching a target the Instagram workflows ask, per username: was it processed
+recently, was it filtered, did we interact with it lately, did the bot follow it (and
+how long ago). Each used to be its own query — a profile lookup plus an `interactions`
+or `filtered_profiles` read — and several mixins repeat them for the same profile.
+
+`TargetDecisionCache` loads everything those checks need for the active account in two
+grouped queries when the session starts, then answers them from dicts. It stays exact
+for the rest of the session because every interaction / filter this process records
+goes through `LocalDatabaseService`, which writes it through to the cache as well.
+
+Expiry semantics are the SQL ones, reproduced on the same data:
+
+- timestamps are stored as UTC 'YYYY-MM-DD HH:MM:SS' (SQLite `datetime('now')`) and
+  compared as strings against a cutoff built the same way `datetime('now', '-N hours')`
+  builds it;
+- "days since follow" keeps the repository's `(datetime.now() - follow_time).days`.
+
+Usernames are matched case-insensitively (Instagram usernames are lowercase).
+
+Usage (the workflow session lifecycle does this):
+
+    activate_target_decision_cache(account_id)   # session start
+    cache = get_target_decision_cache(account_id)  # None when no session cache
+    deactivate_target_decision_cache()           # session end
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from loguru import logger
+
+log = logger.bind(module="target-decision-cache")
+
+_SQL_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _utc_cutoff(delta: timedelta) -> str:
+    """The string SQLite's `datetime('now', '-N <unit>')` would produce."""
+    return (datetime.now(timezone.utc) - delta).strftime(_SQL_TIME_FORMAT)
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime(_SQL_TIME_FORMAT)
+
+
+def _latest(current: Optional[str], candidate: Optional[str]) -> Optional[str]:
+    if candidate is None:
+        return current
+    if current is None or candidate > current:
+        return candidate
+    return current
+
+
+class TargetDecisionCache:
+    """Processed / filtered / follow state of one account, answered from memory."""
+
+    def __init__(
+        self,
+        account_id: int,
+        interactions: Optional[Dict[str, Optional[str]]] = None,
+        follows: Optional[Dict[str, str]] = None,
+        filtered: Optional[Dict[str, Optional[str]]] = None,
+    ):
+        self.account_id = account_id
+        # username -> latest interaction_time (any type, any outcome: what "processed" reads)
+        self._interactions: Dict[str, Optional[str]] = dict(interactions or {})
+        # username -> latest successful FOLLOW interaction_time
+        self._follows: Dict[str, str] = dict(follows or {})
+        # username -> latest filtered_at (None when the row has no date: filtered forever)
+        self._filtered: Dict[str, Optional[str]] = dict(filtered or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, account_id: int, local_db=None) -> "TargetDecisionCache":
+        """Bulk-load the account's state: two grouped queries, whatever the history size."""
+        if local_db is None:
+            from taktik.core.database.local.service import get_local_database
+
+            local_db = get_local_database()
+
+        interactions: Dict[str, Optional[str]] = {}
+        follows: Dict[str, str] = {}
+        for row in local_db.interactions.latest_interaction_times(account_id):
+            key = str(row['username'] or '').lower()
+            if not key:
+                continue
+            # Several profile rows can differ only by case: keep the newest of them.
+            interactions[key] = _latest(interactions.get(key), row['last_interaction'])
+            if row['last_follow']:
+                follows[key] = _latest(follows.get(key), row['last_follow'])
+
+        filtered: Dict[str, Optional[str]] = {}
+        for username, filtered_at in local_db.interactions.latest_filtered_times(account_id).items():
+            key = str(username or '').lower()
+            if key:
+                filtered[key] = _latest(filtered.get(key), filtered_at)
+
+        log.debug(
+            "Target decision cache loaded for account {}: {} interacted, {} followed, {} filtered",
+            account_id, len(interactions), len(follows), len(filtered),
+        )
+        return cls(account_id, interactions=interactions, follows=follows, filtered=filtered)
+
+    # ------------------------------------------------------------------
+    # Predicates
+    # ------------------------------------------------------------------
+
+    def last_interaction(self, username: str) -> Optional[str]:
+        """Latest interaction time with this profile (any type), None if never."""
+        return self._interactions.get(username.lower())
+
+    def is_processed(self, username: str, hours_limit: int) -> bool:
+        """Any interaction within the last `hours_limit` hours (`check_profile_processed`)."""
+        last = self._interactions.get(username.lower())
+        return last is not None and last >= _utc_cutoff(timedelta(hours=hours_limit))
+
+    def has_recent_interaction(self, username: str, days: int = 7) -> bool:
+        """Any interaction within the last `days` days (`has_recent_interaction`)."""
+        last = self._interactions.get(username.lower())
+        return last is not None and last >= _utc_cutoff(timedelta(days=days))
+
+    def is_filtered(self, username: str, max_age_days: Optional[int] = None) -> bool:
+        """Filtered for this account; older than `max_age_days` no longer counts (None = never expires)."""
+        key = username.lower()
+        if key not in self._filtered:
+            return False
+        if max_age_days is None or max_age_days <= 0:
+            return True
+        filtered_at = self._filtered[key]
+        return filtered_at is not None and filtered_at >= _utc_cutoff(timedelta(days=int(max_age_days)))
+
+    def has_bot_follow_record(self, username: str) -> bool:
+        """The bot account successfully followed this profile at least once."""
+        return username.lower() in self._follows
+
+    def get_days_since_follow(self, username: str) -> Optional[int]:
+        """Full days since the most recent successful follow, None if never followed."""
+        follow_time = self._follows.get(username.lower())
+        if not follow_time:
+            return None
+        try:
+            return (datetime.now() - datetime.fromisoformat(follow_time)).days
+        except ValueError:
+            return None
+
+    # ------------------------------------------------------------------
+    # Write-through
+    # ------------------------------------------------------------------
+
+    def note_interaction(
+        self,
+        username: str,
+        interaction_type: str,
+        success: bool = True,
+        interaction_time: Optional[str] = None,
+    ) -> None:
+        """Mirror a recorded interaction row (None time = insert time, like the INSERT)."""
+        key = username.lower()
+        stamp = interaction_time or _utc_now()
+        with self._lock:
+            self._interactions[key] = _latest(self._interactions.get(key), stamp)
+            if success and interaction_type.upper() == 'FOLLOW':
+                self._follows[key] = _latest(self._follows.get(key), stamp)
+
+    def note_filtered(self, username: str, filtered_at: Optional[str] = None) -> None:
+        """Mirror a recorded `filtered_profiles` row."""
+        key = username.lower()
+        with self._lock:
+            self._filtered[key] = _latest(self._filtered.get(key), filtered_at or _utc_now())
+
+
+_active_cache: Optional[TargetDecisionCache] = None
+_active_lock = threading.Lock()
+
+
+def activate_target_decision_cache(account_id: int, local_db=None) -> Optional[TargetDecisionCache]:
+    """Load and install the session cache for `account_id` (None if loading fails).
+
+    A failed load leaves no cache installed, so every check falls back to its query.
+    """
+    global _active_cache
+    if not account_id:
+        return None
+    try:
+        cache = TargetDecisionCache.load(account_id, local_db)
+    except Exception as exc:
+        log.warning("Target decision cache unavailable for account {}: {}", account_id, exc)
+        cache = None
+    with _active_lock:
+        _active_cache = cache
+    return cache
+
+
+def get_target_decision_cache(account_id: Optional[int]) -> Optional[TargetDecisionCache]:
+    """The installed cache when it belongs to `account_id`, else None (use the database)."""
+    cache = _active_cache
+    if cache is None or not account_id or cache.account_id != account_id:
+        return None
+    return cache
+
+
+def deactivate_target_decision_cache() -> None:
+    """Drop the session cache; checks go back to the database."""
+    global _active_cache
+    with _active_lock:
+        _active_cache = None
+
+
+__all__ = [
+    "TargetDecisionCache",
+    "activate_target_decision_cache",
+    "get_target_decision_cache",
+    "deactivate_target_decision_cache",
+]
@@ -2,22 +2,35 @@
 
 Contains base classes and shared Android/action primitives used by platform
 implementations.
+
+Exports are resolved on first access (module `__getattr__`): importing one shared
+module must not import the device manager - and uiautomator2 with it.
 """
 
-from .actions import ActionUtils, SharedBaseAction, parse_count
-from .device import BaseDeviceFacade, DeviceManager, Direction
-from .input import (
-    IME_CLEAR_TEXT,
-    IME_MESSAGE_B64,
-    TAKTIK_KEYBOARD_IME,
-    TAKTIK_KEYBOARD_PKG,
-    activate_taktik_keyboard,
-    clear_text_with_taktik_keyboard,
-    is_taktik_keyboard_active,
-    run_adb_shell,
-    type_with_taktik_keyboard,
-)
-from .platform import SocialMediaBase
+from .lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    "ActionUtils": (".actions", "ActionUtils"),
+    "SharedBaseAction": (".actions", "SharedBaseAction"),
+    "parse_count": (".actions", "parse_count"),
+    "BaseDeviceFacade": (".device", "BaseDeviceFacade"),
+    "DeviceManager": (".device", "DeviceManager"),
+    "Direction": (".device", "Direction"),
+    "IME_CLEAR_TEXT": (".input", "IME_CLEAR_TEXT"),
+    "IME_MESSAGE_B64": (".input", "IME_MESSAGE_B64"),
+    "TAKTIK_KEYBOARD_IME": (".input", "TAKTIK_KEYBOARD_IME"),
+    "TAKTIK_KEYBOARD_PKG": (".input", "TAKTIK_KEYBOARD_PKG"),
+    "activate_taktik_keyboard": (".input", "activate_taktik_keyboard"),
+    "clear_text_with_taktik_keyboard": (".input", "clear_text_with_taktik_keyboard"),
+    "is_taktik_keyboard_active": (".input", "is_taktik_keyboard_active"),
+    "run_adb_shell": (".input", "run_adb_shell"),
+    "type_with_taktik_keyboard": (".input", "type_with_taktik_keyboard"),
+    "SocialMediaBase": (".platform", "SocialMediaBase"),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     "SharedBaseAction",
@@ -1,6 +1,18 @@
-"""Shared actions package."""
+"""Shared actions package.
+
+Exports are resolved on first access (module `__getattr__`).
+"""
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    "SharedBaseAction": (".base_action", "SharedBaseAction"),
+    "ActionUtils": (".utils", "ActionUtils"),
+    "parse_count": (".utils", "parse_count"),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-from .base_action import SharedBaseAction
-from .utils import ActionUtils, parse_count
 
 __all__ = ["SharedBaseAction", "ActionUtils", "parse_count"]
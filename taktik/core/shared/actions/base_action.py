@@ -16,6 +16,7 @@ from loguru import logger
 
 from taktik.core.shared.device.adb import run_adb_shell
 from taktik.core.shared.device.facade import BaseDeviceFacade
+from taktik.core.shared.device.selector_order import ordered_selectors, record_selector_match
 from taktik.core.shared.actions.utils import ActionUtils
 from taktik.core.shared.telemetry import emit_step
 from taktik.core.shared.input.taktik_keyboard import (
@@ -94,11 +95,15 @@ class SharedBaseAction:
         
         self.logger.debug(f"🔍 Searching for elements with {len(selectors)} selectors")
         
+        # Alternatives known dead on this app build are probed last (shared/device/selector_order).
+        probes = ordered_selectors(selectors)
         while time.time() - start_time < timeout:
-            for i, selector in enumerate(selectors):
+            for i, selector in enumerate(probes):
                 try:
                     element = self.device.xpath(selector)
                     if element.exists:
+                        record_selector_match(selectors, probes, i)
+                        i = selectors.index(selector)
                         self.logger.debug(f"✅ Element found with selector #{i+1}: {selector[:50]}...")
                         # Tap a varied point inside the element (never its exact centre);
                         # fall back to a plain centre click if the bounds are unreadable.
@@ -166,10 +171,12 @@ class SharedBaseAction:
         if not silent:
             self.logger.debug(f"⏳ Waiting for element with {len(selectors)} selectors")
         
+        probes = ordered_selectors(selectors)
         while time.time() - start_time < timeout:
-            for selector in selectors:
+            for i, selector in enumerate(probes):
                 try:
                     if self.device.xpath(selector).exists:
+                        record_selector_match(selectors, probes, i)
                         if not silent:
                             self.logger.debug(f"✅ Element appeared: {selector[:50]}...")
                         self._method_stats['waits'] += 1
@@ -189,9 +196,11 @@ class SharedBaseAction:
         if isinstance(selectors, str):
             selectors = [selectors]
         
-        for selector in selectors:
+        probes = ordered_selectors(selectors)
+        for i, selector in enumerate(probes):
             try:
                 if self.device.xpath(selector).exists:
+                    record_selector_match(selectors, probes, i)
                     return True
             except Exception:
                 continue
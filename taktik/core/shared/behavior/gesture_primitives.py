@@ -412,10 +412,17 @@ class GestureMixin:
                 0.11,
             )
             raw = getattr(self.device, "_device", None)
+            self._last_gesture_injection = None
             if raw is not None and hasattr(raw, "swipe"):
                 raw.swipe(sx, sy, ex, ey, duration=duration)
             else:
                 self.device.swipe_coordinates(sx, sy, ex, ey, duration)
+            # What the feed's landing predictor needs: how far the finger went and how fast it let
+            # go. A flick is one swipe RPC, so there is no pacing to report.
+            self._last_gesture_injection = {
+                "gesture": "flick", "distance_px": int(dy),
+                "velocity_pxs": round(dy / duration), "duration_ms": round(duration * 1000),
+            }
             emit_step(
                 "scroll", action="flick", target=direction,
                 distance_px=int(dy), duration_ms=round(duration * 1000),
@@ -454,6 +461,7 @@ class GestureMixin:
             scaled_vel_range = tuple(float(value) * speed for value in vel_range)
             duration = min(max(dy / random.uniform(*scaled_vel_range), 0.40), 0.85)
             raw = getattr(self.device, "_device", None)
+            self._last_gesture_injection = None   # a fallback route records nothing: no stale pacing
             if not self._execute_device_path(raw, path, duration):
                 touch = self._touch_api(raw)
                 if touch is not None:
@@ -462,11 +470,17 @@ class GestureMixin:
                     raw.swipe_points(path, duration / max(1, len(path) - 1))
                 else:
                     self.device.swipe_coordinates(sx, sy, ex, ey, duration)
+            injection = {
+                **(getattr(self, "_last_gesture_injection", None) or {}),
+                "gesture": "drag", "distance_px": int(dy),
+                "velocity_pxs": round(dy / duration), "duration_ms": round(duration * 1000),
+            }
+            self._last_gesture_injection = injection
             emit_step(
                 "scroll", action="drag", target=direction,
                 distance_px=int(dy), duration_ms=round(duration * 1000),
                 velocity_scale=round(speed, 3),
-                paced=(getattr(self, "_last_gesture_injection", None) or {}).get("mode"),
+                paced=injection.get("mode"),
             )
             time.sleep(0.08)
             return True
@@ -1,32 +1,60 @@
-"""Shared device primitives for ADB, ATX, media and permissions."""
+"""Shared device primitives for ADB, ATX, media and permissions.
+
+Exports are resolved on first access (module `__getattr__`): `adb` and
+`dump_index` are imported by bridges long before a device is connected, and must
+not import `manager` - and uiautomator2 with it - on the way.
+"""
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    "run_adb_shell": (".adb", "run_adb_shell"),
+    "run_adb_shell_process": (".adb", "run_adb_shell_process"),
+    "stream_adb_shell_process": (".adb", "stream_adb_shell_process"),
+    "DeviceConnectionRegistry": (".connections", "DeviceConnectionRegistry"),
+    "get_connection_registry": (".connections", "get_connection_registry"),
+    "DumpIndex": (".dump_index", "DumpIndex"),
+    "DumpNode": (".dump_index", "DumpNode"),
+    "index_for_xml": (".dump_index", "index_for_xml"),
+    "BaseDeviceFacade": (".facade", "BaseDeviceFacade"),
+    "Direction": (".facade", "Direction"),
+    "DeviceManager": (".manager", "DeviceManager"),
+    "MediaPrefetcher": (".media_prefetch", "MediaPrefetcher"),
+    "get_android_sdk_version": (".media_store", "get_android_sdk_version"),
+    "guess_mime_type": (".media_store", "guess_mime_type"),
+    "is_video_file": (".media_store", "is_video_file"),
+    "push_and_scan": (".media_store", "push_and_scan"),
+    "push_media": (".media_store", "push_media"),
+    "scan_wait_for": (".media_store", "scan_wait_for"),
+    "trigger_media_scan": (".media_store", "trigger_media_scan"),
+    "SelectorOrdering": (".selector_order", "SelectorOrdering"),
+    "activate_selector_ordering": (".selector_order", "activate_selector_ordering"),
+    "get_selector_ordering": (".selector_order", "get_selector_ordering"),
+    "ALLOW_SELECTORS": (".permissions", "ALLOW_SELECTORS"),
+    "DENY_SELECTORS": (".permissions", "DENY_SELECTORS"),
+    "DIALOG_INDICATORS": (".permissions", "DIALOG_INDICATORS"),
+    "PermissionHandler": (".permissions", "PermissionHandler"),
+    "deny_permissions": (".permissions", "deny_permissions"),
+    "grant_permissions": (".permissions", "grant_permissions"),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-from .adb import run_adb_shell, run_adb_shell_process
-from .facade import BaseDeviceFacade, Direction
-from .manager import DeviceManager
-from .media_store import (
-    get_android_sdk_version,
-    guess_mime_type,
-    is_video_file,
-    push_and_scan,
-    push_media,
-    scan_wait_for,
-    trigger_media_scan,
-)
-from .permissions import (
-    ALLOW_SELECTORS,
-    DENY_SELECTORS,
-    DIALOG_INDICATORS,
-    PermissionHandler,
-    deny_permissions,
-    grant_permissions,
-)
 
 __all__ = [
     "run_adb_shell",
     "run_adb_shell_process",
+    "stream_adb_shell_process",
+    "DeviceConnectionRegistry",
+    "get_connection_registry",
+    "DumpIndex",
+    "DumpNode",
+    "index_for_xml",
     "BaseDeviceFacade",
     "Direction",
     "DeviceManager",
+    "MediaPrefetcher",
     "get_android_sdk_version",
     "is_video_file",
     "guess_mime_type",
@@ -34,6 +62,9 @@ __all__ = [
     "trigger_media_scan",
     "scan_wait_for",
     "push_and_scan",
+    "SelectorOrdering",
+    "activate_selector_ordering",
+    "get_selector_ordering",
     "PermissionHandler",
     "grant_permissions",
     "deny_permissions",
@@ -1,10 +1,19 @@
 """Shared ADB shell helpers for device/runtime owners."""
 
+import atexit
+import queue
+import shlex
 import subprocess
-from typing import Sequence
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Union
 
 from loguru import logger
 
+from .connections import get_connection_registry
+
 
 def run_adb_shell_process(
     device_id: str,
@@ -35,6 +44,44 @@ def run_adb_shell_process(
     return subprocess.run([adb_command, "-s", device_id, "shell", *command_args], **kwargs)
 
 
+@contextmanager
+def stream_adb_shell_process(
+    device_id: str,
+    command_args: Sequence[str],
+    *,
+    adb_command: str = "adb",
+    timeout: float = 10,
+    encoding: str = "utf-8",
+    errors: str = "replace",
+) -> Iterator[Iterator[str]]:
+    """
+    Run an ADB shell command and yield its stdout as an iterator of lines.
+
+    Use this for outputs too large to hold whole (``dumpsys``): the caller keeps only
+    the lines it needs and may stop reading early. Leaving the block kills the process,
+    and so does ``timeout`` — the iterator then simply ends.
+    """
+    process = subprocess.Popen(
+        [adb_command, "-s", device_id, "shell", *command_args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding=encoding,
+        errors=errors,
+    )
+    timer = threading.Timer(timeout, process.kill)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield process.stdout
+    finally:
+        timer.cancel()
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+
+
 def run_adb_shell(device_id: str, command: str) -> str:
     """
     Execute an ADB shell command using adbutils, with subprocess fallback.
@@ -46,10 +93,11 @@ def run_adb_shell(device_id: str, command: str) -> str:
     Returns:
         Command output as string, or an empty string on error.
     """
+    registry = get_connection_registry()
     try:
-        from adbutils import adb
-
-        device = adb.device(serial=device_id)
+        # The adbutils handle is resolved once per serial and reused; a handle that
+        # fails is dropped so the next call resolves a fresh one.
+        device = registry.get_adb_device(device_id)
         return device.shell(command)
     except ImportError:
         try:
@@ -64,8 +112,276 @@ def run_adb_shell(device_id: str, command: str) -> str:
             logger.debug(f"ADB subprocess error: {exc}")
             return ""
     except Exception as exc:
+        registry.drop_adb_device(device_id)
         logger.debug(f"ADB shell error: {exc}")
         return ""
 
 
-__all__ = ["run_adb_shell", "run_adb_shell_process"]
+# ---------------------------------------------------------------------------
+# Batched execution
+#
+# Operations like "mkdir + push + scan" or "check IME + broadcast" used to pay one adb
+# round trip (process spawn or adbutils stream) per command. A batch sends all of them
+# as ONE shell script; every command is followed by a delimiter line carrying its exit
+# code, so callers still get per-command results.
+# ---------------------------------------------------------------------------
+
+ShellCommand = Union[str, Sequence[str]]
+
+
+class ShellResult(NamedTuple):
+    """Outcome of one command of a batch. ``exit_code`` is None when it never ran."""
+
+    command: str
+    exit_code: Optional[int]
+    output: str
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
+def _command_line(command: ShellCommand) -> str:
+    """A string is sent verbatim (shell syntax allowed); a sequence is quoted per argument."""
+    if isinstance(command, str):
+        return command
+    return " ".join(shlex.quote(str(arg)) for arg in command)
+
+
+def build_batch_script(commands: Sequence[ShellCommand], marker: str, *, stop_on_error: bool = False) -> str:
+    """One ``sh`` script running ``commands`` in order, each followed by ``<marker>:<i>:<rc>``.
+
+    ``stop_on_error`` makes the script exit after the first non-zero exit code, so later
+    commands can be conditional on earlier ones (``check; act``) in one round trip.
+    """
+    parts = []
+    for i, command in enumerate(commands):
+        part = f'{{ {_command_line(command)} ; }} 2>&1; __rc=$?; echo; echo "{marker}:{i}:$__rc"'
+        if stop_on_error:
+            part += '; [ "$__rc" -eq 0 ] || exit 0'
+        parts.append(part)
+    return "; ".join(parts)
+
+
+def parse_batch_output(commands: Sequence[ShellCommand], raw_output: str, marker: str) -> List[ShellResult]:
+    """Split a batch's combined output back into one ``ShellResult`` per command."""
+    lines = (raw_output or "").replace("\r\n", "\n").split("\n")
+    results: List[ShellResult] = []
+    buffer: List[str] = []
+    for line in lines:
+        if line.startswith(f"{marker}:"):
+            _, index, code = line.split(":", 2)
+            # `echo` before the marker guarantees it starts a line; drop that blank.
+            if buffer and buffer[-1] == "":
+                buffer.pop()
+            try:
+                exit_code: Optional[int] = int(code)
+            except ValueError:
+                exit_code = None
+            results.append(ShellResult(_command_line(commands[int(index)]), exit_code, "\n".join(buffer)))
+            buffer = []
+        else:
+            buffer.append(line)
+    for command in commands[len(results):]:
+        results.append(ShellResult(_command_line(command), None, ""))
+    return results
+
+
+def run_adb_shell_batch(
+    device_id: str,
+    commands: Sequence[ShellCommand],
+    *,
+    stop_on_error: bool = False,
+    timeout: int = 30,
+) -> List[ShellResult]:
+    """Run several shell commands in a single ``adb shell`` round trip.
+
+    Returns one ``ShellResult`` per command, in order; commands skipped by
+    ``stop_on_error`` or lost to a transport failure carry ``exit_code=None``.
+    """
+    if not commands:
+        return []
+    marker = f"__TAKTIK_{uuid.uuid4().hex[:12]}"
+    script = build_batch_script(commands, marker, stop_on_error=stop_on_error)
+    registry = get_connection_registry()
+    try:
+        device = registry.get_adb_device(device_id)
+        raw = device.shell(script, timeout=timeout)
+    except ImportError:
+        try:
+            raw = run_adb_shell_process(device_id, [script], timeout=timeout).stdout or ""
+        except Exception as exc:
+            logger.debug(f"ADB batch subprocess error: {exc}")
+            raw = ""
+    except Exception as exc:
+        registry.drop_adb_device(device_id)
+        logger.debug(f"ADB batch shell error: {exc}")
+        raw = ""
+    return parse_batch_output(commands, raw, marker)
+
+
+class AdbShellSession:
+    """A long-lived interactive ``adb shell`` for high-frequency callers.
+
+    Keeps one shell process open per device and frames each request with the batch
+    delimiters, so a call costs a pipe write instead of a process spawn. A timeout
+    leaves the shell in an unknown state: the session is closed and the next call
+    opens a fresh one.
+    """
+
+    def __init__(self, device_id: str, *, adb_command: str = "adb") -> None:
+        self.device_id = device_id
+        self.adb_command = adb_command
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+        # No adb binary on this host (adbutils-only setups): stop trying to spawn one.
+        self._unavailable = False
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        self._lines = queue.Queue()
+        self._process = subprocess.Popen(
+            [self.adb_command, "-s", self.device_id, "shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+        threading.Thread(
+            target=self._pump, args=(self._process, self._lines), daemon=True,
+            name=f"adb-shell-{self.device_id}",
+        ).start()
+        return self._process
+
+    @staticmethod
+    def _pump(process: subprocess.Popen, lines: "queue.Queue[Optional[str]]") -> None:
+        for line in process.stdout:
+            lines.put(line.rstrip("\r\n"))
+        lines.put(None)
+
+    def run_batch(
+        self,
+        commands: Sequence[ShellCommand],
+        *,
+        stop_on_error: bool = False,
+        timeout: float = 10.0,
+    ) -> List[ShellResult]:
+        results = self.send_batch(commands, stop_on_error=stop_on_error, timeout=timeout)
+        if results is None:
+            return [ShellResult(_command_line(command), None, "") for command in commands]
+        return results
+
+    def send_batch(
+        self,
+        commands: Sequence[ShellCommand],
+        *,
+        stop_on_error: bool = False,
+        timeout: float = 10.0,
+    ) -> Optional[List[ShellResult]]:
+        """Like ``run_batch``, but None when the script never reached the shell.
+
+        A caller replaying a command that is not idempotent elsewhere must tell the two
+        ``exit_code=None`` cases apart: a failed write (safe to replay) and a read that
+        timed out after the write (the device may already have run it).
+        """
+        if not commands:
+            return []
+        marker = f"__TAKTIK_{uuid.uuid4().hex[:12]}"
+        if self._unavailable:
+            return None
+        # The session must not exit on error: `exit` would close the interactive shell.
+        # Run the script in a subshell so stop_on_error only ends that subshell, then
+        # emit a final line telling the reader the batch is over.
+        script = build_batch_script(commands, marker, stop_on_error=stop_on_error)
+        done = f"{marker}:done"
+        with self._lock:
+            try:
+                process = self._ensure_started()
+                process.stdin.write(f"( {script} ); echo {done}\n")
+                process.stdin.flush()
+            except Exception as exc:
+                logger.debug(f"ADB session write failed on {self.device_id}: {exc}")
+                self._unavailable = isinstance(exc, FileNotFoundError)
+                self._close_locked()
+                return None
+
+            collected: List[str] = []
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    line = self._lines.get(timeout=max(0.0, remaining))
+                except queue.Empty:
+                    line = None
+                if line is None:
+                    logger.debug(f"ADB session on {self.device_id} timed out or closed")
+                    self._close_locked()
+                    break
+                if line == done:
+                    break
+                collected.append(line)
+        return parse_batch_output(commands, "\n".join(collected), marker)
+
+    def run(self, command: ShellCommand, *, timeout: float = 10.0) -> ShellResult:
+        return self.run_batch([command], timeout=timeout)[0]
+
+    def _close_locked(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except Exception:
+            pass
+        try:
+            process.kill()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+
+_shell_sessions: Dict[str, AdbShellSession] = {}
+_shell_sessions_lock = threading.Lock()
+
+
+def get_adb_shell_session(device_id: str) -> AdbShellSession:
+    """The persistent shell session of ``device_id`` (created lazily, one per device)."""
+    with _shell_sessions_lock:
+        session = _shell_sessions.get(device_id)
+        if session is None:
+            if not _shell_sessions:
+                atexit.register(close_adb_shell_sessions)
+            session = AdbShellSession(device_id)
+            _shell_sessions[device_id] = session
+        return session
+
+
+def close_adb_shell_sessions() -> None:
+    with _shell_sessions_lock:
+        sessions = list(_shell_sessions.values())
+        _shell_sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+__all__ = [
+    "run_adb_shell",
+    "run_adb_shell_process",
+    "stream_adb_shell_process",
+    "ShellCommand",
+    "ShellResult",
+    "build_batch_script",
+    "parse_batch_output",
+    "run_adb_shell_batch",
+    "AdbShellSession",
+    "get_adb_shell_session",
+    "close_adb_shell_sessions",
+]
@@ -0,0 +1,217 @@
+"""Per-serial registry of warm device connections, shared across one process.
+
+A bridge process runs several workflows against the same phone, and each one used to
+start cold: ``DeviceManager.connect`` re-ran ``u2.connect`` plus the ATX health
+verification (with a possible repair), and every ``run_adb_shell`` re-resolved
+``adb.device(serial=...)``. The registry keeps, per serial, the uiautomator2 device, the
+adbutils handle and the last health probe. A probe younger than ``health_ttl`` is
+trusted, so a warm start skips verification; an optional keep-alive thread re-probes
+idle connections so the cached verdict stays fresh without the workflow paying for it.
+
+Everything here is best effort: a failing probe or a dead handle only evicts the entry,
+the next caller reconnects exactly as before.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+DEFAULT_HEALTH_TTL_SECONDS = 120.0
+DEFAULT_KEEPALIVE_INTERVAL_SECONDS = 45.0
+
+
+class DeviceConnection:
+    """Cached handles and last health verdict for one serial."""
+
+    __slots__ = ("serial", "u2_device", "adb_device", "healthy", "probed_at")
+
+    def __init__(self, serial: str) -> None:
+        self.serial = serial
+        self.u2_device: Any = None
+        self.adb_device: Any = None
+        self.healthy: Optional[bool] = None
+        self.probed_at: float = 0.0
+
+
+def _connect_u2(serial: str):
+    import uiautomator2 as u2
+
+    return u2.connect(serial)
+
+
+def _resolve_adb_device(serial: str):
+    from adbutils import adb
+
+    return adb.device(serial=serial)
+
+
+def _probe_u2_health(device) -> bool:
+    info = device.info
+    return bool(info) and "displayWidth" in info
+
+
+class DeviceConnectionRegistry:
+    """Thread-safe ``serial -> DeviceConnection`` map with health TTL and keep-alive."""
+
+    def __init__(
+        self,
+        *,
+        health_ttl: float = DEFAULT_HEALTH_TTL_SECONDS,
+        keepalive_interval: float = DEFAULT_KEEPALIVE_INTERVAL_SECONDS,
+        connect_u2: Callable[[str], Any] = _connect_u2,
+        resolve_adb: Callable[[str], Any] = _resolve_adb_device,
+        probe: Callable[[Any], bool] = _probe_u2_health,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.health_ttl = health_ttl
+        self.keepalive_interval = keepalive_interval
+        self._connect_u2 = connect_u2
+        self._resolve_adb = resolve_adb
+        self._probe = probe
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._connections: Dict[str, DeviceConnection] = {}
+        self._keepalive_thread: Optional[threading.Thread] = None
+        self._keepalive_stop = threading.Event()
+
+    def _entry(self, serial: str) -> DeviceConnection:
+        entry = self._connections.get(serial)
+        if entry is None:
+            entry = DeviceConnection(serial)
+            self._connections[serial] = entry
+        return entry
+
+    # -- handles -----------------------------------------------------------
+
+    def get_u2_device(self, serial: str):
+        """Warm uiautomator2 device for ``serial``; connects on first use.
+
+        A device whose last probe failed is not handed out again: it is reconnected.
+        """
+        with self._lock:
+            entry = self._entry(serial)
+            if entry.u2_device is None or entry.healthy is False:
+                entry.u2_device = self._connect_u2(serial)
+                entry.healthy, entry.probed_at = None, 0.0
+            return entry.u2_device
+
+    def replace_u2_device(self, serial: str, device) -> None:
+        """Adopt a device reconnected outside the registry (e.g. after an ATX repair)."""
+        with self._lock:
+            entry = self._entry(serial)
+            entry.u2_device = device
+            entry.healthy, entry.probed_at = None, 0.0
+
+    def get_adb_device(self, serial: str):
+        """Cached adbutils device handle for ``serial``."""
+        with self._lock:
+            entry = self._entry(serial)
+            if entry.adb_device is None:
+                entry.adb_device = self._resolve_adb(serial)
+            return entry.adb_device
+
+    def drop_adb_device(self, serial: str) -> None:
+        """Forget the adbutils handle after it failed; the next call resolves a new one."""
+        with self._lock:
+            entry = self._connections.get(serial)
+            if entry is not None:
+                entry.adb_device = None
+
+    def invalidate(self, serial: str) -> None:
+        """Forget everything known about ``serial``."""
+        with self._lock:
+            self._connections.pop(serial, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connections.clear()
+
+    # -- health ------------------------------------------------------------
+
+    def record_health(self, serial: str, healthy: bool) -> None:
+        with self._lock:
+            entry = self._entry(serial)
+            entry.healthy = bool(healthy)
+            entry.probed_at = self._clock()
+
+    def is_health_fresh(self, serial: str) -> bool:
+        """True when the last probe was healthy and younger than ``health_ttl``."""
+        with self._lock:
+            entry = self._connections.get(serial)
+            if entry is None or not entry.healthy:
+                return False
+            return (self._clock() - entry.probed_at) < self.health_ttl
+
+    def probe(self, serial: str) -> bool:
+        """Probe the cached u2 device now and record the verdict."""
+        with self._lock:
+            entry = self._connections.get(serial)
+            device = entry.u2_device if entry else None
+        if device is None:
+            return False
+        try:
+            healthy = bool(self._probe(device))
+        except Exception as exc:
+            logger.debug(f"[DeviceRegistry] Health probe failed for {serial}: {exc}")
+            healthy = False
+        self.record_health(serial, healthy)
+        return healthy
+
+    # -- keep-alive --------------------------------------------------------
+
+    def start_keepalive(self) -> None:
+        """Re-probe idle connections in a daemon thread (idempotent)."""
+        with self._lock:
+            if self._keepalive_thread is not None and self._keepalive_thread.is_alive():
+                return
+            self._keepalive_stop.clear()
+            self._keepalive_thread = threading.Thread(
+                target=self._keepalive_loop,
+                name="taktik-device-keepalive",
+                daemon=True,
+            )
+            self._keepalive_thread.start()
+
+    def stop_keepalive(self) -> None:
+        self._keepalive_stop.set()
+        thread = self._keepalive_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self._keepalive_thread = None
+
+    def _keepalive_loop(self) -> None:
+        while not self._keepalive_stop.wait(self.keepalive_interval):
+            with self._lock:
+                due = [
+                    serial
+                    for serial, entry in self._connections.items()
+                    if entry.u2_device is not None
+                    and (self._clock() - entry.probed_at) >= self.keepalive_interval
+                ]
+            for serial in due:
+                self.probe(serial)
+
+
+_registry: Optional[DeviceConnectionRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_connection_registry() -> DeviceConnectionRegistry:
+    """Process-wide registry shared by ``DeviceManager`` and the ADB helpers."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = DeviceConnectionRegistry()
+    return _registry
+
+
+__all__ = [
+    "DeviceConnection",
+    "DeviceConnectionRegistry",
+    "get_connection_registry",
+]
@@ -0,0 +1,276 @@
+"""One index per hierarchy dump, shared by every reader of that snapshot.
+
+Every dump consumer used to re-parse the XML and evaluate each selector with lxml, an
+O(nodes) walk per XPath. Most selectors are not XPath at all in spirit: they are a
+``resource-id``, an exact ``text`` / ``content-desc`` or a bare class, sometimes with a
+few extra equality predicates. ``DumpIndex`` parses the snapshot once into a flat node
+array plus hash maps keyed on those attributes, answers the simple selectors with a
+dictionary lookup and hands everything else (``contains()``, axes, nested paths) to
+lxml on the same parsed tree.
+
+The fast path is exact: it returns the same elements, in the same document order, as
+``tree.xpath(selector)`` would. A selector it cannot prove simple is never guessed at.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .ui_dump import parse_bounds
+
+# `//tag` or `//*`, optionally followed by predicates made of `@attr="value"` terms
+# joined with `and`. Anything else (functions, `or`, axes, a second step) falls back.
+# Chained predicates (`//node[@class="x"][@text="y"]`, the raw-uiautomator form the TikTok
+# rewriter emits) are the same conjunction as long as none of them is positional.
+_SIMPLE_STEP_RE = re.compile(r"^//(\*|[A-Za-z_][\w.$-]*)((?:\[[^\[\]]+\])*)$")
+_PREDICATE_RE = re.compile(r"\[([^\[\]]+)\]")
+_EQUALITY_TERM_RE = re.compile(
+    r"""^\s*@([A-Za-z_][\w-]*)\s*=\s*(?:"([^"]*)"|'([^']*)')\s*$"""
+)
+_AND_SPLIT_RE = re.compile(r"\s+and\s+")
+
+SimpleSelector = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+@lru_cache(maxsize=4096)
+def compile_simple_selector(selector: str) -> Optional[SimpleSelector]:
+    """Return ``(tag, ((attr, value), ...))`` for a selector the index answers, else None.
+
+    ``tag`` is ``"*"`` for any element. Compiled once per selector string: the selector
+    catalogs are a few hundred constants reused on every dump.
+    """
+    match = _SIMPLE_STEP_RE.match((selector or "").strip())
+    if not match:
+        return None
+    tag = match.group(1)
+    # A quoted value may itself contain " and " — split only when every piece is a
+    # well-formed term, otherwise let lxml decide.
+    terms = []
+    for predicate in _PREDICATE_RE.findall(match.group(2)):
+        for part in _AND_SPLIT_RE.split(predicate.strip()):
+            term = _EQUALITY_TERM_RE.match(part)
+            if not term:
+                return None
+            value = term.group(2) if term.group(2) is not None else term.group(3)
+            terms.append((term.group(1), value))
+    return tag, tuple(terms)
+
+
+class DumpNode:
+    """One element of a dump, with the attributes the readers need already decoded."""
+
+    __slots__ = (
+        "index", "element", "tag", "class_name", "resource_id", "text", "content_desc", "_bounds",
+    )
+
+    def __init__(self, index: int, element) -> None:
+        self.index = index
+        self.element = element
+        self.tag = element.tag
+        attrib = element.attrib
+        # uiautomator2 names elements after their class; a raw uiautomator dump uses
+        # `<node class="...">`. Either way this is the widget class.
+        self.class_name = attrib.get("class") or element.tag
+        self.resource_id = attrib.get("resource-id", "")
+        self.text = attrib.get("text", "")
+        self.content_desc = attrib.get("content-desc", "")
+        self._bounds = None
+
+    @property
+    def bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """Integer ``(x1, y1, x2, y2)``, parsed on first access."""
+        if self._bounds is None:
+            self._bounds = parse_bounds(self.element.attrib.get("bounds", "")) or ()
+        return self._bounds or None
+
+    def get(self, name: str, default: str = "") -> str:
+        return self.element.attrib.get(name, default)
+
+
+class DumpIndex:
+    """Flat, hash-indexed view of one hierarchy snapshot.
+
+    ``xpath()`` is a drop-in for ``tree.xpath()``: it returns lxml elements, so callers
+    keep reading ``element.get('text')`` and may still run relative XPaths on them.
+    """
+
+    def __init__(self, root) -> None:
+        self.root = root
+        self.nodes: List[DumpNode] = []
+        self.by_resource_id: Dict[str, List[int]] = {}
+        self.by_text: Dict[str, List[int]] = {}
+        self.by_content_desc: Dict[str, List[int]] = {}
+        self.by_class: Dict[str, List[int]] = {}
+        self.by_tag: Dict[str, List[int]] = {}
+        # Attributes with their own hash map. Any other equality predicate (``@clickable``,
+        # ``@selected``...) is checked on the candidates of an indexed one.
+        self._attribute_maps = {
+            "resource-id": self.by_resource_id,
+            "text": self.by_text,
+            "content-desc": self.by_content_desc,
+            "class": self.by_class,
+        }
+        self.fast_hits = 0
+        self.fallbacks = 0
+
+        for element in root.iter():
+            if not isinstance(element.tag, str):
+                continue  # comments / processing instructions
+            node = DumpNode(len(self.nodes), element)
+            self.nodes.append(node)
+            self.by_tag.setdefault(node.tag, []).append(node.index)
+            if node.class_name:
+                self.by_class.setdefault(node.class_name, []).append(node.index)
+            if node.resource_id:
+                self.by_resource_id.setdefault(node.resource_id, []).append(node.index)
+            if node.text:
+                self.by_text.setdefault(node.text, []).append(node.index)
+            if node.content_desc:
+                self.by_content_desc.setdefault(node.content_desc, []).append(node.index)
+
+    @classmethod
+    def from_xml(cls, xml_content: Optional[str]) -> Optional["DumpIndex"]:
+        """Parse a dump string; None when it is empty or not XML."""
+        if not xml_content:
+            return None
+        # lxml is imported on the first parse, not when a bridge imports this module.
+        from lxml import etree
+
+        try:
+            return cls(etree.fromstring(xml_content.encode("utf-8")))
+        except Exception:
+            return None
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    # -- queries -------------------------------------------------------------
+
+    def _candidates(self, tag: str, terms) -> List[int]:
+        maps = self._attribute_maps
+        for attr, value in terms:
+            if attr in maps:
+                if value == "":
+                    # `@text=""` also matches nodes where the attribute is present but
+                    # empty, which the maps deliberately do not hold.
+                    break
+                return maps[attr].get(value, [])
+        if tag != "*":
+            return self.by_tag.get(tag, [])
+        return list(range(len(self.nodes)))
+
+    def find(self, selector: str) -> Optional[List[DumpNode]]:
+        """Nodes matching a simple selector, or None when it needs full XPath."""
+        compiled = compile_simple_selector(selector)
+        if compiled is None:
+            return None
+        tag, terms = compiled
+        matches = []
+        for idx in self._candidates(tag, terms):
+            node = self.nodes[idx]
+            if tag != "*" and node.tag != tag:
+                continue
+            attrib = node.element.attrib
+            if all(attrib.get(attr) == value for attr, value in terms):
+                matches.append(node)
+        return matches
+
+    def xpath(self, selector: str) -> list:
+        """Elements matching ``selector`` in document order, like ``tree.xpath``.
+
+        Raises what lxml raises for an invalid expression, so existing
+        ``try: ... except Exception: continue`` loops keep their behaviour.
+        """
+        nodes = self.find(selector)
+        if nodes is not None:
+            self.fast_hits += 1
+            return [node.element for node in nodes]
+        self.fallbacks += 1
+        return self.root.xpath(selector)
+
+    def exists(self, selector: str) -> bool:
+        try:
+            return bool(self.xpath(selector))
+        except Exception:
+            return False
+
+    def first(self, selector: str):
+        """First matching element, or None (also on an invalid expression)."""
+        try:
+            elements = self.xpath(selector)
+        except Exception:
+            return None
+        return elements[0] if elements else None
+
+
+def scope_dump_xml(
+    xml_content: Optional[str],
+    root_resource_ids: Sequence[str] = (),
+    *,
+    visible_only: bool = False,
+) -> Tuple[Optional[str], bool]:
+    """Cut a dump down to what an optional reader actually looks at.
+
+    Keeps only the subtrees rooted at ``root_resource_ids`` (outermost match wins, in
+    document order) under the original ``<hierarchy>`` element, and with
+    ``visible_only`` drops every node the agent reported as ``visible-to-user="false"``
+    together with its children. Returns ``(xml, found)``: ``found`` is False when roots
+    were requested and none is on screen — the caller decides whether that warrants a
+    fuller dump. An unparseable input comes back as ``(None, False)``.
+    """
+    if not xml_content:
+        return None, False
+    from lxml import etree
+
+    try:
+        root = etree.fromstring(xml_content.encode("utf-8"))
+    except Exception:
+        return None, False
+
+    if visible_only:
+        hidden = [el for el in root.iter() if el.get("visible-to-user") == "false"]
+        for element in hidden:
+            parent = element.getparent()
+            if parent is not None:
+                parent.remove(element)
+
+    wanted = {rid for rid in root_resource_ids if rid}
+    if not wanted:
+        return etree.tostring(root, encoding="unicode"), True
+
+    scoped = etree.Element(root.tag, dict(root.attrib))
+    kept = []
+    for element in root.iter():
+        if element.get("resource-id") not in wanted:
+            continue
+        if any(ancestor in kept for ancestor in element.iterancestors()):
+            continue
+        kept.append(element)
+    for element in kept:
+        scoped.append(element)
+    return etree.tostring(scoped, encoding="unicode"), bool(kept)
+
+
+# One snapshot is typically read by several helpers in a row (flags, texts, avatar,
+# bio region...). Re-indexing the exact same string is the waste this module removes,
+# so the last index is kept, keyed on the dump itself.
+_last_index: Tuple[Optional[str], Optional[DumpIndex]] = (None, None)
+
+
+def index_for_xml(xml_content: Optional[str]) -> Optional[DumpIndex]:
+    """Shared ``DumpIndex`` of a dump string, reused while the same snapshot is read."""
+    global _last_index
+    cached_xml, cached_index = _last_index
+    if xml_content and cached_index is not None and (
+        cached_xml is xml_content or cached_xml == xml_content
+    ):
+        return cached_index
+    index = DumpIndex.from_xml(xml_content)
+    if index is not None:
+        _last_index = (xml_content, index)
+    return index
+
+
+__all__ = ["DumpIndex", "DumpNode", "compile_simple_selector", "index_for_xml", "scope_dump_xml"]
@@ -6,7 +6,7 @@ Instagram and TikTok device facades. Platform-specific facades
 inherit from this and override only what differs (app_id, swipe behavior, etc.).
 """
 
-from typing import Any, Dict, Optional, List, Union, Tuple
+from typing import Any, Dict, Optional, List, Sequence, Union, Tuple
 from enum import Enum
 import time
 import os
@@ -32,6 +32,9 @@ class BaseDeviceFacade:
     
     app_id: str = ''
     _facade_name: str = 'BaseDeviceFacade'
+    # None until the agent has answered a compressed dump request once; False after it
+    # rejected one, so an old agent costs a single failed call per facade, not one per read.
+    _compressed_dump_supported: Optional[bool] = None
     
     def __init__(self, device, module_name: str = "shared-device-facade"):
         self.logger = logger.bind(module=module_name)
@@ -186,6 +189,94 @@ class BaseDeviceFacade:
             self.logger.error(f"Error getting XML dump: {e}")
             return None
     
+    @staticmethod
+    def _is_rpc_rejection(exc: Exception) -> bool:
+        """Did the agent itself refuse the call (unknown method, bad params, RPC error)?
+
+        Only that says compression is unsupported. A timeout, a dropped connection or a
+        busy agent are transient and must not switch compression off for the session.
+        """
+        name = type(exc).__name__.lower()
+        text = str(exc).lower()
+        return ("rpc" in name or "method not found" in text or "-32601" in text
+                or "-32602" in text or "invalid params" in text)
+
+    @property
+    def compressed_dumps_active(self) -> bool:
+        """True once the agent has served a compressed dump: a reader that found nothing
+        in one may want to look again in a full dump before concluding."""
+        return self._compressed_dump_supported is True
+
+    def _get_compressed_xml_dump(self, timeout_seconds: Optional[float] = None) -> Optional[str]:
+        """Ask the agent for its compressed hierarchy (accessibility-important nodes only).
+
+        Returns None when the agent does not support it; the flag is then remembered, but
+        only when the agent rejected the call (`_is_rpc_rejection`). Any other failure says
+        nothing about support and is simply reported as no dump.
+        """
+        if self._compressed_dump_supported is False:
+            return None
+        try:
+            max_depth = self._device.settings.get("max_depth")
+            if max_depth is None:
+                max_depth = 50
+            kwargs = {}
+            if timeout_seconds is not None:
+                kwargs["http_timeout"] = max(0.1, float(timeout_seconds))
+            xml = self._device.jsonrpc.dumpWindowHierarchy(True, max_depth, **kwargs)
+        except Exception as e:
+            if self._is_rpc_rejection(e):
+                self._compressed_dump_supported = False
+                self.logger.debug(f"Compressed dump unsupported, using full dumps: {e}")
+            else:
+                self.logger.debug(f"Compressed dump failed, full dump this time: {e}")
+            return None
+        self._compressed_dump_supported = True
+        return xml
+
+    def get_scoped_xml_dump(
+        self,
+        root_resource_ids: Sequence[str] = (),
+        *,
+        visible_only: bool = True,
+        compressed: bool = True,
+        timeout_seconds: Optional[float] = None,
+    ) -> Optional[str]:
+        """Dump for optional reads that only need part of the screen.
+
+        The agent cannot serialise a subtree, so the reduction happens in two places: the
+        device sends its compressed hierarchy when it supports one, and the result is cut
+        down to the ``root_resource_ids`` subtrees (and to visible nodes) before any
+        reader parses it. Compression may drop a layout-only container, so a requested
+        root missing from the compressed dump triggers one full dump before concluding
+        it is not on screen. The returned XML keeps the ``<hierarchy>`` root, so existing
+        selectors evaluate unchanged.
+        """
+        from taktik.core.shared.device.dump_index import scope_dump_xml
+
+        xml = self._get_compressed_xml_dump(timeout_seconds) if compressed else None
+        used_compressed = xml is not None
+        if xml is None:
+            xml = self.get_xml_dump(timeout_seconds)
+        scoped, found = scope_dump_xml(xml, root_resource_ids, visible_only=visible_only)
+        if not found and used_compressed:
+            scoped, _ = scope_dump_xml(
+                self.get_xml_dump(timeout_seconds), root_resource_ids, visible_only=visible_only
+            )
+        return scoped
+
+    def get_dump_index(self, timeout_seconds: Optional[float] = None):
+        """Dump the screen once and return its shared ``DumpIndex`` (None on failure).
+
+        Readers that evaluate several selectors against the same snapshot should take
+        the index instead of the raw XML: simple selectors become hash lookups.
+        """
+        from taktik.core.shared.device.dump_index import index_for_xml
+
+        if timeout_seconds is None:
+            return index_for_xml(self.get_xml_dump())
+        return index_for_xml(self.get_xml_dump(timeout_seconds=timeout_seconds))
+
     def screenshot(self, filename: str) -> bool:
         try:
             os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
@@ -4,6 +4,8 @@ from typing import List, Dict, Optional, Tuple
 import uiautomator2 as u2
 from loguru import logger
 
+from taktik.core.shared.device.connections import get_connection_registry
+
 
 class DeviceManager:
     # ATX agent packages
@@ -57,19 +59,26 @@ class DeviceManager:
                     return False
                 self.device_id = devices[0]["id"]
             
-            self.device = u2.connect(self.device_id)
+            # Warm connection: a previous workflow in this process may already hold a
+            # connected device for this serial, together with a recent health probe.
+            registry = get_connection_registry()
+            self.device = registry.get_u2_device(self.device_id)
             logger.info(f"Connected to device: {self.device_id}")
             
             # Verify ATX agent is working (only once per session)
             # Non-blocking: log warning but don't prevent connection
             # The workflow can still work even if ATX is temporarily unhealthy
             if verify_atx and not self._atx_verified:
-                if self._verify_and_repair_atx():
+                if registry.is_health_fresh(self.device_id):
+                    logger.debug("✅ ATX agent probed healthy recently - verification skipped")
+                    self._atx_verified = True
+                elif self._verify_and_repair_atx():
                     self._atx_verified = True
                 else:
                     logger.warning("⚠️ ATX agent verification failed - continuing anyway (workflow may still work)")
                     # Don't return False: let the workflow attempt to proceed
             
+            registry.start_keepalive()
             return True
             
         except Exception as e:
@@ -112,10 +121,15 @@ class DeviceManager:
         try:
             # Try a simple operation that requires ATX
             info = self.device.info
-            if info and 'displayWidth' in info:
+            healthy = bool(info and 'displayWidth' in info)
+            if self.device_id:
+                get_connection_registry().record_health(self.device_id, healthy)
+            if healthy:
                 return True, None
             return False, "Device info incomplete"
         except Exception as e:
+            if self.device_id:
+                get_connection_registry().record_health(self.device_id, False)
             error_msg = str(e)
             # Common ATX errors
             if "uiautomator" in error_msg.lower():
@@ -144,6 +158,7 @@ class DeviceManager:
             # Method 2: Force reinstall via u2.connect with init=True
             try:
                 self.device = u2.connect(self.device_id)
+                get_connection_registry().replace_u2_device(self.device_id, self.device)
                 # Try to force init
                 if hasattr(self.device, 'uiautomator'):
                     self.device.uiautomator.start()
@@ -165,6 +180,7 @@ class DeviceManager:
                 
                 # Reconnect to trigger ATX restart
                 self.device = u2.connect(self.device_id)
+                get_connection_registry().replace_u2_device(self.device_id, self.device)
                 return True
             except Exception as e:
                 logger.warning(f"ADB ATX restart failed: {e}")
@@ -0,0 +1,432 @@
+"""
+Background media prefetch for publish queues (Shared)
+
+Publishing used to push each file right before composing: `adb push` of a video is the
+longest step of a publish, and the workflow sat idle for it every time. When the queue of
+upcoming media is known, `MediaPrefetcher` transfers it in the background while the current
+post is being composed, so composing post N never waits on the transfer of post N.
+
+Why a staging directory?
+------------------------
+The publish flows pick "the first gallery item", i.e. the most recent media. A file
+prefetched into `DCIM/Camera` would become that item and be published in place of the
+current one. Prefetched files therefore land in a hidden staging directory carrying a
+`.nomedia` marker (never indexed by MediaStore). `activate()` then moves the file into the
+camera folder under a fresh `TAKTIK_<timestamp>` name — a rename on the same volume, not a
+transfer — and runs the usual `trigger_media_scan`, right when the flow needs it.
+
+Bounds and dedup
+----------------
+- Staged files are named by content hash: media already on the device (a repeated post, a
+  leftover from a run that crashed) is found by one `stat` listing and never pushed again.
+- At most `max_staged_bytes` wait in staging; a worker blocks until an activation frees
+  room. Only files this prefetcher pushed count against that budget: leftovers from an
+  earlier run can never be activated to free room, so counting them could block the
+  workers for good. A push that would leave less than `min_free_bytes` on the device is
+  not staged.
+- `activate()` waits at most `DEFAULT_ACTIVATE_TIMEOUT_S` for its file by default. A file
+  still queued or waiting for room is then taken off the queue and pushed directly; one whose
+  transfer already started is waited for instead — a second push of it would only share the
+  same USB link.
+- `max_workers` bounds concurrent transfers (one USB link rarely benefits from more than 1).
+
+Anything that fails here degrades to the plain `push_media` path at activation time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from . import media_store
+from .media_store import DEFAULT_FILE_PREFIX, DEFAULT_REMOTE_DIR
+
+
+DEFAULT_STAGING_DIR = '/sdcard/.taktik_staging'
+DEFAULT_MAX_STAGED_BYTES = 1024 * 1024 * 1024
+DEFAULT_MIN_FREE_BYTES = 512 * 1024 * 1024
+DEFAULT_ACTIVATE_TIMEOUT_S = 180.0
+
+_HASH_CHUNK = 1024 * 1024
+_digest_cache: Dict[tuple, str] = {}
+
+
+def file_digest(path: str) -> str:
+    """Short SHA-256 of the file content, cached by (path, size, mtime)."""
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+    cached = _digest_cache.get(key)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    value = digest.hexdigest()[:32]
+    _digest_cache[key] = value
+    return value
+
+
+def _digest_or_none(entry: '_StagedMedia') -> Optional[str]:
+    if entry.digest is not None:
+        return entry.digest
+    try:
+        return file_digest(entry.local_path)
+    except OSError:
+        return None
+
+
+class _StagedMedia:
+    __slots__ = ('local_path', 'digest', 'size', 'ext', 'ready', 'staged', 'activated',
+                 'pushing', 'cancelled')
+
+    def __init__(self, local_path: str) -> None:
+        self.local_path = local_path
+        self.digest: Optional[str] = None
+        self.size = 0
+        self.ext = os.path.splitext(local_path)[1] or '.mp4'
+        self.ready = threading.Event()
+        self.staged = False
+        self.activated = False
+        self.pushing = False     # its transfer started (set under the prefetcher's lock)
+        self.cancelled = False   # `activate` gave up waiting: never start its transfer
+
+
+class MediaPrefetcher:
+    """Push upcoming publish media to a device staging area in the background.
+
+    Parameters
+    ----------
+    device_id        : ADB serial
+    media_paths      : Upcoming local files, in publish order (more via `enqueue`)
+    remote_dir       : Camera folder the media is activated into
+    file_prefix      : Prefix of the activated name (see `media_store.push_media`)
+    staging_dir      : Hidden on-device directory holding prefetched files
+    max_workers      : Concurrent transfers
+    max_staged_bytes : Staged-but-not-activated bytes allowed on the device
+    min_free_bytes   : Free space a prefetch must leave on the device volume
+    """
+
+    def __init__(
+        self,
+        device_id: str,
+        media_paths: Iterable[str] = (),
+        *,
+        remote_dir: str = DEFAULT_REMOTE_DIR,
+        file_prefix: str = DEFAULT_FILE_PREFIX,
+        staging_dir: str = DEFAULT_STAGING_DIR,
+        max_workers: int = 1,
+        max_staged_bytes: int = DEFAULT_MAX_STAGED_BYTES,
+        min_free_bytes: int = DEFAULT_MIN_FREE_BYTES,
+        log: Optional[Callable[[str, str], None]] = None,
+    ) -> None:
+        self.device_id = device_id
+        self.remote_dir = remote_dir
+        self.file_prefix = file_prefix
+        self.staging_dir = staging_dir.rstrip('/')
+        self.max_workers = max(1, int(max_workers))
+        self.max_staged_bytes = max_staged_bytes
+        self.min_free_bytes = min_free_bytes
+        self._log_cb = log
+
+        self._cond = threading.Condition()
+        self._entries: Dict[str, _StagedMedia] = {}
+        self._pending: Deque[_StagedMedia] = deque()
+        self._workers: List[threading.Thread] = []
+        self._running_workers = 0
+        self._closed = False
+        self._prepared = False
+        # digest -> (size, file name) of every complete file in staging, ours or left by an
+        # earlier run.
+        self._remote: Dict[str, Tuple[int, str]] = {}
+        self._in_flight: Set[str] = set()
+        # Digests this prefetcher pushed: the only ones `_staged_bytes` accounts for.
+        self._pushed: Set[str] = set()
+        self._staged_bytes = 0
+        self._free_bytes: Optional[int] = None
+
+        self.enqueue(media_paths)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def enqueue(self, media_paths: Iterable[str]) -> None:
+        """Add upcoming media to the background queue (duplicates are ignored)."""
+        with self._cond:
+            if self._closed:
+                return
+            for path in media_paths:
+                self._entry_locked(path, front=False)
+            self._start_workers_locked()
+            self._cond.notify_all()
+
+    def activate(
+        self,
+        local_path: str,
+        *,
+        timeout: Optional[float] = DEFAULT_ACTIVATE_TIMEOUT_S,
+        log: Optional[Callable[[str, str], None]] = None,
+    ) -> Optional[str]:
+        """Move the staged copy of `local_path` into the gallery and index it.
+
+        A file nobody enqueued jumps to the front of the queue. Its staging is waited for up
+        to `timeout` (None waits for good); past that a transfer not started yet is cancelled,
+        and one in progress is waited for to the end rather than pushed a second time. Falls
+        back to a direct `push_media` when staging is unavailable. Returns the remote path
+        (already media-scanned) or None.
+        """
+        with self._cond:
+            entry = self._entry_locked(local_path, front=True)
+            if entry is not None and not self._closed:
+                self._start_workers_locked()
+                self._cond.notify_all()
+        if entry is None:
+            logger.error(f'[media_prefetch] file not found: {local_path}')
+            return None
+
+        if not entry.ready.wait(timeout):
+            with self._cond:
+                entry.cancelled = True
+                if entry in self._pending:
+                    self._pending.remove(entry)
+                pushing = entry.pushing
+                self._cond.notify_all()
+            name = os.path.basename(local_path)
+            if pushing:
+                self._log('debug', f'[media_prefetch] {name} still transferring, waiting for it')
+                entry.ready.wait()
+            else:
+                self._log('debug', f'[media_prefetch] staging of {name} not started, pushing directly')
+        remote_path = self._activate_staged(entry) if entry.ready.is_set() and entry.staged else None
+        if remote_path is None:
+            remote_path = media_store.push_media(
+                self.device_id, local_path, remote_dir=self.remote_dir, file_prefix=self.file_prefix
+            )
+            if not remote_path:
+                return None
+        media_store.trigger_media_scan(self.device_id, remote_path, local_path, log=log or self._log_cb)
+        return remote_path
+
+    def close(self, *, remove_staged: bool = True) -> None:
+        """Stop the workers; by default delete whatever was staged but never activated."""
+        with self._cond:
+            self._closed = True
+            # Nothing will stage these any more: release anyone waiting in `activate`.
+            for entry in self._pending:
+                entry.ready.set()
+            self._pending.clear()
+            self._cond.notify_all()
+            workers = list(self._workers)
+        for worker in workers:
+            if worker is not threading.current_thread():
+                worker.join(timeout=5.0)
+        if not remove_staged:
+            return
+        with self._cond:
+            leftovers = [self._staged_path(name) for _, name in self._remote.values()]
+            self._remote.clear()
+            self._pushed.clear()
+            self._staged_bytes = 0
+        if leftovers:
+            media_store._adb_shell_batch(self.device_id, [['rm', '-f', *leftovers]])
+
+    def __enter__(self) -> 'MediaPrefetcher':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Queue / workers
+    # ------------------------------------------------------------------
+
+    def _entry_locked(self, path: str, *, front: bool) -> Optional[_StagedMedia]:
+        key = os.path.abspath(path)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if front and entry in self._pending:
+                self._pending.remove(entry)
+                self._pending.appendleft(entry)
+            return entry
+        if not os.path.isfile(path):
+            return None
+        entry = _StagedMedia(path)
+        self._entries[key] = entry
+        if self._closed:
+            entry.ready.set()
+        elif front:
+            self._pending.appendleft(entry)
+        else:
+            self._pending.append(entry)
+        return entry
+
+    def _start_workers_locked(self) -> None:
+        # Counted under the lock (not `is_alive`): a worker that saw an empty queue has
+        # already given up even if its thread has not finished returning.
+        self._workers = [w for w in self._workers if w.is_alive()]
+        while self._running_workers < min(self.max_workers, len(self._pending)):
+            self._running_workers += 1
+            worker = threading.Thread(
+                target=self._worker_loop, daemon=True,
+                name=f'media-prefetch-{self.device_id}-{self._running_workers}',
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                if self._closed or not self._pending:
+                    self._running_workers -= 1
+                    return
+                entry = self._pending.popleft()
+            try:
+                self._stage(entry)
+            except Exception as e:
+                logger.debug(f'[media_prefetch] staging failed for {entry.local_path}: {e}')
+            finally:
+                entry.ready.set()
+
+    def _stage(self, entry: _StagedMedia) -> None:
+        entry.digest = file_digest(entry.local_path)
+        entry.size = os.path.getsize(entry.local_path)
+        self._prepare()
+
+        with self._cond:
+            # Content already on the device, or being pushed for another path: no transfer.
+            while entry.digest in self._in_flight and not self._closed and not entry.cancelled:
+                self._cond.wait()
+            if entry.digest in self._remote:
+                entry.staged = True
+                return
+            # Bounded staging: wait for activations to free room (always admit one file).
+            while (not self._closed and not entry.cancelled and self._staged_bytes > 0
+                   and self._staged_bytes + entry.size > self.max_staged_bytes):
+                self._cond.wait()
+            if self._closed or entry.cancelled:
+                return
+            if self._free_bytes is not None and self._free_bytes - entry.size < self.min_free_bytes:
+                self._log('warning', f'[media_prefetch] device storage too low to stage {os.path.basename(entry.local_path)}')
+                return
+            self._in_flight.add(entry.digest)
+            entry.pushing = True
+            self._staged_bytes += entry.size
+            if self._free_bytes is not None:
+                self._free_bytes -= entry.size
+
+        name = f'{entry.digest}{entry.ext}'
+        final = self._staged_path(name)
+        ok = False
+        try:
+            # Push under a temporary name: a listed `<digest><ext>` is always complete.
+            part = f'{final}.part'
+            if media_store._adb_push(self.device_id, entry.local_path, part):
+                results = media_store._adb_shell_batch(self.device_id, [['mv', '-f', part, final]])
+                ok = results[0].exit_code == 0
+        finally:
+            with self._cond:
+                self._in_flight.discard(entry.digest)
+                if ok:
+                    self._remote[entry.digest] = (entry.size, name)
+                    self._pushed.add(entry.digest)
+                    entry.staged = True
+                else:
+                    self._staged_bytes -= entry.size
+                    if self._free_bytes is not None:
+                        self._free_bytes += entry.size
+                self._cond.notify_all()
+        if ok:
+            self._log('debug', f'[media_prefetch] staged {os.path.basename(entry.local_path)}')
+
+    def _prepare(self) -> None:
+        """Create the staging dir and read what it already holds, once, in one shell."""
+        with self._cond:
+            if self._prepared:
+                return
+            self._prepared = True
+        staging = self.staging_dir
+        results = media_store._adb_shell_batch(self.device_id, [
+            ['mkdir', '-p', staging],
+            ['touch', f'{staging}/.nomedia'],
+            f'rm -f {staging}/*.part',
+            f'stat -c "%s %n" {staging}/* 2>/dev/null',
+            ['stat', '-f', '-c', '%a %S', staging],
+        ])
+        remote: Dict[str, Tuple[int, str]] = {}
+        for line in results[3].output.splitlines():
+            size, _, path = line.strip().partition(' ')
+            name = os.path.basename(path)
+            digest = os.path.splitext(name)[0]
+            if size.isdigit() and digest and not name.startswith('.'):
+                remote[digest] = (int(size), name)
+        free: Optional[int] = None
+        try:
+            blocks, block_size = results[4].output.split()
+            free = int(blocks) * int(block_size)
+        except ValueError:
+            pass
+        with self._cond:
+            # Leftovers are reused for dedup but not counted: see the module docstring.
+            self._remote.update(remote)
+            self._free_bytes = free
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Activation
+    # ------------------------------------------------------------------
+
+    def _activate_staged(self, entry: _StagedMedia) -> Optional[str]:
+        with self._cond:
+            known = self._remote.get(entry.digest)
+        if known is None:
+            return None
+        staged = self._staged_path(known[1])
+        remote_path = f'{self.remote_dir.rstrip("/")}/{media_store._unique_media_name(self.file_prefix, entry.ext)}'
+        with self._cond:
+            others = [e for e in self._entries.values() if e is not entry and not e.activated]
+        # Another queued path with the same content still needs the staged copy (hashing is
+        # cached, and a not-yet-staged entry would be hashed by its worker anyway).
+        keep = any(_digest_or_none(other) == entry.digest for other in others)
+        move = ['cp', staged, remote_path] if keep else ['mv', '-f', staged, remote_path]
+        results = media_store._adb_shell_batch(
+            self.device_id, [['mkdir', '-p', self.remote_dir], move], stop_on_error=True, timeout=60
+        )
+        if results[1].exit_code != 0:
+            self._log('debug', f'[media_prefetch] activation of {os.path.basename(entry.local_path)} failed, pushing directly')
+            return None
+        with self._cond:
+            entry.activated = True
+            if not keep:
+                self._remote.pop(entry.digest, None)
+                if entry.digest in self._pushed:
+                    self._pushed.discard(entry.digest)
+                    self._staged_bytes -= known[0]
+                self._cond.notify_all()
+        logger.info(f'[media_store] activated {os.path.basename(entry.local_path)} → {remote_path}')
+        return remote_path
+
+    def _staged_path(self, name: str) -> str:
+        return f'{self.staging_dir}/{name}'
+
+    def _log(self, level: str, msg: str) -> None:
+        if self._log_cb is not None:
+            try:
+                self._log_cb(level, msg)
+                return
+            except Exception:
+                pass
+        getattr(logger, level if hasattr(logger, level) else 'debug')(msg)
+
+
+__all__ = [
+    'DEFAULT_ACTIVATE_TIMEOUT_S',
+    'DEFAULT_STAGING_DIR',
+    'MediaPrefetcher',
+    'file_digest',
+]
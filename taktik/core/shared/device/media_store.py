@@ -31,11 +31,14 @@ from __future__ import annotations
 
 import os
 import subprocess
+import threading
 import time
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from loguru import logger
 
+from .adb import ShellCommand, ShellResult, run_adb_shell_batch
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -70,6 +73,34 @@ def _adb_shell(device_id: str, *args: str, timeout: int = 15) -> tuple[int, str,
         return 1, '', str(e)
 
 
+def _adb_shell_batch(device_id: str, commands: Sequence[ShellCommand], *, stop_on_error: bool = False,
+                    timeout: int = 30) -> List[ShellResult]:
+    """Run several shell commands in one adb round trip (see `adb.run_adb_shell_batch`)."""
+    return run_adb_shell_batch(device_id, commands, stop_on_error=stop_on_error, timeout=timeout)
+
+
+# Per-device facts that never change while a device stays connected: reading them once
+# saves a shell per push / scan.
+_sdk_versions: Dict[str, int] = {}
+_ensured_dirs: Set[Tuple[str, str]] = set()
+
+
+_name_lock = threading.Lock()
+_last_name_stamp: Dict[str, int] = {}
+
+
+def _unique_media_name(file_prefix: str, ext: str) -> str:
+    """`<prefix>_<YYYYmmdd_HHMMSS><ext>`, never the same second twice for one prefix.
+
+    Names are second-resolution; a carousel or a prefetched queue lands several files within
+    one second, and the second `push`/`mv` would silently overwrite the first.
+    """
+    with _name_lock:
+        stamp = max(int(time.time()), _last_name_stamp.get(file_prefix, 0) + 1)
+        _last_name_stamp[file_prefix] = stamp
+    return f'{file_prefix}_{time.strftime("%Y%m%d_%H%M%S", time.localtime(stamp))}{ext}'
+
+
 def _adb_push(device_id: str, local_path: str, remote_path: str, timeout: int = 60) -> bool:
     """Run `adb -s <device_id> push <local> <remote>`. Returns True on success."""
     try:
@@ -95,12 +126,17 @@ def get_android_sdk_version(device_id: str) -> int:
 
     Defaults to 28 (Android 9) on failure — the safe broadcast-only branch.
     """
+    cached = _sdk_versions.get(device_id)
+    if cached is not None:
+        return cached
     rc, out, _ = _adb_shell(device_id, 'getprop', 'ro.build.version.sdk')
     try:
-        return int(out)
+        sdk = int(out)
     except (TypeError, ValueError):
         logger.debug('[media_store] could not read SDK version, defaulting to 28')
         return 28
+    _sdk_versions[device_id] = sdk
+    return sdk
 
 
 def is_video_file(path: str) -> bool:
@@ -144,12 +180,14 @@ def push_media(
         return None
 
     ext = os.path.splitext(local_path)[1] or '.mp4'
-    ts = time.strftime('%Y%m%d_%H%M%S')
-    filename = f'{file_prefix}_{ts}{ext}'
+    filename = _unique_media_name(file_prefix, ext)
     remote_path = f'{remote_dir.rstrip("/")}/{filename}'
 
-    # mkdir -p the remote dir (no-op if exists)
-    _adb_shell(device_id, 'mkdir', '-p', remote_dir)
+    # mkdir -p the remote dir (no-op if exists) — once per device and directory.
+    if (device_id, remote_dir) not in _ensured_dirs:
+        rc, _, _ = _adb_shell(device_id, 'mkdir', '-p', remote_dir)
+        if rc == 0:
+            _ensured_dirs.add((device_id, remote_dir))
 
     if not _adb_push(device_id, local_path, remote_path):
         return None
@@ -209,25 +247,31 @@ def purge_pushed_media(
         return 0
 
     cutoff = time.time() - max_age_hours * 3600
-    removed = 0
+    stale: List[str] = []
     for name in (line.strip() for line in out.splitlines()):
         if not name:
             continue
         pushed_at = parse_pushed_timestamp(name, file_prefix)
         if pushed_at is None or pushed_at > cutoff:
             continue
+        stale.append(f'{remote_dir.rstrip("/")}/{name}')
 
-        remote_path = f'{remote_dir.rstrip("/")}/{name}'
-        rm_code, _, _ = _adb_shell(device_id, 'rm', '-f', remote_path)
-        if rm_code != 0:
-            continue
+    if not stale:
+        return 0
 
-        # Drop the MediaStore row too: deleting the file alone leaves a ghost thumbnail in the
-        # gallery, and the picker would offer a medium that no longer exists.
+    # Every deletion goes out in ONE shell: per file, the rm then its MediaStore rows. Drop the
+    # MediaStore row too: deleting the file alone leaves a ghost thumbnail in the gallery, and
+    # the picker would offer a medium that no longer exists.
+    commands: List[ShellCommand] = []
+    rm_indexes: List[int] = []
+    for remote_path in stale:
+        rm_indexes.append(len(commands))
+        commands.append(['rm', '-f', remote_path])
         normalized = remote_path.replace('/sdcard/', '/storage/emulated/0/')
         for uri in ('content://media/external/images/media', 'content://media/external/video/media'):
-            _adb_shell(device_id, 'content', 'delete', '--uri', uri, '--where', f'_data=\'{normalized}\'')
-        removed += 1
+            commands.append(['content', 'delete', '--uri', uri, '--where', f'_data=\'{normalized}\''])
+    results = _adb_shell_batch(device_id, commands, timeout=max(30, 5 * len(stale)))
+    removed = sum(1 for i in rm_indexes if results[i].exit_code == 0)
 
     if removed:
         _log('info', f'[media_store] purged {removed} previously pushed media older than {max_age_hours:g}h')
@@ -275,69 +319,57 @@ def trigger_media_scan(
     filename = os.path.basename(remote_path)
     sdk = get_android_sdk_version(device_id)
 
+    scan_broadcast = ['am', 'broadcast', '-a', 'android.intent.action.MEDIA_SCANNER_SCAN_FILE',
+                      '-d', f'file://{normalized_path}']
     try:
-        # Step 0: update mtime so the file lands at top of Recents
-        _adb_shell(device_id, 'touch', remote_path)
-        _log('debug', f'[media_scan] touched {filename}')
+        # Step 0: update mtime so the file lands at top of Recents. It travels in the same
+        # shell as the scan commands below: one adb round trip per scan instead of 2-3.
+        touch = ['touch', remote_path]
 
         if is_video:
             # ── VIDEO: broadcast ONLY (preserves duration metadata) ──────────
             _log('debug', f'[media_scan] video → broadcast scan for {filename}')
-            _adb_shell(
-                device_id, 'am', 'broadcast',
-                '-a', 'android.intent.action.MEDIA_SCANNER_SCAN_FILE',
-                '-d', f'file://{normalized_path}'
-            )
+            commands = [touch, scan_broadcast]
             if sdk >= 29:
-                rc, _, _ = _adb_shell(
-                    device_id, 'content', 'call',
-                    '--uri', 'content://media',
-                    '--method', 'scan_file',
-                    '--arg', normalized_path
-                )
-                if rc == 0:
-                    _log('debug', f'[media_scan] content call scan_file fired for {filename}')
+                commands.append(['content', 'call', '--uri', 'content://media',
+                                 '--method', 'scan_file', '--arg', normalized_path])
+            results = _adb_shell_batch(device_id, commands, timeout=15)
+            _log('debug', f'[media_scan] touched {filename}')
+            if sdk >= 29 and results[2].exit_code == 0:
+                _log('debug', f'[media_scan] content call scan_file fired for {filename}')
 
         elif sdk >= 29:
             # ── IMAGE, Android 10+: content insert ───────────────────────────
             content_uri = 'content://media/external/images/media'
             now_sec = int(time.time())
             _log('debug', f'[media_scan] Android {sdk} → content insert for {filename}')
-            try:
-                result = subprocess.run(
-                    ['adb', '-s', device_id, 'shell',
-                     'content', 'insert',
-                     '--uri', content_uri,
-                     '--bind', f'_data:s:{normalized_path}',
-                     '--bind', f'_display_name:s:{filename}',
-                     '--bind', f'mime_type:s:{mime}',
-                     '--bind', f'date_modified:i:{now_sec}',  # :i: integer required (not :l:)
-                     '--bind', f'date_added:i:{now_sec}'],
-                    capture_output=True, text=True, timeout=10
-                )
-                ok = result.returncode == 0 and 'Error' not in (result.stdout or '')
-            except Exception as e:
-                _log('debug', f'[media_scan] content insert exception: {e}')
-                ok = False
+            insert = ['content', 'insert',
+                      '--uri', content_uri,
+                      '--bind', f'_data:s:{normalized_path}',
+                      '--bind', f'_display_name:s:{filename}',
+                      '--bind', f'mime_type:s:{mime}',
+                      '--bind', f'date_modified:i:{now_sec}',  # :i: integer required (not :l:)
+                      '--bind', f'date_added:i:{now_sec}']
+            results = _adb_shell_batch(device_id, [touch, insert], timeout=15)
+            _log('debug', f'[media_scan] touched {filename}')
+            inserted = results[1]
+            ok = inserted.exit_code == 0 and 'Error' not in inserted.output
 
             if not ok:
                 _log('debug', f'[media_scan] insert failed → fallback broadcast for {filename}')
-                _adb_shell(
-                    device_id, 'am', 'broadcast',
-                    '-a', 'android.intent.action.MEDIA_SCANNER_SCAN_FILE',
-                    '-d', f'file://{normalized_path}'
-                )
+                _adb_shell(device_id, *scan_broadcast)
             else:
                 _log('debug', f'[media_scan] content insert OK for {filename}')
 
         else:
             # ── IMAGE, Android ≤ 9: broadcast (original /sdcard/ path) ───────
             _log('debug', f'[media_scan] Android {sdk} → broadcast for {filename}')
-            _adb_shell(
-                device_id, 'am', 'broadcast',
-                '-a', 'android.intent.action.MEDIA_SCANNER_SCAN_FILE',
-                '-d', f'file://{remote_path}'
-            )
+            _adb_shell_batch(device_id, [
+                touch,
+                ['am', 'broadcast', '-a', 'android.intent.action.MEDIA_SCANNER_SCAN_FILE',
+                 '-d', f'file://{remote_path}'],
+            ], timeout=15)
+            _log('debug', f'[media_scan] touched {filename}')
 
         _log('info', f'📂 Media indexed in gallery: {filename}')
 
@@ -0,0 +1,227 @@
+"""Adaptive selector ordering — probe the alternative that matches on this build first.
+
+The selector dataclasses list fallbacks in a fixed order, and the probe helpers
+(`SharedBaseAction._find_and_click`, `wait_for_any`, ...) walk that order on every call.
+On an app version where only the fifth alternative still matches, each call pays four
+misses before it, in every poll round.
+
+`SelectorOrdering` learns, per (platform, app version, package) and per list, which
+alternatives actually match, and reorders the list accordingly:
+
+  * only calls that FOUND something are observed: the winner scores a hit and every
+    alternative probed before it in that round a miss. A call that found nothing says
+    nothing about the alternatives (the screen may simply not be there yet);
+  * counts are decayed (each observation ages the older ones by ``decay``), so the order
+    follows the build rather than its whole history;
+  * an alternative is demoted only once it is known dead on this build - at least
+    ``min_probes`` decayed observations with a hit rate under ``dead_rate``. Live
+    alternatives keep their source order, so a specific selector never loses precedence
+    to a generic fallback that happens to match more often; dead ones go last, best rate
+    first, source order breaking ties. With no data the order is exactly the source one.
+
+A list is identified by a digest of its XPaths in source order, which is stable across
+runs for a given catalog key (see `compat/selectors/catalog.py`). The learning is loaded
+from `selector_hit_rates` when a key is activated and written back every ``flush_every``
+observations, when the key is replaced or deactivated, and at interpreter exit.
+
+Nothing is reordered until a runtime activates a key (`activate_selector_ordering`), so
+code paths without an app context - and every unit test - probe in source order.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+
+log = logger.bind(module="shared-selector-order")
+
+Loader = Callable[[str, str, str], Dict[Tuple[str, str], Tuple[float, float]]]
+Saver = Callable[[str, str, str, List[Tuple[str, str, float, float]]], int]
+
+
+def list_id(selectors: Sequence[str]) -> str:
+    """Stable id of a selector list: digest of its XPaths in source order."""
+    return hashlib.sha1("\x1f".join(selectors).encode("utf-8")).hexdigest()[:16]
+
+
+def _load_from_db(platform: str, app_version: str, package: str):
+    from taktik.core.database.selector_hit_rates import SelectorHitRates
+
+    return SelectorHitRates.load(platform, app_version, package)
+
+
+def _save_to_db(platform: str, app_version: str, package: str, entries) -> int:
+    from taktik.core.database.selector_hit_rates import SelectorHitRates
+
+    return SelectorHitRates.save(platform, app_version, package, entries)
+
+
+class SelectorOrdering:
+    """Learned hit rates of one (platform, app version, package), and the orders they give."""
+
+    def __init__(
+        self,
+        platform: str,
+        app_version: Optional[str],
+        package: str,
+        *,
+        decay: float = 0.9,
+        dead_rate: float = 0.1,
+        min_probes: float = 3.0,
+        flush_every: int = 20,
+        loader: Optional[Loader] = None,
+        saver: Optional[Saver] = None,
+    ):
+        self.key = (platform, app_version or "", package)
+        self.decay = decay
+        self.dead_rate = dead_rate
+        self.min_probes = min_probes
+        self.flush_every = flush_every
+        self._saver = saver or _save_to_db
+        self._rates: Dict[Tuple[str, str], List[float]] = {
+            entry: [hits, probes] for entry, (hits, probes) in (loader or _load_from_db)(*self.key).items()
+        }
+        self._ids: Dict[Tuple[str, ...], str] = {}
+        self._orders: Dict[str, List[str]] = {}
+        self._dirty: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self.observations = 0
+        self.probes_saved = 0
+        self.reordered: Set[str] = set()
+
+    def _list_id(self, selectors: Tuple[str, ...]) -> str:
+        lid = self._ids.get(selectors)
+        if lid is None:
+            lid = self._ids[selectors] = list_id(selectors)
+        return lid
+
+    def is_dead(self, lid: str, xpath: str) -> bool:
+        hits, probes = self._rates.get((lid, xpath), (0.0, 0.0))
+        return probes >= self.min_probes and hits / probes < self.dead_rate
+
+    def order(self, selectors: Sequence[str]) -> List[str]:
+        """``selectors`` in probe order: live alternatives in source order, dead ones last."""
+        source = tuple(selectors)
+        if len(source) < 2:
+            return list(source)
+        with self._lock:
+            lid = self._list_id(source)
+            cached = self._orders.get(lid)
+            if cached is None:
+                live, dead = [], []
+                for index, xpath in enumerate(source):
+                    if self.is_dead(lid, xpath):
+                        hits, probes = self._rates[(lid, xpath)]
+                        dead.append((-hits / probes, index, xpath))
+                    else:
+                        live.append(xpath)
+                cached = self._orders[lid] = live + [xpath for _, _, xpath in sorted(dead)]
+                if cached != list(source):
+                    self.reordered.add(lid)
+            return list(cached)
+
+    def record(self, selectors: Sequence[str], probed: Sequence[str], winner: int) -> None:
+        """``probed[winner]`` matched after ``probed[:winner]`` missed, in one round."""
+        source = tuple(selectors)
+        if len(source) < 2:
+            return
+        with self._lock:
+            lid = self._list_id(source)
+            for position, xpath in enumerate(probed[:winner + 1]):
+                entry = self._rates.setdefault((lid, xpath), [0.0, 0.0])
+                entry[0] = entry[0] * self.decay + (1.0 if position == winner else 0.0)
+                entry[1] = entry[1] * self.decay + 1.0
+                self._dirty.add((lid, xpath))
+            self._orders.pop(lid, None)
+            self.observations += 1
+            # Positive when the learned order reached the winner sooner than the source order.
+            self.probes_saved += source.index(probed[winner]) - winner
+            due = bool(self._dirty) and self.observations % self.flush_every == 0
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write the entries touched since the last flush. Returns the number written."""
+        with self._lock:
+            entries = [(lid, xpath, *self._rates[(lid, xpath)]) for lid, xpath in self._dirty]
+            self._dirty = set()
+        if not entries:
+            return 0
+        return self._saver(*self.key, entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "observations": self.observations,
+            "probes_saved": self.probes_saved,
+            "lists_reordered": len(self.reordered),
+        }
+
+
+_active: Optional[SelectorOrdering] = None
+_exit_flush_registered = False
+
+
+def _flush_at_exit() -> None:
+    """Write the observations still below ``flush_every`` when the bridge process ends."""
+    ordering = _active
+    if ordering is None:
+        return
+    try:
+        ordering.flush()
+    except Exception as exc:
+        log.debug(f"Selector ordering not flushed at exit: {exc}")
+
+
+def activate_selector_ordering(platform: str, app_version: Optional[str], package: str,
+                               **kwargs) -> SelectorOrdering:
+    """Start reordering for a runtime key (the previous key, if any, is flushed first)."""
+    global _active, _exit_flush_registered
+    previous, _active = _active, None
+    if previous is not None:
+        previous.flush()
+    _active = SelectorOrdering(platform, app_version, package, **kwargs)
+    if not _exit_flush_registered:
+        atexit.register(_flush_at_exit)
+        _exit_flush_registered = True
+    log.debug(f"Selector ordering active for {platform} {app_version or 'baseline'} ({package})")
+    return _active
+
+
+def deactivate_selector_ordering() -> None:
+    """Flush and stop reordering: probes go back to source order."""
+    global _active
+    previous, _active = _active, None
+    if previous is not None:
+        previous.flush()
+
+
+def get_selector_ordering() -> Optional[SelectorOrdering]:
+    return _active
+
+
+def ordered_selectors(selectors: Sequence[str]) -> List[str]:
+    """Probe order of ``selectors`` under the active key (source order when none is active)."""
+    ordering = _active
+    return ordering.order(selectors) if ordering is not None else list(selectors)
+
+
+def record_selector_match(selectors: Sequence[str], probed: Sequence[str], winner: int) -> None:
+    """Report which alternative matched (no-op when no key is active)."""
+    ordering = _active
+    if ordering is not None:
+        ordering.record(selectors, probed, winner)
+
+
+__all__ = [
+    "SelectorOrdering",
+    "activate_selector_ordering",
+    "deactivate_selector_ordering",
+    "get_selector_ordering",
+    "list_id",
+    "ordered_selectors",
+    "record_selector_match",
+]
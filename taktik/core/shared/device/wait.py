@@ -19,6 +19,8 @@ from __future__ import annotations
 import time
 from typing import Callable, Optional, Sequence
 
+from .selector_order import ordered_selectors, record_selector_match
+
 
 def wait_for_any(
     device,
@@ -31,7 +33,8 @@ def wait_for_any(
     """Return the first XPath selector that becomes visible within `timeout` seconds.
 
     Scans every selector in a tight deadline loop. Total wait time is bounded
-    by `timeout` regardless of the number of selectors. If `log` is provided
+    by `timeout` regardless of the number of selectors. Alternatives known dead
+    on the active app build are scanned last (see `selector_order`). If `log` is provided
     it is called with `(level, message)` for found / not-found events.
 
     Args:
@@ -46,10 +49,12 @@ def wait_for_any(
         The winning selector, or `None` if none matched within the deadline.
     """
     deadline = time.time() + timeout
+    probes = ordered_selectors(selectors)
     while time.time() < deadline:
-        for sel in selectors:
+        for i, sel in enumerate(probes):
             try:
                 if device.xpath(sel).exists:
+                    record_selector_match(selectors, probes, i)
                     if log:
                         log("debug", f"✅ [{label or 'found'}] selector: {sel}")
                     return sel
@@ -105,10 +110,12 @@ def find_element(device, selectors: Sequence[str]):
 
     Returns the xpath handle (not a bool) so the caller can click or read it.
     """
-    for selector in selectors or []:
+    probes = ordered_selectors(selectors or [])
+    for i, selector in enumerate(probes):
         try:
             element = device.xpath(selector)
             if element.exists:
+                record_selector_match(selectors, probes, i)
                 return element
         except Exception:
             continue
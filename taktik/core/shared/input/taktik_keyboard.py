@@ -7,10 +7,15 @@ shell execution lives under `taktik.core.shared.device.adb`.
 
 import base64
 import time
+from typing import Optional
 
 from loguru import logger
 
-from taktik.core.shared.device.adb import run_adb_shell
+from taktik.core.shared.device.adb import (
+    get_adb_shell_session,
+    run_adb_shell,
+    run_adb_shell_batch,
+)
 from taktik.core.shared.telemetry import emit_step
 
 
@@ -22,10 +27,38 @@ _ACTIVE_CACHE_TTL_SECONDS = 120.0
 _active_ime_cache: dict[str, float] = {}
 
 
+def _active_ime_cached(device_id: str) -> bool:
+    cached_at = _active_ime_cache.get(device_id)
+    return bool(cached_at) and (time.time() - cached_at) < _ACTIVE_CACHE_TTL_SECONDS
+
+
+def _run_keyboard_commands(device_id: str, commands: list) -> list:
+    """Run keyboard commands through the device's persistent shell — typing and typo
+    corrections come in bursts, and a pipe write is far cheaper than spawning an adb
+    shell each time. Falls back to a one-shot batch only when the commands never reached
+    the session: after a read timeout the device may already have typed them, so the
+    results come back with ``exit_code=None`` instead of being replayed."""
+    results = get_adb_shell_session(device_id).send_batch(commands)
+    if results is None:
+        return run_adb_shell_batch(device_id, commands)
+    return results
+
+
+def _run_keyboard_command(device_id: str, command: str) -> Optional[str]:
+    """Output of one keyboard command; None when it was sent but its result was lost to a
+    read timeout (not replayed, see ``_run_keyboard_commands``)."""
+    results = get_adb_shell_session(device_id).send_batch([command])
+    if results is None:
+        return run_adb_shell(device_id, command)
+    if results[0].exit_code is None:
+        logger.debug("Keyboard command sent but not acknowledged — not replaying it")
+        return None
+    return results[0].output
+
+
 def is_taktik_keyboard_active(device_id: str) -> bool:
     """Check if Taktik Keyboard (ADB Keyboard) is the active IME."""
-    cached_at = _active_ime_cache.get(device_id)
-    if cached_at and (time.time() - cached_at) < _ACTIVE_CACHE_TTL_SECONDS:
+    if _active_ime_cached(device_id):
         return True
 
     try:
@@ -42,8 +75,12 @@ def is_taktik_keyboard_active(device_id: str) -> bool:
 def activate_taktik_keyboard(device_id: str) -> bool:
     """Activate Taktik Keyboard as the default IME."""
     try:
-        run_adb_shell(device_id, f"ime enable {TAKTIK_KEYBOARD_IME}")
-        result = run_adb_shell(device_id, f"ime set {TAKTIK_KEYBOARD_IME}")
+        # enable + set in one shell round trip.
+        _, selected = run_adb_shell_batch(
+            device_id,
+            [f"ime enable {TAKTIK_KEYBOARD_IME}", f"ime set {TAKTIK_KEYBOARD_IME}"],
+        )
+        result = selected.output
 
         if "selected" in result.lower():
             logger.debug("Taktik Keyboard activated")
@@ -78,19 +115,33 @@ def type_with_taktik_keyboard(
         return True
 
     try:
-        if not is_taktik_keyboard_active(device_id):
-            logger.debug("Taktik Keyboard not active, activating")
-            if not activate_taktik_keyboard(device_id):
-                logger.warning("Could not activate Taktik Keyboard")
-                return False
-
         text_b64 = base64.b64encode(text.encode("utf-8")).decode("utf-8")
         broadcast_cmd = (
             f"am broadcast -a {IME_MESSAGE_B64} --es msg {text_b64} "
             f"--ei delay_mean {delay_mean} --ei delay_deviation {delay_deviation}"
         )
         started_at = time.time()
-        result = run_adb_shell(device_id, broadcast_cmd)
+        if _active_ime_cached(device_id):
+            result = _run_keyboard_command(device_id, broadcast_cmd)
+        else:
+            # Cold cache: check the IME and broadcast in ONE shell — the broadcast only
+            # runs when the check passed, so an inactive keyboard never receives text.
+            _, broadcast = run_adb_shell_batch(
+                device_id,
+                [f"settings get secure default_input_method | grep -qF {TAKTIK_KEYBOARD_IME}", broadcast_cmd],
+                stop_on_error=True,
+            )
+            if broadcast.exit_code is None:
+                logger.debug("Taktik Keyboard not active, activating")
+                if not activate_taktik_keyboard(device_id):
+                    logger.warning("Could not activate Taktik Keyboard")
+                    return False
+                started_at = time.time()
+                result = _run_keyboard_command(device_id, broadcast_cmd)
+            else:
+                # The check passed inside the batch: the keyboard IS active.
+                _active_ime_cache[device_id] = time.time()
+                result = broadcast.output
         ack_duration = time.time() - started_at
 
         if result and "error" not in result.lower():
@@ -128,16 +179,33 @@ def clear_text_with_taktik_keyboard(device_id: str) -> bool:
 
 
 def _press_backspace(device_id: str, count: int = 1) -> bool:
-    """Delete `count` characters (KEYCODE_DEL = 67) — used to correct a typo."""
+    """Delete `count` characters (KEYCODE_DEL = 67) — used to correct a typo.
+
+    The key presses keep their ~40 ms spacing, but it is slept on the device inside one
+    batched shell instead of paying an adb round trip per key.
+    """
+    count = max(0, count)
     ok = True
-    for _ in range(max(0, count)):
+    if count == 1:
         try:
-            run_adb_shell(device_id, "input keyevent 67")
+            ok = _run_keyboard_command(device_id, "input keyevent 67") is not None
             time.sleep(0.04)
         except Exception as exc:
             logger.debug(f"Backspace keyevent failed: {exc}")
             ok = False
-    emit_step("keystroke", action="backspace", count=max(0, count), success=ok)
+    elif count > 1:
+        commands = []
+        for i in range(count):
+            if i:
+                commands.append("sleep 0.04")
+            commands.append("input keyevent 67")
+        try:
+            results = _run_keyboard_commands(device_id, commands)
+            ok = all(result.exit_code is not None for result in results)
+        except Exception as exc:
+            logger.debug(f"Backspace keyevents failed: {exc}")
+            ok = False
+    emit_step("keystroke", action="backspace", count=count, success=ok)
     return ok
 
 
@@ -0,0 +1,34 @@
+"""Module `__getattr__` for package exports resolved on first access.
+
+A package `__init__` that re-exports from its submodules imports all of them, and every
+dependency behind them, as soon as anything under the package is imported. The bridges
+pay that on every command, so the packages declare their exports as a table instead:
+
+    __getattr__ = lazy_exports(__name__, {
+        "DeviceManager": (".manager", "DeviceManager"),
+    })
+
+The first access imports the submodule and caches the value in the package namespace,
+so later lookups never come back here.
+"""
+
+import sys
+from importlib import import_module
+from typing import Callable, Dict, Tuple
+
+
+def lazy_exports(module_name: str, exports: Dict[str, Tuple[str, str]]) -> Callable[[str], object]:
+    """Return the `__getattr__` of `module_name` for `{name: (relative module, attribute)}`."""
+
+    def __getattr__(name: str):
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(import_module(target[0], module_name), target[1])
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
+
+
+__all__ = ["lazy_exports"]
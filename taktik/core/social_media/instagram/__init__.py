@@ -1,9 +1,24 @@
-from .workflows.core.automation import InstagramAutomation
-from .workflows.management.session import SessionManager
-from .actions.core.base_action import BaseAction
-from .actions.compatibility.modern_instagram_actions import ModernInstagramActions
+"""Instagram automation package.
+
+The public names below are resolved on first access (module `__getattr__`): importing
+any submodule - `instagram.actions.core.ipc`, a selector module, ... - runs this file
+first, and it must not drag the whole automation stack (workflows, actions, device
+facade) into bridges and providers that only need that one submodule.
+"""
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'InstagramAutomation': ('.workflows.core.automation', 'InstagramAutomation'),
+    'SessionManager': ('.workflows.management.session', 'SessionManager'),
+    'BaseAction': ('.actions.core.base_action', 'BaseAction'),
+    'ModernInstagramActions': ('.actions.compatibility.modern_instagram_actions', 'ModernInstagramActions'),
+    'InstagramActions': ('.actions', 'InstagramActions'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-from .actions import InstagramActions
 
 __all__ = [
     'InstagramAutomation',
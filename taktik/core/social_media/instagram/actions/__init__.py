@@ -1,11 +1,20 @@
 """Compatibility module for Instagram automation actions.
 
 This module now uses the new modular architecture with ModernInstagramActions.
+`BaseAction` and `ModernInstagramActions` are resolved on first access: every import of
+`actions.core.*` runs this file, and most of them never need the action classes.
 """
 import warnings
 
-from .core.base_action import BaseAction
-from .compatibility.modern_instagram_actions import ModernInstagramActions
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'BaseAction': ('.core.base_action', 'BaseAction'),
+    'ModernInstagramActions': ('.compatibility.modern_instagram_actions', 'ModernInstagramActions'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 
 class InstagramActions:
@@ -22,6 +31,8 @@ class InstagramActions:
         else:
             device = device_manager
         
+        from .compatibility.modern_instagram_actions import ModernInstagramActions
+
         self._modern_actions = ModernInstagramActions(device, session_manager)
         
         self.device_manager = device_manager
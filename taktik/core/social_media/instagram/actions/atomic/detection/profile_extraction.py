@@ -6,6 +6,8 @@ from loguru import logger
 
 from ...core.base_action import BaseAction
 from ....ui.selectors.surfaces.profile import PROFILE_SELECTORS
+from taktik.core.shared.device.dump_index import index_for_xml
+from taktik.core.shared.device.facade import BaseDeviceFacade
 from taktik.core.shared.vision import locate_text_on_screen
 
 _BOUNDS_RE = re.compile(r"\[(\d+),(\d+)\]\[(\d+),(\d+)\]")
@@ -139,8 +141,6 @@ class ProfileExtractionMixin(BaseAction):
         Returns:
             Dict with keys: username, full_name, biography
         """
-        from lxml import etree
-        
         results = {
             'username': None,
             'full_name': None,
@@ -152,12 +152,14 @@ class ProfileExtractionMixin(BaseAction):
             return results
         
         try:
-            tree = etree.fromstring(xml_content.encode('utf-8'))
+            index = index_for_xml(xml_content)
+            if index is None:
+                raise ValueError("unparseable XML dump")
             
             # Extract username
             for selector in self.selectors.username:
                 try:
-                    elements = tree.xpath(selector)
+                    elements = index.xpath(selector)
                     if elements:
                         text = elements[0].get('text', '').strip()
                         if text:
@@ -169,7 +171,7 @@ class ProfileExtractionMixin(BaseAction):
             # Extract full name
             for selector in self.selectors.full_name:
                 try:
-                    elements = tree.xpath(selector)
+                    elements = index.xpath(selector)
                     if elements:
                         text = elements[0].get('text', '').strip()
                         if text:
@@ -181,7 +183,7 @@ class ProfileExtractionMixin(BaseAction):
             # Extract biography
             for selector in self.selectors.bio:
                 try:
-                    elements = tree.xpath(selector)
+                    elements = index.xpath(selector)
                     if elements:
                         text = elements[0].get('text', '').strip()
                         if text:
@@ -259,8 +261,6 @@ class ProfileExtractionMixin(BaseAction):
         Returns:
             Dict with all enriched profile fields
         """
-        from lxml import etree
-        
         results = {
             'username': None,
             'full_name': None,
@@ -287,13 +287,15 @@ class ProfileExtractionMixin(BaseAction):
             return results
         
         try:
-            tree = etree.fromstring(xml_content.encode('utf-8'))
+            index = index_for_xml(xml_content)
+            if index is None:
+                raise ValueError("unparseable XML dump")
             
             # Extract username from action bar
             username_selectors = PROFILE_SELECTORS.enrichment_username_selectors
             for selector in username_selectors:
                 try:
-                    elements = tree.xpath(selector)
+                    elements = index.xpath(selector)
                     if elements:
                         text = elements[0].get('text', '').strip()
                         if text:
@@ -306,7 +308,7 @@ class ProfileExtractionMixin(BaseAction):
             full_name_selectors = PROFILE_SELECTORS.enrichment_full_name_selectors
             for selector in full_name_selectors:
                 try:
-                    elements = tree.xpath(selector)
+                    elements = index.xpath(selector)
                     if elements:
                         text = elements[0].get('text', '').strip()
                         if text:
@@ -319,7 +321,7 @@ class ProfileExtractionMixin(BaseAction):
             category_selectors = PROFILE_SELECTORS.enrichment_category_selectors
             for selector in category_selectors:
                 try:
-                    elements = tree.xpath(selector)
+                    elements = index.xpath(selector)
                     if elements:
                         text = elements[0].get('text', '').strip()
                         if text:
@@ -332,7 +334,7 @@ class ProfileExtractionMixin(BaseAction):
             bio_selectors = PROFILE_SELECTORS.enrichment_bio_selectors
             for selector in bio_selectors:
                 try:
-                    elements = tree.xpath(selector)
+                    elements = index.xpath(selector)
                     self.logger.debug(f"Bio selector '{selector[:60]}...' found {len(elements)} elements")
                     # Iterate through all TextViews to find one with actual bio text
                     for element in elements:
@@ -366,7 +368,7 @@ class ProfileExtractionMixin(BaseAction):
             website_selectors = PROFILE_SELECTORS.enrichment_website_selectors
             for selector in website_selectors:
                 try:
-                    elements = tree.xpath(selector)
+                    elements = index.xpath(selector)
                     if elements:
                         text = elements[0].get('text', '').strip()
                         if text:
@@ -379,7 +381,7 @@ class ProfileExtractionMixin(BaseAction):
             banner_selectors = PROFILE_SELECTORS.enrichment_banner_selectors
             for selector in banner_selectors:
                 try:
-                    elements = tree.xpath(selector)
+                    elements = index.xpath(selector)
                     for elem in elements:
                         # Get the title (account name)
                         title_elem = elem.xpath(PROFILE_SELECTORS.enrichment_banner_title_selector)
@@ -449,7 +451,6 @@ class ProfileExtractionMixin(BaseAction):
         return it as a JPEG base64 data URL. `scale` upsamples the crop (Lanczos)."""
         import base64
         import io
-        from lxml import etree
         from PIL import Image
 
         try:
@@ -458,13 +459,15 @@ class ProfileExtractionMixin(BaseAction):
             if not xml_content:
                 return None
 
-            tree = etree.fromstring(xml_content.encode('utf-8'))
+            index = index_for_xml(xml_content)
+            if index is None:
+                return None
 
             # Find the avatar ImageView bounds
             bounds = None
             for selector in selectors:
                 try:
-                    elements = tree.xpath(selector)
+                    elements = index.xpath(selector)
                     if elements:
                         bounds_str = elements[0].get('bounds', '')
                         if bounds_str:
@@ -526,23 +529,29 @@ class ProfileExtractionMixin(BaseAction):
 
         Language-neutral: finds the bio TextView (resource-id based) whose text carries
         the truncation ellipsis "…"/"...". Used as the OCR region to locate the expander.
+        Without a pre-fetched dump it reads a dump scoped to the bio subtree only.
         """
-        from lxml import etree
         xml = xml_content
-        if xml is None:
+        if xml is None and isinstance(self.device, BaseDeviceFacade):
+            # Only the bio subtree matters here: a scoped, visible-only dump keeps this
+            # optional read from parsing the whole profile screen.
+            xml = self.device.get_scoped_xml_dump(
+                PROFILE_SELECTORS.bio_region_resource_ids,
+                timeout_seconds=timeout_seconds,
+            )
+        elif xml is None:
             try:
                 xml = self.device.get_xml_dump(timeout_seconds=timeout_seconds)
             except TypeError:
                 xml = self.device.get_xml_dump()
         if not xml:
             return None
-        try:
-            tree = etree.fromstring(xml.encode("utf-8"))
-        except Exception:
+        index = index_for_xml(xml)
+        if index is None:
             return None
         for selector in PROFILE_SELECTORS.enrichment_bio_selectors:
             try:
-                elements = tree.xpath(selector)
+                elements = index.xpath(selector)
             except Exception:
                 continue
             for element in elements:
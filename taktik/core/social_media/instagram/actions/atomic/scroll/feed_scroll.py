@@ -49,6 +49,30 @@ _MIN_SMOOTH_CORRECTION_H = 0.10     # below this, touch-slop exit would consume
 # NOT the tail — at 2 runs in a row we have glided past ~4-6 junk units with no organic post, which a
 # human reads as "you're all caught up" and stops. A real post anywhere in between resets the count.
 _TAIL_FILLER_RUNS = 2
+# Landing predictor + targeted probe. A full dump per landing was the costliest part of a feed
+# advance; the gesture primitives now record the finger travel and release velocity, so where the
+# next header lands is PREDICTED (travel ≈ finger distance + coast × release velocity) and only
+# CONFIRMED by querying the few probe resource-ids, plus one content-desc query for the ad /
+# suggestion markers a dump would see on the media or on id-less nodes. A full dump happens when
+# the probe and the prediction disagree, when the probe sees an ad/suggestion marker, or when there
+# is nothing to predict from. `coast` (seconds) is learned per gesture from every measured landing,
+# and the wall time of probes and dumps is measured too: once the probe stops being the cheaper
+# read on this device, the advance goes straight to the dump.
+_COAST_SEED_S = {"flick": 0.15, "drag": 0.0}   # fling ≈ 3x finger travel; a drag tracks 1:1
+_COAST_BOUNDS_S = (0.0, 0.40)       # a measured coast outside this is a stale expectation, not a fling
+_COAST_ALPHA = 0.30                 # EMA weight of one measured landing
+_POST_PITCH_SEED_H = 0.90           # next header when it is below the fold: dominant header + pitch
+_PREDICT_TOLERANCE_H = 0.08         # probe header within this of the prediction ⇒ they agree
+_PROBE_CONFIDENCE_MIN = 0.80        # below this the probe is not trusted → one full dump
+_PROBE_MAX_NODES = 10               # ~2 posts × 4 probe ids: one RPC each, far below a dump
+_COST_MIN_SAMPLES = 3               # probes and dumps timed before their costs are compared
+# Java regex (`descriptionMatches`, whole-string match): a content-desc that a dump would count
+# as an ad or a suggested unit (`_read_feed_anchors`).
+_MARKER_DESC_PATTERN = (
+    r"(?isu)(?:(?:" + "|".join(re.escape(p) for p in FS.suggested_desc_prefixes) + r").*"
+    r"|.*(?:" + "|".join(re.escape(t) for t in FS.ad_desc_tokens + FS.suggested_desc_contains)
+    + r").*)"
+)
 
 class FeedScrollMixin(PostReadingMixin):
     """Mixin: the intelligent Instagram feed scroll (perception, engine, reading, session). Host
@@ -156,6 +180,70 @@ class FeedScrollMixin(PostReadingMixin):
             "video_band": video_band,
         }
 
+    def _probe_feed_anchors(self) -> Optional[Dict[str, Any]]:
+        """Targeted landing read: only the `FS.landing_probe_ids` nodes, through JSON-RPC element
+        queries instead of a hierarchy dump. Returns partial anchors (`probe=True`) — headers,
+        posts, like rows, and the ad/suggestion markers — or None when the device cannot be
+        queried. The markers come from the probe ids and from one `descriptionMatches` query
+        over every node, so a "Sponsored" media or an id-less suggestion label is seen as the
+        dump sees it; only the first marker is read, since any marker sends the landing to the
+        dump. At most 2 + `_PROBE_MAX_NODES` + 1 RPCs. It cannot see the top/tab bars or the
+        surface, which is why it is only trusted when it confirms a predicted landing
+        (`_landing_confidence`)."""
+        raw = getattr(self.device, "_device", None)
+        if raw is None:
+            return None
+        pattern = r".*:id/(" + "|".join(re.escape(rid) for rid in FS.landing_probe_ids) + r")"
+        headers: List[int] = []
+        posts: List[tuple] = []
+        likes: List[int] = []
+        ad_tops: List[int] = []
+        sugg_tops: List[int] = []
+        try:
+            query = raw(resourceIdMatches=pattern)
+            for i in range(min(query.count, _PROBE_MAX_NODES)):
+                info = raw(resourceIdMatches=pattern, instance=i).info or {}
+                top = (info.get("bounds") or {}).get("top")
+                if top is None:
+                    continue
+                short = (info.get("resourceName") or "").rsplit("/", 1)[-1]
+                text = (info.get("text") or "").strip()
+                desc = (info.get("contentDescription") or "").strip()
+                label = f"{text} {desc}".lower()
+                if any(tok in label for tok in FS.ad_desc_tokens):
+                    ad_tops.append(top)
+                if short == FS.header_id:
+                    headers.append(top)
+                    posts.append((top, text or desc))
+                elif short == FS.like_button_id:
+                    likes.append(top)
+                elif short == FS.secondary_label_id and text.lower().startswith(
+                        FS.suggested_label_prefix):
+                    sugg_tops.append(top)
+            if raw(descriptionMatches=_MARKER_DESC_PATTERN).count:
+                info = raw(descriptionMatches=_MARKER_DESC_PATTERN, instance=0).info or {}
+                top = (info.get("bounds") or {}).get("top")
+                desc = (info.get("contentDescription") or "").lower()
+                if top is not None:
+                    (ad_tops if any(tok in desc for tok in FS.ad_desc_tokens)
+                     else sugg_tops).append(top)
+        except Exception as e:
+            self.logger.debug(f"feed landing probe failed: {e}")
+            return None
+        return {
+            "headers": sorted(headers),
+            "posts": sorted(posts),
+            "likes": sorted(likes),
+            "ad_tops": sorted(set(ad_tops)),
+            "sugg_tops": sorted(set(sugg_tops)),
+            "top": int(self.screen_height * 0.10),
+            "tab": int(self.screen_height * 0.92),
+            "on_feed": bool(headers),
+            "surface": "feed" if headers else "unknown",
+            "video_band": None,
+            "probe": True,
+        }
+
     def _tap_xpath(self, xpath: str) -> bool:
         """Best-effort click on the first match of an xpath; False if absent/failed."""
         try:
@@ -250,7 +338,11 @@ class FeedScrollMixin(PostReadingMixin):
         return min(on) / float(self.screen_height)
 
     def _landing_confidence(self, anchors: Dict[str, Any], land: Optional[float]) -> float:
-        """Confidence that ``land`` describes a real, dominant post header."""
+        """Confidence that ``land`` describes a real, dominant post header.
+
+        Probe anchors see far less than a dump, so they keep their score only when they confirm
+        the landing the predictor expected (`predicted`, stored on them); otherwise the score
+        drops below `_PROBE_CONFIDENCE_MIN` and the caller takes a full dump."""
         if land is None:
             return 0.0
         confidence = 0.55
@@ -263,8 +355,112 @@ class FeedScrollMixin(PostReadingMixin):
         headers = anchors.get("headers") or []
         if len(headers) > 1 and headers[1] - headers[0] < 0.18 * self.screen_height:
             confidence -= 0.15
+        if anchors.get("probe"):
+            predicted = anchors.get("predicted")
+            if predicted is None or abs(land - predicted) > _PREDICT_TOLERANCE_H:
+                confidence -= 0.30
         return min(1.0, max(0.0, confidence))
 
+    # ── PREDICTION: where a gesture lands, calibrated on the measured landings ──────
+
+    def _landing_model(self) -> Dict[str, Any]:
+        """Per-host predictor state: learned coast per gesture, post pitch, the header the next
+        advance is expected to bring to the top (set from the last anchors read), and the
+        measured wall time of probes and dumps (`[samples, mean seconds]`)."""
+        model = getattr(self, "_feed_landing_model", None)
+        if model is None:
+            model = {"coast": dict(_COAST_SEED_S), "pitch_h": _POST_PITCH_SEED_H, "expect": None,
+                     "cost_s": {"probe": [0, 0.0], "dump": [0, 0.0]}}
+            self._feed_landing_model = model
+        return model
+
+    def _remember_landing_expectation(self, anchors: Dict[str, Any]) -> None:
+        """Remember which header the NEXT advance should bring up: the second post on screen,
+        or — below the fold — the dominant header one learned pitch further down (user unknown).
+        Off-feed or headerless anchors leave nothing to predict from."""
+        model = self._landing_model()
+        posts = sorted(p for p in (anchors.get("posts") or []) if p[0] >= 0)
+        if not anchors.get("on_feed") or not posts:
+            model["expect"] = None
+        elif len(posts) > 1:
+            model["expect"] = {"header_px": posts[1][0], "user": posts[1][1]}
+        else:
+            model["expect"] = {"header_px": posts[0][0] + model["pitch_h"] * self.screen_height,
+                               "user": None}
+        headers = sorted(y for y in anchors.get("headers", []) if y >= 0)
+        if not anchors.get("probe") and len(headers) > 1:
+            pitch = (headers[1] - headers[0]) / float(self.screen_height)
+            if pitch >= 0.30:          # two headers closer than this are not two full posts
+                model["pitch_h"] += _COAST_ALPHA * (pitch - model["pitch_h"])
+
+    def _predict_landing(self, expect: Optional[Dict[str, Any]],
+                         injection: Dict[str, Any]) -> Optional[float]:
+        """y/h where the expected header lands after the recorded gesture, or None when there is
+        nothing to predict from (no expectation, an unrecorded gesture) or when the gesture carries
+        it past the top (the dominant post is then one we have not seen yet)."""
+        coast = self._landing_model()["coast"].get(injection.get("gesture"))
+        distance = injection.get("distance_px")
+        if expect is None or coast is None or not distance:
+            return None
+        travel = distance + coast * float(injection.get("velocity_pxs") or 0.0)
+        land = (expect["header_px"] - travel) / float(self.screen_height)
+        return land if 0.0 <= land < 1.0 else None
+
+    def _calibrate_landing(self, expect: Optional[Dict[str, Any]], injection: Dict[str, Any],
+                           anchors: Dict[str, Any]) -> None:
+        """Learn the gesture's coast from a measured landing — only when the expected post is
+        identified on screen, so a landing one post off never teaches a wrong coast."""
+        model = self._landing_model()
+        gesture = injection.get("gesture")
+        velocity = float(injection.get("velocity_pxs") or 0.0)
+        if (expect is None or not expect.get("user") or gesture not in model["coast"]
+                or velocity <= 0 or not injection.get("distance_px")):
+            return
+        landed = next((y for y, user in anchors.get("posts") or [] if user == expect["user"]), None)
+        if landed is None:
+            return
+        observed = (expect["header_px"] - landed - injection["distance_px"]) / velocity
+        if _COAST_BOUNDS_S[0] <= observed <= _COAST_BOUNDS_S[1]:
+            model["coast"][gesture] += _COAST_ALPHA * (observed - model["coast"][gesture])
+
+    def _timed_read(self, kind: str, read: Callable[[], Any]) -> Any:
+        """Run one landing read and fold its wall time into the `kind` running mean."""
+        started = time.monotonic()
+        try:
+            return read()
+        finally:
+            cost = self._landing_model()["cost_s"][kind]
+            cost[0] += 1
+            cost[1] += (time.monotonic() - started - cost[1]) / cost[0]
+
+    def _probe_is_cheaper(self) -> bool:
+        """True until the probe has measurably cost as much as a dump on this device."""
+        cost = self._landing_model()["cost_s"]
+        if min(cost["probe"][0], cost["dump"][0]) < _COST_MIN_SAMPLES:
+            return True
+        return cost["probe"][1] < cost["dump"][1]
+
+    def _perceive_landing(self, expect: Optional[Dict[str, Any]]) -> tuple:
+        """Return (anchors, probed) after a gesture. The landing is predicted from the recorded
+        gesture and confirmed by the targeted probe; a full dump is taken only when the probe's
+        confidence is below `_PROBE_CONFIDENCE_MIN` or it sees an ad/suggestion marker (the skip
+        logic needs the full picture), or when the probe has measured no cheaper than a dump.
+        Either way the measured landing calibrates the predictor."""
+        injection = getattr(self, "_last_gesture_injection", None) or {}
+        predicted = self._predict_landing(expect, injection)
+        if predicted is not None and self._probe_is_cheaper():
+            probe = self._timed_read("probe", self._probe_feed_anchors)
+            if probe is not None:
+                probe["predicted"] = predicted
+                land = self._incoming_header_ratio(probe)
+                if (not probe["ad_tops"] and not probe["sugg_tops"]
+                        and self._landing_confidence(probe, land) >= _PROBE_CONFIDENCE_MIN):
+                    self._calibrate_landing(expect, injection, probe)
+                    return probe, True
+        anchors = self._timed_read("dump", self._read_feed_anchors)
+        self._calibrate_landing(expect, injection, anchors)
+        return anchors, False
+
     def _framing_decision(
         self, anchors: Dict[str, Any], land: Optional[float], context: str
     ) -> Dict[str, Any]:
@@ -398,7 +594,9 @@ class FeedScrollMixin(PostReadingMixin):
         tripped feed-exhaustion. Skipping a post WITHOUT reading is `browse_feed.skip_prob`, which
         advances to a REAL next post (no junk overshoot).
 
-        Then ONE settle + dump measures where the incoming post's header landed (`land_ratio`).
+        Then ONE settle + read measures where the incoming post's header landed (`land_ratio`):
+        the landing predicted from the recorded gesture, confirmed by a targeted probe of the
+        header/like-row ids — a full dump only when that confidence is too low (`_perceive_landing`).
         A session-aware policy combines framing severity, perception confidence, current style,
         and recent corrections. It can accept a small imperfection instead of producing a fixed
         gesture/dump/correction loop; a severe half-shown post is always repaired with one precise
@@ -413,10 +611,10 @@ class FeedScrollMixin(PostReadingMixin):
         counting encounters counts them exactly; anything it raises is swallowed, because a
         side effect must never break the crawl it observes.
         Returns {advanced, on_feed, on_reel, mode, land_ratio, corrected, reveal, full_post,
-        metadata_visible, is_ad, ads_skipped, surface, gestures, dumps, advance_decision,
+        metadata_visible, is_ad, ads_skipped, surface, gestures, dumps, probes, advance_decision,
         framing_decision}."""
         h = self.screen_height
-        dumps = 0
+        dumps = probes = 0
         ads_skipped = 0
         try:
             chooser = getattr(self, "_choose_advance_mode", None)
@@ -435,6 +633,7 @@ class FeedScrollMixin(PostReadingMixin):
                     "burst_remaining": 0,
                     "drag_probability": dict(_MODE_WEIGHTS)["drag"],
                 }
+            expect = self._landing_model()["expect"]   # read before this call overwrites it
             distance_scale = float(advance_decision.get("distance_scale", 1.0))
             velocity_scale = float(advance_decision.get("velocity_scale", 1.0))
             settle_scale = float(advance_decision.get("settle_scale", 1.0))
@@ -459,8 +658,10 @@ class FeedScrollMixin(PostReadingMixin):
                 settle = random.uniform(0.45, 0.70) * settle_scale
             time.sleep(settle)   # let the fling coast settle before measuring (natural glance beat)
 
-            anchors = self._read_feed_anchors()      # single dump: surface check + landing
-            dumps += 1
+            # predicted landing confirmed by the probe, else a single dump: surface check + landing
+            anchors, probed = self._perceive_landing(expect)
+            probes += probed
+            dumps += 0 if probed else 1
             if not anchors["on_feed"]:                # a mis-tap left the feed → recover (rare)
                 anchors, used = self._recover_to_feed(anchors)
                 dumps += used
@@ -545,8 +746,12 @@ class FeedScrollMixin(PostReadingMixin):
                     )
                     corrected = True
                     time.sleep(random.uniform(0.30, 0.50) * settle_scale)
-                    anchors = self._read_feed_anchors()
-                    dumps += 1
+                    dominant = next((p for p in anchors.get("posts") or [] if p[0] >= 0), None)
+                    anchors, probed = self._perceive_landing(
+                        {"header_px": dominant[0], "user": dominant[1]} if dominant else None
+                    )
+                    probes += probed
+                    dumps += 0 if probed else 1
                     land = self._incoming_header_ratio(anchors)
 
             on_feed = anchors["on_feed"]
@@ -586,6 +791,7 @@ class FeedScrollMixin(PostReadingMixin):
                             and new_user != getattr(self, "_last_top_username", None))
             if on_feed:
                 self._last_top_username = new_user
+            self._remember_landing_expectation(anchors)
             # filler_run = this gesture only ever saw filler — we hit a block of ads/suggestions and
             # capped the skips, OR we simply ended on an ad/suggested unit. NOT terminal on its own:
             # `browse_feed` decides the feed is exhausted only after several filler runs in a row.
@@ -599,7 +805,8 @@ class FeedScrollMixin(PostReadingMixin):
                 f"burst_left={advance_decision.get('burst_remaining')} "
                 f"framing={framing_decision} corrected={corrected} full_post={full_post} "
                 f"meta={meta_vis} ad={is_ad} sugg={is_sugg} "
-                f"advanced={advanced} on_feed={on_feed} surface={anchors.get('surface')} dumps={dumps}")
+                f"advanced={advanced} on_feed={on_feed} surface={anchors.get('surface')} dumps={dumps} "
+                f"probes={probes}")
             return {"advanced": advanced, "on_feed": on_feed, "on_reel": on_reel, "mode": mode,
                     "land_ratio": round(land, 3) if land is not None else None,
                     "corrected": corrected, "reveal": reveal, "stuck_retry": stuck,
@@ -609,11 +816,12 @@ class FeedScrollMixin(PostReadingMixin):
                     "advance_decision": advance_decision,
                     "framing_decision": framing_decision,
                     "like_ratio": round(like_ratio, 3) if like_ratio is not None else None,
-                    "surface": anchors.get("surface"), "gestures": gestures, "dumps": dumps}
+                    "surface": anchors.get("surface"), "gestures": gestures, "dumps": dumps,
+                    "probes": probes}
         except Exception as e:
             self.logger.error(f"scroll_feed_to_next_post failed: {e}")
             return {"advanced": False, "on_feed": False, "on_reel": False, "mode": None,
-                    "gestures": 0, "dumps": dumps, "error": str(e)}
+                    "gestures": 0, "dumps": dumps, "probes": probes, "error": str(e)}
 
     # ── SESSION: a human browsing rhythm over N read posts ─────────────────────────
 
@@ -638,9 +846,11 @@ class FeedScrollMixin(PostReadingMixin):
         options surfaced as Lab scenario controls.
 
         Stops early if pushed off-feed and unrecoverable. Returns
-        {steps, off_feed, reached_tail, pauses_s, ads_skipped, suggested_skipped, skipped_posts}."""
+        {steps, off_feed, reached_tail, pauses_s, ads_skipped, suggested_skipped, skipped_posts,
+        dumps, probes, dumps_per_post} — the last three over the advances only."""
         done = 0
         off_feed = False
+        dumps = probes = advances = 0
         pauses: List[float] = []
         ads_skipped = 0
         sugg_skipped = 0
@@ -652,8 +862,10 @@ class FeedScrollMixin(PostReadingMixin):
             cur = self._read_feed_anchors()
             real = (cur.get("on_feed") and not self._dominant_is_ad(cur)
                     and not (skip_suggested and self._dominant_is_suggested(cur)))
+            self._remember_landing_expectation(cur)
             if real:
                 if not self._metadata_visible(cur)[0]:
+                    self._remember_landing_expectation({})   # the reveal scroll moves the next header
                     self._reveal_current_metadata()          # scroll a little to see it whole
                 pauses.append(round(self.human_reading_pause(
                     read_captions=read_captions, browse_carousels=browse_carousels), 1))
@@ -666,6 +878,9 @@ class FeedScrollMixin(PostReadingMixin):
         while done < max(1, steps) and guard < max_iters:
             guard += 1
             res = self.scroll_feed_to_next_post(skip_ads=skip_ads, skip_suggested=skip_suggested)
+            advances += 1
+            dumps += res.get("dumps", 0)
+            probes += res.get("probes", 0)
             ads_skipped += res.get("ads_skipped", 0)
             sugg_skipped += res.get("suggested_skipped", 0)
             if not res.get("on_feed"):
@@ -680,6 +895,9 @@ class FeedScrollMixin(PostReadingMixin):
             filler_runs = 0                # reached a real post → reset the exhaustion counter
             if random.random() < skip_prob:          # a human occasionally skips ONE post (no reading)
                 r2 = self.scroll_feed_to_next_post(skip_ads=skip_ads, skip_suggested=skip_suggested)
+                advances += 1
+                dumps += r2.get("dumps", 0)
+                probes += r2.get("probes", 0)
                 ads_skipped += r2.get("ads_skipped", 0)
                 sugg_skipped += r2.get("suggested_skipped", 0)
                 if not r2.get("on_feed"):
@@ -698,7 +916,9 @@ class FeedScrollMixin(PostReadingMixin):
             done += 1
         self.logger.debug(f"📰 browse_feed: read={done} off_feed={off_feed} reached_tail={reached_tail} "
                           f"ads_skipped={ads_skipped} "
-                          f"sugg_skipped={sugg_skipped} skipped={skipped_posts} pauses={pauses}")
+                          f"sugg_skipped={sugg_skipped} skipped={skipped_posts} dumps={dumps} "
+                          f"probes={probes} pauses={pauses}")
         return {"steps": done, "off_feed": off_feed, "reached_tail": reached_tail, "pauses_s": pauses,
                 "ads_skipped": ads_skipped, "suggested_skipped": sugg_skipped,
-                "skipped_posts": skipped_posts}
+                "skipped_posts": skipped_posts, "dumps": dumps, "probes": probes,
+                "dumps_per_post": round(dumps / advances, 2) if advances else 0.0}
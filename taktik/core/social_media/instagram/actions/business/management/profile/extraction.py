@@ -180,17 +180,28 @@ class ProfileExtraction(BaseBusinessAction):
             if save_to_db:
                 from .persistence import save_profile_to_database
                 save_profile_to_database(profile_info, self.logger)
+
+            # The avatar goes to the blob store once; the row and the IPC message carry
+            # its path. The base64 copy is only kept when the store is unavailable.
+            if profile_pic_base64 and profile_info.get('username'):
+                from taktik.core.database.profile_avatars import ProfileAvatarService
+                profile_pic_path = ProfileAvatarService.store_avatar(profile_info['username'], profile_pic_base64)
+                if profile_pic_path:
+                    profile_info['profile_pic_path'] = profile_pic_path
+                    profile_info.pop('profile_pic_base64', None)
             
             # Emit profile_captured IPC event for live display in Electron
             if emit_ipc:
                 try:
                     from ....core.ipc.emitter import IPCEmitter
-                    # Don't include base64 in profile_data (it's sent separately)
-                    ipc_profile_data = {k: v for k, v in profile_info.items() if k != 'profile_pic_base64'}
+                    # Don't include the picture in profile_data (it's sent separately)
+                    ipc_profile_data = {k: v for k, v in profile_info.items()
+                                        if k not in ('profile_pic_base64', 'profile_pic_path')}
                     IPCEmitter.emit_profile_captured(
                         username=profile_info['username'],
                         profile_data=ipc_profile_data,
-                        profile_pic_base64=profile_pic_base64
+                        profile_pic_base64=profile_info.get('profile_pic_base64'),
+                        profile_pic_path=profile_info.get('profile_pic_path'),
                     )
                     self.logger.debug(f"📤 profile_captured IPC sent for @{profile_info['username']} (pic={'yes' if profile_pic_base64 else 'no'})")
                 except Exception as e:
@@ -14,6 +14,23 @@ who gets how much. Three strategies, picked by the operator from the desktop app
   not hammer a single audience in one continuous block. Costs extra navigation
   (each rotation reopens a source), which is why it is opt-in.
 
+Scheduling, for ``balanced`` and ``interleaved``:
+
+- when the caller knows each source's historic yield (profiles processed per quota
+  allotted, see `taktik/core/database/source_yields.py`), the best sources run first:
+  the balanced split hands its self-adjusting leftovers forward, so the sources that
+  are most likely to fill their share should be the ones asked first. A source with
+  no history ranks as a full one — it has not been tried yet. Without yields the
+  operator's order is kept.
+- a source that returns less than its quota is exhausted for this run and is not
+  asked again. Whatever budget is left once every source had its turn goes back to
+  the sources that DID fill their share, best realised yield first, until the budget
+  or the productive sources run out. Before this, a dry last source simply ended the
+  session short of its quota.
+
+``sequential`` keeps the given order and is left as it was: each source already gets
+the whole remaining budget, so there is never leftover to move.
+
 The driver below owns the loop; callers provide a ``run_source(source, quota)``
 callback that performs the actual interactions and reports back. Session
 finalisation stays OUT of the callback — a per-source runner that finalises the
@@ -84,6 +101,13 @@ def ipc_source_progress(workflow_kind: str) -> OnProgress:
     return report
 
 
+def rank_sources(sources: List[str], expected_yield: Optional[Dict[str, float]]) -> List[str]:
+    """``sources`` best expected yield first; untried sources rank as full, ties keep order."""
+    if not expected_yield:
+        return list(sources)
+    return sorted(sources, key=lambda source: -expected_yield.get(source, 1.0))
+
+
 def run_distributed(
     sources: List[str],
     budget: int,
@@ -91,13 +115,18 @@ def run_distributed(
     run_source: RunSource,
     batch_size: int = INTERLEAVED_BATCH_SIZE,
     on_progress: Optional[OnProgress] = None,
+    expected_yield: Optional[Dict[str, float]] = None,
 ) -> Dict[str, Any]:
     """Drive ``run_source`` over ``sources`` until the budget or the sources run out.
 
-    Returns ``{'processed': int, 'per_source': {source: int}, 'session_stop': bool}``.
+    Returns ``{'processed': int, 'per_source': {source: int}, 'allotted': {source: int},
+    'exhausted': [source], 'session_stop': bool}`` — ``allotted`` is the total quota each
+    source was given, what its yield is measured against.
     """
     mode = normalize_distribution(mode)
     per_source: Dict[str, int] = {}
+    allotted: Dict[str, int] = {}
+    exhausted: List[str] = []
     remaining = max(int(budget or 0), 0)
     session_stop = False
 
@@ -108,6 +137,9 @@ def run_distributed(
         processed, stop = run_source(source, quota)
         processed = max(int(processed or 0), 0)
         per_source[source] = per_source.get(source, 0) + processed
+        allotted[source] = allotted.get(source, 0) + quota
+        if processed < quota and source not in exhausted:
+            exhausted.append(source)
         remaining -= processed
         if stop:
             session_stop = True
@@ -116,7 +148,7 @@ def run_distributed(
         return processed
 
     if mode == DISTRIBUTION_INTERLEAVED:
-        active = [source for source in sources if source]
+        active = rank_sources([source for source in sources if source], expected_yield)
         positions = {source: idx + 1 for idx, source in enumerate(active)}
         total = len(active)
         while remaining > 0 and active and not session_stop:
@@ -131,19 +163,33 @@ def run_distributed(
                     active.remove(source)
     else:
         pending = [source for source in sources if source]
-        for index, source in enumerate(pending):
-            if remaining <= 0 or session_stop:
+        if mode == DISTRIBUTION_BALANCED:
+            pending = rank_sources(pending, expected_yield)
+        positions = {source: idx + 1 for idx, source in enumerate(pending)}
+        while pending:
+            for index, source in enumerate(pending):
+                if remaining <= 0 or session_stop:
+                    break
+                sources_left = len(pending) - index
+                quota = (
+                    remaining
+                    if mode == DISTRIBUTION_SEQUENTIAL
+                    else math.ceil(remaining / sources_left)
+                )
+                run_one(source, quota, positions[source], len(positions))
+            if mode == DISTRIBUTION_SEQUENTIAL or remaining <= 0 or session_stop:
                 break
-            sources_left = len(pending) - index
-            quota = (
-                remaining
-                if mode == DISTRIBUTION_SEQUENTIAL
-                else math.ceil(remaining / sources_left)
+            # Leftover round: only the sources that filled every share so far, best
+            # realised yield first. Each round either spends budget or drops a source.
+            pending = sorted(
+                (source for source in pending if source not in exhausted),
+                key=lambda source: -per_source.get(source, 0) / max(allotted.get(source, 1), 1),
             )
-            run_one(source, quota, index + 1, len(pending))
 
     return {
         "processed": sum(per_source.values()),
         "per_source": per_source,
+        "allotted": allotted,
+        "exhausted": exhausted,
         "session_stop": session_stop,
     }
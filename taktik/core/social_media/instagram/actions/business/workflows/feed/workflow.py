@@ -236,6 +236,7 @@ class FeedBusiness(FeedPostActionsMixin, DiscoverSuggestionsVisitMixin,
                 visit_author = effective_config.get('interact_with_post_author', False)
                 visit_likers = effective_config.get('interact_with_post_likers', False)
                 filler_streak = 0
+                advances = 0
 
                 # Ad harvesting (opt-in). The crawl already recognises sponsored posts to
                 # skip them; this keeps what it recognised instead of throwing it away.
@@ -419,6 +420,10 @@ class FeedBusiness(FeedPostActionsMixin, DiscoverSuggestionsVisitMixin,
                     stats['posts_skipped_suggested'] = (
                         stats.get('posts_skipped_suggested', 0) + res.get('suggested_skipped', 0)
                     )
+                    advances += 1
+                    stats['scroll_dumps'] += res.get('dumps', 0)
+                    stats['scroll_probes'] += res.get('probes', 0)
+                    stats['dumps_per_post'] = round(stats['scroll_dumps'] / advances, 2)
 
                     if not res.get('on_feed', False):
                         self.logger.info("🏁 Left the feed (reel/profile) - stopping")
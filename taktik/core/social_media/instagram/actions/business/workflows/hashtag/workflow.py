@@ -13,6 +13,7 @@ from ....core.stats import create_workflow_stats
 from taktik.core.social_media.instagram.actions.core.ipc import IPCEmitter
 from taktik.core.social_media.instagram.workflows.management.session import stop_reasons
 from taktik.core.database.instagram_hashtag_posts import InstagramHashtagPostService
+from taktik.core.database.instagram_post_identity import build_post_ref
 from taktik.core.social_media.instagram.ui.extractors import parse_number_from_text
 
 from .mixins.post_finder import HashtagPostFinderMixin
@@ -254,6 +255,7 @@ class HashtagBusiness(
                     hashtag=hashtag, post_author=author,
                     post_caption_hash=(metadata or {}).get('caption_hash'),
                     account_id=account_id, hours_limit=168,
+                    post_ref=build_post_ref(author, (metadata or {}).get('caption')),
                 ):
                     self.logger.info(f"⏭️ Post by @{author} already processed, next post")
                     stats['already_processed'] = stats.get('already_processed', 0) + 1
@@ -380,9 +382,18 @@ class HashtagBusiness(
             if self.session_manager:
                 self.session_manager.start_interaction_phase()
 
-            result = self._run_interaction_plan(
-                hashtag, plan, effective_config, stats, account_id, finalize=finalize,
-            )
+            # The runner indexes the processed posts of all its hashtags up front; run on
+            # its own, this hashtag is indexed here, for its own walk only.
+            own_index = bool(account_id) and not InstagramHashtagPostService.is_preloaded(hashtag, account_id)
+            if own_index:
+                InstagramHashtagPostService.preload([hashtag], account_id)
+            try:
+                result = self._run_interaction_plan(
+                    hashtag, plan, effective_config, stats, account_id, finalize=finalize,
+                )
+            finally:
+                if own_index:
+                    InstagramHashtagPostService.clear_preloaded()
             return result
 
         except Exception as e:
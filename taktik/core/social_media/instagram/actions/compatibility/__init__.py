@@ -1,7 +1,20 @@
-"""Compatibility layer for integrating new architecture with existing workflows."""
+"""Compatibility layer for integrating new architecture with existing workflows.
+
+Exports are resolved on first access (module `__getattr__`), so importing one
+submodule does not import its siblings.
+"""
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'ModernInstagramActions': ('.modern_instagram_actions', 'ModernInstagramActions'),
+    'InstagramCLIAdapter': ('.cli_adapter', 'InstagramCLIAdapter'),
+    'create_cli_parser': ('.cli_adapter', 'create_cli_parser'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-from .modern_instagram_actions import ModernInstagramActions
-from .cli_adapter import InstagramCLIAdapter, create_cli_parser
 
 __all__ = [
     'ModernInstagramActions',
@@ -7,12 +7,24 @@ Sub-packages:
 - base_action/   — Infrastructure actions IG (delays, scroll, typing, app mgmt)
 - base_business/ — Logique métier commune (popups, config, interactions, likers, stats)
 - stats/         — Statistiques temps réel
+
+Exports are resolved on first access (module `__getattr__`), so importing one
+submodule does not import its siblings.
 """
 
-from .base_action import BaseAction
-from .base_business import BaseBusinessAction
-from .device import DeviceFacade, DeviceManager
-from .utils import ActionUtils
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'BaseAction': ('.base_action', 'BaseAction'),
+    'BaseBusinessAction': ('.base_business', 'BaseBusinessAction'),
+    'DeviceFacade': ('.device', 'DeviceFacade'),
+    'DeviceManager': ('.device', 'DeviceManager'),
+    'ActionUtils': ('.utils', 'ActionUtils'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     'BaseAction',
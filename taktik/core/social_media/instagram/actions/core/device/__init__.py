@@ -3,9 +3,20 @@
 `DeviceFacade` stays platform-specific because it adds Instagram-aware
 interaction behavior. `DeviceManager` is only a compatibility shim that
 re-exports the shared Android runtime manager.
+
+Both are resolved on first access (module `__getattr__`), so the facade - which every
+action imports - does not import the manager and uiautomator2 with it.
 """
 
-from .facade import DeviceFacade
-from .manager import DeviceManager
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'DeviceFacade': ('.facade', 'DeviceFacade'),
+    'DeviceManager': ('.manager', 'DeviceManager'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = ['DeviceFacade', 'DeviceManager']
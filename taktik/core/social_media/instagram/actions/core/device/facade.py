@@ -2,9 +2,9 @@ from typing import Any, Dict, Optional, List, Union, Tuple
 from enum import Enum
 import time
 import re
-from lxml import etree
 from loguru import logger
 
+from taktik.core.shared.device.dump_index import index_for_xml
 from taktik.core.shared.device.facade import BaseDeviceFacade, Direction
 from taktik.core.clone import get_active_package
 
@@ -86,12 +86,8 @@ class DeviceFacade(BaseDeviceFacade):
     
     def xpath_exists_in_xml(self, xml_content: str, xpath: str) -> bool:
         """Check if xpath exists in pre-fetched XML content (fast, no ADB call)."""
-        try:
-            tree = etree.fromstring(xml_content.encode('utf-8'))
-            result = tree.xpath(xpath)
-            return len(result) > 0
-        except Exception:
-            return False
+        index = index_for_xml(xml_content)
+        return index.exists(xpath) if index is not None else False
     
     def batch_xpath_check(self, selectors_dict: Dict[str, List[str]]) -> Dict[str, bool]:
         """
@@ -111,20 +107,11 @@ class DeviceFacade(BaseDeviceFacade):
         if not xml_content:
             return results
         
-        try:
-            tree = etree.fromstring(xml_content.encode('utf-8'))
-            
-            for name, selectors in selectors_dict.items():
-                for selector in selectors:
-                    try:
-                        if tree.xpath(selector):
-                            results[name] = True
-                            break
-                    except Exception:
-                        continue
-            
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Error in batch xpath check: {e}")
+        index = index_for_xml(xml_content)
+        if index is None:
+            self.logger.error("Error in batch xpath check: unparseable XML dump")
             return results
+
+        for name, selectors in selectors_dict.items():
+            results[name] = any(index.exists(selector) for selector in selectors)
+        return results
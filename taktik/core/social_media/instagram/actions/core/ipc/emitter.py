@@ -98,8 +98,13 @@ class IPCEmitter:
         username: str,
         profile_data: Optional[Dict[str, Any]] = None,
         profile_pic_base64: Optional[str] = None,
+        profile_pic_path: Optional[str] = None,
     ) -> None:
-        """Emit a profile_captured event with optional base64 profile image."""
+        """Emit a profile_captured event with the profile image.
+
+        `profile_pic_path` (a blob-store file) is preferred: the message then carries a
+        path, not the image. `profile_pic_base64` is the fallback when nothing was stored.
+        """
         bridge = _get_bridge()
         if not bridge:
             return
@@ -109,6 +114,7 @@ class IPCEmitter:
                     username,
                     profile_data=profile_data,
                     profile_pic_base64=profile_pic_base64,
+                    profile_pic_path=profile_pic_path,
                 )
         except Exception as exc:
             log.debug(f"IPC profile_captured event error: {exc}")
@@ -60,6 +60,11 @@ _TYPE_EXTRAS: Dict[str, Dict[str, Any]] = {
         # global follow counter; this key isolates the share coming from the suggestions,
         # for the run report.
         'suggestion_follows': 0,
+        # Perception cost of the feed advances: full hierarchy dumps vs landings confirmed by
+        # the targeted probe, and the dumps per advance (the figure the predictor drives down).
+        'scroll_dumps': 0,
+        'scroll_probes': 0,
+        'dumps_per_post': 0.0,
     },
     'notifications': {
         'notifications_processed': 0,
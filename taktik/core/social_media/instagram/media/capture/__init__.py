@@ -1,5 +1,6 @@
 """Instagram media capture service."""
 
+from .capture_store import CaptureBatchWriter, CaptureStore
 from .media_capture import MediaCapture, MediaCaptureService, ProfileCapture
 
-__all__ = ["MediaCapture", "MediaCaptureService", "ProfileCapture"]
+__all__ = ["CaptureBatchWriter", "CaptureStore", "MediaCapture", "MediaCaptureService", "ProfileCapture"]
@@ -0,0 +1,186 @@
+"""Bounded in-memory window of captures, and the batch writer that streams them to disk.
+
+`MediaCaptureService` used to keep every profile and media item of the session in two
+plain dicts: a long session grew them without limit, and `get_media_by_username` scanned
+every media item to answer. Two pieces replace them:
+
+- `CaptureStore` - an LRU keyed by username / media id, bounded both in entries and in
+  approximate bytes. A read or a re-capture moves the entry to the young end; the old
+  end is evicted. A username -> keys index answers the per-user read without a scan.
+- `CaptureBatchWriter` - queues every capture and hands them to a sink (the
+  `media_captures` table by default) in batches: when `batch_size` captures are
+  waiting, when the oldest has waited `flush_interval` seconds, and on `flush()`.
+  An evicted capture is therefore already queued or archived, never lost.
+
+Neither is thread-safe on its own; the service serialises access under its lock.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+from loguru import logger
+
+from taktik.core.database.media_captures import CaptureRow
+
+R = TypeVar("R")
+
+
+def record_size(record: Any) -> int:
+    """Approximate bytes held by a slots record: the object plus its string fields."""
+    size = sys.getsizeof(record)
+    for name in getattr(record, "__slots__", ()):
+        value = getattr(record, name, None)
+        if isinstance(value, str):
+            size += sys.getsizeof(value)
+    return size
+
+
+class CaptureStore(Generic[R]):
+    """LRU of capture records, bounded by `max_entries` and `max_bytes`."""
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 4 * 1024 * 1024,
+        username_of: Optional[Callable[[R], Optional[str]]] = None,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self._username_of = username_of
+        self._items: "OrderedDict[str, R]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        # username -> {key: None}: an ordered set, in capture order.
+        self._by_username: Dict[str, Dict[str, None]] = {}
+        self.bytes_used = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def put(self, key: str, record: R) -> Optional[R]:
+        """Insert or replace `key` at the young end. Returns the record it replaced."""
+        previous = self._discard(key)
+        size = record_size(record)
+        self._items[key] = record
+        self._sizes[key] = size
+        self.bytes_used += size
+        username = self._username_of(record) if self._username_of else None
+        if username:
+            self._by_username.setdefault(username, {})[key] = None
+        # Always keep the record just stored, even if it alone is over the byte bound.
+        while len(self._items) > 1 and (
+            len(self._items) > self.max_entries or self.bytes_used > self.max_bytes
+        ):
+            oldest = next(iter(self._items))
+            self._discard(oldest)
+            self.evictions += 1
+        return previous
+
+    def get(self, key: str) -> Optional[R]:
+        record = self._items.get(key)
+        if record is not None:
+            self._items.move_to_end(key)
+        return record
+
+    def by_username(self, username: str) -> List[R]:
+        """Records indexed under `username`, in capture order."""
+        return [self._items[key] for key in self._by_username.get(username, ())]
+
+    def values(self) -> List[R]:
+        return list(self._items.values())
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._sizes.clear()
+        self._by_username.clear()
+        self.bytes_used = 0
+
+    def _discard(self, key: str) -> Optional[R]:
+        record = self._items.pop(key, None)
+        if record is None:
+            return None
+        self.bytes_used -= self._sizes.pop(key, 0)
+        username = self._username_of(record) if self._username_of else None
+        if username:
+            keys = self._by_username.get(username)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del self._by_username[username]
+        return record
+
+
+class CaptureBatchWriter:
+    """Queues captures and hands them to `sink` in batches (one transaction each)."""
+
+    def __init__(
+        self,
+        sink: Optional[Callable[[List[CaptureRow]], int]] = None,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if sink is None:
+            from taktik.core.database.media_captures import MediaCaptureArchive
+
+            sink = MediaCaptureArchive.save_batch
+        self._sink = sink
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval)
+        self._clock = clock
+        # Keyed so a profile re-captured before the flush is written once, with its latest state.
+        self._pending: Dict[tuple, CaptureRow] = {}
+        self._oldest: Optional[float] = None
+        self.batches = 0
+        self.written = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, kind: str, key: str, username: Optional[str], record: Dict[str, Any]) -> int:
+        """Queue one capture; flushes when the batch is full or old enough. Returns rows written."""
+        if not key:
+            return 0
+        self._pending.pop((kind, key), None)
+        self._pending[(kind, key)] = (kind, key, username, record)
+        now = self._clock()
+        if self._oldest is None:
+            self._oldest = now
+        if len(self._pending) >= self.batch_size or now - self._oldest >= self.flush_interval:
+            return self.flush()
+        return 0
+
+    def pending(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        """The queued record of one capture not written yet, or None."""
+        row = self._pending.get((kind, key))
+        return row[3] if row is not None else None
+
+    def pending_by_username(self, username: str, kind: str = "media") -> List[Dict[str, Any]]:
+        """Queued records of one kind for a username, oldest first."""
+        return [row[3] for row in self._pending.values() if row[0] == kind and row[2] == username]
+
+    def flush(self) -> int:
+        """Write everything queued. Returns the number of rows the sink accepted."""
+        if not self._pending:
+            return 0
+        batch = list(self._pending.values())
+        self._pending.clear()
+        self._oldest = None
+        try:
+            written = int(self._sink(batch) or 0)
+        except Exception as exc:
+            logger.debug(f"Capture batch of {len(batch)} dropped: {exc}")
+            return 0
+        self.batches += 1
+        self.written += written
+        return written
+
+
+__all__ = ["CaptureBatchWriter", "CaptureStore", "record_size"]
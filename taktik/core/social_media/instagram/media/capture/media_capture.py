@@ -2,20 +2,31 @@
 """
 Media Capture Service for Instagram.
 Provides a high-level interface for capturing and forwarding Instagram media data.
+
+Captures are kept in a bounded in-memory window (`CaptureStore`) and streamed to the
+`media_captures` table in batches (`CaptureBatchWriter`), so a session of any length
+holds a constant amount of memory. Reads fall back to the batch still queued in the
+writer, then to the archive rows written by this service's own session, for what has
+left the window.
 """
 import json
 import threading
+import uuid
+from functools import partial
 from typing import Optional, Callable, Dict, Any, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from loguru import logger
 
+from taktik.core.database.media_captures import MediaCaptureArchive
+
 from ..proxy.proxy_manager import ProxyManager
+from .capture_store import CaptureBatchWriter, CaptureStore
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileCapture:
-    """Captured Instagram profile data."""
+    """Captured Instagram profile data (slots: no per-instance __dict__)."""
     username: str
     full_name: Optional[str] = None
     biography: Optional[str] = None
@@ -36,12 +47,13 @@ class ProfileCapture:
             self.captured_at = datetime.now().isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat fields only: cheaper than asdict(), which deep-copies.
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaCapture:
-    """Captured Instagram media data."""
+    """Captured Instagram media data (slots: no per-instance __dict__)."""
     media_id: str
     media_type: str  # photo, video, carousel
     image_url: str
@@ -59,7 +71,17 @@ class MediaCapture:
             self.captured_at = datetime.now().isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _from_archive(cls, data: Optional[Dict[str, Any]]):
+    """Rebuild a capture record from its archived dict (unknown keys ignored)."""
+    if not data:
+        return None
+    try:
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+    except TypeError:
+        return None
 
 
 class MediaCaptureService:
@@ -80,7 +102,13 @@ class MediaCaptureService:
         self,
         device_id: Optional[str] = None,
         proxy_port: int = 8888,
-        desktop_bridge_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
+        desktop_bridge_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        max_profiles: int = 500,
+        max_media: int = 2000,
+        max_bytes: int = 8 * 1024 * 1024,
+        persist: bool = True,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
     ):
         self.device_id = device_id
         self.proxy_port = proxy_port
@@ -89,9 +117,26 @@ class MediaCaptureService:
         self.proxy_manager: Optional[ProxyManager] = None
         self.running = False
         
-        # Captured data storage
-        self.profiles: Dict[str, ProfileCapture] = {}
-        self.media: Dict[str, MediaCapture] = {}
+        # Captured data: a bounded window in memory, everything streamed to the archive.
+        # The byte budget is shared 1:3 between profiles and media.
+        self.profiles: CaptureStore[ProfileCapture] = CaptureStore(
+            max_entries=max_profiles, max_bytes=max_bytes // 4
+        )
+        self.media: CaptureStore[MediaCapture] = CaptureStore(
+            max_entries=max_media, max_bytes=max_bytes - max_bytes // 4,
+            username_of=lambda m: m.username,
+        )
+        # Archive reads stay within this run: the table retains every session for weeks.
+        self.session_id = uuid.uuid4().hex
+        self.writer: Optional[CaptureBatchWriter] = None
+        if persist:
+            self.writer = CaptureBatchWriter(
+                sink=partial(MediaCaptureArchive.save_batch, session_id=self.session_id),
+                batch_size=batch_size,
+                flush_interval=flush_interval,
+            )
+        # Session totals: they survive eviction from the window.
+        self._totals = {"profiles_captured": 0, "media_captured": 0, "total_followers": 0, "total_likes": 0}
         
         # Callbacks
         self.on_profile_captured: Optional[Callable[[ProfileCapture], None]] = None
@@ -158,15 +203,23 @@ class MediaCaptureService:
                 category=data.get("category")
             )
             
+            record = profile.to_dict()
             with self._lock:
-                self.profiles[profile.username] = profile
+                previous = self.profiles.put(profile.username, profile)
+                if previous is None:
+                    self._totals["profiles_captured"] += 1
+                else:
+                    self._totals["total_followers"] -= previous.follower_count or 0
+                self._totals["total_followers"] += profile.follower_count or 0
+                if self.writer is not None:
+                    self.writer.add("profile", profile.username, profile.username, record)
             
             # Trigger callback
             if self.on_profile_captured:
                 self.on_profile_captured(profile)
             
             # Forward to desktop bridge
-            self._send_to_desktop("profile_captured", profile.to_dict())
+            self._send_to_desktop("profile_captured", record)
             
             logger.info(f"📸 Profile captured: @{profile.username}")
             
@@ -189,15 +242,23 @@ class MediaCaptureService:
                 username=data.get("username")
             )
             
+            record = media.to_dict()
             with self._lock:
-                self.media[media.media_id] = media
+                previous = self.media.put(media.media_id, media)
+                if previous is None:
+                    self._totals["media_captured"] += 1
+                else:
+                    self._totals["total_likes"] -= previous.like_count or 0
+                self._totals["total_likes"] += media.like_count or 0
+                if self.writer is not None:
+                    self.writer.add("media", media.media_id, media.username, record)
             
             # Trigger callback
             if self.on_media_captured:
                 self.on_media_captured(media)
             
             # Forward to desktop bridge
-            self._send_to_desktop("media_captured", media.to_dict())
+            self._send_to_desktop("media_captured", record)
             
             logger.debug(f"🖼️ Media captured: {media.media_id}")
             
@@ -234,41 +295,84 @@ class MediaCaptureService:
             message = {"type": event_type, **data}
             print(json.dumps(message), flush=True)
     
+    def _archive(self):
+        """The archive facade (None when not persisting)."""
+        return MediaCaptureArchive if self.writer is not None else None
+    
     def get_profile(self, username: str) -> Optional[ProfileCapture]:
-        """Get captured profile data for a username."""
+        """Get captured profile data for a username (from the archive once evicted)."""
         with self._lock:
-            return self.profiles.get(username)
+            profile = self.profiles.get(username)
+            if profile is not None:
+                return profile
+            archive = self._archive()
+            if archive is None:
+                return None
+            pending = self.writer.pending("profile", username)
+        if pending is not None:
+            return _from_archive(ProfileCapture, pending)
+        return _from_archive(ProfileCapture, archive.get("profile", username, session_id=self.session_id))
     
     def get_all_profiles(self) -> List[ProfileCapture]:
-        """Get all captured profiles."""
+        """Get the captured profiles still in the in-memory window (most recent last)."""
         with self._lock:
-            return list(self.profiles.values())
+            return self.profiles.values()
     
     def get_media(self, media_id: str) -> Optional[MediaCapture]:
-        """Get captured media by ID."""
+        """Get captured media by ID (from the archive once evicted)."""
         with self._lock:
-            return self.media.get(media_id)
+            media = self.media.get(media_id)
+            if media is not None:
+                return media
+            archive = self._archive()
+            if archive is None:
+                return None
+            pending = self.writer.pending("media", media_id)
+        if pending is not None:
+            return _from_archive(MediaCapture, pending)
+        return _from_archive(MediaCapture, archive.get("media", media_id, session_id=self.session_id))
     
     def get_media_by_username(self, username: str) -> List[MediaCapture]:
-        """Get all captured media for a username."""
+        """Get all captured media for a username: the archived items, then the window's."""
         with self._lock:
-            return [m for m in self.media.values() if m.username == username]
+            recent = self.media.by_username(username)
+            archive = self._archive()
+            if archive is None:
+                return recent
+            pending = self.writer.pending_by_username(username, "media")
+        in_window = {m.media_id for m in recent}
+        # Oldest first: the archive reads most recent first, and the queued batch is newer
+        # still - a queued record replaces its archived state in place.
+        archived: Dict[str, MediaCapture] = {}
+        records = list(reversed(archive.by_username(username, session_id=self.session_id))) + pending
+        for media in (_from_archive(MediaCapture, d) for d in records):
+            if media is not None and media.media_id not in in_window:
+                archived[media.media_id] = media
+        return list(archived.values()) + recent
     
     def get_stats(self) -> Dict[str, int]:
-        """Get capture statistics."""
+        """Get capture statistics for the session (evicted captures included).
+
+        Counted as captures arrive, not over the window: a key re-captured after it
+        left the window counts again.
+        """
+        with self._lock:
+            return dict(self._totals)
+    
+    def flush(self) -> int:
+        """Write the pending captures to the archive now. Returns the rows written."""
         with self._lock:
-            return {
-                "profiles_captured": len(self.profiles),
-                "media_captured": len(self.media),
-                "total_followers": sum(p.follower_count for p in self.profiles.values()),
-                "total_likes": sum(m.like_count for m in self.media.values())
-            }
+            return self.writer.flush() if self.writer is not None else 0
     
     def clear(self):
-        """Clear all captured data."""
+        """Clear all captured data held in memory (pending captures are written first)."""
         with self._lock:
+            if self.writer is not None:
+                self.writer.flush()
             self.profiles.clear()
             self.media.clear()
+            for key in self._totals:
+                self._totals[key] = 0
     
     def stop(self):
         """Stop the media capture service."""
@@ -278,6 +382,7 @@ class MediaCaptureService:
             self.proxy_manager.stop()
             self.proxy_manager = None
         
+        self.flush()
         logger.info("MediaCaptureService stopped")
     
     def __enter__(self):
@@ -9,7 +9,8 @@ import json
 import subprocess
 import threading
 import time
-from typing import Optional, Callable, Dict, Any, List
+from collections import deque
+from typing import Optional, Callable, Deque, Dict, Any, List
 from pathlib import Path
 from loguru import logger
 
@@ -58,9 +59,9 @@ class ProxyManager:
         self.addon_path = self.scripts_dir / "mitm_addon.py"
         self.frida_script_path = self.scripts_dir / "frida_ssl_bypass.js"
         
-        # Message buffer for recent captures
-        self.message_buffer: List[Dict[str, Any]] = []
+        # Message buffer for recent captures (the deque drops the oldest in O(1))
         self.buffer_max_size = 100
+        self.message_buffer: Deque[Dict[str, Any]] = deque(maxlen=self.buffer_max_size)
     
     def start(self) -> bool:
         """Start the proxy infrastructure."""
@@ -163,6 +164,10 @@ class ProxyManager:
                 line = line.strip()
                 if not line:
                     continue
+                if line[0] != "{":
+                    # mitmproxy's own log lines: not worth a JSON parse attempt
+                    logger.debug(f"mitmproxy: {line}")
+                    continue
                 
                 try:
                     message = json.loads(line)
@@ -180,8 +185,6 @@ class ProxyManager:
         
         # Add to buffer
         self.message_buffer.append(message)
-        if len(self.message_buffer) > self.buffer_max_size:
-            self.message_buffer.pop(0)
         
         # Log based on type
         if msg_type == "profile_data":
@@ -307,12 +310,12 @@ class ProxyManager:
     
     def get_recent_captures(self, msg_type: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent captured messages."""
-        messages = self.message_buffer
+        messages = list(self.message_buffer)
         
         if msg_type:
             messages = [m for m in messages if m.get("type") == msg_type]
         
-        return messages[-limit:]
+        return messages[-limit:] if limit > 0 else []
     
     def get_profile_data(self, username: str) -> Optional[Dict[str, Any]]:
         """Get captured profile data for a username."""
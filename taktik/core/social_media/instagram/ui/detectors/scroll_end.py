@@ -1,3 +1,4 @@
+from collections import deque
 from typing import List, Set, Optional
 from loguru import logger
 from ..selectors import SCROLL_SELECTORS
@@ -8,20 +9,27 @@ class ScrollEndDetector:
     usernames and the presence of a "load more" button.
     
     """
-    def __init__(self, repeats_to_end=5, device=None):
+    def __init__(self, repeats_to_end=5, device=None, max_remembered: Optional[int] = None):
         """
         Initialise the end-of-scroll detector.
         
         Args:
                 repeats_to_end: repetitions before the end is considered reached
                 device: device instance, used to detect the "load more" button
+                max_remembered: usernames kept to tell a new one from a known one
+                    (None = all of them; a streaming scrape bounds it, a list never
+                    shows a username again thousands of rows further down)
         """
         self.repeats_to_end = repeats_to_end
         self.device = device
+        self.max_remembered = max_remembered
         self._repeat_count = 0
         self._last_seen = set()
+        self._seen_order = deque()
         self._total_unique_users = 0
-        self.pages = []
+        # Only the last pages are kept; the count covers all of them.
+        self.pages = deque(maxlen=20)
+        self.page_count = 0
         
         # Metrics used for the optimization
         self._consecutive_empty_pages = 0
@@ -97,6 +105,10 @@ class ScrollEndDetector:
             self._pages_without_new_users = 0
             self._total_unique_users += len(new_users)
             self._last_seen.update(new_users)
+            if self.max_remembered is not None:
+                self._seen_order.extend(new_users)
+                while len(self._seen_order) > self.max_remembered:
+                    self._last_seen.discard(self._seen_order.popleft())
             
             # With handled users known, count only those
             if processed_usernames is not None:
@@ -106,6 +118,7 @@ class ScrollEndDetector:
                 self.logger.debug(f"{len(new_users)} nouveaux utilisateurs détectés (total: {self._total_unique_users})")
         
         self.pages.append(usernames)
+        self.page_count += 1
         return len(new_users) > 0
 
     def has_load_more_button(self) -> bool:
@@ -181,7 +194,7 @@ class ScrollEndDetector:
             dict: Statistiques de détection
         """
         return {
-            'total_pages': len(self.pages),
+            'total_pages': self.page_count,
             'total_unique_users': self._total_unique_users,
             'repeat_count': self._repeat_count,
             'consecutive_empty_pages': self._consecutive_empty_pages,
@@ -191,7 +204,9 @@ class ScrollEndDetector:
     def reset(self):
         """Reset every counter and history."""
         self.pages.clear()
+        self.page_count = 0
         self._last_seen.clear()
+        self._seen_order.clear()
         self._repeat_count = 0
         self._consecutive_empty_pages = 0
         self._total_unique_users = 0
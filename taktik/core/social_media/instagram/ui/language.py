@@ -309,9 +309,7 @@ def detect_and_optimize(device, override: Optional[str] = None) -> str:
     """
     global _detected_lang
 
-    # Locale overlay: migrated selectors read their language fragments from the
-    # active locale set here.
-    from .selectors.locales import set_active_locale, available_locales
+    from .selectors.locales import available_locales
 
     if override:
         lang = override if override in available_locales() else 'unknown'
@@ -320,11 +318,26 @@ def detect_and_optimize(device, override: Optional[str] = None) -> str:
     else:
         lang = detect_language(device)
 
+    optimize_for_language(lang)
+    return lang
+
+
+def optimize_for_language(lang: str) -> int:
+    """Activate the locale overlay of ``lang`` and filter the selector singletons for it.
+
+    The second half of ``detect_and_optimize``, for a caller that already knows the
+    language (the selector catalog, which caches the outcome). Returns the number of
+    selectors removed.
+    """
+    # Locale overlay: migrated selectors read their language fragments from the
+    # active locale set here.
+    from .selectors.locales import set_active_locale
+
     set_active_locale(lang if lang != 'unknown' else None)
 
     if lang == 'unknown':
         log.info("Language unknown — overlay union + no in-place filtering")
-        return lang
+        return 0
 
     # Import all selector singletons from the centralized selectors package
     from .selectors import (
@@ -378,4 +391,4 @@ def detect_and_optimize(device, override: Optional[str] = None) -> str:
             log.warning(f"  {name}: optimization failed: {e}")
 
     log.info(f"🌐 Selector optimization complete: {total_removed} wrong-language selectors removed (lang={lang})")
-    return lang
+    return total_removed
@@ -18,23 +18,34 @@ never match fewer selectors than the legacy "keep-all" behaviour.
 Adding a language = add ``<lang>.py`` with a ``STRINGS`` dict (same keys) and
 register it in ``_LOCALES`` below. No change to the selector dataclasses.
 
+Language modules are imported on first use: once the session locale is known only
+that language is ever loaded; the union fallback loads them all.
+
 Note: per-process module-global state. Bots run one bridge process per device,
 so parallel devices in different languages do not share this global.
 """
+from importlib import import_module
 from typing import Dict, List, Optional, Set
 
-from . import en as _en
-from . import fr as _fr
-
-# lang code -> { "<surface>.<field>": [xpath fragment, ...] }
-_LOCALES: Dict[str, Dict[str, List[str]]] = {
-    "en": _en.STRINGS,
-    "fr": _fr.STRINGS,
+# lang code -> module holding its ``STRINGS`` dict
+_LOCALES: Dict[str, str] = {
+    "en": ".en",
+    "fr": ".fr",
 }
 
+# lang code -> { "<surface>.<field>": [xpath fragment, ...] }, filled on first use
+_loaded: Dict[str, Dict[str, List[str]]] = {}
+
 _active: Optional[str] = None  # active language code, or None when unknown
 
 
+def _strings(lang: str) -> Dict[str, List[str]]:
+    strings = _loaded.get(lang)
+    if strings is None:
+        strings = _loaded[lang] = import_module(_LOCALES[lang], __name__).STRINGS
+    return strings
+
+
 def available_locales() -> List[str]:
     """Registered language codes (e.g. ``['en', 'fr']``)."""
     return list(_LOCALES.keys())
@@ -61,7 +72,7 @@ def L(key: str) -> List[str]:
     - active locale unknown -> union of every language (dedup, stable order)
     """
     if _active is not None:
-        return list(_LOCALES[_active].get(key, []))
+        return list(_strings(_active).get(key, []))
     return L_all(key)
 
 
@@ -76,8 +87,8 @@ def L_all(key: str) -> List[str]:
     """
     seen: Set[str] = set()
     union: List[str] = []
-    for strings in _LOCALES.values():
-        for sel in strings.get(key, []):
+    for lang in _LOCALES:
+        for sel in _strings(lang).get(key, []):
             if sel not in seen:
                 seen.add(sel)
                 union.append(sel)
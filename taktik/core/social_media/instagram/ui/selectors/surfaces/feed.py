@@ -169,6 +169,10 @@ class FeedScrollSelectors:
     video_ids: tuple = ("video_container", "clips_video_container", "clips_media_component")
     profile_ids: tuple = ("row_profile_header", "profile_header_follow_button",
                           "profile_viewpager", "profile_tabs_container")
+    # Targeted landing probe: the only nodes queried after a gesture whose landing was predicted
+    # (header + its subtitle/header row, where the ad/suggestion label sits, + the like row).
+    landing_probe_ids: tuple = ("row_feed_photo_profile_name", "row_feed_profile_header",
+                                "secondary_label", "row_feed_button_like")
 
     # --- Marqueurs de contenu non-organique (à skipper comme un humain) ---
     ad_desc_tokens: tuple = ("sponsoris", "sponsored")          # "Sponsorisée Photo de…" / "Reel sponsorisé…"
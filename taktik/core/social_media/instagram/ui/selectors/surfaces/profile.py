@@ -281,6 +281,13 @@ class ProfileSelectors:
         '//*[@resource-id="com.instagram.android:id/profile_header_bio_text"]',
     ])
 
+    # Roots of the `enrichment_bio_selectors` above, as bare resource ids: the truncated-bio
+    # probe asks for a dump scoped to these subtrees instead of the whole profile screen.
+    bio_region_resource_ids: List[str] = field(default_factory=lambda: [
+        'com.instagram.android:id/profile_user_info_compose_view',
+        'com.instagram.android:id/profile_header_bio_text',
+    ])
+
     enrichment_website_selectors: List[str] = field(default_factory=lambda: [
         '//*[@resource-id="com.instagram.android:id/profile_links_view"]//*[@resource-id="com.instagram.android:id/text_view"]',
         '//*[@resource-id="com.instagram.android:id/profile_header_website"]',
@@ -1,6 +1,22 @@
-from .core import InstagramAutomation, WorkflowRunner
-from .management import SessionManager, WorkflowConfigBuilder, ActionProbabilities, FilterCriteria, LoginWorkflow
-from .support import WorkflowHelpers, UIHelpers
+"""Instagram workflows; the exports are resolved on first access (see `instagram/__init__.py`)."""
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'InstagramAutomation': ('.core.automation', 'InstagramAutomation'),
+    'WorkflowRunner': ('.core.workflow_runner', 'WorkflowRunner'),
+    'SessionManager': ('.management.session', 'SessionManager'),
+    'WorkflowConfigBuilder': ('.management.config', 'WorkflowConfigBuilder'),
+    'ActionProbabilities': ('.management.config', 'ActionProbabilities'),
+    'FilterCriteria': ('.management.config', 'FilterCriteria'),
+    'LoginWorkflow': ('.management.login', 'LoginWorkflow'),
+    'WorkflowHelpers': ('.support.workflow_helpers', 'WorkflowHelpers'),
+    'UIHelpers': ('.support.ui_helpers', 'UIHelpers'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     'InstagramAutomation',
@@ -83,14 +83,17 @@ def analyze_pending_ads(ai_service, *, limit: int = 20,
     log.info(f"Analysing {len(pending)} creative(s), most-seen first")
 
     for creative in pending:
+        # A blob-store screenshot is already a file the vision call can read as is; only
+        # rows still holding the bytes inline need a temporary copy.
+        stored_path = creative.get("screenshot_path")
         blob = creative.get("screenshot")
-        if not blob:
+        if not stored_path and not blob:
             # No picture: stamp it anyway so it stops coming back as pending forever.
             InstagramFeedAdsService.save_analysis(creative["id"], {"notes": "no screenshot stored"})
             report["skipped"] += 1
             continue
 
-        path = _write_temp_jpeg(blob)
+        path = stored_path or _write_temp_jpeg(blob)
         if not path:
             report["failed"] += 1
             continue
@@ -132,10 +135,11 @@ def analyze_pending_ads(ai_service, *, limit: int = 20,
             report["failed"] += 1
             log.debug(f"Ad analysis failed for {creative['id']}: {exc}")
         finally:
-            try:
-                os.unlink(path)
-            except OSError:
-                pass
+            if not stored_path:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
 
     log.info(
         f"Ad analysis done: {report['analyzed']} analysed, "
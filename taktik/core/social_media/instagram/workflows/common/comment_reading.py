@@ -14,28 +14,42 @@ The two sources answer different questions and are used together:
 
 This is the mechanism the standalone Smart Comment bridge proved in production; it lives in
 core so the in-thread reply keeps using it once that bridge is gone.
+
+`dumpsys activity top` prints the whole activity and can run to megabytes, of which only the
+comments RecyclerView matters. It is streamed: lines are dropped until that view's line,
+kept while they are nested under it, and the process is killed once the section closes. The
+hierarchy dump is taken at the same time, so a read costs the slower of the two sources
+rather than their sum.
 """
 
 from __future__ import annotations
 
 import re
+import threading
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from loguru import logger
 
-from taktik.core.shared.device.adb import run_adb_shell_process
+from taktik.core.shared.device.adb import stream_adb_shell_process
 from taktik.core.social_media.instagram.ui.selectors.surfaces.post import POST_COMMENTS_SELECTORS
 
 # A comment body carries no attribute saying "this is a body", so each field is located by
-# its Litho node name and the records are rebuilt from the ORDER the fields appear in.
-_LITHO_PATTERNS = {
-    "username": re.compile(r'text="([\w][\w.]{0,29})"\s+props="\{"synthetic":true\}"'),
-    "comment": re.compile(r'row_comment_textview_comment\s+text="([^"]+)"'),
-    "likes": re.compile(r'row_comment_textview_like_count\s+text="(\d+)"'),
-}
+# its Litho node name and the records are rebuilt from the ORDER the fields appear in — one
+# alternation, so a single pass yields them already in order.
+_LITHO_RE = re.compile(
+    r'text="(?P<username>[\w][\w.]{0,29})"\s+props="\{"synthetic":true\}"'
+    r'|row_comment_textview_comment\s+text="(?P<comment>[^"]+)"'
+    r'|row_comment_textview_like_count\s+text="(?P<likes>\d+)"'
+)
+# Lines worth keeping when the dump has no recognisable comments list at all.
+_LITHO_MARKERS = ("row_comment_textview_", '"synthetic":true')
 _USERNAME_RE = re.compile(r"^[\w][\w.]{0,29}$")
 _MENTION_RE = re.compile(r"@([\w][\w.]{0,29})")
+_PROFILE_DESC_RES = tuple(
+    re.compile(pattern) for pattern in POST_COMMENTS_SELECTORS.profile_content_description_patterns
+)
+_DUMPSYS_TIMEOUT = 10
 
 
 def parse_litho_comments(dumpsys_output: str) -> List[Dict[str, Any]]:
@@ -45,16 +59,12 @@ def parse_litho_comments(dumpsys_output: str) -> List[Dict[str, Any]]:
     an @mention is a reply to that person, which is how a nested reply is told apart from a
     top-level comment without walking the tree.
     """
-    events = []
-    for name, pattern in _LITHO_PATTERNS.items():
-        for match in pattern.finditer(dumpsys_output or ""):
-            events.append((match.start(), name, match.group(1)))
-    events.sort(key=lambda item: item[0])
-
     comments: List[Dict[str, Any]] = []
     current_username: Optional[str] = None
 
-    for _, kind, value in events:
+    for match in _LITHO_RE.finditer(dumpsys_output or ""):
+        kind = match.lastgroup
+        value = match.group(kind)
         if kind == "username":
             current_username = value
         elif kind == "likes":
@@ -95,13 +105,68 @@ def extract_visible_comment_usernames(xml: str) -> Set[str]:
         # The avatar next to a comment spells the owner out ("Go to <user>'s profile"), which
         # still identifies the row when its username button is clipped.
         desc = (elem.get("content-desc") or elem.get("content-description") or "").strip()
-        for pattern in POST_COMMENTS_SELECTORS.profile_content_description_patterns:
-            match = re.search(pattern, desc)
+        if not desc:
+            continue
+        for pattern in _PROFILE_DESC_RES:
+            match = pattern.search(desc)
             if match:
                 visible.add(match.group(1).lower())
     return visible
 
 
+def extract_comments_section(lines: Iterable[str]) -> str:
+    """The comments-list part of a `dumpsys activity top` dump, read line by line.
+
+    The section is the line naming the comments RecyclerView plus every line indented under
+    it; reading stops at the first line back at its level, so a streamed dump is abandoned
+    there. A quote left open by a multi-line comment body keeps the section going whatever
+    the indentation of its continuation lines. A dump that never names the list, or whose
+    Litho rows are not nested under it (the section holds no comment record), falls back to
+    the lines carrying a Litho comment field, read to the end of the dump.
+    """
+    key = POST_COMMENTS_SELECTORS.comments_list_resource_key
+    section: List[str] = []
+    fallback: List[str] = []
+    level: Optional[int] = None
+    closed = False
+    quote_open = False
+
+    for line in lines:
+        is_marker = any(marker in line for marker in _LITHO_MARKERS)
+        if level is None:
+            if key in line:
+                level = _indent(line)
+                section.append(line)
+                quote_open = line.count('"') % 2 == 1
+            elif is_marker:
+                fallback.append(line)
+            continue
+        if not closed and not quote_open and line.strip() and _indent(line) <= level:
+            if parse_litho_comments("".join(section)):
+                return "".join(section)
+            closed = True
+        if is_marker:
+            fallback.append(line)
+        if closed:
+            continue
+        section.append(line)
+        if line.count('"') % 2:
+            quote_open = not quote_open
+
+    if section and parse_litho_comments("".join(section)):
+        return "".join(section)
+    return "".join(fallback)
+
+
+def read_litho_comments(device_id: str) -> List[Dict[str, Any]]:
+    """Comment records of the thread on screen, from a streamed Litho dump."""
+    with stream_adb_shell_process(
+        device_id, ["dumpsys", "activity", "top"], timeout=_DUMPSYS_TIMEOUT,
+    ) as lines:
+        section = extract_comments_section(lines)
+    return parse_litho_comments(section)
+
+
 def resolve_device_serial(device) -> str:
     """The adb serial behind `device`, needed for the Litho dump.
 
@@ -129,25 +194,34 @@ def read_visible_comments(device, device_id: str = "") -> List[Dict[str, Any]]:
         logger.debug("[comments] no adb serial — cannot read the Litho dump")
         return []
 
+    # Both sources describe the same screen and neither touches it: the Litho dump is read
+    # on a worker while the hierarchy is dumped here.
+    litho: Dict[str, Any] = {}
+
+    def _read_litho() -> None:
+        try:
+            litho["comments"] = read_litho_comments(device_id)
+        except Exception as exc:
+            litho["error"] = exc
+
+    worker = threading.Thread(target=_read_litho, name="comments-litho", daemon=True)
+    worker.start()
+
     try:
         xml = device.dump_hierarchy()
     except Exception as exc:
         logger.debug(f"[comments] hierarchy dump failed: {exc}")
-        return []
-
-    on_screen = extract_visible_comment_usernames(xml or "")
+        xml = None
 
-    try:
-        result = run_adb_shell_process(
-            device_id, ["dumpsys", "activity", "top"],
-            timeout=10, encoding="utf-8", errors="replace",
-        )
-        dumpsys = result.stdout or ""
-    except Exception as exc:
-        logger.debug(f"[comments] dumpsys activity top failed: {exc}")
+    worker.join(_DUMPSYS_TIMEOUT + 2)
+    if xml is None:
+        return []
+    if "comments" not in litho:
+        logger.debug(f"[comments] dumpsys activity top failed: {litho.get('error', 'timed out')}")
         return []
 
-    comments = parse_litho_comments(dumpsys)
+    on_screen = extract_visible_comment_usernames(xml or "")
+    comments = litho["comments"]
     if on_screen:
         comments = [c for c in comments if c["username"].lower() in on_screen]
     return comments
@@ -161,6 +235,10 @@ def _find_comments_recycler(root):
     return None
 
 
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
 def _looks_like_username_button(node_class: str, text: str) -> bool:
     return (
         node_class == POST_COMMENTS_SELECTORS.button_class_name
@@ -173,6 +251,8 @@ def _looks_like_username_button(node_class: str, text: str) -> bool:
 __all__ = [
     "parse_litho_comments",
     "extract_visible_comment_usernames",
+    "extract_comments_section",
+    "read_litho_comments",
     "read_visible_comments",
     "resolve_device_serial",
 ]
@@ -1,12 +1,22 @@
-"""Core workflow orchestration modules."""
+"""Core workflow orchestration modules.
+
+Exports are resolved on first access (module `__getattr__`), so importing one
+submodule does not import its siblings.
+"""
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'InstagramAutomation': ('.automation', 'InstagramAutomation'),
+    'WorkflowRunner': ('.workflow_runner', 'WorkflowRunner'),
+    'INSTAGRAM_AUTOMATION_WORKFLOW_IDS': ('.agent_handler', 'INSTAGRAM_AUTOMATION_WORKFLOW_IDS'),
+    'build_instagram_automation_handler': ('.agent_handler', 'build_instagram_automation_handler'),
+    'register_instagram_automation_handlers': ('.agent_handler', 'register_instagram_automation_handlers'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-from .automation import InstagramAutomation
-from .workflow_runner import WorkflowRunner
-from .agent_handler import (
-    INSTAGRAM_AUTOMATION_WORKFLOW_IDS,
-    build_instagram_automation_handler,
-    register_instagram_automation_handlers,
-)
 
 __all__ = [
     'INSTAGRAM_AUTOMATION_WORKFLOW_IDS',
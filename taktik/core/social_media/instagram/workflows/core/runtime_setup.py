@@ -4,9 +4,10 @@ from typing import Any, Callable, Optional
 
 from taktik.core.clone import patch_selectors_for_package, set_active_package
 from taktik.core.clone.packages import get_original_package
-from taktik.core.social_media.instagram.ui.language import detect_and_optimize
+from taktik.core.shared.device.selector_order import activate_selector_ordering
+from taktik.core.social_media.instagram.ui.language import detect_language, optimize_for_language
 
-# NB: `apply_version_overrides` is imported lazily inside the function below.
+# NB: `apply_version_overrides` and `resolve_selectors` are imported lazily below.
 # `compat.selectors.setup` imports the Instagram selector catalogs, which forces
 # this package (`social_media.instagram`) to initialize; a module-level import here
 # would re-enter the still-initializing compat module and raise a circular ImportError.
@@ -35,10 +36,48 @@ def prepare_instagram_automation_runtime(
     set_active_package(effective_package)
     log("info", "Dynamic config applied")
 
+    detected_version = None
+    try:
+        detected_version = installed_version_provider() if installed_version_provider else None
+    except Exception as exc:
+        log("warning", f"Version detection failed (non-fatal): {exc}")
+
+    # Detection only reads the screen, never the selectors: it runs first so the
+    # language is part of the selector catalog key.
+    try:
+        detected_lang = detect_language(automation.device)
+    except Exception as exc:
+        log("warning", f"Language detection failed (non-fatal): {exc}")
+        detected_lang = "unknown"
+
+    from taktik.core.compat.selectors.catalog import resolve_selectors
+
+    def _resolve() -> None:
+        _apply_selector_passes(detected_version, package_name, detected_lang, log)
+
+    if resolve_selectors(
+        "instagram",
+        lang=detected_lang,
+        version=detected_version,
+        package=effective_package,
+        resolve=_resolve,
+    ):
+        log("info", f"Selector catalog loaded for Instagram v{detected_version or 'baseline'} ({detected_lang})")
+    # Same key minus the language: a dead alternative is dead whatever the UI language.
+    activate_selector_ordering("instagram", detected_version, effective_package)
+    log("info", f"App language detected: {detected_lang.upper()}")
+
+
+def _apply_selector_passes(
+    detected_version: Optional[str],
+    package_name: Optional[str],
+    detected_lang: str,
+    log: LogCallback,
+) -> None:
+    """Version overrides, clone package rewrite and language filter, in place."""
     try:
         from taktik.core.compat.selectors.setup import apply_version_overrides
 
-        detected_version = installed_version_provider() if installed_version_provider else None
         if detected_version:
             patched = apply_version_overrides("instagram", detected_version)
             if patched > 0:
@@ -57,7 +96,6 @@ def prepare_instagram_automation_runtime(
             log("warning", f"Clone selector patching failed (non-fatal): {exc}")
 
     try:
-        detected_lang = detect_and_optimize(automation.device)
-        log("info", f"App language detected: {detected_lang.upper()}")
+        optimize_for_language(detected_lang)
     except Exception as exc:
-        log("warning", f"Language detection failed (non-fatal): {exc}")
+        log("warning", f"Language optimization failed (non-fatal): {exc}")
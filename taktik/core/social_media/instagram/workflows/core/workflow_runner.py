@@ -8,6 +8,9 @@ from ...actions.business.workflows.common.distribution import (
     normalize_distribution,
     run_distributed,
 )
+from ..management.session import stop_reasons
+from taktik.core.database.instagram_hashtag_posts import InstagramHashtagPostService
+from taktik.core.database.source_yields import SourceYields
 from taktik.core.shared.config import resolve_filter_criteria
 
 
@@ -155,8 +158,15 @@ class WorkflowRunner:
 
         budget = config.get('max_interactions', action.get('max_interactions', 10))
         distribution = normalize_distribution(action.get('distribution'))
+        account_id = getattr(self.automation, 'active_account_id', None)
+        expected_yield = SourceYields.load(account_id, 'hashtag', hashtags) if len(hashtags) > 1 else {}
         if len(hashtags) > 1:
             self.logger.info(f"🏷️ {len(hashtags)} hashtags, distribution: {distribution}")
+            if expected_yield:
+                self.logger.info("🏷️ Expected yield: " + ", ".join(
+                    f"#{tag} {rate:.0%}" for tag, rate in expected_yield.items()))
+        # Every post the run may meet, checked in memory rather than one query per post.
+        InstagramHashtagPostService.preload(hashtags, account_id)
 
         total_interacted = 0
         last_stop_reason = ''
@@ -176,10 +186,15 @@ class WorkflowRunner:
             stop_reason = (result or {}).get('stop_reason') or ''
             if stop_reason:
                 last_stop_reason = stop_reason
-            return interacted, bool(stop_reason)
+            return interacted, self._stops_session(stop_reason)
 
-        run_distributed(hashtags, budget, distribution, run_one_hashtag,
-                        on_progress=ipc_source_progress('hashtag'))
+        try:
+            outcome = run_distributed(hashtags, budget, distribution, run_one_hashtag,
+                                      on_progress=ipc_source_progress('hashtag'),
+                                      expected_yield=expected_yield)
+        finally:
+            InstagramHashtagPostService.clear_preloaded()
+        SourceYields.record(account_id, 'hashtag', outcome['allotted'], outcome['per_source'])
 
         if last_stop_reason and not getattr(self.automation, 'session_finalized', False):
             self.automation.helpers.finalize_session(status='COMPLETED', reason=last_stop_reason)
@@ -206,6 +221,8 @@ class WorkflowRunner:
 
         budget = config.get('max_interactions', action.get('max_interactions', 10))
         distribution = normalize_distribution(action.get('distribution'))
+        account_id = getattr(self.automation, 'active_account_id', None)
+        expected_yield = SourceYields.load(account_id, 'post_url', post_urls) if len(post_urls) > 1 else {}
         if len(post_urls) > 1:
             self.logger.info(f"🔗 {len(post_urls)} post URLs, distribution: {distribution}")
 
@@ -232,10 +249,12 @@ class WorkflowRunner:
             stop_reason = result.get('stop_reason') or ''
             if stop_reason:
                 last_stop_reason = stop_reason
-            return interacted, bool(stop_reason)
+            return interacted, self._stops_session(stop_reason)
 
-        run_distributed(post_urls, budget, distribution, run_one_post,
-                        on_progress=ipc_source_progress('post_url'))
+        outcome = run_distributed(post_urls, budget, distribution, run_one_post,
+                                  on_progress=ipc_source_progress('post_url'),
+                                  expected_yield=expected_yield)
+        SourceYields.record(account_id, 'post_url', outcome['allotted'], outcome['per_source'])
 
         if last_stop_reason and not getattr(self.automation, 'session_finalized', False):
             self.automation.helpers.finalize_session(status='COMPLETED', reason=last_stop_reason)
@@ -243,6 +262,15 @@ class WorkflowRunner:
         # Return True only if we actually interacted with users
         return total_interacted > 0
     
+    @staticmethod
+    def _stops_session(stop_reason: Any) -> bool:
+        """Does a per-source stop end the whole multi-source run?
+
+        Only when it is not about the source itself: a hashtag that spent its post budget
+        or ran out of posts hands over to the next one (see `stop_reasons.ends_source_only`).
+        """
+        return bool(stop_reason) and not stop_reasons.ends_source_only(stop_reason)
+
     def _run_unfollow_workflow(self, action: Dict[str, Any]) -> bool:
         """Run the unfollow workflow.
         
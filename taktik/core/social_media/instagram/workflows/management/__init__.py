@@ -1,24 +1,40 @@
-"""Session and configuration management modules."""
+"""Session and configuration management modules.
+
+Exports are resolved on first access (module `__getattr__`), so importing one
+submodule does not import its siblings.
+"""
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'INSTAGRAM_ACCOUNT_LOGIN_WORKFLOW_ID': ('.agent_handler', 'INSTAGRAM_ACCOUNT_LOGIN_WORKFLOW_ID'),
+    'INSTAGRAM_ACCOUNT_LOGOUT_WORKFLOW_ID': ('.agent_handler', 'INSTAGRAM_ACCOUNT_LOGOUT_WORKFLOW_ID'),
+    'INSTAGRAM_ACCOUNT_REGISTER_WORKFLOW_ID': ('.agent_handler', 'INSTAGRAM_ACCOUNT_REGISTER_WORKFLOW_ID'),
+    'INSTAGRAM_ACCOUNT_WORKFLOW_IDS': ('.agent_handler', 'INSTAGRAM_ACCOUNT_WORKFLOW_IDS'),
+    'register_instagram_account_handlers': ('.agent_handler', 'register_instagram_account_handlers'),
+    'SessionManager': ('.session', 'SessionManager'),
+    'WorkflowConfigBuilder': ('.config', 'WorkflowConfigBuilder'),
+    'ActionProbabilities': ('.config', 'ActionProbabilities'),
+    'FilterCriteria': ('.config', 'FilterCriteria'),
+    'LoginWorkflow': ('.login', 'LoginWorkflow'),
+    'LogoutWorkflow': ('.logout', 'LogoutWorkflow'),
+    'DMOutreachWorkflow': ('.dm', 'DMOutreachWorkflow'),
+    'DMOutreachConfig': ('.dm', 'DMOutreachConfig'),
+    'DMOutreachResult': ('.dm', 'DMOutreachResult'),
+    'DMAutoReplyWorkflow': ('.dm', 'DMAutoReplyWorkflow'),
+    'DMAutoReplyConfig': ('.dm', 'DMAutoReplyConfig'),
+    'AutoReplyResult': ('.dm', 'AutoReplyResult'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-from .agent_handler import (
-    INSTAGRAM_ACCOUNT_LOGIN_WORKFLOW_ID,
-    INSTAGRAM_ACCOUNT_LOGOUT_WORKFLOW_ID,
-    INSTAGRAM_ACCOUNT_REGISTER_WORKFLOW_ID,
-    INSTAGRAM_ACCOUNT_WORKFLOW_IDS,
-    register_instagram_account_handlers,
-)
-from .session import SessionManager
-from .config import WorkflowConfigBuilder, ActionProbabilities, FilterCriteria
-from .login import LoginWorkflow
-from .logout import LogoutWorkflow
-from .dm import DMOutreachWorkflow, DMOutreachConfig, DMOutreachResult
-from .dm import DMAutoReplyWorkflow, DMAutoReplyConfig, AutoReplyResult
 
 __all__ = [
-    'SessionManager', 
-    'WorkflowConfigBuilder', 
-    'ActionProbabilities', 
-    'FilterCriteria', 
+    'SessionManager',
+    'WorkflowConfigBuilder',
+    'ActionProbabilities',
+    'FilterCriteria',
     'INSTAGRAM_ACCOUNT_LOGIN_WORKFLOW_ID',
     'INSTAGRAM_ACCOUNT_LOGOUT_WORKFLOW_ID',
     'INSTAGRAM_ACCOUNT_REGISTER_WORKFLOW_ID',
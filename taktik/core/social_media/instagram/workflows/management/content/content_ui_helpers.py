@@ -168,12 +168,17 @@ class ContentUIHelpersMixin:
                 return None
 
             self.logger.debug(f"Pushing image to device: {local_path}")
-            remote_path = push_media(device_id, local_path)
+            prefetcher = getattr(self, '_media_prefetcher', None)
+            if prefetcher is not None:
+                remote_path = prefetcher.activate(local_path)
+            else:
+                remote_path = push_media(device_id, local_path)
+                if remote_path:
+                    trigger_media_scan(device_id, remote_path, local_path)
             if not remote_path:
                 self.logger.error("push_media failed")
                 return None
 
-            trigger_media_scan(device_id, remote_path, local_path)
             time.sleep(scan_wait_for(local_path))
             self.logger.debug(f"✅ Image pushed to: {remote_path}")
             return remote_path
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from loguru import logger
 
+from taktik.core.shared.device.media_prefetch import MediaPrefetcher
 from ....ui.selectors.surfaces.content_creation import CONTENT_CREATION_SELECTORS
 from .content_ui_helpers import ContentUIHelpersMixin
 
@@ -33,6 +34,8 @@ class ContentWorkflow(ContentUIHelpersMixin):
         self.device = device_manager.device
         self.logger = logger
         self.content_selectors = CONTENT_CREATION_SELECTORS
+        # Set for the duration of a bulk post: upcoming images transfer in the background.
+        self._media_prefetcher: Optional[MediaPrefetcher] = None
     
     def post_single_photo(
         self,
@@ -265,6 +268,26 @@ class ContentWorkflow(ContentUIHelpersMixin):
         
         self.logger.info(f"📸 Starting bulk post: {len(image_paths)} images")
         
+        device_id = getattr(self.device_manager, 'device_id', None)
+        if device_id:
+            self._media_prefetcher = MediaPrefetcher(device_id, image_paths)
+        try:
+            self._post_queue(image_paths, captions, delay_between_posts, results)
+        finally:
+            if self._media_prefetcher is not None:
+                self._media_prefetcher.close()
+                self._media_prefetcher = None
+        
+        self.logger.success(f"✅ Bulk post completed: {results['success']}/{results['total']} successful")
+        return results
+
+    def _post_queue(
+        self,
+        image_paths: List[str],
+        captions: Optional[List[str]],
+        delay_between_posts: int,
+        results: Dict[str, Any],
+    ) -> None:
         for i, image_path in enumerate(image_paths):
             caption = captions[i] if captions and i < len(captions) else None
             
@@ -282,6 +305,3 @@ class ContentWorkflow(ContentUIHelpersMixin):
             if i < len(image_paths) - 1:
                 self.logger.info(f"⏳ Waiting {delay_between_posts}s before next post...")
                 time.sleep(delay_between_posts)
-        
-        self.logger.success(f"✅ Bulk post completed: {results['success']}/{results['total']} successful")
-        return results
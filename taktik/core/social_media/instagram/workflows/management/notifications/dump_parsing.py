@@ -53,6 +53,48 @@ def parse_feed_rows(root, row_bare_id: str, fragments: Dict[str, List[str]]) ->
     return rows
 
 
+def parse_feed_screen(root, row_bare_id: str, header_bare_id: str,
+                      fragments: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Everything the scan reads from one dump, in ONE walk of the tree.
+
+    Returns ``{rows, headers, truncated}``: the classified rows (as ``parse_feed_rows``),
+    the section headers (as ``parse_section_headers``) and the truncated rows (as
+    ``find_truncated_targets``), each target carrying ``row``, the index in ``rows`` of
+    the row it belongs to, so the scan can restrict expansion to the rows it keeps.
+    """
+    rows: List[Dict[str, Any]] = []
+    headers: List[str] = []
+    truncated: List[Dict[str, Any]] = []
+    for node in root.iter("node"):
+        resource_id = node.get("resource-id") or ""
+        if header_bare_id in resource_id:
+            text = (node.get("text") or "").strip()
+            if text and text not in headers:
+                headers.append(text)
+        if row_bare_id not in resource_id:
+            continue
+        full = concat_text(node)
+        if not full:
+            continue
+        ntype, username = classify_row(full, fragments)
+        rows.append({
+            "type": ntype,
+            "username": username,
+            "time": extract_time(full),
+            "text": full[:200],
+            "label": clean_label(full),
+            "has_action": row_has_action(full),
+        })
+        for descendant in node.iter():
+            value = descendant.get("text") or ""
+            if value and _TRUNCATION_RE.search(value):
+                box = parse_bounds(descendant.get("bounds", ""))
+                if box:
+                    truncated.append({"key": value, "region": box, "row": len(rows) - 1})
+                break
+    return {"rows": rows, "headers": headers, "truncated": truncated}
+
+
 def node_text_deep(node) -> str:
     """Text of ``node`` or, if empty, of its first descendant that has text.
 
@@ -45,9 +45,8 @@ from .dump_parsing import (
     find_truncated_targets,
     node_bounds_deep,
     node_text_deep,
-    parse_feed_rows,
+    parse_feed_screen,
     parse_request_rows,
-    parse_section_headers,
 )
 
 # Families whose row text carries USER-written content that may contain emojis the XML
@@ -372,13 +371,27 @@ class NotificationsEngagementWorkflow(NotificationSuggestionsMixin):
 
     def _dump_screen(self) -> tuple:
         """One dump -> (classified feed rows, visible time-section header texts)."""
+        screen = self._read_screen()
+        return screen["rows"], screen["headers"]
+
+    def _read_screen(self) -> Dict[str, Any]:
+        """One dump parsed once -> ``{rows, headers, truncated}`` (see ``parse_feed_screen``)."""
         root = self._dump_root()
         if root is None:
-            return [], []
-        rows = parse_feed_rows(root, self.selectors.notification_row_resource_id,
-                               self.selectors.classifier_fragments)
-        headers = parse_section_headers(root, self.selectors.notification_section_header_resource_id)
-        return rows, headers
+            return {"rows": [], "headers": [], "truncated": []}
+        return parse_feed_screen(root, self.selectors.notification_row_resource_id,
+                                 self.selectors.notification_section_header_resource_id,
+                                 self.selectors.classifier_fragments)
+
+    @staticmethod
+    def _rows_above_mark(rows: List[Dict[str, Any]], high_water) -> int:
+        """How many of ``rows`` (top first) are newer than the scan mark (all without one)."""
+        if high_water is None:
+            return len(rows)
+        for index, row in enumerate(rows):
+            if high_water(row, rows[index + 1:]):
+                return index
+        return len(rows)
 
     def _resolve_emoji_text(self, parsed_text: str) -> Optional[str]:
         """Re-read a comment row's real text through the element API to recover the
@@ -406,7 +419,7 @@ class NotificationsEngagementWorkflow(NotificationSuggestionsMixin):
             return real
         return None
 
-    def _expand_one_more(self) -> bool:
+    def _expand_one_more(self, targets: Optional[List[Dict[str, Any]]] = None) -> bool:
         """Expand ONE not-yet-tried truncated row (reveal its full comment/mention text).
 
         The "… more" / "… suite" expander is a ClickableSpan with NO accessibility
@@ -415,11 +428,16 @@ class NotificationsEngagementWorkflow(NotificationSuggestionsMixin):
         True if a row was tried (caller re-reads). Each row is tried once, tracked by
         its truncated text, so a miss never loops; a tap that opens the post instead
         is recovered by going back. No-op when OCR is unavailable.
+
+        ``targets`` are the truncated rows of a dump the caller already parsed; without
+        them the screen is dumped here.
         """
-        root = self._dump_root()
-        if root is None:
-            return False
-        for target in find_truncated_targets(root, self.selectors.notification_row_resource_id):
+        if targets is None:
+            root = self._dump_root()
+            if root is None:
+                return False
+            targets = find_truncated_targets(root, self.selectors.notification_row_resource_id)
+        for target in targets:
             if target["key"] in self._expanded_keys:
                 continue
             self._expanded_keys.add(target["key"])
@@ -453,7 +471,7 @@ class NotificationsEngagementWorkflow(NotificationSuggestionsMixin):
             return []
         return self._parse_requests(root)
 
-    def scan(self, max_scrolls: int = 3, known_checker=None) -> Dict[str, Any]:
+    def scan(self, max_scrolls: int = 3, known_checker=None, high_water=None) -> Dict[str, Any]:
         """Read + classify the activity feed across a few screens (all families),
         AND navigate into the follow-requests sub-screen to enumerate the pending
         requests in the same pass (so the page gets the actionable list directly).
@@ -465,6 +483,14 @@ class NotificationsEngagementWorkflow(NotificationSuggestionsMixin):
         ``known_checker`` (optional ``item -> bool``): when provided, the scroll stops early once it
         reaches notifications already recorded on a previous scan (the feed is chronological), so we
         don't re-scrape the whole history each pass. None => read the feed fully (previous behaviour).
+
+        ``high_water`` (optional ``(row, below) -> bool``, incremental mode): True for a row at
+        or below the newest notifications the previous scan read; ``below`` are the rows under it
+        on the same screen, so the mark can check their order too. The scan keeps the rows above
+        the first such row and stops right there, without scrolling further or expanding the rows
+        below it: a poll with nothing new costs one dump. Rows are matched as parsed from the dump
+        (an expanded or emoji-resolved row keeps its parsed text under ``parsed_text``). Both predicates may be
+        given: when the mark is never reached, the ``known_checker`` streak still stops the scroll.
         """
         # Detect the app language on the HOME feed, before navigating: the bottom nav
         # carries a strong per-language content-desc signal there, whereas the
@@ -500,20 +526,30 @@ class NotificationsEngagementWorkflow(NotificationSuggestionsMixin):
         known_streak = 0  # consecutive screens that added only already-recorded notifications
         iteration_cap = max(max_scrolls + 1, 12)
         for index in range(iteration_cap):
-            rows, headers = self._dump_screen()
-            if not rows and not items and index == 0:
+            screen = self._read_screen()
+            if not screen["rows"] and not items and index == 0:
                 time.sleep(1.2)  # feed may still be rendering
-                rows, headers = self._dump_screen()
+                screen = self._read_screen()
+            cut = self._rows_above_mark(screen["rows"], high_water)
             # Reveal truncated comment/mention text in view ("… more" / "… suite") via OCR,
-            # then re-read so the FULL text is captured. Bounded + best-effort.
-            expanded_any = False
+            # then re-read so the FULL text is captured. Bounded + best-effort. Only the rows
+            # this scan keeps are worth it: those below the mark were read by a previous scan.
+            # The rows as first parsed, before expansion: the scan mark is matched against them.
+            truncated_rows = {t["row"]: screen["rows"][t["row"]] for t in screen["truncated"]}
             for _ in range(4):
-                if not self._expand_one_more():
+                targets = [t for t in screen["truncated"] if t["row"] < cut]
+                if not self._expand_one_more(targets):
                     break
-                expanded_any = True
                 time.sleep(0.4)
-            if expanded_any:
-                rows, headers = self._dump_screen()
+                screen = self._read_screen()
+                cut = self._rows_above_mark(screen["rows"], high_water)
+            rows, headers = screen["rows"][:cut], screen["headers"]
+            for index, row in enumerate(rows):
+                before = truncated_rows.get(index)
+                if (before and before["text"] != row["text"]
+                        and (before["type"], before["username"]) == (row["type"], row["username"])):
+                    row["parsed_text"] = before["text"]
+            reached_mark = cut < len(screen["rows"])
             # Narrate each newly-revealed time bucket ("Today", "Yesterday", "Last 7
             # days"…) as the scroll uncovers it (Taktik Agent live card).
             for header in headers:
@@ -532,12 +568,17 @@ class NotificationsEngagementWorkflow(NotificationSuggestionsMixin):
                 if row["type"] in _EMOJI_TEXT_TYPES:
                     real = self._resolve_emoji_text(row["text"])
                     if real:
+                        row.setdefault("parsed_text", row["text"])
                         row["text"] = real[:200]
                         row["label"] = clean_label(real)
                 items.append(row)
                 new_count += 1
                 if known_checker is None or not known_checker(row):
                     new_unknown += 1
+            if reached_mark:
+                self.logger.info(f"scan: reached the previous scan's newest notifications "
+                                 f"after {index + 1} screen(s) — stopping")
+                break
             if new_count:
                 stale = 0
                 # EARLY-STOP: the feed is chronological, newest first. Once a screen adds
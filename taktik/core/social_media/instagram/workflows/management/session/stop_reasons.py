@@ -260,6 +260,25 @@ def no_targets() -> StopReason:
     return _reason("no_targets", FAMILY_FAILED, "no_targets")
 
 
+# -- scope: the source, or the session -------------------------------------------
+#
+# A per-source runner reports why IT stopped. Under a multi-source driver most of those motives
+# end one hashtag or one post, not the session: the next source is a new list. Read as a session
+# stop, `posts_cap` -- set by every hashtag walk that spent its post budget -- ended a
+# five-hashtag run after the first one.
+
+SOURCE_SCOPED_CODES = frozenset({
+    "posts_cap", "posts_examined_cap", "no_valid_post", "no_new_post",
+    "end_of_list", "end_of_list_repeated", "end_of_list_suggestions",
+    "no_new_profiles", "known_streak", "scroll_streak", "completed",
+})
+
+
+def ends_source_only(reason: Any) -> bool:
+    """True when ``reason`` only says this source is done. Plain strings count as session stops."""
+    return getattr(reason, "code", None) in SOURCE_SCOPED_CODES
+
+
 # -- manual: someone pressed stop ----------------------------------------------
 
 def manual_stop() -> StopReason:
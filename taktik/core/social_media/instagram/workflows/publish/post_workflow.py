@@ -31,6 +31,7 @@ from typing import Callable, List, Optional
 from loguru import logger
 
 from taktik.core.clone import get_active_package
+from taktik.core.shared.device.media_prefetch import MediaPrefetcher
 from taktik.core.shared.device.media_store import (
     purge_pushed_media,
     push_media,
@@ -76,6 +77,7 @@ class InstagramPostWorkflow:
         package_name: Optional[str] = None,
         post_type: str = "post",
         story_via_feed: bool = False,
+        media_prefetcher: Optional[MediaPrefetcher] = None,
     ):
         self.device = device
         self.device_id = device_id
@@ -89,6 +91,9 @@ class InstagramPostWorkflow:
         # Story entry method: False = create "+" then STORY tab; True = tap our own
         # bubble in the feed reels tray ("Add to story"). Both reach the same gallery.
         self.story_via_feed = bool(story_via_feed)
+        # Optional queue-wide prefetcher owned by the caller: media of upcoming posts is already
+        # transferring while this one is composed.
+        self._media_prefetcher = media_prefetcher
         self._a = self._build_actions(device)
 
     # ------------------------------------------------------------------
@@ -181,13 +186,26 @@ class InstagramPostWorkflow:
         except Exception as e:
             self._log("warning", f"Media purge skipped: {e}")
 
-        for path in media_paths:
-            self._status("uploading", f"Pushing media: {os.path.basename(path)}")
-            remote_path = push_media(self.device_id, path)
-            if not remote_path:
-                return False
-            trigger_media_scan(self.device_id, remote_path, path, log=self._log)
-            time.sleep(scan_wait_for(path))
+        prefetcher = self._media_prefetcher
+        # A carousel is a queue of its own: item 2 transfers while item 1 is being indexed.
+        owned = prefetcher is None and len(media_paths) > 1
+        if owned:
+            prefetcher = MediaPrefetcher(self.device_id, media_paths, log=self._log)
+        try:
+            for path in media_paths:
+                self._status("uploading", f"Pushing media: {os.path.basename(path)}")
+                if prefetcher is not None:
+                    remote_path = prefetcher.activate(path, log=self._log)
+                else:
+                    remote_path = push_media(self.device_id, path)
+                    if remote_path:
+                        trigger_media_scan(self.device_id, remote_path, path, log=self._log)
+                if not remote_path:
+                    return False
+                time.sleep(scan_wait_for(path))
+        finally:
+            if owned:
+                prefetcher.close()
         return True
 
     def _launch_and_home(self) -> None:
@@ -19,6 +19,7 @@ from .list_strategy import (
     make_commenters_strategy,
 )
 from .deep_qualify import DeepQualifyMixin
+from .list_stream import ProfileStreamSink, ScrapeCheckpoint, SeenSet
 
 console = Console()
 
@@ -84,6 +85,7 @@ class ScrapingListMixin(DeepQualifyMixin):
             profile_data['date_joined'] = enriched_data.get('date_joined', '')
             profile_data['account_based_in'] = enriched_data.get('account_based_in', '')
             profile_data['profile_pic_base64'] = enriched_data.get('profile_pic_base64')
+            profile_data['profile_pic_path'] = enriched_data.get('profile_pic_path')
 
             self.logger.debug(f"✅ Enriched @{username}: {profile_data['followers_count']} followers, category={profile_data.get('business_category')}")
             # Re-emit the visit with complete profile stats immediately, so the desktop live card
@@ -216,8 +218,9 @@ class ScrapingListMixin(DeepQualifyMixin):
             self.scraped_profiles.append(profile_data)
             profile_id = self._save_profile_immediately(profile_data)
 
-            _pic_b64 = profile_data.pop('profile_pic_base64', None)
-            IPCEmitter.emit_profile_captured(username, profile_data, profile_pic_base64=_pic_b64)
+            _pic_b64, _pic_path = self._pop_profile_picture(username, profile_data)
+            IPCEmitter.emit_profile_captured(username, profile_data, profile_pic_base64=_pic_b64,
+                                             profile_pic_path=_pic_path)
 
             if profile_id and getattr(self, '_ai_service', None) and not profile_data.get('is_private', False):
                 self._qualify_profile_ai(profile_data, profile_id)
@@ -226,6 +229,21 @@ class ScrapingListMixin(DeepQualifyMixin):
 
         return scraped
 
+    @staticmethod
+    def _pop_profile_picture(username: str, profile_data: Dict[str, Any]):
+        """Take the picture out of the saved profile dict: (base64 fallback, blob path).
+
+        The row now exists, so a picture already in the blob store is attached to it here.
+        """
+        pic_b64 = profile_data.pop('profile_pic_base64', None)
+        pic_path = profile_data.pop('profile_pic_path', None)
+        if pic_path:
+            from taktik.core.database.profile_avatars import ProfileAvatarService
+
+            ProfileAvatarService.attach_avatar(username, pic_path)
+            pic_b64 = None
+        return pic_b64, pic_path
+
     def _back_to_list(self, strategy: ListScrapingStrategy) -> None:
         """Return to the list we came from — Instagram can push extra screens on top."""
         for _back_attempt in range(5):
@@ -251,7 +269,7 @@ class ScrapingListMixin(DeepQualifyMixin):
         following_count = int(profile.get('following_count') or 0)
         posts_count = int(profile.get('posts_count') or 0)
         is_private = bool(profile.get('is_private', False))
-        has_profile_picture = bool(profile.get('profile_pic_base64'))
+        has_profile_picture = bool(profile.get('profile_pic_path') or profile.get('profile_pic_base64'))
 
         if skip_private_profiles and is_private:
             return 'private profile'
@@ -272,7 +290,8 @@ class ScrapingListMixin(DeepQualifyMixin):
     def _scrape_list(self, max_count: int, source_type: str, source_name: str,
                       total_available: int = None, enrich_on_the_fly: bool = False,
                       source_post_url: str = None,
-                      strategy: ListScrapingStrategy = None) -> List[Dict[str, Any]]:
+                      strategy: ListScrapingStrategy = None,
+                      sink: Optional[ProfileStreamSink] = None) -> List[Dict[str, Any]]:
         """
         Scrape usernames from a visible list (followers, following, likers, commenters).
 
@@ -292,16 +311,57 @@ class ScrapingListMixin(DeepQualifyMixin):
             strategy: ListScrapingStrategy implementing the UI-specific extraction.
                       Defaults to ``make_followers_strategy(self)`` for backward compat
                       (followers / following / post likers).
+            sink: Streaming mode (see ``list_stream.py``): profiles are handed to the sink
+                  and persisted in batches instead of being kept, the seen set is bounded,
+                  and the list resumes from its stored checkpoint.
 
         Returns:
-            List of scraped profile data
+            List of scraped profile data (empty in streaming mode: the sink has them)
         """
         if strategy is None:
             strategy = make_followers_strategy(self)
+        streaming = sink is not None
         scraped = []
-        scroll_detector = ScrollEndDetector(repeats_to_end=5, device=self.device)
-        seen_usernames = set()
+        scraped_count = 0
+        scrolls = 0
+        last_visible: List[str] = []
         no_new_users_count = 0
+        if streaming:
+            seen_usernames = SeenSet(capacity=max(max_count, total_available or 0, 10_000))
+            scroll_detector = ScrollEndDetector(repeats_to_end=5, device=self.device,
+                                                max_remembered=2 * seen_usernames.window)
+            checkpoint = sink.load_checkpoint()
+            if checkpoint is not None and checkpoint.seen:
+                seen_usernames = SeenSet.from_state(checkpoint.seen)
+                scraped_count = checkpoint.scraped
+                no_new_users_count = checkpoint.counters.get('no_new_users', 0)
+                scrolls = self._fast_forward_list(strategy, checkpoint)
+                self.logger.info(
+                    f"⏩ Resumed {source_type.lower()} of {source_name}: {scraped_count} scraped, "
+                    f"{len(seen_usernames)} seen, {scrolls} scrolls in"
+                )
+            sink.checkpoint = lambda: ScrapeCheckpoint(
+                source_type=source_type,
+                source_name=source_name,
+                scraped=scraped_count,
+                scrolls=scrolls,
+                last_usernames=last_visible,
+                counters={'no_new_users': no_new_users_count},
+                seen=seen_usernames.to_state(),
+            )
+        else:
+            seen_usernames = set()
+            scroll_detector = ScrollEndDetector(repeats_to_end=5, device=self.device)
+        list_done = True
+
+        def _scroll() -> None:
+            nonlocal scrolls
+            strategy.scroll_down()
+            scrolls += 1
+            # A stretch of already-known profiles produces no batch; the resume point still
+            # has to follow the scroll position.
+            if streaming and scrolls % 10 == 0:
+                sink.flush()
 
         # Dedup: skip profiles already known in DB — checked directly per username.
         # - rescrape_after_days = None (default)  → skip ALL known profiles (pure existence check)
@@ -353,17 +413,18 @@ class ScrapingListMixin(DeepQualifyMixin):
         ) as progress:
             # Show realistic progress info
             task = progress.add_task(
-                f"[cyan]Scraping {source_type.lower()} (0/{progress_total:,})...", 
-                total=progress_total
+                f"[cyan]Scraping {source_type.lower()} ({scraped_count:,}/{progress_total:,})...", 
+                total=progress_total,
+                completed=scraped_count,
             )
             
             suggestions_check_count = 0  # Count consecutive suggestions detections
             min_profiles_before_suggestions_check = 50  # Don't check suggestions until we have some profiles
             
-            while len(scraped) < max_count and self._should_continue():
+            while scraped_count < max_count and self._should_continue():
                 # Only check suggestions section after collecting some profiles
                 # This prevents false positives when suggestions are visible but we haven't scrolled yet
-                if strategy.enable_suggestions_check and len(scraped) >= min_profiles_before_suggestions_check:
+                if strategy.enable_suggestions_check and scraped_count >= min_profiles_before_suggestions_check:
                     if strategy.is_in_suggestions():
                         suggestions_check_count += 1
                         # Require 2 consecutive detections to confirm we're really in suggestions
@@ -371,7 +432,7 @@ class ScrapingListMixin(DeepQualifyMixin):
                             self.logger.info("📋 Reached suggestions section - end of real followers list")
                             progress.update(
                                 task,
-                                description=f"[green]Completed {source_type.lower()} ({len(scraped):,}/{len(scraped):,}) - end of list[/green]"
+                                description=f"[green]Completed {source_type.lower()} ({scraped_count:,}/{scraped_count:,}) - end of list[/green]"
                             )
                             break
                     else:
@@ -403,13 +464,14 @@ class ScrapingListMixin(DeepQualifyMixin):
                                     break
                             if not recovered:
                                 self.logger.error("❌ Could not recover to target list — stopping scraping")
+                                list_done = False
                                 break
                         else:
                             # We ARE on the list but it's empty — treat as end of list
                             consecutive_empty_visible = 0
 
                     # Try scrolling - wait for Instagram to load
-                    strategy.scroll_down()
+                    _scroll()
                     time.sleep(1.5)
 
                     if scroll_detector.is_the_end():
@@ -419,6 +481,7 @@ class ScrapingListMixin(DeepQualifyMixin):
 
                 # Successful scan — reset the empty-visible counter
                 consecutive_empty_visible = 0
+                last_visible = [f.get('username') for f in visible if f.get('username')]
 
                 new_count = 0
                 new_visible_count = 0  # new usernames seen (including dedup-skipped) — used for end-of-list detection
@@ -495,13 +558,21 @@ class ScrapingListMixin(DeepQualifyMixin):
                             except Exception:
                                 pass
                     
-                    scraped.append(profile_data)
-                    self.scraped_profiles.append(profile_data)
-                    profile_id = self._save_profile_immediately(profile_data, source_post_url=source_post_url)
+                    scraped_count += 1
+                    if streaming:
+                        # The sink links it to the session (and moves the count) with its batch.
+                        profile_id = self._save_profile_immediately(
+                            profile_data, source_post_url=source_post_url, link=False)
+                        sink.add(profile_data, profile_id, source_post_url)
+                    else:
+                        scraped.append(profile_data)
+                        self.scraped_profiles.append(profile_data)
+                        profile_id = self._save_profile_immediately(profile_data, source_post_url=source_post_url)
 
                     # Signal Agent panel that this profile has been saved (completes the visit card)
-                    _pic_b64 = profile_data.pop('profile_pic_base64', None)
-                    IPCEmitter.emit_profile_captured(username, profile_data, profile_pic_base64=_pic_b64)
+                    _pic_b64, _pic_path = self._pop_profile_picture(username, profile_data)
+                    IPCEmitter.emit_profile_captured(username, profile_data, profile_pic_base64=_pic_b64,
+                                                     profile_pic_path=_pic_path)
 
                     # AI qualification (if enabled and profile was enriched with bio data)
                     if enrich_on_the_fly and profile_id and getattr(self, '_ai_service', None) and not profile_data.get('is_private', False):
@@ -513,10 +584,10 @@ class ScrapingListMixin(DeepQualifyMixin):
                     progress.update(
                         task, 
                         advance=1,
-                        description=f"[cyan]{action_desc} {source_type.lower()} ({len(scraped):,}/{progress_total:,})..."
+                        description=f"[cyan]{action_desc} {source_type.lower()} ({scraped_count:,}/{progress_total:,})..."
                     )
                     
-                    if len(scraped) >= max_count:
+                    if scraped_count >= max_count:
                         break
                     
                     # When enriching on-the-fly, navigating away and back makes
@@ -536,7 +607,8 @@ class ScrapingListMixin(DeepQualifyMixin):
                 )
                 
                 # Notify scroll detector
-                scroll_detector.notify_new_page(list(seen_usernames))
+                scroll_detector.notify_new_page(
+                    seen_usernames.recent() if streaming else list(seen_usernames))
                 
                 if new_visible_count == 0:
                     # Check if there's a "See more" / "Load more" button before giving up
@@ -549,7 +621,7 @@ class ScrapingListMixin(DeepQualifyMixin):
                     self.logger.debug(f"No new users found ({no_new_users_count}/{max_no_new_users})")
                     
                     # Check suggestions only after collecting enough profiles
-                    if strategy.enable_suggestions_check and len(scraped) >= min_profiles_before_suggestions_check:
+                    if strategy.enable_suggestions_check and scraped_count >= min_profiles_before_suggestions_check:
                         if strategy.is_in_suggestions():
                             suggestions_check_count += 1
                             if suggestions_check_count >= 2:
@@ -566,7 +638,7 @@ class ScrapingListMixin(DeepQualifyMixin):
                     current_usernames = set(f.get('username') for f in visible if f.get('username'))
                     
                     # Scroll to find more
-                    strategy.scroll_down()
+                    _scroll()
                     
                     # Wait for content to actually change (not just a fixed delay)
                     max_wait_attempts = 5
@@ -576,7 +648,7 @@ class ScrapingListMixin(DeepQualifyMixin):
                         new_usernames = set(f.get('username') for f in new_visible if f.get('username'))
                         
                         # Check if we have new usernames (content loaded)
-                        if new_usernames != current_usernames and len(new_usernames - seen_usernames) > 0:
+                        if new_usernames != current_usernames and any(u not in seen_usernames for u in new_usernames):
                             self.logger.debug(f"✅ New content loaded after {wait_attempt + 1}s")
                             break
                         
@@ -604,7 +676,7 @@ class ScrapingListMixin(DeepQualifyMixin):
                     # so visible may still contain unprocessed profiles — don't scroll yet.
                     if not has_unprocessed_visible:
                         # Scroll down to reveal more profiles
-                        strategy.scroll_down()
+                        _scroll()
                         
                         # Wait for Instagram to finish loading (detect spinner)
                         max_loading_wait = 10  # Max 10 seconds waiting for loading
@@ -617,11 +689,33 @@ class ScrapingListMixin(DeepQualifyMixin):
                             self.logger.debug("⏳ Loading timeout, continuing anyway...")
         
         # Log final count vs expected
-        if total_available and len(scraped) < total_available:
-            self.logger.info(f"📊 Scraped {len(scraped)}/{total_available} ({len(scraped)*100//total_available}%) - some may be hidden/private")
-        
+        if total_available and scraped_count < total_available:
+            self.logger.info(f"📊 Scraped {scraped_count}/{total_available} ({scraped_count*100//total_available}%) - some may be hidden/private")
+
+        if streaming:
+            # Stopped by the session clock (or a lost list): keep the resume point.
+            sink.finish(list_done=list_done and (scraped_count >= max_count or self._should_continue()))
+
         return scraped
 
+    def _fast_forward_list(self, strategy: ListScrapingStrategy, checkpoint: ScrapeCheckpoint) -> int:
+        """Scroll back to a checkpoint's position without opening any profile on the way.
+
+        Stops as soon as one of the usernames that were on screen at the checkpoint shows
+        up again, and never scrolls more than the checkpoint did. Returns the scroll count
+        the resumed scrape starts from.
+        """
+        targets = set(checkpoint.last_usernames)
+        scrolls = 0
+        while scrolls < checkpoint.scrolls and self._should_continue():
+            visible = {f.get('username') for f in strategy.get_visible()}
+            if targets & visible:
+                break
+            strategy.scroll_down()
+            scrolls += 1
+            time.sleep(0.4)
+        return max(scrolls, checkpoint.scrolls)
+
     def _qualify_profile_ai(self, profile: dict, profile_id: int) -> None:
         """Classify profile using AI (vision model if screenshot available, text-based otherwise)."""
         import time as _time, json as _json, os as _os
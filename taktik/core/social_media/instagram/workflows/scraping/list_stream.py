@@ -0,0 +1,208 @@
+"""Streaming list scraping: bounded memory and a resume point for long lists.
+
+`_scrape_list` used to keep every profile dict it produced and every username it met for
+the whole run, and return them all at the end. On a 50k-follower list that is the whole
+list in RAM, and a crash lost the position: the next run walked the list from the top.
+
+In streaming mode (a `ProfileStreamSink` handed to `_scrape_list`):
+
+  * a profile is still saved the moment it is scraped (AI qualification needs its id),
+    but it is then handed to the sink instead of being kept. The sink links the batch to
+    the session, moves the session count, appends the CSV rows and writes the resume point
+    in ONE transaction every ``batch_size`` profiles;
+  * the usernames already met live in a `SeenSet`: the recent ones exactly, all of them in
+    a Bloom filter. A false positive skips a real follower; at the default error rate that
+    is about one in a thousand, which the dedup against the base was already allowed to do;
+  * the `ScrapeCheckpoint` (seen set, last usernames on screen, scroll count, counters) is
+    stored per list in `scraping_checkpoints`. A restarted scrape of the same list restores
+    it, scrolls straight back to those usernames without opening any profile on the way,
+    and carries on. A list walked to its end clears its checkpoint.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import math
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+log = logger.bind(module="instagram-scraping-stream")
+
+
+class SeenSet:
+    """Usernames met so far: exact for the recent window, Bloom filter for the rest."""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001, window: int = 2_000):
+        capacity = max(1, int(capacity))
+        self.bits = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.window = window
+        self._filter = bytearray((self.bits + 7) // 8)
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+        self.count = 0
+
+    def _positions(self, username: str) -> Iterable[int]:
+        digest = hashlib.blake2b(username.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def __contains__(self, username: str) -> bool:
+        if username in self._recent:
+            return True
+        return all(self._filter[p >> 3] & (1 << (p & 7)) for p in self._positions(username))
+
+    def __len__(self) -> int:
+        # Distinct names as far as the filter can tell (a false positive is not counted).
+        return self.count
+
+    def recent(self) -> List[str]:
+        """The exact window, oldest first."""
+        return list(self._recent)
+
+    def add(self, username: str) -> None:
+        if username in self._recent:
+            self._recent.move_to_end(username)
+            return
+        if username not in self:
+            self.count += 1
+        for p in self._positions(username):
+            self._filter[p >> 3] |= 1 << (p & 7)
+        self._recent[username] = None
+        if len(self._recent) > self.window:
+            self._recent.popitem(last=False)
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "bits": self.bits,
+            "hashes": self.hashes,
+            "window": self.window,
+            "count": self.count,
+            "filter": base64.b64encode(bytes(self._filter)).decode("ascii"),
+            "recent": list(self._recent),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "SeenSet":
+        seen = cls.__new__(cls)
+        seen.bits = int(state["bits"])
+        seen.hashes = int(state["hashes"])
+        seen.window = int(state["window"])
+        seen.count = int(state.get("count", 0))
+        seen._filter = bytearray(base64.b64decode(state["filter"]))
+        seen._recent = OrderedDict((username, None) for username in state.get("recent", []))
+        return seen
+
+
+@dataclass
+class ScrapeCheckpoint:
+    """Where a list scrape stands, enough to resume it."""
+
+    source_type: str
+    source_name: str
+    scraped: int = 0
+    scrolls: int = 0
+    last_usernames: List[str] = field(default_factory=list)
+    counters: Dict[str, int] = field(default_factory=dict)
+    seen: Optional[Dict[str, Any]] = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> Optional["ScrapeCheckpoint"]:
+        try:
+            return cls(**json.loads(payload))
+        except Exception as exc:
+            log.debug(f"Unreadable scraping checkpoint ignored: {exc}")
+            return None
+
+
+class ProfileStreamSink:
+    """Receives the profiles of a streaming `_scrape_list` and persists them in batches.
+
+    A batch goes to ``local_db.save_scraping_batch`` (links, session count and checkpoint
+    in one transaction) and, when given, to ``write_rows`` (the workflow's CSV append).
+    ``checkpoint`` is set by the scrape loop to build the current resume point at each flush.
+    """
+
+    def __init__(
+        self,
+        source_type: str,
+        source_name: str,
+        *,
+        scraping_id: Optional[int] = None,
+        batch_size: int = 50,
+        local_db=None,
+        write_rows: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        total_offset: int = 0,
+    ):
+        self.source_type = source_type
+        self.source_name = source_name
+        self.scraping_id = scraping_id
+        self.batch_size = batch_size
+        self._db = local_db
+        self._write_rows = write_rows
+        # Profiles of the same session scraped outside this sink (earlier targets).
+        self.total_offset = total_offset
+        self.checkpoint: Optional[Callable[[], ScrapeCheckpoint]] = None
+        self._links: List[Tuple[int, Optional[str]]] = []
+        self._rows: List[Dict[str, Any]] = []
+        self.count = 0
+        self.batches = 0
+        self.by_source: Dict[str, int] = {}
+
+    def add(self, profile: Dict[str, Any], profile_id: Optional[int] = None,
+            source_post_url: Optional[str] = None) -> None:
+        self.count += 1
+        source = profile.get("source_type", "UNKNOWN")
+        self.by_source[source] = self.by_source.get(source, 0) + 1
+        if profile_id:
+            self._links.append((profile_id, source_post_url))
+        if self._write_rows is not None:
+            self._rows.append(profile)
+        if self.count % self.batch_size == 0:
+            self.flush()
+
+    def flush(self) -> bool:
+        """Persist the pending batch and the current resume point."""
+        links, self._links = self._links, []
+        rows, self._rows = self._rows, []
+        if rows:
+            try:
+                self._write_rows(rows)
+            except Exception as exc:
+                log.warning(f"Could not append {len(rows)} row(s) to the CSV export: {exc}")
+        checkpoint = None
+        if self.checkpoint is not None:
+            checkpoint = (self.source_type, self.source_name, self.checkpoint().to_json())
+        if self._db is None:
+            return False
+        self.batches += 1
+        return self._db.save_scraping_batch(
+            self.scraping_id, self.total_offset + self.count, links, checkpoint,
+        )
+
+    def load_checkpoint(self) -> Optional[ScrapeCheckpoint]:
+        if self._db is None:
+            return None
+        payload = self._db.get_scraping_checkpoint(self.source_type, self.source_name)
+        return ScrapeCheckpoint.from_json(payload) if payload else None
+
+    def finish(self, list_done: bool) -> None:
+        """Flush what is pending; forget the resume point once the list is done."""
+        if not list_done:
+            self.flush()
+            return
+        self.checkpoint = None
+        self.flush()
+        if self._db is not None:
+            self._db.clear_scraping_checkpoint(self.source_type, self.source_name)
+
+
+__all__ = ["ProfileStreamSink", "ScrapeCheckpoint", "SeenSet"]
@@ -26,21 +26,28 @@ class ScrapingPersistenceMixin:
             self.local_db = local_db
         return local_db
 
-    def _export_to_csv(self):
-        """Export scraped profiles to CSV file."""
-        if not self.scraped_profiles:
-            return
-        
-        # Create exports directory
-        exports_dir = os.path.join(os.getcwd(), 'exports')
-        os.makedirs(exports_dir, exist_ok=True)
-        
-        # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        scraping_type = self.config.get('type', 'unknown')
-        filename = f"scraping_{scraping_type}_{timestamp}.csv"
-        filepath = os.path.join(exports_dir, filename)
-        
+    def _total_scraped(self) -> int:
+        """Profiles scraped this session: those kept in memory plus those streamed to the base."""
+        return len(self.scraped_profiles) + getattr(self, 'streamed_count', 0)
+
+    def _csv_append(self, rows: List[Dict[str, Any]]) -> None:
+        """Append rows to the session's CSV export, creating it (with its header) on first use.
+
+        Streamed list scrapes call this with each batch, so their profiles reach the export
+        without being kept in memory until the end.
+        """
+        filepath = self.csv_export_path
+        if not filepath:
+            # Create exports directory
+            exports_dir = os.path.join(os.getcwd(), 'exports')
+            os.makedirs(exports_dir, exist_ok=True)
+
+            # Generate filename
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            scraping_type = self.config.get('type', 'unknown')
+            filename = f"scraping_{scraping_type}_{timestamp}.csv"
+            filepath = os.path.join(exports_dir, filename)
+
         # Determine fieldnames based on whether profiles are enriched
         is_enriched = self.config.get('enrich_profiles', False)
         if is_enriched:
@@ -49,27 +56,39 @@ class ScrapingPersistenceMixin:
                          'source_type', 'source_name', 'scraped_at']
         else:
             fieldnames = ['username', 'source_type', 'source_name', 'scraped_at']
-        
-        # Write CSV
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+
+        new_file = not os.path.exists(filepath)
+        with open(filepath, 'a', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(self.scraped_profiles)
-        
+            if new_file:
+                writer.writeheader()
+            writer.writerows(rows)
+
         # Store path for session completion
         self.csv_export_path = filepath
-        
-        console.print(f"\n[green]📁 Exported {len(self.scraped_profiles)} profiles to:[/green]")
-        console.print(f"   [cyan]{filepath}[/cyan]")
+
+    def _export_to_csv(self):
+        """Export scraped profiles to CSV file (after any rows already streamed to it)."""
+        if not self.scraped_profiles and not self.csv_export_path:
+            return
+
+        if self.scraped_profiles:
+            self._csv_append(self.scraped_profiles)
+
+        console.print(f"\n[green]📁 Exported {self._total_scraped()} profiles to:[/green]")
+        console.print(f"   [cyan]{self.csv_export_path}[/cyan]")
 
     def _save_profile_immediately(self, profile: Dict[str, Any],
-                                    source_post_url: str = None) -> Optional[int]:
+                                    source_post_url: str = None,
+                                    link: bool = True) -> Optional[int]:
         """Save a single profile to database immediately as it's scraped.
 
         Args:
             profile: Profile dict (must contain 'username', 'source_type', 'source_name').
             source_post_url: Optional Instagram post URL from which this profile was found
                              (used for likers scraped from hashtag posts).
+            link: Link the profile to the session and update its count. A streamed list
+                  scrape passes False: its sink does both once per batch.
 
         Returns:
             profile_id if saved successfully, None otherwise.
@@ -112,6 +131,9 @@ class ScrapingPersistenceMixin:
             else:
                 self.logger.debug(f"♻️  Known profile updated: @{username} (id={profile_id})")
 
+            if not link:
+                return profile_id
+
             # Link profile to scraping session in junction table (with optional post URL)
             if self.scraping_session_id and profile_id:
                 local_db.link_profile_to_session(self.scraping_session_id, profile_id,
@@ -119,7 +141,7 @@ class ScrapingPersistenceMixin:
             
             # Update session count in database
             if self.scraping_session_id:
-                local_db.update_scraping_session_count(self.scraping_session_id, len(self.scraped_profiles))
+                local_db.update_scraping_session_count(self.scraping_session_id, self._total_scraped())
             
             return profile_id
         except Exception as e:
@@ -220,11 +242,12 @@ class ScrapingPersistenceMixin:
         table.add_column("Value", style="yellow")
         
         table.add_row("⏱️  Duration", f"{elapsed_min}m {elapsed_sec}s")
-        table.add_row("👤 Profiles scraped", str(len(self.scraped_profiles)))
-        table.add_row("📊 Rate", f"{len(self.scraped_profiles) / (elapsed / 60):.1f} profiles/min" if elapsed > 0 else "N/A")
+        total = self._total_scraped()
+        table.add_row("👤 Profiles scraped", str(total))
+        table.add_row("📊 Rate", f"{total / (elapsed / 60):.1f} profiles/min" if elapsed > 0 else "N/A")
         
         # Count by source type
-        source_counts = {}
+        source_counts = dict(getattr(self, '_streamed_sources', {}))
         for p in self.scraped_profiles:
             source = p.get('source_type', 'UNKNOWN')
             source_counts[source] = source_counts.get(source, 0) + 1
@@ -293,13 +316,13 @@ class ScrapingPersistenceMixin:
             local_db = self._local_db()
             local_db.complete_scraping_session(
                 scraping_id=self.scraping_session_id,
-                total_scraped=len(self.scraped_profiles),
+                total_scraped=self._total_scraped(),
                 csv_path=self.csv_export_path,
                 error_message=error_message
             )
             
             status = 'ERROR' if error_message else 'COMPLETED'
-            self.logger.info(f"Scraping session {self.scraping_session_id} {status}: {len(self.scraped_profiles)} profiles")
+            self.logger.info(f"Scraping session {self.scraping_session_id} {status}: {self._total_scraped()} profiles")
             
         except Exception as e:
             self.logger.warning(f"Could not complete scraping session: {e}")
@@ -9,6 +9,7 @@ This module provides scraping functionality to extract profiles from:
 Internal structure (SRP split):
 - post_scraping_helpers.py — Post opening, reel detection, likers/commenters extraction
 - list_scraping.py         — Generic list scraping, hashtag scraping, post URL scraping
+- list_stream.py           — Streaming mode of long lists: batched persistence, resume point
 - persistence.py           — CSV export, DB save, session management, enrichment, stats
 - scraping_workflow.py     — Orchestrator (this file)
 """
@@ -17,26 +18,33 @@ import json
 import sys
 import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from loguru import logger
 from rich.console import Console
 
-from taktik.core.shared.device.manager import DeviceManager
 from taktik.core.social_media.instagram.actions.atomic.navigation import NavigationActions
 from taktik.core.social_media.instagram.actions.atomic.detection import DetectionActions
 from taktik.core.social_media.instagram.actions.atomic.scroll import ScrollActions
 from taktik.core.social_media.instagram.actions.business.management.profile import ProfileBusiness
 from taktik.core.social_media.instagram.ui.extractors import InstagramUIExtractors
 from taktik.core.database.local.service import get_local_database
+from .list_stream import ProfileStreamSink
 
 from .post_scraping_helpers import ScrapingPostHelpersMixin
 from .list_scraping import ScrapingListMixin
 from .persistence import ScrapingPersistenceMixin
 from ..common.session import should_continue_session
 
+if TYPE_CHECKING:
+    from taktik.core.shared.device.manager import DeviceManager
+
 
 console = Console()
 
+# Followers/following lists at least this long are scraped in streaming mode
+# (config `stream_profiles` forces it for any length).
+STREAM_LIST_THRESHOLD = 2000
+
 
 class ScrapingWorkflow(
     ScrapingPostHelpersMixin,
@@ -54,7 +62,7 @@ class ScrapingWorkflow(
     
     def __init__(
         self,
-        device_manager: DeviceManager,
+        device_manager: "DeviceManager",
         config: Dict[str, Any],
         ai_notifier=None,
         ai_service=None,
@@ -82,6 +90,9 @@ class ScrapingWorkflow(
         
         # Stats
         self.scraped_profiles: List[Dict[str, Any]] = []
+        # Profiles of streamed lists: persisted in batches, never kept (see list_stream.py)
+        self.streamed_count = 0
+        self._streamed_sources: Dict[str, int] = {}
         self.start_time = None
         self.session_duration_minutes = config.get('session_duration_minutes', 60)
         self.scraping_session_id: Optional[int] = None
@@ -150,7 +161,7 @@ class ScrapingWorkflow(
             # No separate enrichment step needed anymore
             
             # Export results
-            if self.config.get('export_csv', True) and self.scraped_profiles:
+            if self.config.get('export_csv', True) and (self.scraped_profiles or self.csv_export_path):
                 self._export_to_csv()
             
             # Save to database
@@ -321,16 +332,34 @@ class ScrapingWorkflow(
             # AI qualification requires enrichment to get full bio/category data
             if self.config.get('ai_mode') and self._ai_service:
                 enrich_profiles = True
+            # Long lists are streamed: batched to the base, bounded in memory, resumable.
+            sink = None
+            if self.config.get('stream_profiles') or actual_max >= STREAM_LIST_THRESHOLD:
+                sink = ProfileStreamSink(
+                    scrape_type.upper(),
+                    target,
+                    scraping_id=self.scraping_session_id,
+                    local_db=self.local_db if self._save_immediately else None,
+                    write_rows=self._csv_append if self.config.get('export_csv', True) else None,
+                    total_offset=self._total_scraped(),
+                )
             profiles_from_target = self._scrape_list(
                 max_count=actual_max,
                 source_type=scrape_type.upper(),
                 source_name=target,
                 total_available=available_count,
-                enrich_on_the_fly=enrich_profiles
+                enrich_on_the_fly=enrich_profiles,
+                sink=sink,
             )
             
-            total_scraped += len(profiles_from_target)
-            console.print(f"[green]✅ Scraped {len(profiles_from_target):,}/{available_count:,} {scrape_type} from @{target}[/green]")
+            scraped_from_target = len(profiles_from_target)
+            if sink is not None:
+                scraped_from_target = sink.count
+                self.streamed_count += sink.count
+                for source, count in sink.by_source.items():
+                    self._streamed_sources[source] = self._streamed_sources.get(source, 0) + count
+            total_scraped += scraped_from_target
+            console.print(f"[green]✅ Scraped {scraped_from_target:,}/{available_count:,} {scrape_type} from @{target}[/green]")
             
             # Go back
             self.device.press("back")
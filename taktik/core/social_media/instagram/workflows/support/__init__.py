@@ -1,6 +1,18 @@
-"""Runtime support for Instagram automation workflows."""
+"""Runtime support for Instagram automation workflows.
+
+Exports are resolved on first access (module `__getattr__`), so importing one
+submodule does not import its siblings.
+"""
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'WorkflowHelpers': ('.workflow_helpers', 'WorkflowHelpers'),
+    'UIHelpers': ('.ui_helpers', 'UIHelpers'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-from .workflow_helpers import WorkflowHelpers
-from .ui_helpers import UIHelpers
 
 __all__ = ['WorkflowHelpers', 'UIHelpers']
@@ -5,7 +5,12 @@ import random
 from datetime import datetime
 from typing import Dict, Any, Optional
 from loguru import logger
+from .....database.local.retention import start_background_retention
 from .....database.local.service import get_local_database
+from .....database.target_decision_cache import (
+    activate_target_decision_cache,
+    deactivate_target_decision_cache,
+)
 from ...ui.language import redetect_if_unknown
 from ..management.session import stop_reasons
 from ..management.session.stop_reasons import StopReason
@@ -330,6 +335,15 @@ class WorkflowHelpers:
             
             if session_id:
                 self.logger.info(f"✅ Session created: {session_name} (ID: {session_id})")
+                # Skip / follow checks for every target of the session are answered from
+                # this snapshot (kept current by the session's own writes).
+                activate_target_decision_cache(self.automation.active_account_id, local_db)
+                # Trim the unbounded tables while the session runs (small batches on its
+                # own connection, at most once a day, a bounded time per run). A dry run
+                # until the operator enables `database_retention` in the config.
+                start_background_retention(
+                    local_db.db_path, self.automation.config.get('database_retention')
+                )
                 return session_id
             else:
                 self.logger.error("❌ Session creation failed")
@@ -345,6 +359,7 @@ class WorkflowHelpers:
         # end_time + stats_* aggregated from interactions. Electron only writes that
         # snapshot on its own manual-stop path — bot-ended sessions used to keep
         # stats_* at 0 and end_time NULL, under-reporting the account's real activity.
+        deactivate_target_decision_cache()
         try:
             session_duration = int(time.time() - self.automation.stats['start_time'])
 
@@ -11,25 +11,32 @@ Main components:
 - Models: Data models
 - Utils: Utility functions
 
+Exports are resolved on first access (module `__getattr__`), like the Instagram
+package: importing one TikTok submodule (a selector, an IPC helper) must not import the
+manager, the workflows and uiautomator2 behind them.
 """
 
-from .core.manager import TikTokManager
-from .actions import (
-    ClickActions,
-    NavigationActions,
-    ScrollActions,
-    DetectionActions,
-    ForYouWorkflow,
-    ForYouConfig,
-    ForYouStats,
-)
-from .ui import (
-    TIKTOK_PACKAGE,
-    VIDEO_SELECTORS,
-    NAVIGATION_SELECTORS,
-    PROFILE_SELECTORS,
-    INBOX_SELECTORS,
-)
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'TikTokManager': ('.core.manager', 'TikTokManager'),
+    'ClickActions': ('.actions', 'ClickActions'),
+    'NavigationActions': ('.actions', 'NavigationActions'),
+    'ScrollActions': ('.actions', 'ScrollActions'),
+    'DetectionActions': ('.actions', 'DetectionActions'),
+    'ForYouWorkflow': ('.actions', 'ForYouWorkflow'),
+    'ForYouConfig': ('.actions', 'ForYouConfig'),
+    'ForYouStats': ('.actions', 'ForYouStats'),
+    'TIKTOK_PACKAGE': ('.ui', 'TIKTOK_PACKAGE'),
+    'VIDEO_SELECTORS': ('.ui', 'VIDEO_SELECTORS'),
+    'NAVIGATION_SELECTORS': ('.ui', 'NAVIGATION_SELECTORS'),
+    'PROFILE_SELECTORS': ('.ui', 'PROFILE_SELECTORS'),
+    'INBOX_SELECTORS': ('.ui', 'INBOX_SELECTORS'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     'TikTokManager',
@@ -50,4 +57,4 @@ __all__ = [
     'INBOX_SELECTORS',
 ]
 
-__version__ = '1.0.0'
\ No newline at end of file
+__version__ = '1.0.0'
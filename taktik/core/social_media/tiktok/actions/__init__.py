@@ -1,9 +1,23 @@
 """Actions module for TikTok automation.
 
+Exports are resolved on first access (module `__getattr__`).
 """
 
-from .atomic import ClickActions, NavigationActions, ScrollActions, DetectionActions
-from .business import ForYouWorkflow, ForYouConfig, ForYouStats
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'ClickActions': ('.atomic', 'ClickActions'),
+    'NavigationActions': ('.atomic', 'NavigationActions'),
+    'ScrollActions': ('.atomic', 'ScrollActions'),
+    'DetectionActions': ('.atomic', 'DetectionActions'),
+    'ForYouWorkflow': ('.business', 'ForYouWorkflow'),
+    'ForYouConfig': ('.business', 'ForYouConfig'),
+    'ForYouStats': ('.business', 'ForYouStats'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     # Atomic actions
@@ -9,6 +9,9 @@ Aggregate classes (backward-compatible):
 Granular classes (for targeted imports):
     VideoActions, PopupActions, SearchActions,
     VideoDetector, PopupDetector
+
+Single-dump reader:
+    VideoFrame         — everything the video loop reads, from one dump
 """
 
 from .click_actions import ClickActions
@@ -22,6 +25,7 @@ from .popup_actions import PopupActions
 from .search_actions import SearchActions
 from .video_detector import VideoDetector
 from .popup_detector import PopupDetector
+from .video_frame import VideoFrame
 
 __all__ = [
     # Aggregate (backward-compat)
@@ -36,4 +40,5 @@ __all__ = [
     'SearchActions',
     'VideoDetector',
     'PopupDetector',
+    'VideoFrame',
 ]
@@ -10,7 +10,7 @@ Based on the UI dumps:
 
 import re
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from loguru import logger
 
 from ..core.base_action import BaseAction
@@ -193,7 +193,13 @@ class DMActions(BaseAction):
             
             count = username_elements.count
             self.logger.debug(f"Found {count} conversation usernames")
-            
+
+            # Last-message preview and time, paired with the usernames by index (same as
+            # get_inbox_conversations): together they fingerprint the row, so a delta read
+            # can tell an unchanged thread without opening it.
+            previews = self._texts_by_index(self.inbox_selectors.conversation_last_message)
+            timestamps = self._texts_by_index(self.inbox_selectors.conversation_timestamp)
+
             for i in range(count):  # No limit here, workflow handles max_conversations
                 try:
                     elem = username_elements[i]
@@ -202,15 +208,11 @@ class DMActions(BaseAction):
                     if not name:
                         continue
                     
-                    # For now, we can't easily get last_message and timestamp
-                    # without complex parent/sibling navigation
-                    # We'll get basic info and read details when opening the conversation
-                    
                     conversations.append({
                         'type': 'conversation',
                         'name': name,
-                        'last_message': '',
-                        'timestamp': '',
+                        'last_message': previews[i] if i < len(previews) else '',
+                        'timestamp': timestamps[i] if i < len(timestamps) else '',
                         'is_group': False,  # Will detect when opening
                         'unread_count': 0,
                     })
@@ -223,6 +225,19 @@ class DMActions(BaseAction):
 
         return conversations
 
+    def _texts_by_index(self, selectors: List[str]) -> List[str]:
+        """Texts of every element matching ``selectors``, in screen order ('' when unreadable)."""
+        elements = self._find_all_by_rid(selectors)
+        if elements is None or not elements.exists:
+            return []
+        texts = []
+        for i in range(elements.count):
+            try:
+                texts.append((elements[i].get_text() or '').strip())
+            except Exception:
+                texts.append('')
+        return texts
+
     # ==========================================================================
     # NEW FOLLOWERS (page dédiée — onglet Messages -> « Nouveaux followers »)
     # ==========================================================================
@@ -638,41 +653,53 @@ class DMActions(BaseAction):
         
         return info
     
-    def get_messages(self, limit: int = 20) -> List[Dict[str, Any]]:
+    def get_messages(self, limit: int = 20, stop_at: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get messages from current conversation.
         
         Args:
             limit: Maximum number of messages to retrieve
+            stop_at: Text of the newest message already on record (delta read). Messages
+                are read from the newest up and the read stops there, so only the new
+                ones come back.
             
         Returns:
-            List of messages with sender, text, type, timestamp
+            List of messages with sender, text, type, timestamp (oldest first). ``is_sent``
+            comes from the bubble's side of the screen, None when it cannot be told.
         """
         messages = []
         
         try:
+            display_width = self._display_width()
             # Find all text message elements via centralized message_text resource-id
             # (pattern match: robust to the containment form, see _find_all_by_rid)
             text_elements = self._find_all_by_rid(self.conversation_selectors.message_text)
 
             if text_elements is not None and text_elements.exists:
-                count = min(text_elements.count, limit)
-                self.logger.debug(f"Found {count} text messages")
+                total = text_elements.count
+                self.logger.debug(f"Found {total} text messages")
                 
-                for i in range(count):
+                # The newest message is at the bottom: walk up from it.
+                for i in range(total - 1, -1, -1):
+                    if len(messages) >= limit:
+                        break
                     try:
-                        elem = text_elements[i]
-                        text = elem.get_text()
+                        # One RPC for the text and the bounds the direction is read from.
+                        info = text_elements[i].info or {}
+                        text = info.get('text')
                         
+                        if text and text == stop_at:
+                            break  # everything above is already on record
                         if text:
                             messages.append({
                                 'sender': None,  # Would need parent navigation
                                 'text': text,
                                 'type': 'text',
-                                'is_sent': False,  # Can't easily determine
+                                'is_sent': self._bubble_is_sent(info.get('bounds'), display_width),
                             })
                     except Exception as e:
                         self.logger.debug(f"Error parsing message {i}: {e}")
                         continue
+                messages.reverse()
             
             # Also check for stickers/GIFs
             sticker_elements = self._find_all_by_rid(self.conversation_selectors.message_sticker)
@@ -684,13 +711,39 @@ class DMActions(BaseAction):
                         'sender': None,
                         'text': None,
                         'type': 'sticker',
-                        'is_sent': False,
+                        'is_sent': None,
                     })
             
         except Exception as e:
             self.logger.warning(f"Error getting messages: {e}")
         
         return messages
+
+    def _display_width(self) -> Optional[int]:
+        """Screen width in px, or None when the device does not report it."""
+        raw_device = self.device._device if hasattr(self.device, '_device') else self.device
+        try:
+            return int(raw_device.info.get('displayWidth')) or None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _bubble_is_sent(bounds: Optional[Dict[str, int]], display_width: Optional[int]) -> Optional[bool]:
+        """Our bubbles hug the right edge, the partner's sit after the avatar on the left.
+
+        The side with the smaller margin wins; a bubble whose margins are within 5% of the
+        width of each other (a long message spanning the screen) gives None, not a guess.
+        """
+        if not bounds or not display_width:
+            return None
+        try:
+            left_margin = int(bounds['left'])
+            right_margin = display_width - int(bounds['right'])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if abs(left_margin - right_margin) < display_width * 0.05:
+            return None
+        return right_margin < left_margin
     
     # ==========================================================================
     # MESSAGE SENDING
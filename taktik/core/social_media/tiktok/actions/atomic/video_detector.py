@@ -38,6 +38,48 @@ def _extract_count_from_content_desc(desc: str, patterns: List[str]) -> Optional
     return None
 
 
+def _is_truncated(raw: str) -> bool:
+    """True when a description ends with the '…more' expander."""
+    return 'more' in raw and ('…' in raw or raw.rstrip().endswith('...more'))
+
+
+def _author_from_content_desc(desc: str) -> Optional[str]:
+    """Username from the avatar content-desc (trill: 'username profile')."""
+    if desc.endswith(' profile'):
+        return desc[:-len(' profile')].strip()
+    if desc.startswith('Profile '):
+        return desc[len('Profile '):].strip()
+    if desc.startswith('Profil '):
+        return desc[len('Profil '):].strip()
+    return None
+
+
+def _sound_from_content_desc(desc: str) -> Optional[str]:
+    """Sound name from the sound button content-desc ('Sound: X by Y' -> 'X by Y')."""
+    sound_match = re.match(r'^(?:Sound|Son)\s*:\s*(.+)$', desc, re.IGNORECASE)
+    if sound_match:
+        return sound_match.group(1).strip()
+    # Fallback: sometimes just the name
+    return desc.strip() or None
+
+
+def _like_count_from_content_desc(desc: str) -> Optional[str]:
+    """Like count from the like button content-desc (EN 'Like video. 2 likes', or FR)."""
+    extracted = _extract_count_from_content_desc(desc, [
+        r'(?:Like video|Unlike video)[.\s]+(.+?)\s+likes?',
+    ])
+    if extracted:
+        return extracted
+    return _extract_french_like_count(desc)
+
+
+def _comment_count_from_content_desc(desc: str) -> Optional[str]:
+    """Comment count from the comment button content-desc ('Read or add comments. 0 comments')."""
+    return _extract_count_from_content_desc(desc, [
+        r'(?:Read or add comments|Lire ou ajouter des commentaires)[.\s]+(.+?)\s+(?:comments?|commentaires?)',
+    ])
+
+
 def _extract_french_like_count(desc: str) -> Optional[str]:
     """Extract the like count from a French TikTok like button content-desc."""
     if "J'aime" not in desc:
@@ -89,12 +131,7 @@ class VideoDetector(BaseAction):
 
         desc = self._get_element_content_desc(self.video_selectors.creator_profile_image, timeout=1)
         if desc:
-            if desc.endswith(' profile'):
-                return desc[:-len(' profile')].strip()
-            if desc.startswith('Profile '):
-                return desc[len('Profile '):].strip()
-            if desc.startswith('Profil '):
-                return desc[len('Profil '):].strip()
+            return _author_from_content_desc(desc)
 
         return None
 
@@ -111,9 +148,11 @@ class VideoDetector(BaseAction):
         raw = self._get_element_text(self.video_selectors.video_description, timeout=1)
         if not raw:
             return None
+        return self._expand_description(raw)
 
-        # Check if truncated
-        if 'more' in raw and ('…' in raw or raw.rstrip().endswith('...more')):
+    def _expand_description(self, raw: str) -> str:
+        """Tap a truncated description open and re-read it; `raw` when not truncated."""
+        if _is_truncated(raw):
             try:
                 for sel in self.video_selectors.video_description:
                     elem = self.device.xpath(sel)
@@ -153,12 +192,7 @@ class VideoDetector(BaseAction):
         """
         desc = self._get_element_content_desc(self.video_selectors.sound_button, timeout=1)
         if desc:
-            sound_match = re.match(r'^(?:Sound|Son)\s*:\s*(.+)$', desc, re.IGNORECASE)
-            if sound_match:
-                return sound_match.group(1).strip()
-            # Fallback: sometimes just the name
-            if desc:
-                return desc.strip()
+            return _sound_from_content_desc(desc)
         return None
 
     def get_author_profile_pic(self) -> Optional[str]:
@@ -268,15 +302,7 @@ class VideoDetector(BaseAction):
             timeout=1,
         )
         if desc:
-            extracted = _extract_count_from_content_desc(desc, [
-                r'(?:Like video|Unlike video)[.\s]+(.+?)\s+likes?',
-            ])
-            if extracted:
-                return extracted
-
-            extracted = _extract_french_like_count(desc)
-            if extracted:
-                return extracted
+            return _like_count_from_content_desc(desc)
 
         return None
 
@@ -291,11 +317,7 @@ class VideoDetector(BaseAction):
 
         desc = self._get_element_content_desc(self.video_selectors.comment_button_for_count, timeout=1)
         if desc:
-            extracted = _extract_count_from_content_desc(desc, [
-                r'(?:Read or add comments|Lire ou ajouter des commentaires)[.\s]+(.+?)\s+(?:comments?|commentaires?)',
-            ])
-            if extracted:
-                return extracted
+            return _comment_count_from_content_desc(desc)
 
         return None
 
@@ -329,6 +351,22 @@ class VideoDetector(BaseAction):
             info['comment_count'] = self.get_video_comment_count()
         return info
 
+    # === Single-dump reads ===
+
+    def capture_video_frame(self):
+        """Dump the screen once into a ``VideoFrame`` (None when the dump fails)."""
+        from .video_frame import VideoFrame
+
+        return VideoFrame.capture(self.device)
+
+    def get_video_info_from_frame(self, frame, include_comment_count: bool = False,
+                                  full_description: bool = True) -> Dict[str, Any]:
+        """``get_video_info`` answered from a frame; only a truncated description is probed."""
+        expanded = None
+        if full_description and frame.description_truncated():
+            expanded = self._expand_description(frame.description())
+        return frame.video_info(include_comment_count=include_comment_count, description=expanded)
+
     # === Ad Detection ===
 
     def is_ad_video(self) -> bool:
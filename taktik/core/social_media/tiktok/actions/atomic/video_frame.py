@@ -0,0 +1,184 @@
+"""One hierarchy dump per video, read by everything the feed loop asks about it.
+
+Each iteration of a video loop used to ask the device a dozen separate questions: is a
+popup up, is the comment sheet open, is this a suggestion page, then author,
+description, sound, like count, liked, favourited, ad - one selector probe each, and
+the boolean probes poll their full timeout when the answer is "no", which on a plain
+video it almost always is. ``VideoFrame`` takes ONE dump, indexes it
+(``shared/device/dump_index.py``) and answers all of them from memory, with the same
+selector catalogs and the same content-desc parsing as ``VideoDetector``.
+
+The dump is the visible-only one the popup scan already used: the feed pager keeps the
+neighbouring videos in the hierarchy, and a hidden author is the previous video's.
+
+What a snapshot cannot do is tap: a description truncated with '…more' is still
+expanded by ``VideoDetector`` with a targeted probe. A frame that does not look like a
+video (no like button, no author) tells the caller to fall back to the probes.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Union
+
+from loguru import logger
+
+from ...ui.selectors.shell.popups import POPUP_SELECTORS
+from ...ui.selectors.surfaces.video import VIDEO_SELECTORS
+from .video_detector import (
+    _author_from_content_desc,
+    _comment_count_from_content_desc,
+    _is_truncated,
+    _like_count_from_content_desc,
+    _parse_description,
+    _sound_from_content_desc,
+)
+
+# XPath rewriter: converts Android class-name steps to lxml node[@class=…] form.
+# e.g. //android.widget.Button[@text="x"] → //node[@class="android.widget.Button"][@text="x"]
+_CLASS_STEP_RE = re.compile(
+    r'(/{1,2})([a-zA-Z][a-zA-Z0-9]*(?:\.[a-zA-Z][a-zA-Z0-9]*)+)'
+)
+
+Selectors = Union[List[str], str]
+
+
+def to_lxml(xp: str) -> str:
+    """Rewrite a uiautomator2 selector so lxml evaluates it on a raw dump."""
+    return _CLASS_STEP_RE.sub(r'\1node[@class="\2"]', xp)
+
+
+class VideoFrame:
+    """Everything the video loop reads about the current screen, from one ``DumpIndex``."""
+
+    def __init__(self, index, video_selectors=VIDEO_SELECTORS, popup_selectors=POPUP_SELECTORS):
+        self.index = index
+        self.video_selectors = video_selectors
+        self.popup_selectors = popup_selectors
+
+    @classmethod
+    def capture(cls, device) -> Optional["VideoFrame"]:
+        """Dump the screen once; None when the dump fails or is not XML."""
+        from taktik.core.shared.device.dump_index import DumpIndex
+        from taktik.core.shared.device.facade import BaseDeviceFacade
+
+        try:
+            if isinstance(device, BaseDeviceFacade):
+                xml = device.get_scoped_xml_dump(visible_only=True)
+            else:
+                xml = device.dump_hierarchy(compressed=False)
+            index = DumpIndex.from_xml(xml)
+        except Exception as exc:
+            logger.debug(f"VideoFrame: dump failed ({exc})")
+            return None
+        return cls(index) if index is not None else None
+
+    # -- selector evaluation ------------------------------------------------
+
+    def _elements(self, selector: str) -> list:
+        try:
+            return self.index.xpath(to_lxml(selector))
+        except Exception:
+            return []
+
+    def exists(self, selectors: Selectors) -> bool:
+        """Any selector matches (the snapshot form of ``_element_exists``)."""
+        for selector in (selectors if isinstance(selectors, list) else [selectors]):
+            if self._elements(selector):
+                return True
+        return False
+
+    def attribute(self, selectors: Selectors, name: str) -> Optional[str]:
+        """Stripped, non-empty attribute of the first match of the first selector that has one.
+
+        Same resolution as ``_get_element_text`` / ``_get_element_content_desc``: only
+        the first element a selector matches is read.
+        """
+        for selector in (selectors if isinstance(selectors, list) else [selectors]):
+            elements = self._elements(selector)
+            if elements:
+                value = (elements[0].get(name) or '').strip()
+                if value:
+                    return value
+        return None
+
+    # -- interruptions ------------------------------------------------------
+
+    def is_video_page(self) -> bool:
+        """A video is on screen: its like button or its author can be read."""
+        return self.exists(self.video_selectors.like_button) or self.author() is not None
+
+    def has_suggestion_page(self) -> bool:
+        return self.exists(self.popup_selectors.suggestion_page_indicator)
+
+    def has_comments_section_open(self) -> bool:
+        return self.exists(self.popup_selectors.comments_section_indicator)
+
+    # -- video info ---------------------------------------------------------
+
+    def author(self) -> Optional[str]:
+        text = self.attribute(self.video_selectors.author_username, 'text')
+        if text:
+            return text
+        desc = self.attribute(self.video_selectors.creator_profile_image, 'content-desc')
+        return _author_from_content_desc(desc) if desc else None
+
+    def description(self) -> Optional[str]:
+        """Raw description, possibly truncated with '…more'."""
+        return self.attribute(self.video_selectors.video_description, 'text')
+
+    def description_truncated(self) -> bool:
+        raw = self.description()
+        return bool(raw) and _is_truncated(raw)
+
+    def sound(self) -> Optional[str]:
+        desc = self.attribute(self.video_selectors.sound_button, 'content-desc')
+        return _sound_from_content_desc(desc) if desc else None
+
+    def like_count(self) -> Optional[str]:
+        count = self.attribute(self.video_selectors.like_count, 'text')
+        if count:
+            return count
+        desc = self.attribute(self.video_selectors.like_button_for_count, 'content-desc')
+        return _like_count_from_content_desc(desc) if desc else None
+
+    def comment_count(self) -> Optional[str]:
+        count = self.attribute(self.video_selectors.comment_count, 'text')
+        if count:
+            return count
+        desc = self.attribute(self.video_selectors.comment_button_for_count, 'content-desc')
+        return _comment_count_from_content_desc(desc) if desc else None
+
+    def is_liked(self) -> bool:
+        return self.exists(self.video_selectors.unlike_indicator)
+
+    def is_favorited(self) -> bool:
+        return self.exists(self.video_selectors.video_favorited_indicator)
+
+    def is_ad(self) -> bool:
+        return self.exists(self.video_selectors.ad_label)
+
+    def video_info(self, include_comment_count: bool = False,
+                   description: Optional[str] = None) -> Dict[str, Any]:
+        """The ``VideoDetector.get_video_info`` dict, read from the snapshot.
+
+        ``description`` overrides the snapshot's (truncated) text once it was expanded.
+        """
+        raw = description if description is not None else self.description()
+        desc_parsed = _parse_description(raw) if raw else {'description_text': None, 'hashtags': []}
+        info: Dict[str, Any] = {
+            'author': self.author(),
+            # Legacy field kept for backward compat (raw text)
+            'description': desc_parsed.get('description_text'),
+            'description_text': desc_parsed.get('description_text'),
+            'hashtags': desc_parsed.get('hashtags', []),
+            'sound': self.sound(),
+            'like_count': self.like_count(),
+            'is_liked': self.is_liked(),
+            'is_favorited': self.is_favorited(),
+            'is_ad': self.is_ad(),
+        }
+        if include_comment_count:
+            info['comment_count'] = self.comment_count()
+        return info
+
+
+__all__ = ["VideoFrame", "to_lxml"]
@@ -1,8 +1,19 @@
 """Business logic actions for TikTok.
 
+Exports are resolved on first access (module `__getattr__`).
 """
 
-from .workflows import ForYouWorkflow, ForYouConfig, ForYouStats
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'ForYouWorkflow': ('.workflows', 'ForYouWorkflow'),
+    'ForYouConfig': ('.workflows', 'ForYouConfig'),
+    'ForYouStats': ('.workflows', 'ForYouStats'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     'ForYouWorkflow',
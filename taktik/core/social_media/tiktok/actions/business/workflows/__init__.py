@@ -1,11 +1,30 @@
 """Workflow actions for TikTok automation.
 
+Exports are resolved on first access (module `__getattr__`), so importing one
+workflow (or a shared helper under `_internal`) does not import the other three.
 """
 
-from .for_you import ForYouWorkflow, ForYouConfig, ForYouStats
-from .dm import DMWorkflow, DMConfig, DMStats, ConversationData
-from .search import SearchWorkflow, SearchConfig, SearchStats
-from .followers import FollowersWorkflow, FollowersConfig, FollowersStats
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'ForYouWorkflow': ('.for_you', 'ForYouWorkflow'),
+    'ForYouConfig': ('.for_you', 'ForYouConfig'),
+    'ForYouStats': ('.for_you', 'ForYouStats'),
+    'DMWorkflow': ('.dm', 'DMWorkflow'),
+    'DMConfig': ('.dm', 'DMConfig'),
+    'DMStats': ('.dm', 'DMStats'),
+    'ConversationData': ('.dm', 'ConversationData'),
+    'SearchWorkflow': ('.search', 'SearchWorkflow'),
+    'SearchConfig': ('.search', 'SearchConfig'),
+    'SearchStats': ('.search', 'SearchStats'),
+    'FollowersWorkflow': ('.followers', 'FollowersWorkflow'),
+    'FollowersConfig': ('.followers', 'FollowersConfig'),
+    'FollowersStats': ('.followers', 'FollowersStats'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     'ForYouWorkflow',
@@ -4,6 +4,7 @@ from .base_workflow import BaseTikTokWorkflow
 from .base_video_workflow import BaseVideoWorkflow
 from .models import VideoWorkflowStats
 from .popup_handler import PopupHandler
+from .dwell import DwellScheduler
 from .feed_interruptions import FeedInterruptionsMixin
 from .profile_extractor import extract_profile_from_screen
 
@@ -12,6 +13,7 @@ __all__ = [
     'BaseVideoWorkflow',
     'VideoWorkflowStats',
     'PopupHandler',
+    'DwellScheduler',
     'FeedInterruptionsMixin',
     'extract_profile_from_screen',
 ]
@@ -17,6 +17,7 @@ import random
 from taktik.core.shared.telemetry.sink import emit_step
 from ....core.utils import parse_count
 from .base_workflow import BaseTikTokWorkflow
+from .dwell import DwellScheduler
 from .models import VideoWorkflowStats
 
 
@@ -38,6 +39,8 @@ class BaseVideoWorkflow(BaseTikTokWorkflow):
         - _like_video, _follow_user, _favorite_video
         - _decide_and_execute_actions
         - _check_limits_reached, _check_pause_needed
+        - _read_current_video (popups + interruptions + video info, one dump)
+        - _emit_video_info / _dwell (side work overlapped with the watch)
         - _handle_stuck_video (stuck-video detection)
         - _parse_count (delegate to utils.parse_count)
         - get_stats
@@ -55,6 +58,9 @@ class BaseVideoWorkflow(BaseTikTokWorkflow):
         self._last_video_signature: Optional[str] = None
         self._same_video_count = 0
 
+        # Per-video side work (IPC, avatar capture) runs during the watch
+        self._dwell = DwellScheduler()
+
     # ------------------------------------------------------------------
     # Callback setters
     # ------------------------------------------------------------------
@@ -71,6 +77,14 @@ class BaseVideoWorkflow(BaseTikTokWorkflow):
         """Set callback called when a user is followed."""
         self._on_follow_callback = callback
 
+    def _emit_video_info(self, video_info: Dict[str, Any]):
+        """Fire the video callback (IPC card, author picture); errors are logged."""
+        if self._on_video_callback:
+            try:
+                self._on_video_callback(video_info)
+            except Exception as e:
+                self.logger.warning(f"Video callback error: {e}")
+
     # ------------------------------------------------------------------
     # Video actions
     # ------------------------------------------------------------------
@@ -166,13 +180,52 @@ class BaseVideoWorkflow(BaseTikTokWorkflow):
             return True
         return False
 
-    def _handle_popups(self) -> bool:
+    def _handle_popups(self, index=None) -> bool:
         """Override to also track popup stats."""
-        closed = super()._handle_popups()
+        closed = super()._handle_popups(index)
         if closed:
             self.stats.popups_closed += 1
         return closed
 
+    # ------------------------------------------------------------------
+    # One dump per video
+    # ------------------------------------------------------------------
+
+    def _read_current_video(self) -> Optional[Dict[str, Any]]:
+        """Handle popups and feed interruptions, then read the video — from one dump.
+
+        Returns the ``get_video_info`` dict, or None when an interruption (comment
+        sheet, suggestion page) was handled and the caller should ``continue``.
+
+        The ``VideoFrame`` answers the popup scan, the interruption checks and every
+        video field; the only extra round trips are a re-dump after a popup was
+        closed (the screen changed) and the tap that expands a truncated
+        description. A failed dump, or a frame with no video on it, falls back to
+        the per-selector probes.
+        """
+        handles_interruptions = hasattr(self, '_handle_comments_section')
+        frame = self.detection.capture_video_frame()
+        if frame is None:
+            self._handle_popups()
+            if handles_interruptions and (
+                    self._handle_comments_section() or self._handle_suggestion_page()):
+                return None
+            return self.detection.get_video_info()
+
+        if self._handle_popups(frame.index):
+            frame = self.detection.capture_video_frame()
+            if frame is None:
+                return self.detection.get_video_info()
+
+        if handles_interruptions and (
+                self._handle_comments_section(frame) or self._handle_suggestion_page(frame)):
+            return None
+
+        if not frame.is_video_page():
+            self.logger.debug("No video in the snapshot, probing selectors one by one")
+            return self.detection.get_video_info()
+        return self.detection.get_video_info_from_frame(frame)
+
     # ------------------------------------------------------------------
     # Stuck-video detection
     # ------------------------------------------------------------------
@@ -130,10 +130,11 @@ class BaseTikTokWorkflow:
     # Popup handling
     # ------------------------------------------------------------------
 
-    def _handle_popups(self) -> bool:
+    def _handle_popups(self, index=None) -> bool:
         """Check for and close any popups that might block interaction.
 
         What counts as an accidental surface rather than a destination comes from
-        ``OWNED_SURFACES``, declared by the workflow class.
+        ``OWNED_SURFACES``, declared by the workflow class. ``index`` is a
+        ``DumpIndex`` of the current screen when the caller already dumped it.
         """
-        return self._popup_handler.close_all()
+        return self._popup_handler.close_all(index)
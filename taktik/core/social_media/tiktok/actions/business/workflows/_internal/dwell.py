@@ -0,0 +1,81 @@
+"""Dwell scheduler — side work of a video runs while the bot watches it.
+
+A video loop plans a watch time and then sleeps through it; everything else it does
+per video (the video-info IPC with the author picture capture and its blob-store
+write, the stats IPC, whatever hook a caller adds) used to run before or after that
+sleep, so each video cost its dwell PLUS its side work. None of that work needs the
+main thread, and none of it changes what the app sees, so it can run during the sleep.
+
+``defer()`` queues work for the next dwell. ``dwell(wait)`` starts the queued work on
+a worker thread, runs ``wait`` (the unchanged sleep) on the calling thread, then joins
+the worker before returning: the next device step (like, scroll) never races the side
+work, and work that must see the current video on screen (the author picture) runs
+while it still is. The app sees the same dwell as before; wall-clock per video only
+exceeds it when the side work outlasts the sleep.
+
+Deferred work is best-effort, like the callbacks it carries: an exception is logged,
+never raised into the loop. ``drain()`` runs what is queued synchronously, for a video
+that is not watched (an ad, a filtered video) and at the end of a run.
+"""
+
+import threading
+import time
+from typing import Any, Callable, List, Tuple
+
+from loguru import logger
+
+Task = Tuple[Callable[..., Any], tuple, dict]
+
+
+class DwellScheduler:
+    """Queues per-video side work and overlaps it with the next dwell."""
+
+    def __init__(self, join_timeout: float = 10.0):
+        # Bound on how long a dwell waits for overrunning work before moving on.
+        self.join_timeout = join_timeout
+        self._pending: List[Task] = []
+        self.logger = logger.bind(module="tiktok-dwell-scheduler")
+        self.tasks_run = 0
+        self.overrun_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def defer(self, fn: Callable[..., Any], *args, **kwargs) -> None:
+        """Queue ``fn(*args, **kwargs)`` for the next dwell (run in submission order)."""
+        self._pending.append((fn, args, kwargs))
+
+    def _run(self, tasks: List[Task]) -> None:
+        for fn, args, kwargs in tasks:
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                self.logger.debug(f"Deferred {getattr(fn, '__name__', fn)!s} failed: {e}")
+            self.tasks_run += 1
+
+    def drain(self) -> None:
+        """Run the queued work now, on the calling thread."""
+        tasks, self._pending = self._pending, []
+        self._run(tasks)
+
+    def dwell(self, wait: Callable[[], Any]) -> Any:
+        """Run ``wait`` with the queued work in the background. Returns what ``wait`` returns."""
+        tasks, self._pending = self._pending, []
+        if not tasks:
+            return wait()
+        worker = threading.Thread(target=self._run, args=(tasks,), name="tiktok-dwell", daemon=True)
+        worker.start()
+        try:
+            return wait()
+        finally:
+            started = time.monotonic()
+            worker.join(self.join_timeout)
+            overrun = time.monotonic() - started
+            if overrun > 0.05:
+                self.overrun_seconds += overrun
+                self.logger.debug(f"Side work outlasted the dwell by {overrun:.2f}s")
+            if worker.is_alive():
+                self.logger.warning(f"Side work still running after {self.join_timeout:.0f}s, moving on")
+
+
+__all__ = ["DwellScheduler"]
@@ -24,13 +24,17 @@ class FeedInterruptionsMixin:
     # Subclass may override (ForYouConfig sets it, SearchConfig defaults False)
     _follow_back_suggestions: bool = False
 
-    def _handle_suggestion_page(self) -> bool:
+    def _handle_suggestion_page(self, frame=None) -> bool:
         """Check for and handle suggestion page (Follow back / Not interested).
         
+        Args:
+            frame: ``VideoFrame`` of the current screen, read instead of probing.
+
         Returns:
             True if a suggestion page was handled, False otherwise.
         """
-        if not self.detection.has_suggestion_page():
+        present = frame.has_suggestion_page() if frame is not None else self.detection.has_suggestion_page()
+        if not present:
             return False
 
         self.logger.info("💡 Suggestion page detected")
@@ -86,16 +90,21 @@ class FeedInterruptionsMixin:
 
         return True
 
-    def _handle_comments_section(self) -> bool:
+    def _handle_comments_section(self, frame=None) -> bool:
         """Check for and close comments section if accidentally opened.
         
         This can happen when scrolling and accidentally clicking on the
         comment input area.
         
+        Args:
+            frame: ``VideoFrame`` of the current screen, read instead of probing.
+
         Returns:
             True if comments section was detected and closed, False otherwise.
         """
-        if not self.detection.has_comments_section_open():
+        present = (frame.has_comments_section_open() if frame is not None
+                   else self.detection.has_comments_section_open())
+        if not present:
             return False
 
         self.logger.info("💬 Comments section detected, closing...")
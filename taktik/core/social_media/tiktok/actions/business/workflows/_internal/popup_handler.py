@@ -4,20 +4,11 @@ Centralises the popup-detection-and-close chain that was duplicated
 across ForYouWorkflow, SearchWorkflow, and FollowersWorkflow.
 """
 
-import re as _re
 import time
 from loguru import logger
 
-
-# XPath rewriter: converts Android class-name steps to lxml node[@class=…] form.
-# e.g. //android.widget.Button[@text="x"] → //node[@class="android.widget.Button"][@text="x"]
-_CLASS_STEP_RE = _re.compile(
-    r'(/{1,2})([a-zA-Z][a-zA-Z0-9]*(?:\.[a-zA-Z][a-zA-Z0-9]*)+)'
-)
-
-
-def _to_lxml(xp: str) -> str:
-    return _CLASS_STEP_RE.sub(r'\1node[@class="\2"]', xp)
+# Shared with the video frame reader; kept importable under its old name.
+from ....atomic.video_frame import to_lxml as _to_lxml
 
 
 class PopupHandler:
@@ -54,21 +45,39 @@ class PopupHandler:
         Returns an empty set when nothing popup-related is found (fast exit).
         """
         try:
-            from lxml import etree
+            from taktik.core.shared.device.dump_index import DumpIndex
+            from taktik.core.shared.device.facade import BaseDeviceFacade
         except ImportError:
             return {'_fallback'}
 
         try:
-            xml = self.detection.device.dump_hierarchy(compressed=False)
-            tree = etree.fromstring(xml.encode('utf-8'))
+            device = self.detection.device
+            scoped = isinstance(device, BaseDeviceFacade)
+            if scoped:
+                # A popup that matters is on screen: hidden nodes are noise. Not compressed:
+                # a popup built from plain layouts is not accessibility-important, so only a
+                # full dump proves a clean screen — and a clean screen is the usual answer.
+                xml = device.get_scoped_xml_dump(visible_only=True, compressed=False)
+            else:
+                xml = device.dump_hierarchy(compressed=False)
+            index = DumpIndex.from_xml(xml)
+            if index is None:
+                raise ValueError("unparseable hierarchy dump")
         except Exception as exc:
             self.logger.debug(f"_fast_detect: dump failed ({exc}) — falling back")
             return {'_fallback'}
+        return self.detect(index)
 
+    def detect(self, index):
+        """What popup-related surfaces a ``DumpIndex`` shows (empty set: clean screen).
+
+        Split out of ``_fast_detect`` so a caller that already holds the snapshot (the
+        video loop's ``VideoFrame``) does not pay a second dump.
+        """
         def hit(selectors):
             for xp in (selectors if isinstance(selectors, list) else [selectors]):
                 try:
-                    if tree.xpath(_to_lxml(xp)):
+                    if index.xpath(_to_lxml(xp)):
                         return True
                 except Exception:
                     continue
@@ -107,9 +116,12 @@ class PopupHandler:
     # Main entry point
     # ------------------------------------------------------------------
 
-    def close_all(self) -> bool:
+    def close_all(self, index=None) -> bool:
         """Run through the full popup chain. Returns True if any popup was closed.
 
+        ``index``: a ``DumpIndex`` of the current screen the caller already took;
+        detection then reads it instead of dumping again.
+
         Fast path: a single dump_hierarchy() + lxml XPath scan is used to
         determine in ~0.5 s whether *anything* needs handling.  When the
         screen is clean this avoids the ~15 s of sequential per-selector
@@ -118,7 +130,7 @@ class PopupHandler:
         Falls back transparently to sequential polling when lxml is
         unavailable or when the hierarchy dump fails.
         """
-        detected = self._fast_detect()
+        detected = self.detect(index) if index is not None else self._fast_detect()
 
         # ── Fallback: lxml unavailable or dump failed ─────────────────
         if '_fallback' in detected:
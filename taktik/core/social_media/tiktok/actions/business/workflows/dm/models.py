@@ -38,6 +38,7 @@ class DMStats:
     messages_sent: int = 0
     groups_skipped: int = 0
     notifications_skipped: int = 0
+    conversations_unchanged: int = 0  # Skipped: inbox row unchanged since the last read
     errors: int = 0
     
     start_time: float = field(default_factory=time.time)
@@ -51,6 +52,7 @@ class DMStats:
             'messages_sent': self.messages_sent,
             'groups_skipped': self.groups_skipped,
             'notifications_skipped': self.notifications_skipped,
+            'conversations_unchanged': self.conversations_unchanged,
             'errors': self.errors,
             'elapsed_seconds': elapsed,
             'elapsed_formatted': f"{int(elapsed // 60)}m {int(elapsed % 60)}s",
@@ -69,6 +71,7 @@ class ConversationData:
     timestamp: Optional[str] = None
     unread_count: int = 0
     can_reply: bool = True
+    inbox_fingerprint: Optional[str] = None  # Inbox row fingerprint at read time (delta sync, not emitted)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -11,6 +11,7 @@ from typing import Optional, Dict, Any, List, Callable
 from loguru import logger
 import time
 
+from taktik.core.database.messaging import inbox_fingerprint
 from .._internal import BaseTikTokWorkflow
 from ....atomic.dm_actions import DMActions
 from .models import DMConfig, DMStats, ConversationData
@@ -66,6 +67,13 @@ class DMWorkflow(BaseTikTokWorkflow):
         
         # DM-specific state
         self._conversations: List[ConversationData] = []
+        # Delta sync: recorded state per thread (DmConversationService.inbox_state), by
+        # lowercased name. Empty = every conversation is opened and read in full.
+        self._known_threads: Dict[str, Dict[str, Any]] = {}
+    
+    def set_known_threads(self, known_threads: Dict[str, Dict[str, Any]]):
+        """Set the recorded thread state used to skip unchanged conversations."""
+        self._known_threads = known_threads or {}
     
     def set_on_conversation_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """Set callback called for each conversation read."""
@@ -147,6 +155,17 @@ class DMWorkflow(BaseTikTokWorkflow):
                     if self.config.only_unread and item.get('unread_count', 0) == 0:
                         continue
                     
+                    if item['type'] == 'conversation':
+                        item['inbox_fingerprint'] = inbox_fingerprint(
+                            name, item.get('last_message'), item.get('timestamp')
+                        )
+                        known = self._known_threads.get(name.lower())
+                        if known and known.get('fingerprint') == item['inbox_fingerprint']:
+                            # Same preview and time as when it was recorded: nothing new.
+                            read_names.add(name)
+                            self.stats.conversations_unchanged += 1
+                            continue
+                    
                     new_conversations.append(item)
                 
                 if not new_conversations:
@@ -257,8 +276,10 @@ class DMWorkflow(BaseTikTokWorkflow):
             # Get conversation info
             conv_info = self.dm.get_conversation_info()
             
-            # Get messages
-            messages = self.dm.get_messages(limit=20)
+            # Get messages, stopping at the newest one already on record
+            known = self._known_threads.get(name.lower()) or {}
+            recent = known.get('recent_texts') or []
+            messages = self.dm.get_messages(limit=20, stop_at=recent[0] if recent else None)
             self.stats.messages_read += len(messages)
             
             # Create conversation data
@@ -271,6 +292,7 @@ class DMWorkflow(BaseTikTokWorkflow):
                 timestamp=item.get('timestamp'),
                 unread_count=item.get('unread_count', 0),
                 can_reply=True,
+                inbox_fingerprint=item.get('inbox_fingerprint'),
             )
             
             # Go back to inbox
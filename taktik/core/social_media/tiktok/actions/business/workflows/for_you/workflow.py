@@ -70,24 +70,16 @@ class ForYouWorkflow(FeedInterruptionsMixin, BaseVideoWorkflow):
                 if not self._wait_if_paused():
                     break
                 
-                # Check and close any popups first
-                self._handle_popups()
-                
-                # Check for comments section accidentally opened
-                if self._handle_comments_section():
-                    continue
-                
-                # Check for suggestion page (Follow back / Not interested)
-                if self._handle_suggestion_page():
-                    continue
-                
                 # Check limits
                 if self._check_limits_reached():
                     self.logger.info("📊 Session limits reached")
                     break
                 
-                # Get video info immediately for real-time display
-                video_info = self.detection.get_video_info()
+                # One dump: close popups, handle an open comment sheet or a suggestion
+                # page (Follow back / Not interested), then read the video info
+                video_info = self._read_current_video()
+                if video_info is None:
+                    continue
                 
                 # Detect stuck state
                 if self._handle_stuck_video(video_info):
@@ -100,15 +92,10 @@ class ForYouWorkflow(FeedInterruptionsMixin, BaseVideoWorkflow):
                     video_info['watch_time'] = round(
                         random.uniform(self.config.min_watch_time, self.config.max_watch_time), 1)
 
-                # Send video info callback immediately (before any processing)
-                if self._on_video_callback:
-                    try:
-                        self._on_video_callback(video_info)
-                    except Exception as e:
-                        self.logger.warning(f"Video callback error: {e}")
-
                 # Check if current video is an ad
                 if self.config.skip_ads and video_info.get('is_ad', False):
+                    # Not watched: there is no dwell to hide the callback in
+                    self._emit_video_info(video_info)
                     self.logger.info("📺 Skipping advertisement")
                     self.stats.ads_skipped += 1
                     self._send_stats_update()
@@ -154,6 +141,7 @@ class ForYouWorkflow(FeedInterruptionsMixin, BaseVideoWorkflow):
             self.stats.errors += 1
         
         finally:
+            self._dwell.drain()
             self._running = False
         
         return self.stats
@@ -197,27 +185,25 @@ class ForYouWorkflow(FeedInterruptionsMixin, BaseVideoWorkflow):
         """
         self.logger.debug(f"📹 Processing video #{self.stats.videos_watched + 1}")
         
-        # Get video info if not provided
+        # Get video info if not provided; its callback (IPC card, author picture)
+        # runs during the watch below either way.
         if video_info is None:
             video_info = self.detection.get_video_info()
-            # Send callback if we just fetched it
-            if self._on_video_callback:
-                try:
-                    self._on_video_callback(video_info)
-                except Exception as e:
-                    self.logger.warning(f"Video callback error: {e}")
+        self._dwell.defer(self._emit_video_info, video_info)
         
         self.logger.debug(f"📹 Video: @{video_info.get('author')} - "
                          f"likes: {video_info.get('like_count')}")
         
+        # Counted when the watch starts so the stats update can ride along in it
+        self.stats.videos_watched += 1
+        self._dwell.defer(self._send_stats_update)  # Real-time stats
+        
         # Watch video — honor the dwell planned (and emitted to the front) in the run
-        # loop; draw one only if this call fetched its own video_info.
+        # loop; draw one only if this call fetched its own video_info. The deferred
+        # side work runs while we sleep; the sleep itself is unchanged.
         watch_time = video_info.get('watch_time') or random.uniform(
             self.config.min_watch_time, self.config.max_watch_time)
-        self.scroll.watch_video(watch_time)
-        
-        self.stats.videos_watched += 1
-        self._send_stats_update()  # Real-time stats
+        self._dwell.dwell(lambda: self.scroll.watch_video(watch_time))
         
         # Check if should skip
         if self._should_skip_video(video_info):
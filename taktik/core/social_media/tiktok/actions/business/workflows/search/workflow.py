@@ -72,16 +72,15 @@ class SearchWorkflow(BaseVideoWorkflow):
                 if not self._wait_if_paused():
                     break
                 
-                # Check and close any popups first
-                self._handle_popups()
-                
                 # Check limits
                 if self._check_limits_reached():
                     self.logger.info("📊 Session limits reached")
                     break
                 
-                # Get video info
-                video_info = self.detection.get_video_info()
+                # One dump: close popups, then read the video info
+                video_info = self._read_current_video()
+                if video_info is None:
+                    continue
                 
                 # Detect stuck state
                 if self._handle_stuck_video(video_info):
@@ -91,17 +90,18 @@ class SearchWorkflow(BaseVideoWorkflow):
                 # the watch time (the bot then sleeps exactly this value). Here the ad/skip
                 # checks happen before watching, so only stamp a video that WILL be watched
                 # (both checks are pure reads of config + video_info).
-                if (not (self.config.skip_ads and video_info.get('is_ad', False))
-                        and not self._should_skip_video(video_info)):
+                will_watch = (not (self.config.skip_ads and video_info.get('is_ad', False))
+                              and not self._should_skip_video(video_info))
+                if will_watch:
                     video_info['watch_time'] = round(
                         random.uniform(self.config.min_watch_time, self.config.max_watch_time), 1)
 
-                # Send video info callback
-                if self._on_video_callback:
-                    try:
-                        self._on_video_callback(video_info)
-                    except Exception as e:
-                        self.logger.warning(f"Video callback error: {e}")
+                # Send video info callback: during the watch for a watched video, now
+                # for one that is skipped (there is no dwell to hide it in)
+                if will_watch:
+                    self._dwell.defer(self._emit_video_info, video_info)
+                else:
+                    self._emit_video_info(video_info)
                 
                 # Check if current video is an ad
                 if self.config.skip_ads and video_info.get('is_ad', False):
@@ -126,9 +126,9 @@ class SearchWorkflow(BaseVideoWorkflow):
                 _fav0 = getattr(self.stats, 'videos_favorited', 0)
                 _t0 = time.time()
                 emit_step("analysis", action="start", target="search")
-                self._watch_video(video_info.get('watch_time'))
                 self.stats.videos_watched += 1
-                self._send_stats_update()
+                self._dwell.defer(self._send_stats_update)
+                self._dwell.dwell(lambda: self._watch_video(video_info.get('watch_time')))
                 self._decide_and_execute_actions(video_info)
                 _acted = (getattr(self.stats, 'videos_liked', 0) > _liked0
                           or getattr(self.stats, 'users_followed', 0) > _follow0
@@ -149,6 +149,9 @@ class SearchWorkflow(BaseVideoWorkflow):
             self.logger.error(f"❌ Error in Search workflow: {e}")
             self.stats.errors += 1
         
+        finally:
+            self._dwell.drain()
+        
         return self.stats
     
     def _navigate_to_search_videos(self) -> bool:
@@ -7,6 +7,7 @@ from .device_facade import DeviceFacade
 from .utils import ActionUtils
 
 from taktik.core.shared.actions.base_action import SharedBaseAction
+from taktik.core.shared.device.selector_order import ordered_selectors, record_selector_match
 
 # Re-export for backward compatibility (some files import these from here)
 TAKTIK_KEYBOARD_PKG = 'com.alexal1.adbkeyboard'
@@ -60,11 +61,13 @@ class BaseAction(SharedBaseAction):
             selectors = [selectors]
         
         start_time = time.time()
+        probes = ordered_selectors(selectors)
         
         while time.time() - start_time < timeout:
-            for selector in selectors:
+            for i, selector in enumerate(probes):
                 try:
                     if self.device.xpath(selector).exists:
+                        record_selector_match(selectors, probes, i)
                         return True
                 except Exception:
                     continue
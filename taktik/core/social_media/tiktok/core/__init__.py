@@ -1,5 +1,16 @@
-"""TikTok core — manager and high-level orchestration."""
+"""TikTok core — manager and high-level orchestration.
+
+Exports are resolved on first access (module `__getattr__`).
+"""
+
+from taktik.core.shared.lazy_exports import lazy_exports
+
+_LAZY_EXPORTS = {
+    'TikTokManager': ('.manager', 'TikTokManager'),
+}
+
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-from .manager import TikTokManager
 
 __all__ = ['TikTokManager']
@@ -3,7 +3,6 @@ from typing import Optional
 from loguru import logger
 
 from taktik.core.clone.packages.package_map import get_package_variants
-from taktik.core.shared.device.manager import DeviceManager
 from taktik.core.shared.platform.social_media_base import SocialMediaBase
 
 # All known TikTok package names, in order of preference.
@@ -19,6 +18,9 @@ class TikTokManager(SocialMediaBase):
 
     def __init__(self, device_id: Optional[str] = None):
         super().__init__(device_id)
+        # Imported here so that importing the TikTok workflows does not import uiautomator2.
+        from taktik.core.shared.device.manager import DeviceManager
+
         self.device_manager = DeviceManager(device_id)
         self._detected_package: Optional[str] = None
 
@@ -5,8 +5,8 @@ from __future__ import annotations
 import re
 from typing import Callable, Optional
 
-from lxml import etree
-
+from taktik.core.shared.device.dump_index import DumpIndex
+from taktik.core.shared.device.facade import BaseDeviceFacade
 from taktik.core.social_media.tiktok.ui.selectors.flows.publish import (
     PUBLISH_PROGRESS_SELECTORS,
     PublishProgressSelectors,
@@ -45,34 +45,48 @@ def get_publish_progress_percent(
 ) -> Optional[int]:
     """Read TikTok's top-left upload progress badge while publish is running."""
     try:
-        xml = device.dump_hierarchy(compressed=False)
-        tree = etree.fromstring(xml.encode("utf-8"))
-
-        for xpath in selectors.publish_progress_indicator:
-            try:
-                nodes = tree.xpath(to_lxml(xpath))
-            except Exception:
-                continue
-            for node in nodes:
-                percent = extract_percent_value(node.attrib.get("text"))
-                if percent is not None:
-                    return percent
-
-        for xpath in selectors.publish_progress_text_nodes:
-            for node in tree.xpath(xpath):
-                percent = extract_percent_value(node.attrib.get("text"))
-                if percent is None:
-                    continue
-                bounds = parse_bounds(node.attrib.get("bounds", ""))
-                if bounds is None:
-                    continue
-                left, top, right, bottom = bounds
-                if left > 160 or top > 320:
-                    continue
-                if (right - left) > 120 or (bottom - top) > 80:
-                    continue
-                return percent
+        if isinstance(device, BaseDeviceFacade):
+            # Polled every few seconds during an upload, mostly between two badges: a
+            # miss in a compressed dump would need a full one to confirm, so read the full
+            # dump once and only parse its visible nodes.
+            return _read_progress_percent(
+                device.get_scoped_xml_dump(visible_only=True, compressed=False), selectors
+            )
+        return _read_progress_percent(device.dump_hierarchy(compressed=False), selectors)
     except Exception as exc:
         if log:
             log("debug", f"[publishing] progress parse failed: {exc}")
     return None
+
+
+def _read_progress_percent(xml: Optional[str], selectors: PublishProgressSelectors) -> Optional[int]:
+    """The badge percentage found in one dump, or None. Raises on an unparseable dump."""
+    index = DumpIndex.from_xml(xml)
+    if index is None:
+        raise ValueError("unparseable hierarchy dump")
+
+    for xpath in selectors.publish_progress_indicator:
+        try:
+            nodes = index.xpath(to_lxml(xpath))
+        except Exception:
+            continue
+        for node in nodes:
+            percent = extract_percent_value(node.attrib.get("text"))
+            if percent is not None:
+                return percent
+
+    for xpath in selectors.publish_progress_text_nodes:
+        for node in index.xpath(xpath):
+            percent = extract_percent_value(node.attrib.get("text"))
+            if percent is None:
+                continue
+            bounds = parse_bounds(node.attrib.get("bounds", ""))
+            if bounds is None:
+                continue
+            left, top, right, bottom = bounds
+            if left > 160 or top > 320:
+                continue
+            if (right - left) > 120 or (bottom - top) > 80:
+                continue
+            return percent
+    return None
@@ -249,13 +249,23 @@ def detect_and_optimize(device, override: Optional[str] = None) -> str:
     else:
         lang = detect_language(device)
 
+    optimize_for_language(lang)
+    return lang
+
+
+def optimize_for_language(lang: str) -> int:
+    """Activate the locale overlay of ``lang`` and filter every selector singleton for it.
+
+    The second half of ``detect_and_optimize``, for a caller that already knows the
+    language (the selector catalog). Returns the number of selectors removed.
+    """
     # Overlay: the migrated selectors read from the active locale.
     from .selectors.locales import set_active_locale
     set_active_locale(lang if lang != "unknown" else None)
 
     if lang == "unknown":
         log.info("Language unknown — overlay union + no in-place filtering")
-        return lang
+        return 0
 
     # Import every singleton from the selectors barrel
     from .selectors import (
@@ -311,4 +321,4 @@ def detect_and_optimize(device, override: Optional[str] = None) -> str:
 
     log.info(f"✅ TikTok selectors optimized for '{lang}' "
              f"({total_removed} wrong-language selector(s) removed)")
-    return lang
+    return total_removed
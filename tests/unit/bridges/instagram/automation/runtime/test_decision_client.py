@@ -91,6 +91,11 @@ def test_close_releases_a_pending_request_and_stops_reader():
         target=lambda: result.update(client.request_plan({"username": "alice"}))
     )
     request.start()
+    # Close while the request waits for its reply, not before it was sent.
+    for _ in range(100):
+        if client._pending:
+            break
+        threading.Event().wait(0.01)
 
     client.close()
     request.join(0.5)
@@ -0,0 +1,136 @@
+"""Delta re-read of a known Instagram DM thread.
+
+A thread on record is read only down to its newest stored message. Pinned here: the
+conversation handed to the front (and the reply context) is the stored history followed by
+the new messages, not the short tail the read covered; and recording it grows the thread's
+``message_count`` by the new messages instead of resetting it to the length of the read.
+"""
+
+import sqlite3
+
+import pytest
+
+import bridges.instagram.engagement.runtime.dm.persistence as persistence
+import bridges.instagram.engagement.runtime.dm.reader as reader
+from bridges.instagram.engagement.runtime.dm.reader import DMConversationReaderMixin
+from taktik.core.database import messaging
+from taktik.core.database.messaging import DmConversationService
+
+
+def _msg(idx):
+    return {"type": "text", "text": f"m{idx}", "is_sent": idx % 2 == 1}
+
+
+class _Element:
+    def __init__(self, text="", info=None):
+        self.text = text
+        self.info = info or {}
+
+    def exists(self, timeout=0):
+        return True
+
+    def get_text(self):
+        return self.text
+
+
+class _XPath:
+    def __init__(self, thread):
+        self.thread = thread
+
+    def all(self):
+        return [self.thread]
+
+
+class _Device:
+    def __init__(self, partner, preview):
+        self.thread = _Element(info={
+            "contentDescription": f"{partner}, {preview}, 1m",
+            "bounds": {"top": 200, "bottom": 300},
+        })
+        self.partner = partner
+
+    def xpath(self, selector):
+        return _XPath(self.thread)
+
+    def __call__(self, **selector):
+        return _Element(self.partner)
+
+
+class _Reader(DMConversationReaderMixin):
+    """One inbox row opening a chat whose viewport starts at the bottom, 8 messages tall."""
+
+    def __init__(self, partner, chat):
+        self.device = _Device(partner, chat[-1]["text"])
+        self._dm_account_id = 1
+        self._chat = chat
+        self._start = max(0, len(chat) - 8)
+        self.scrolls = 0
+
+    def _resolve_thread_username(self, thread_info, fallback):
+        return fallback
+
+    def _detect_conversation_reply_state(self, real_username):
+        return False, True
+
+    def _go_back_from_conversation(self, delay=1):
+        pass
+
+    def _return_to_inbox_if_needed(self):
+        pass
+
+    def _is_accounts_to_follow_visible(self):
+        return True
+
+    def _collect_current_screen(self):
+        return list(self._chat[self._start:self._start + 8])
+
+    def _scroll_to_older_messages(self):
+        self.scrolls += 1
+        self._start = max(0, self._start - 5)
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "dm.sqlite"
+    sqlite3.connect(path).close()
+    monkeypatch.setattr(messaging, "get_default_database_path", lambda: str(path))
+    monkeypatch.setattr(persistence, "configure_db_service", lambda: None)
+    monkeypatch.setattr(persistence, "_get_or_create_partner_profile_id", lambda handle: None)
+    monkeypatch.setattr(reader.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(reader, "tap_element_human", lambda *args, **kwargs: True)
+    monkeypatch.setattr(reader, "emit_dm_json", lambda *args, **kwargs: None)
+    return path
+
+
+def _message_count(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT message_count FROM dm_threads").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_a_reread_sends_the_stored_history_and_grows_the_count(db_path):
+    DmConversationService.record_conversation(
+        platform="instagram", account_id=1, partner_username="bob", external_thread_id="bob",
+        messages=[
+            {"direction": "sent" if m["is_sent"] else "received", "text": m["text"]}
+            for m in map(_msg, range(25))
+        ],
+    )
+    assert _message_count(db_path) == 25
+
+    bridge = _Reader("bob", [_msg(i) for i in range(27)])
+    [conv] = bridge.read_conversations(limit=1)
+
+    # The newest stored message was on the first screen: no scroll, only m19..m26 were read.
+    assert bridge.scrolls == 0
+    assert [m["text"] for m in conv["messages"]] == [f"m{i}" for i in range(7, 27)]
+    assert [m["is_sent"] for m in conv["messages"]] == [i % 2 == 1 for i in range(7, 27)]
+    assert conv["delta"] and conv["last_message_is_ours"] is False
+
+    persistence.record_conversations(1, [conv])
+
+    assert _message_count(db_path) == 27
+    recent = DmConversationService.inbox_state("instagram", 1)["bob"]["recent_texts"]
+    assert recent[:3] == ["m26", "m25", "m24"]
@@ -175,3 +175,16 @@ def test_attach_timestamps_leaves_messages_above_the_first_header_untagged():
     convo._attach_timestamps(items)
 
     assert "timestamp" not in items[0]
+
+
+def test_reading_stops_once_the_newest_recorded_message_is_on_screen():
+    convo = FakeConversation(total=30)
+    scrolls = []
+    scroll = convo._scroll_to_older_messages
+    convo._scroll_to_older_messages = lambda: (scrolls.append(1), scroll())
+
+    # m25 is the newest message on record: it is on the first screen, so nothing above is read.
+    messages = convo._collect_messages(max_messages=20, max_scrolls=4, stop_at="m25")
+
+    assert scrolls == []
+    assert [m["text"] for m in messages] == [f"m{i}" for i in range(22, 30)]
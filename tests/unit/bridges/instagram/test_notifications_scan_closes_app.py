@@ -57,6 +57,8 @@ def bridge(monkeypatch):
     monkeypatch.setattr(commands, "emit_notif_json", lambda *a, **k: None)
     monkeypatch.setattr(commands, "emit_notif_step", lambda *a, **k: None)
     monkeypatch.setattr(commands, "build_known_checker", lambda *a, **k: None)
+    monkeypatch.setattr(commands, "build_high_water_mark", lambda *a, **k: None)
+    monkeypatch.setattr(commands, "save_high_water_mark", lambda *a, **k: False)
     monkeypatch.setattr(commands, "record_scan_notifications", lambda *a, **k: [])
     return created
 
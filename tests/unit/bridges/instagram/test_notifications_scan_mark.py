@@ -0,0 +1,65 @@
+"""The notifications scan mark: what the incremental scan stops at, persisted per account.
+
+Pinned here: an account never scanned has no mark (the scan falls back to the known-hash
+early-stop); a saved mark recognises the rows it was built from, by the text parsed from
+the dump even when the scan re-read the row's emojis, by the whole row rather than the dedup
+identity, and only when the row below it keeps the mark's order; a scan with few new rows
+keeps the older marks behind them; and an empty scan leaves the mark where it was.
+"""
+
+import sqlite3
+
+import pytest
+
+import bridges.instagram.engagement.runtime.notifications.persistence as persistence
+import taktik.core.database.notifications as notifications
+
+
+@pytest.fixture
+def account(tmp_path, monkeypatch):
+    path = tmp_path / "taktik.db"
+    sqlite3.connect(path).close()
+    monkeypatch.setattr(notifications, "get_default_database_path", lambda: str(path))
+    monkeypatch.setattr(persistence, "resolve_account_id", lambda username: 7 if username else None)
+    return "me"
+
+
+def _item(name, **extra):
+    return {"type": "new_follower", "username": name, "text": f"{name} started following you. 2h",
+            "time": "2h", **extra}
+
+
+def test_a_saved_mark_recognises_its_rows(account):
+    assert persistence.build_high_water_mark(account) is None
+
+    resolved = _item("carl", type="post_comment", text="carl commented: ok 🙂", parsed_text="carl commented: ok ?")
+    assert persistence.save_high_water_mark(account, [_item("anna"), resolved])
+
+    reached = persistence.build_high_water_mark(account)
+    assert reached(_item("anna"))
+    assert reached(_item("carl", type="post_comment", text="carl commented: ok ?"))
+    assert not reached(_item("dora"))
+
+
+def test_the_mark_keeps_older_rows_behind_a_few_new_ones(account):
+    persistence.save_high_water_mark(account, [_item(f"old{i}") for i in range(persistence.SCAN_MARK_DEPTH)])
+    persistence.save_high_water_mark(account, [_item("new0"), _item("new1")])
+    assert not persistence.save_high_water_mark(account, [])
+
+    reached = persistence.build_high_water_mark(account)
+    kept = [name for name in ["new0", "new1"] + [f"old{i}" for i in range(5)] if reached(_item(name))]
+    assert kept == ["new0", "new1", "old0", "old1", "old2"]
+
+
+def test_a_repeat_actor_does_not_reach_the_mark(account):
+    liked = dict(type="post_like", text="anna liked your photo. 2h")
+    persistence.save_high_water_mark(account, [_item("anna", **liked), _item("bob")])
+    reached = persistence.build_high_water_mark(account)
+
+    # Same actor and type, another post: the dedup hash is the same, the row is not.
+    assert not reached(_item("anna", type="post_like", text="anna liked your video. 5m", time="5m"))
+    # The very same row again, newer: only the copy followed by the mark's next row is the mark.
+    again = _item("anna", **liked, time="1m")
+    again["text"] = "anna liked your photo. 1m"
+    screen = [again, _item("anna", **liked), _item("bob")]
+    assert [reached(row, screen[i + 1:]) for i, row in enumerate(screen)] == [False, True, True]
@@ -0,0 +1,96 @@
+"""Every bridge entry point of `bridges.manifest.json` imports within its budget.
+
+The desktop spawns a fresh Python process per command, so import time is paid on every
+click. The package `__init__` files resolve their exports lazily and the heavy
+dependencies (uiautomator2 and adbutils/requests behind it, lxml, the SQLite service)
+are imported where they are first used; a single eager import in a package `__init__`
+is enough to put them all back on every bridge - which is what these tests catch.
+
+The heavy-module check is what guards the lazy imports, and it does not depend on
+timing at all. The wall-clock budgets are opt-in (`TAKTIK_IMPORT_BUDGETS=1`): absolute
+milliseconds depend on the machine, so they are a profiling aid, not a CI gate. Timings
+come from `python -X importtime` in a clean subprocess (cumulative time of the entry
+module); a run over budget is retried and the best run kept, and
+`TAKTIK_IMPORT_BUDGET_SCALE` widens every budget on a slow machine.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[3]
+MANIFEST_PATH = ROOT / "bridges" / "bridges.manifest.json"
+
+DEFAULT_BUDGET_MS = 300
+# Bridges that import a device workflow at module level (and so lxml / Pillow).
+BUDGET_MS = {
+    "bridges.instagram.scraping.scraping": 650,
+    "bridges.instagram.engagement.notifications": 500,
+    "bridges.instagram.engagement.dm": 450,
+    "bridges.compat.diagnostics.entrypoints.workflow_test": 450,
+    "bridges.compat.diagnostics.entrypoints.action_test": 500,
+}
+
+# Only loaded once a device is connected / a database query runs.
+HEAVY_MODULES = ("uiautomator2", "sqlalchemy")
+HEAVY_ALLOWED = {
+    # The Instagram action lab drives the device from its module-level action table.
+    "bridges.compat.diagnostics.entrypoints.action_test",
+}
+
+_LINE = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*(\S+)$")
+
+
+def _entry_points():
+    data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8-sig"))
+    return sorted({module for bridges in data.values() for module in bridges.values()})
+
+
+@lru_cache(maxsize=None)
+def _import_profile(module: str):
+    """(cumulative import time of `module` in ms, names of every module imported)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            cumulative[match.group(2)] = int(match.group(1))
+    return cumulative[module] / 1000, frozenset(cumulative)
+
+
+@pytest.mark.skipif(
+    os.environ.get("TAKTIK_IMPORT_BUDGETS") != "1",
+    reason="wall-clock import budgets are opt-in (TAKTIK_IMPORT_BUDGETS=1)",
+)
+@pytest.mark.parametrize("module", _entry_points())
+def test_bridge_imports_within_budget(module):
+    budget = BUDGET_MS.get(module, DEFAULT_BUDGET_MS) * float(os.environ.get("TAKTIK_IMPORT_BUDGET_SCALE", "1"))
+    elapsed, _ = _import_profile(module)
+    for _ in range(2):
+        if elapsed <= budget:
+            break
+        _import_profile.cache_clear()
+        elapsed = min(elapsed, _import_profile(module)[0])
+
+    assert elapsed <= budget, f"{module} imports in {elapsed:.0f} ms (budget {budget:.0f} ms)"
+
+
+@pytest.mark.parametrize("module", [m for m in _entry_points() if m not in HEAVY_ALLOWED])
+def test_bridge_import_does_not_load_device_or_orm_stacks(module):
+    _, imported = _import_profile(module)
+
+    assert not [name for name in HEAVY_MODULES if name in imported]
@@ -0,0 +1,35 @@
+"""Recording the TikTok DM read.
+
+Pinned here: a message whose direction the reader could not tell is not recorded (as
+received, our own reply would read as unanswered), and the record is a delta, so the
+thread's count grows instead of being replaced by the size of the read.
+"""
+
+import types
+
+from bridges.tiktok.workflows.engagement.runtime import dm_persistence
+
+
+def test_unknown_direction_is_left_out_and_the_record_is_a_delta(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        dm_persistence.DmConversationService, "record_conversation",
+        lambda **kwargs: calls.append(kwargs) or "sync-1",
+    )
+    conv = types.SimpleNamespace(
+        name="bob", is_group=False, can_reply=True, unread_count=0, inbox_fingerprint="f1",
+        messages=[
+            {"text": "hello", "type": "text", "is_sent": False},
+            {"text": "a long story", "type": "text", "is_sent": None},
+            {"text": "hi bob", "type": "text", "is_sent": True},
+            {"text": None, "type": "sticker", "is_sent": None},
+        ],
+    )
+
+    assert dm_persistence.record_conversations(1, [conv]) == 1
+
+    (call,) = calls
+    assert [(m["direction"], m["text"]) for m in call["messages"]] == [
+        ("received", "hello"), ("sent", "hi bob"),
+    ]
+    assert call["delta"] is True and call["last_message_is_ours"] is True
@@ -0,0 +1,154 @@
+"""A long mitm session holds a bounded window in memory and streams the rest to the base.
+
+Pinned here: replaying a large synthetic mitm stdout (profiles, media, CDN hits and
+mitmproxy's own log lines) through `ProxyManager` into `MediaCaptureService` keeps the
+proxy buffer, the in-memory stores and their byte accounting within their bounds; every
+capture reaches `media_captures` in batches, one row per key; the per-user and per-key
+reads still see what was evicted from memory - from the queued batch without flushing
+it, and from the archive only within the service's own session; and the batches go
+through the archive's own connection, not the service's shared one.
+"""
+
+import io
+import json
+
+import pytest
+
+from taktik.core.database.media_captures import MediaCaptureArchive
+from taktik.core.social_media.instagram.media import MediaCaptureService, ProxyManager
+from taktik.core.social_media.instagram.media.capture import CaptureStore, MediaCapture
+
+USERS = 300
+MEDIA_PER_USER = 40
+PROFILE_VISITS = 3
+
+
+class _FakeMitm:
+    def __init__(self, lines):
+        self.stdout = io.StringIO("".join(line + "\n" for line in lines))
+
+    def poll(self):
+        return 0
+
+
+def _stream():
+    for visit in range(PROFILE_VISITS):
+        for u in range(USERS):
+            yield json.dumps({
+                "type": "profile_data", "username": f"user{u}", "full_name": f"User {u}",
+                "biography": "bio " * 20, "follower_count": 1000 + u, "following_count": 10,
+                "media_count": MEDIA_PER_USER,
+            })
+            if visit == 0:
+                for m in range(MEDIA_PER_USER):
+                    yield json.dumps({
+                        "type": "media_data", "media_id": f"{u}_{m}", "media_type": "photo",
+                        "image_url": f"https://scontent.cdninstagram.com/v/{u}/{m}.jpg",
+                        "like_count": 1, "caption": "caption " * 10, "username": f"user{u}",
+                    })
+                    yield json.dumps({"type": "cdn_capture", "url": "https://x", "size": 2048})
+            yield "[12:00:00] client connect"
+
+
+@pytest.fixture
+def service(db, monkeypatch):
+    monkeypatch.setattr(MediaCaptureArchive, "_db", staticmethod(lambda: db))
+    forwarded = []
+    svc = MediaCaptureService(
+        desktop_bridge_callback=lambda event, data: forwarded.append(event),
+        max_profiles=100, max_media=400, max_bytes=512 * 1024, batch_size=100,
+    )
+    return svc, forwarded
+
+
+def test_a_long_stream_stays_bounded_and_is_archived_in_batches(service, db):
+    svc, forwarded = service
+    batches = []
+    sink = svc.writer._sink
+    svc.writer._sink = lambda rows: batches.append(len(rows)) or sink(rows)
+
+    proxy = ProxyManager(on_message=svc._handle_proxy_message)
+    proxy.mitm_process = _FakeMitm(_stream())
+    proxy.running = True
+    proxy._read_mitm_output()
+    svc.stop()
+
+    total_media = USERS * MEDIA_PER_USER
+    assert len(proxy.message_buffer) == proxy.buffer_max_size
+    assert len(svc.profiles) <= 100 and len(svc.media) <= 400
+    assert svc.media.bytes_used <= svc.media.max_bytes
+    assert svc.media.evictions >= total_media - 400
+    assert forwarded.count("media_captured") == total_media
+
+    assert max(batches) <= 100 and len(batches) >= (total_media + USERS) // 100
+    rows = dict(db._get_connection().execute(
+        "SELECT kind, COUNT(*) FROM media_captures GROUP BY kind"
+    ).fetchall())
+    assert rows == {"profile": USERS, "media": total_media}
+
+    stats = svc.get_stats()
+    assert (stats["media_captured"], stats["total_likes"]) == (total_media, total_media)
+    assert stats["profiles_captured"] >= USERS
+    evicted = svc.get_media_by_username("user0")
+    assert [m.media_id for m in evicted] == [f"0_{m}" for m in range(MEDIA_PER_USER)]
+    assert svc.get_profile("user0").follower_count == 1000
+    assert svc.get_media("0_0").caption.startswith("caption")
+
+
+def test_the_store_evicts_by_bytes_and_keeps_its_username_index_exact():
+    store = CaptureStore(max_entries=1000, max_bytes=4000, username_of=lambda m: m.username)
+    for i in range(50):
+        store.put(str(i), MediaCapture(media_id=str(i), media_type="photo", image_url="u" * 200,
+                                       username=f"user{i % 2}"))
+
+    assert store.bytes_used <= 4000
+    assert 0 < len(store) < 50
+    kept = {m.media_id for m in store.values()}
+    assert {m.media_id for m in store.by_username("user0")} == {k for k in kept if int(k) % 2 == 0}
+    assert "0" not in store and store.get("0") is None
+
+
+def _media(media_id, username="user0", caption="new"):
+    return {"type": "media_data", "media_id": media_id, "media_type": "photo",
+            "image_url": "https://x", "caption": caption, "username": username}
+
+
+def test_evicted_reads_stay_in_the_session_and_never_flush(service, db):
+    svc, _ = service
+    # A previous run archived this user; this session must not read it back.
+    MediaCaptureArchive.save_batch(
+        [("media", "old_1", "user0", {"media_id": "old_1", "media_type": "photo", "image_url": "u"})],
+        session_id="earlier-run",
+    )
+    svc.media = CaptureStore(max_entries=1, max_bytes=1 << 20, username_of=lambda m: m.username)
+    flushed = []
+    sink = svc.writer._sink
+    svc.writer._sink = lambda rows: flushed.append(len(rows)) or sink(rows)
+
+    svc._handle_proxy_message(_media("0_0"))
+    svc._handle_proxy_message(_media("0_1"))
+
+    assert svc.get_media("0_0").caption == "new"  # from the queued batch
+    assert [m.media_id for m in svc.get_media_by_username("user0")] == ["0_0", "0_1"]
+    assert svc.get_media("old_1") is None
+    assert flushed == []
+
+    svc.flush()
+    assert [m.media_id for m in svc.get_media_by_username("user0")] == ["0_0", "0_1"]
+    assert svc.get_media("old_1") is None
+
+
+def test_a_batch_leaves_the_shared_connection_alone(service, db):
+    svc, _ = service
+    shared = db._get_connection()
+    shared.execute("BEGIN")
+    shared.execute("SELECT COUNT(*) FROM media_captures").fetchone()
+
+    svc._handle_proxy_message(_media("0_0"))
+    assert svc.flush() == 1
+
+    # The batch went through the archive's own connection: the other thread's
+    # transaction is still open, not committed under it.
+    assert shared.in_transaction
+    shared.rollback()
+    assert shared.execute("SELECT COUNT(*) FROM media_captures").fetchone()[0] == 1
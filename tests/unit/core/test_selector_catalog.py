@@ -0,0 +1,76 @@
+"""A selector catalog replays the start-up passes with one read, and only while current.
+
+Pinned here: a miss runs the passes and stores their outcome; the next start with the
+same key gets the same singleton state (and locale) without running anything; a catalog
+whose sources changed is ignored; and the override pass skips a read-only selector
+instead of dropping every override after it.
+"""
+
+import json
+
+import pytest
+
+from taktik.core.compat.selectors import catalog
+from taktik.core.compat.selectors.setup import apply_version_overrides
+from taktik.core.social_media.instagram.ui import language
+from taktik.core.social_media.instagram.ui.selectors import NAVIGATION_SELECTORS, POST_SELECTORS
+from taktik.core.social_media.instagram.ui.selectors.locales import active_locale, set_active_locale
+
+
+@pytest.fixture
+def pristine(tmp_path, monkeypatch):
+    monkeypatch.setenv("TAKTIK_SELECTOR_CATALOG_DIR", str(tmp_path))
+    monkeypatch.setattr(catalog, "BUNDLED_CATALOG_DIR", tmp_path / "bundled")
+    state = catalog.snapshot("instagram")
+    yield state
+    catalog.restore("instagram", state)
+    set_active_locale(None)
+
+
+def test_a_stored_catalog_replays_the_passes(pristine, tmp_path):
+    runs = []
+
+    def resolve():
+        runs.append(1)
+        language.optimize_for_language("fr")
+
+    assert not catalog.resolve_selectors("instagram", lang="fr", version=None, package=None, resolve=resolve)
+    resolved = catalog.snapshot("instagram")
+    assert resolved != pristine
+    assert (tmp_path / catalog.catalog_name("instagram", "fr", None, None)).is_file()
+
+    catalog.restore("instagram", pristine)
+    set_active_locale(None)
+    assert catalog.resolve_selectors("instagram", lang="fr", version=None, package=None, resolve=resolve)
+
+    assert runs == [1]
+    assert catalog.snapshot("instagram") == resolved
+    assert active_locale() == "fr"
+
+
+def test_a_catalog_built_from_other_sources_is_ignored(pristine, tmp_path):
+    catalog.store_catalog("instagram", "en", None, None)
+    path = tmp_path / catalog.catalog_name("instagram", "en", None, None)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["source_hash"] = "0" * 64
+    payload["singletons"]["NAVIGATION_SELECTORS"]["reels_tab"] = ["//stale"]
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    assert not catalog.load_catalog("instagram", "en", None, None)
+    assert NAVIGATION_SELECTORS.reels_tab != ["//stale"]
+
+
+def test_a_read_only_override_is_skipped_not_fatal(pristine, tmp_path):
+    overrides = tmp_path / "overrides"
+    overrides.mkdir()
+    (overrides / "instagram.yaml").write_text(
+        "versions:\n"
+        "  '999.0':\n"
+        "    post.reel_indicators: ['//reel']\n"
+        "    navigation.reels_tab: ['//reels']\n",
+        encoding="utf-8",
+    )
+
+    assert apply_version_overrides("instagram", "999.0", overrides_dir=str(overrides)) == 1
+    assert NAVIGATION_SELECTORS.reels_tab == ["//reels"]
+    assert POST_SELECTORS.reel_indicators != ["//reel"]
@@ -0,0 +1,144 @@
+"""Probe helpers learn which selector alternative matches on the running app build.
+
+Pinned here: with no data, or no active key, lists are probed in source order; an
+alternative that keeps missing is demoted behind the live ones, which keep their source
+order; a call that found nothing teaches nothing; the learning persists per (platform,
+app version, package) through `selector_hit_rates`, including the observations still
+below the flush threshold when the process exits; and the tracer report shows the
+probes saved.
+"""
+
+import pytest
+
+from taktik.core.compat.selectors.tracer import SelectorTracer
+from taktik.core.database.selector_hit_rates import SelectorHitRates
+from taktik.core.shared.device import selector_order
+from taktik.core.shared.device.selector_order import (
+    SelectorOrdering,
+    activate_selector_ordering,
+    deactivate_selector_ordering,
+)
+from taktik.core.shared.device.wait import find_element, wait_for_any
+
+SELECTORS = ["//a[@id='old1']", "//a[@id='old2']", "//a[@id='new']", "//a[@id='generic']"]
+
+
+class _Element:
+    def __init__(self, exists):
+        self.exists = exists
+
+
+class _Device:
+    def __init__(self, visible):
+        self.visible = set(visible)
+        self.probes = []
+
+    def xpath(self, selector):
+        self.probes.append(selector)
+        return _Element(selector in self.visible)
+
+
+@pytest.fixture
+def ordering(db, monkeypatch):
+    monkeypatch.setattr(SelectorHitRates, "_db", staticmethod(lambda: db))
+    active = activate_selector_ordering("instagram", "417.0.0.0", "com.instagram.android")
+    yield active
+    deactivate_selector_ordering()
+
+
+def test_without_an_active_key_lists_are_probed_in_source_order():
+    assert selector_order.get_selector_ordering() is None
+    device = _Device({SELECTORS[2]})
+
+    for _ in range(10):
+        device.probes.clear()
+        assert find_element(device, SELECTORS) is not None
+
+    assert device.probes == SELECTORS[:3]
+
+
+def test_dead_alternatives_are_probed_last_and_live_ones_keep_their_order(ordering):
+    device = _Device({SELECTORS[2], SELECTORS[3]})
+
+    for _ in range(4):
+        device.probes.clear()
+        assert wait_for_any(device, SELECTORS, timeout=1) == SELECTORS[2]
+    assert device.probes == SELECTORS[:3]  # still learning
+
+    device.probes.clear()
+    assert wait_for_any(device, SELECTORS, timeout=1) == SELECTORS[2]
+
+    # The generic fallback matches too, yet never overtakes the specific selector.
+    assert device.probes == [SELECTORS[2]]
+    assert ordering.order(SELECTORS) == [SELECTORS[2], SELECTORS[3], SELECTORS[0], SELECTORS[1]]
+    assert ordering.stats()["probes_saved"] == 2
+
+
+def test_a_call_that_finds_nothing_teaches_nothing(ordering):
+    device = _Device(set())
+    for _ in range(5):
+        assert find_element(device, SELECTORS) is None
+
+    assert ordering.observations == 0
+    assert ordering.order(SELECTORS) == SELECTORS
+
+
+def test_the_learning_persists_per_app_build(ordering):
+    device = _Device({SELECTORS[2]})
+    for _ in range(5):
+        find_element(device, SELECTORS)
+    deactivate_selector_ordering()
+
+    same = activate_selector_ordering("instagram", "417.0.0.0", "com.instagram.android")
+    assert same.order(SELECTORS)[0] == SELECTORS[2]
+
+    other = activate_selector_ordering("instagram", "418.0.0.0", "com.instagram.android")
+    assert other.order(SELECTORS) == SELECTORS
+
+
+def test_observations_below_the_flush_threshold_are_written_at_exit(db, monkeypatch):
+    monkeypatch.setattr(SelectorHitRates, "_db", staticmethod(lambda: db))
+    registered = []
+    monkeypatch.setattr(selector_order.atexit, "register", registered.append)
+    monkeypatch.setattr(selector_order, "_exit_flush_registered", False)
+    activate_selector_ordering("instagram", "417.0.0.0", "com.instagram.android")
+    activate_selector_ordering("instagram", "417.0.0.0", "com.instagram.android")
+    for _ in range(5):
+        find_element(_Device({SELECTORS[2]}), SELECTORS)
+
+    assert registered == [selector_order._flush_at_exit]
+    registered[0]()
+    # The process ends here: nothing else gets a chance to flush.
+    monkeypatch.setattr(selector_order, "_active", None)
+
+    reloaded = activate_selector_ordering("instagram", "417.0.0.0", "com.instagram.android")
+    assert reloaded.order(SELECTORS)[0] == SELECTORS[2]
+    deactivate_selector_ordering()
+
+
+def test_the_tracer_reports_the_probes_saved(ordering):
+    device = _Device({SELECTORS[2]})
+    for _ in range(5):
+        find_element(device, SELECTORS)
+
+    tracer = SelectorTracer()
+    for _ in range(3):
+        find_element(device, SELECTORS)
+
+    report = tracer.report()["selector_ordering"]
+    assert report["active"] and report["key"] == ["instagram", "417.0.0.0", "com.instagram.android"]
+    assert (report["observations"], report["probes_saved"], report["lists_reordered"]) == (3, 6, 1)
+
+
+def test_decay_lets_a_revived_alternative_come_back():
+    ordering = SelectorOrdering("tiktok", None, "pkg", loader=lambda *_: {}, saver=lambda *_: 0)
+    for _ in range(5):
+        ordering.record(SELECTORS, SELECTORS, 2)
+    assert ordering.order(SELECTORS)[0] == SELECTORS[2]
+
+    # The app build changed its mind: the first alternative matches again.
+    for _ in range(10):
+        probed = ordering.order(SELECTORS)
+        ordering.record(SELECTORS, probed, probed.index(SELECTORS[0]))
+
+    assert ordering.order(SELECTORS)[0] == SELECTORS[0]
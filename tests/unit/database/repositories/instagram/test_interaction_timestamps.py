@@ -150,3 +150,55 @@ def test_update_stats_from_interaction_result_records_neither_db_nor_action_coun
 
     assert calls == []  # no direct DB write anymore — the engine already recorded it
     assert host.stats_manager.increments == [('profiles_visited', 1), ('profiles_interacted', 1)]
+
+
+def test_service_record_interactions_is_one_transaction_with_the_stats_bump(db):
+    """The batched path writes the same rows and the same daily counter as N single calls."""
+    account_id, _ = db.get_or_create_account(username='bot', is_bot=True)
+    db.get_or_create_profile({'username': 'someone'})
+    times = ['2026-07-01 10:00:05', None, '2026-07-01 10:02:47']
+    commits = []
+    conn = db._get_connection()
+    conn.set_trace_callback(lambda sql: commits.append(sql) if sql.strip().upper() == 'COMMIT' else None)
+    try:
+        recorded = db.record_interactions(
+            account_id=account_id, target_username='someone',
+            interaction_type='LIKE', interaction_times=times,
+        )
+    finally:
+        conn.set_trace_callback(None)
+
+    assert recorded == 3
+    assert len(commits) == 1
+    rows = conn.execute(
+        "SELECT interaction_time, origin_device_id FROM interactions WHERE account_id = ? ORDER BY id",
+        (account_id,),
+    ).fetchall()
+    assert [r['interaction_time'] for r in rows][0::2] == ['2026-07-01 10:00:05', '2026-07-01 10:02:47']
+    assert rows[1]['interaction_time'] is not None
+    device_id = conn.execute("SELECT device_id FROM device_identity WHERE id = 1").fetchone()
+    assert all(r['origin_device_id'] == (device_id['device_id'] if device_id else None) for r in rows)
+    assert db.get_today_totals(account_id)['likes'] == 3
+
+
+def test_record_individual_actions_uses_the_batch_path_when_available(monkeypatch):
+    class _BatchingDb(_FakeDbService):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+
+        def record_interactions(self, **kwargs):
+            self.batches.append(kwargs)
+            return len(kwargs["interaction_times"])
+
+    fake_db = _BatchingDb()
+    monkeypatch.setattr(InstagramWorkflowStateService, "_db", staticmethod(lambda: fake_db))
+
+    ok = InstagramWorkflowStateService.record_individual_actions(
+        username="target", action_type="STORY_WATCH", count=2, account_id=7,
+        timestamps=['2026-07-01 10:00:05'],
+    )
+
+    assert ok is True
+    assert fake_db.interaction_calls == []
+    assert fake_db.batches[0]["interaction_times"] == ['2026-07-01 10:00:05', None]
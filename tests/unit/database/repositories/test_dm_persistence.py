@@ -129,3 +129,43 @@ def test_next_seq_appends_after_existing_messages(conn):
     # An empty thread starts at 0.
     empty = threads.upsert(platform="instagram", account_id=1, partner_username="alice")
     assert messages.next_seq("instagram", empty) == 0
+
+
+def test_thread_summaries_match_the_per_thread_readers(conn):
+    threads = DmThreadRepository(conn)
+    messages = DmMessageRepository(conn)
+    bob = threads.upsert(platform="instagram", account_id=1, partner_username="bob")
+    alice = threads.upsert(platform="instagram", account_id=1, partner_username="alice")
+    threads.upsert(platform="instagram", account_id=2, partner_username="carol")
+    for seq, (direction, text) in enumerate([("received", "a"), ("sent", "b"), ("received", "c")]):
+        messages.add_message(platform="instagram", thread_sync_id=bob, direction=direction, text=text, seq=seq)
+    messages.add_message(platform="instagram", thread_sync_id=alice, direction="received", text="x")
+
+    summaries = messages.thread_summaries("instagram", 1, limit=2)
+
+    # One query for the account, same answers as the four per-thread lookups.
+    for sync_id in (bob, alice):
+        assert summaries[sync_id] == {
+            "has_sent": messages.has_sent_message("instagram", sync_id),
+            "received_texts": messages.received_texts("instagram", sync_id, 2),
+            "recent_texts": messages.recent_texts("instagram", sync_id, 2),
+            "last_direction": messages.last_direction("instagram", sync_id),
+        }
+    assert summaries[bob]["received_texts"] == ["c", "a"]
+    assert len(summaries) == 2
+
+
+def test_add_messages_appends_only_what_is_not_on_record(conn):
+    threads = DmThreadRepository(conn)
+    messages = DmMessageRepository(conn)
+    sync_id = threads.upsert(platform="instagram", account_id=1, partner_username="bob")
+    read = [{"direction": "received", "text": "a"}, {"direction": "sent", "text": "b"}]
+    assert messages.add_messages(platform="instagram", thread_sync_id=sync_id, messages=read) == 2
+
+    # A later read carries the known tail + the new message: only the new one is written,
+    # after the thread's last seq rather than at its index in the read.
+    tail = [{"direction": "sent", "text": "b"}, {"direction": "received", "text": "c"}]
+    assert messages.add_messages(platform="instagram", thread_sync_id=sync_id, messages=tail) == 1
+
+    rows = messages.query("SELECT text, seq FROM dm_messages ORDER BY seq")
+    assert [(row["text"], row["seq"]) for row in rows] == [("a", 0), ("b", 1), ("c", 2)]
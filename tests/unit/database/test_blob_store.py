@@ -0,0 +1,114 @@
+"""Blobs are stored once, owned by the rows that name them, and collected when nobody does.
+
+Pinned here: identical bytes share one file; a feed-ad row keeps a digest (not the bytes)
+and one reference; an avatar swap moves the profile's reference from the old file to
+the new one; and the garbage collector removes exactly the unreferenced files past the
+grace period - never one a row still points at.
+"""
+
+import base64
+import os
+import time
+
+import pytest
+
+from taktik.core.database.instagram_feed_ads import InstagramFeedAdsService
+from taktik.core.database.local.blob_store import BlobStore, decode_data_url, get_blob_store
+from taktik.core.database.local.retention import RetentionEngine
+from taktik.core.database.profile_avatars import ProfileAvatarService
+
+
+def _data_url(payload: bytes) -> str:
+    return "data:image/jpeg;base64," + base64.b64encode(payload).decode("ascii")
+
+
+def _age(path, seconds):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def local(db, monkeypatch):
+    monkeypatch.setattr(InstagramFeedAdsService, "_db", staticmethod(lambda: db))
+    monkeypatch.setattr(ProfileAvatarService, "_db", staticmethod(lambda: db))
+    return db, get_blob_store(db.db_path)
+
+
+def test_identical_bytes_share_one_file_and_gc_spares_referenced_ones(tmp_path, conn):
+    store = BlobStore(tmp_path / "blobs")
+    kept = store.put(b"avatar")
+    assert store.put(b"avatar") == kept
+    assert store.read(kept) == b"avatar"
+    assert decode_data_url(_data_url(b"avatar")) == (b"avatar", "image/jpeg")
+    assert store.put_data_url(_data_url(b"avatar")) == kept
+
+    dropped = store.put(b"old avatar")
+    orphan = store.put(b"never referenced")
+    fresh = store.put(b"just written")
+    store.incref(conn, kept, 6)
+    store.incref(conn, dropped, 10)
+    store.decref(conn, dropped)
+    conn.commit()
+    for digest in (kept, dropped, orphan):
+        _age(store.path(digest), 2 * 24 * 3600)
+
+    assert store.collect_garbage(conn)[0] == 2
+    assert store.exists(kept) and store.exists(fresh)
+    assert not store.exists(dropped) and not store.exists(orphan)
+    assert [row[0] for row in conn.execute("SELECT digest FROM blob_refs")] == [kept]
+
+
+def test_feed_ad_rows_carry_a_digest_and_release_it_on_retention(local):
+    db, store = local
+    creative_id = InstagramFeedAdsService.record_sighting(creative_hash="c1", screenshot=b"\xff\xd8ad")
+    assert InstagramFeedAdsService.record_sighting(creative_hash="c1", screenshot=b"\xff\xd8ad again") == creative_id
+
+    conn = db._get_connection()
+    inline, digest, seen = conn.execute(
+        "SELECT screenshot, screenshot_blob, times_seen FROM feed_ads WHERE id = ?", (creative_id,)
+    ).fetchone()
+    assert inline is None and seen == 2
+    assert store.read(digest) == b"\xff\xd8ad" and store.refcount(conn, digest) == 1
+    [pending] = InstagramFeedAdsService.pending_analysis()
+    assert pending["screenshot_path"] == str(store.path(digest)) and pending["screenshot"] is None
+
+    conn.execute(
+        "UPDATE feed_ads SET ai_analyzed_at = datetime('now'), last_seen_at = datetime('now', '-100 days')"
+    )
+    conn.commit()
+    _age(store.path(digest), 2 * 24 * 3600)
+    result = RetentionEngine(db.db_path, pause_seconds=0).run()
+
+    assert result.affected["feed_ad_screenshot_blobs"] == 1
+    assert result.blob_files_removed == 1 and not store.exists(digest)
+
+
+def test_inline_screenshots_are_moved_out(local):
+    db, store = local
+    conn = db._get_connection()
+    conn.execute("INSERT INTO feed_ads (creative_hash, screenshot) VALUES ('legacy', ?)", (b"inline bytes",))
+    conn.commit()
+
+    assert InstagramFeedAdsService.externalize_screenshots() == 1
+
+    inline, digest = conn.execute("SELECT screenshot, screenshot_blob FROM feed_ads").fetchone()
+    assert inline is None and store.read(digest) == b"inline bytes"
+    assert store.refcount(conn, digest) == 1
+
+
+def test_avatar_swap_moves_the_profile_reference(local):
+    db, store = local
+    db.get_or_create_profile({"username": "alice"})
+    conn = db._get_connection()
+
+    first = ProfileAvatarService.store_avatar("alice", _data_url(b"first"))
+    second = ProfileAvatarService.store_avatar("alice", _data_url(b"second"))
+
+    row = conn.execute("SELECT profile_pic_path FROM social_profiles WHERE username = 'alice'").fetchone()
+    assert row[0] == second
+    assert store.refcount(conn, store.digest_from_path(first)) == 0
+    assert store.refcount(conn, store.digest_from_path(second)) == 1
+    assert ProfileAvatarService.load_avatar_data_url(second) == _data_url(b"second")
+    # No row yet: the file is still stored for the IPC message, just not referenced.
+    unknown = ProfileAvatarService.store_avatar("nobody", _data_url(b"third"))
+    assert unknown and store.refcount(conn, store.digest_from_path(unknown)) == 0
@@ -0,0 +1,95 @@
+"""DM delta sync: the reader triages its inbox from one bulk state load, skips the threads
+whose inbox row did not move, and records what it read one transaction per thread.
+
+Pinned here: ``inbox_state`` answers for every known thread under both of its keys, with the
+inbox fingerprint stored alongside the recorded thread; a thread that fails halfway leaves
+nothing behind; a delta record grows the thread's message count by what it added; and the
+fingerprint ignores case and spacing but moves with the preview or the time.
+"""
+
+import sqlite3
+
+import pytest
+
+from taktik.core.database import messaging
+from taktik.core.database.messaging import DmConversationService, inbox_fingerprint
+from taktik.core.database.repositories.messaging import DmMessageRepository
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "dm.sqlite"
+    sqlite3.connect(path).close()
+    monkeypatch.setattr(messaging, "get_default_database_path", lambda: str(path))
+    return path
+
+
+def _record(partner, texts, **kwargs):
+    return DmConversationService.record_conversation(
+        platform="instagram", account_id=1, partner_username=partner,
+        messages=[{"direction": direction, "text": text} for direction, text in texts],
+        **kwargs,
+    )
+
+
+def test_inbox_state_answers_every_known_thread_from_one_load(db_path):
+    fingerprint = inbox_fingerprint("Bob.Smith", "bob.smith, see you, 2h")
+    sync_id = _record(
+        "bob_real", [("received", "hello"), ("sent", "see you")],
+        external_thread_id="Bob.Smith", inbox_fingerprint=fingerprint,
+    )
+    _record("alice", [("received", "hey")])
+
+    state = DmConversationService.inbox_state("instagram", 1)
+
+    assert state["bob.smith"]["sync_id"] == state["bob_real"]["sync_id"] == sync_id
+    assert state["bob.smith"]["fingerprint"] == fingerprint
+    assert state["bob.smith"]["last_direction"] == "sent"
+    assert state["bob.smith"]["recent_texts"] == ["see you", "hello"]
+    assert state["alice"]["fingerprint"] is None
+    assert state["alice"]["received_texts"] == ["hey"]
+
+    DmConversationService.save_inbox_fingerprints("instagram", 1, {"Alice": "f1"})
+    assert DmConversationService.inbox_state("instagram", 1)["alice"]["fingerprint"] == "f1"
+
+
+def test_a_thread_that_fails_halfway_leaves_nothing_behind(db_path, monkeypatch):
+    def broken(self, **_):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(DmMessageRepository, "add_messages", broken)
+
+    assert _record("bob", [("received", "hello")], inbox_fingerprint="f1") is None
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM dm_threads").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM dm_inbox_fingerprints").fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
+def test_a_delta_record_adds_its_new_messages_to_the_thread_count(db_path):
+    _record("bob", [("received", "hello"), ("sent", "hi")], delta=True)
+    _record("bob", [("sent", "hi"), ("received", "how are you")], delta=True)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT message_count FROM dm_threads").fetchone()[0] == 3
+    finally:
+        conn.close()
+
+    _record("bob", [("received", "hello"), ("sent", "hi")])
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT message_count FROM dm_threads").fetchone()[0] == 2
+    finally:
+        conn.close()
+
+
+def test_the_fingerprint_moves_with_the_preview_or_the_time():
+    base = inbox_fingerprint("bob", "see you", "2h")
+
+    assert inbox_fingerprint(" Bob ", "See   you", "2H") == base
+    assert inbox_fingerprint("bob", "see you soon", "2h") != base
+    assert inbox_fingerprint("bob", "see you", "now") != base
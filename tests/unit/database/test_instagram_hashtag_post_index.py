@@ -0,0 +1,110 @@
+"""`ProcessedPostIndex`: the in-memory answer to "was this hashtag post already worked?".
+
+Pinned here: the loader streams rows from the base instead of fetching them as a list; a
+post recorded during the run is indexed exactly as a reload would index it, post ref
+included when the stored preview is the whole caption; preloading more hashtags reads only
+the new ones; and a stream that breaks halfway leaves its hashtags to the base rather than
+answering false misses from a partial index.
+"""
+
+import types
+
+from taktik.core.database.instagram_hashtag_post_index import ProcessedPostIndex
+from taktik.core.database.instagram_hashtag_posts import InstagramHashtagPostService
+from taktik.core.database.instagram_post_identity import build_post_ref
+
+SHORT = "Sunset over the Seine"
+LONG = "x" * 150
+
+
+def _record(db, hashtag, author, caption, account_id=3):
+    db.record_processed_hashtag_post(
+        account_id=account_id, hashtag=hashtag, post_author=author,
+        post_caption_hash=InstagramHashtagPostService.generate_caption_hash(caption),
+        post_caption_preview=caption[:100],
+    )
+
+
+def test_the_loader_streams_rows(db):
+    _record(db, "paris", "anna", SHORT)
+    _record(db, "lyon", "ben", LONG)
+
+    rows = db.iter_processed_hashtag_posts(account_id=3, hashtags=["#Paris", "lyon"])
+
+    assert isinstance(rows, types.GeneratorType)
+    index = ProcessedPostIndex(3)
+    assert index.load(["paris", "lyon"], rows) == 2 and len(index) == 2
+
+
+def test_a_recorded_post_is_indexed_as_a_reload_would_index_it(db, monkeypatch):
+    monkeypatch.setattr(InstagramHashtagPostService, "_local_db", staticmethod(lambda: db))
+    check = InstagramHashtagPostService.is_processed
+    try:
+        InstagramHashtagPostService.preload(["paris"], account_id=3)
+        for caption, author in ((SHORT, "anna"), (LONG, "ben")):
+            InstagramHashtagPostService.record_processed(
+                "paris", author, InstagramHashtagPostService.generate_caption_hash(caption),
+                post_caption_preview=caption[:100], account_id=3,
+            )
+        in_run = [
+            check("paris", "anna", account_id=3, post_ref=build_post_ref("anna", "Another day")),
+            check("paris", "anna", account_id=3, post_ref=build_post_ref("anna", SHORT)),
+            check("paris", "ben", account_id=3, post_ref=build_post_ref("ben", LONG)),
+            check("paris", "ben", account_id=3),
+        ]
+
+        InstagramHashtagPostService.clear_preloaded()
+        InstagramHashtagPostService.preload(["paris"], account_id=3)
+        reloaded = [
+            check("paris", "anna", account_id=3, post_ref=build_post_ref("anna", "Another day")),
+            check("paris", "anna", account_id=3, post_ref=build_post_ref("anna", SHORT)),
+            check("paris", "ben", account_id=3, post_ref=build_post_ref("ben", LONG)),
+            check("paris", "ben", account_id=3),
+        ]
+    finally:
+        InstagramHashtagPostService.clear_preloaded()
+
+    # A truncated preview cannot rebuild the ref of a long caption, in the run or after it.
+    assert in_run == reloaded == [False, True, False, True]
+
+
+def test_preloading_more_hashtags_reads_only_the_new_ones(db, monkeypatch):
+    monkeypatch.setattr(InstagramHashtagPostService, "_local_db", staticmethod(lambda: db))
+    _record(db, "paris", "anna", SHORT)
+    _record(db, "lyon", "ben", SHORT)
+    reads = []
+    stream = db.iter_processed_hashtag_posts
+
+    def counted(**kwargs):
+        reads.append(sorted(kwargs["hashtags"]))
+        return stream(**kwargs)
+
+    monkeypatch.setattr(db, "iter_processed_hashtag_posts", counted)
+    try:
+        assert InstagramHashtagPostService.preload(["paris"], account_id=3) == 1
+        assert InstagramHashtagPostService.preload(["#Paris", "lyon"], account_id=3) == 1
+        assert InstagramHashtagPostService.preload(["lyon"], account_id=3) == 0
+        assert InstagramHashtagPostService.is_preloaded("paris", account_id=3)
+        assert not InstagramHashtagPostService.is_preloaded("paris", account_id=4)
+    finally:
+        InstagramHashtagPostService.clear_preloaded()
+
+    assert reads == [["paris"], ["lyon"]]
+
+
+def test_a_broken_stream_leaves_its_hashtags_to_the_base(db, monkeypatch):
+    monkeypatch.setattr(InstagramHashtagPostService, "_local_db", staticmethod(lambda: db))
+    _record(db, "paris", "anna", SHORT)
+    _record(db, "paris", "ben", SHORT)
+
+    def broken(**_):
+        yield "paris", "anna", "h1", None
+        raise RuntimeError("disk I/O error")
+
+    monkeypatch.setattr(db, "iter_processed_hashtag_posts", broken)
+    try:
+        assert InstagramHashtagPostService.preload(["paris"], account_id=3) == 0
+        assert not InstagramHashtagPostService.is_preloaded("paris", account_id=3)
+        assert InstagramHashtagPostService.is_processed("paris", "ben", account_id=3)
+    finally:
+        InstagramHashtagPostService.clear_preloaded()
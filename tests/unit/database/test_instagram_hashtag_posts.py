@@ -1,4 +1,5 @@
 from taktik.core.database.instagram_hashtag_posts import InstagramHashtagPostService
+from taktik.core.database.instagram_post_identity import build_post_ref
 
 
 class _FakeLocalDb:
@@ -38,6 +39,7 @@ def test_is_processed_delegates_to_local_db(monkeypatch):
             "post_author": "creator",
             "post_caption_hash": "abc123",
             "hours_limit": 24,
+            "post_ref": None,
         }
     ]
 
@@ -104,3 +106,57 @@ def test_generate_caption_hash_is_stable_and_normalized():
 
 def test_generate_caption_hash_returns_empty_sentinel():
     assert InstagramHashtagPostService.generate_caption_hash("") == "empty"
+
+
+def test_a_preloaded_run_answers_from_memory_and_stays_in_sync(db, monkeypatch):
+    monkeypatch.setattr(InstagramHashtagPostService, "_local_db", staticmethod(lambda: db))
+    db.record_processed_hashtag_post(account_id=3, hashtag="Paris", post_author="anna", post_caption_hash="h1")
+    db.record_processed_hashtag_post(account_id=3, hashtag="lyon", post_author="ben", post_caption_hash="h2")
+    db.record_processed_hashtag_post(account_id=4, hashtag="paris", post_author="carl", post_caption_hash="h3")
+
+    try:
+        assert InstagramHashtagPostService.preload(["#paris", "lyon", "nice"], account_id=3) == 2
+
+        def no_query(**_):
+            raise AssertionError("asked the base for a preloaded hashtag")
+
+        monkeypatch.setattr(db, "is_hashtag_post_processed", no_query)
+        check = InstagramHashtagPostService.is_processed
+        assert check("paris", "anna", "h1", account_id=3)
+        assert check("#PARIS", "anna", None, account_id=3)  # author fallback, folded hashtag
+        assert not check("paris", "anna", "other", account_id=3)
+        assert not check("paris", "carl", "h3", account_id=3)
+        assert not check("nice", "dora", "h4", account_id=3)
+
+        assert InstagramHashtagPostService.record_processed("nice", "dora", "h4", account_id=3)
+        assert check("nice", "dora", "h4", account_id=3)
+    finally:
+        InstagramHashtagPostService.clear_preloaded()
+
+
+def test_the_base_and_the_preloaded_index_match_a_post_ref_the_same_way(db, monkeypatch):
+    monkeypatch.setattr(InstagramHashtagPostService, "_local_db", staticmethod(lambda: db))
+    short, long = "sunset over the old port", "x" * 150
+    db.record_processed_hashtag_post(account_id=3, hashtag="paris", post_author="anna",
+                                     post_caption_hash="h1", post_caption_preview=short)
+    db.record_processed_hashtag_post(account_id=3, hashtag="paris", post_author="anna",
+                                     post_caption_hash="h2", post_caption_preview=long)
+    queries = [
+        build_post_ref("anna", short),          # its preview is the whole caption
+        build_post_ref("anna", "another post"),  # same author, other post
+        build_post_ref("anna", long),           # stored preview truncated: no ref to match
+        build_post_ref("anna", None),           # no caption: the author fallback
+    ]
+
+    def answers():
+        return [
+            InstagramHashtagPostService.is_processed("paris", "anna", None, account_id=3, post_ref=ref)
+            for ref in queries
+        ]
+
+    from_base = answers()
+    try:
+        InstagramHashtagPostService.preload(["paris"], account_id=3)
+        assert answers() == from_base == [True, False, False, True]
+    finally:
+        InstagramHashtagPostService.clear_preloaded()
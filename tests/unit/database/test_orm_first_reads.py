@@ -99,3 +99,52 @@ def test_account_reads_fallback_without_engine(db_path):
         assert repo.find_by_username("bob") is not None
     finally:
         conn.close()
+
+
+def test_pinned_engine_reads_on_one_connection_with_the_service_pragmas(db_path):
+    """The runtime engine must not open a connection per read (NullPool did, ~1 ms each)
+    and must read with the raw connection's settings."""
+    engine = create_orm_engine(db_path, pinned=True, pragmas=("PRAGMA foreign_keys=ON",))
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        orm_repo = AccountRepository(conn, engine)
+        assert orm_repo.find_all() == AccountRepository(conn, None).find_all()
+
+        first = engine.raw_connection()
+        dbapi = first.dbapi_connection
+        first.close()
+        orm_repo.find_by_username("alice")
+        again = engine.raw_connection()
+        try:
+            assert again.dbapi_connection is dbapi
+            assert again.cursor().execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        finally:
+            again.close()
+    finally:
+        conn.close()
+        engine.dispose()
+
+
+def test_statement_failing_on_the_orm_path_runs_once_afterwards(db_path):
+    """A read the ORM connection cannot run falls back to sqlite3 — and from then on goes
+    straight there instead of failing on the ORM path first every time."""
+    engine = create_orm_engine(db_path, pinned=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        repo = AccountRepository(conn, engine)
+        conn.execute("CREATE TEMP TABLE only_on_raw (x INTEGER)")  # invisible to the engine
+        conn.execute("INSERT INTO only_on_raw VALUES (1)")
+        attempts = []
+        orm_rows = repo._orm_rows
+        repo._orm_rows = lambda *a, **k: attempts.append(a[0]) or orm_rows(*a, **k)
+
+        for _ in range(3):
+            assert repo.query_one_orm_first("SELECT x FROM only_on_raw") == {"x": 1}
+        assert len(attempts) == 1
+        assert repo.query_orm_first("SELECT username FROM accounts ORDER BY username")[0] == {"username": "alice"}
+        assert len(attempts) == 2
+    finally:
+        conn.close()
+        engine.dispose()
@@ -0,0 +1,223 @@
+"""Retention must only remove what its policies name, and never lose daily totals.
+
+The dry run is pinned to touch nothing; the roll-up to fill ONLY the days the live
+counters never wrote (a day that already has a row keeps its numbers); FOLLOW rows and
+unanalysed ad screenshots to survive any age, and permanent filters to stay out of the
+defaults; and the batched deletes to stop at their budget, rank a `keep_latest` table
+once per run, and finish on the next run. The scheduled run deletes nothing until the
+operator enables it, and starts at most once a day across processes.
+"""
+
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from taktik.core.database.local.retention import (
+    FILTERED_PROFILES_POLICY,
+    RetentionEngine,
+    RetentionPolicy,
+    start_background_retention,
+)
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _utc(**ago) -> str:
+    return (datetime.now(timezone.utc) - timedelta(**ago)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _local_noon(days_ago: int, minutes: int = 0) -> str:
+    """UTC stamp of local noon `days_ago` days back: the same local day whatever the clock."""
+    noon = datetime.now().astimezone().replace(hour=12, minute=minutes, second=0, microsecond=0)
+    return (noon - timedelta(days=days_ago)).astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _local_day(stamp: str) -> str:
+    utc = datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+    return utc.astimezone().strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def aged(db):
+    account_id, _ = db.get_or_create_account(username="bot", is_bot=True)
+    old_like_a = _local_noon(500, minutes=1)
+    old_like_b = _local_noon(500, minutes=2)
+    old_counted = _utc(days=450)
+    for stamp in (old_like_a, old_like_b):
+        db.record_interaction(account_id, "ancient", "LIKE", interaction_time=stamp)
+    db.record_interaction(account_id, "ancient", "FOLLOW", interaction_time=_local_noon(500, minutes=3))
+    db.record_interaction(account_id, "counted", "COMMENT", interaction_time=old_counted)
+    db.record_interaction(account_id, "recent", "LIKE", interaction_time=_utc(days=3))
+
+    conn = db._get_connection()
+    conn.execute("DELETE FROM daily_stats_unified")
+    # The live counters wrote this day: its row is the truth and must not change.
+    conn.execute(
+        "INSERT INTO daily_stats_unified (platform, account_id, date, total_comments) VALUES ('instagram', ?, ?, 7)",
+        (account_id, _local_day(old_counted)),
+    )
+    conn.execute(
+        "INSERT INTO feed_ads (creative_hash, screenshot, ai_analyzed_at, last_seen_at) VALUES (?, ?, ?, ?)",
+        ("analysed", b"x" * 4096, _utc(days=100), _utc(days=100)),
+    )
+    conn.execute(
+        "INSERT INTO feed_ads (creative_hash, screenshot, last_seen_at) VALUES (?, ?, ?)",
+        ("pending", b"y" * 4096, _utc(days=100)),
+    )
+    conn.commit()
+    return db, account_id, old_like_a
+
+
+def test_dry_run_reports_without_touching_the_base(aged):
+    db, _, _ = aged
+    conn = db._get_connection()
+    before = conn.execute("SELECT COUNT(*) FROM interactions").fetchone()[0]
+
+    report = RetentionEngine(db.db_path).report()
+
+    by_name = {e.policy.name: e for e in report.estimates}
+    assert by_name["interactions"].rows == 3  # two old likes + the old comment, not the FOLLOW
+    assert by_name["feed_ad_screenshots"].rows == 1
+    assert by_name["feed_ad_screenshots"].bytes == 4096
+    assert report.reclaimable_bytes >= 4096
+    assert "nothing deleted" in report.format()
+    assert conn.execute("SELECT COUNT(*) FROM interactions").fetchone()[0] == before
+    assert conn.execute("SELECT COUNT(*) FROM daily_stats_unified").fetchone()[0] == 1
+
+
+def test_run_rolls_up_missing_days_and_keeps_protected_rows(aged):
+    db, account_id, old_like = aged
+    result = RetentionEngine(db.db_path, pause_seconds=0).run()
+
+    assert result.complete and result.affected["interactions"] == 3
+    conn = db._get_connection()
+    remaining = {row[0] for row in conn.execute("SELECT interaction_type FROM interactions")}
+    assert remaining == {"FOLLOW", "LIKE"}  # the old FOLLOW and the recent like
+    assert db.social_graph.has_bot_follow_record("ancient", account_id)
+
+    daily = {
+        row["date"]: row
+        for row in conn.execute("SELECT * FROM daily_stats_unified WHERE account_id = ?", (account_id,))
+    }
+    rolled = daily[_local_day(old_like)]
+    assert (rolled["total_likes"], rolled["total_follows"]) == (2, 1)
+    assert [row["total_comments"] for row in daily.values() if row["total_comments"]] == [7]
+
+    screenshots = dict(conn.execute("SELECT creative_hash, screenshot IS NOT NULL FROM feed_ads"))
+    assert screenshots == {"analysed": 0, "pending": 1}
+
+
+def test_batches_stop_at_the_budget_and_resume(db):
+    conn = db._get_connection()
+    conn.executemany(
+        "INSERT INTO profile_stats_history (profile_id, followers_count, following_count, posts_count, recorded_at) "
+        "VALUES (1, ?, 0, 0, ?)",
+        [(i, _utc(days=i)) for i in range(30)],
+    )
+    conn.commit()
+    policy = RetentionPolicy(
+        name="history", table="profile_stats_history", time_column="recorded_at",
+        keep_latest=5, partition_by="profile_id",
+    )
+    engine = RetentionEngine(db.db_path, [policy], batch_size=10, pause_seconds=0)
+
+    assert not engine.run(max_seconds=0).complete
+    assert engine.run().affected == {"history": 25}
+    kept = [row[0] for row in conn.execute("SELECT followers_count FROM profile_stats_history ORDER BY 1")]
+    assert kept == [0, 1, 2, 3, 4]
+
+
+def test_keep_latest_ranks_the_table_once_per_run(db, monkeypatch):
+    conn = db._get_connection()
+    conn.executemany(
+        "INSERT INTO profile_stats_history (profile_id, followers_count, following_count, posts_count, recorded_at) "
+        "VALUES (?, ?, 0, 0, ?)",
+        [(pid, i, _utc(days=i)) for pid in (1, 2) for i in range(30)],
+    )
+    conn.commit()
+    policy = RetentionPolicy(
+        name="history", table="profile_stats_history", time_column="recorded_at",
+        keep_latest=5, partition_by="profile_id",
+    )
+    engine = RetentionEngine(db.db_path, [policy], batch_size=7, pause_seconds=0)
+    ranked = []
+    connect = engine._connect
+
+    def _traced():
+        traced = connect()
+        traced.set_trace_callback(lambda sql: ranked.append(sql) if "ROW_NUMBER" in sql else None)
+        return traced
+    monkeypatch.setattr(engine, "_connect", _traced)
+
+    assert engine.run().affected == {"history": 50}
+    assert len(ranked) == 1
+    kept = conn.execute("SELECT profile_id, COUNT(*) FROM profile_stats_history GROUP BY 1").fetchall()
+    assert [tuple(row) for row in kept] == [(1, 5), (2, 5)]
+
+
+def test_permanent_filters_survive_the_default_policies(db):
+    account_id, _ = db.get_or_create_account(username="bot", is_bot=True)
+    db.record_filtered_profile(account_id, "spammer", "spam", "HASHTAG", "travel")
+    conn = db._get_connection()
+    conn.execute("UPDATE filtered_profiles SET filtered_at = ?", (_utc(days=1000),))
+    conn.commit()
+
+    RetentionEngine(db.db_path, pause_seconds=0).run()
+    assert db.is_profile_filtered("spammer", account_id)
+
+    # Opting in is explicit.
+    result = RetentionEngine(db.db_path, [FILTERED_PROFILES_POLICY], pause_seconds=0).run()
+    assert result.affected == {"filtered_profiles": 1}
+    assert not db.is_profile_filtered("spammer", account_id)
+
+
+def test_new_bases_give_deleted_pages_back(db):
+    conn = db._get_connection()
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    conn.executemany(
+        "INSERT INTO feed_ads (creative_hash, screenshot, ai_analyzed_at, last_seen_at) VALUES (?, ?, ?, ?)",
+        [(f"ad{i}", b"z" * 8192, _utc(days=200), _utc(days=200)) for i in range(50)],
+    )
+    conn.commit()
+
+    result = RetentionEngine(db.db_path, pause_seconds=0).run()
+
+    assert result.affected["feed_ad_screenshots"] == 50
+    assert result.vacuumed_pages > 0
+    assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+def test_the_scheduled_run_is_a_dry_run_until_enabled(aged):
+    db, _, _ = aged
+    conn = db._get_connection()
+    before = conn.execute("SELECT COUNT(*) FROM interactions").fetchone()[0]
+
+    start_background_retention(db.db_path).join(10)
+    assert conn.execute("SELECT COUNT(*) FROM interactions").fetchone()[0] == before
+
+    # Enabling it is not held back by today's dry run.
+    start_background_retention(db.db_path, {"enabled": True, "policies": ["interactions"]}).join(10)
+    assert conn.execute("SELECT COUNT(*) FROM interactions").fetchone()[0] == before - 3
+    assert conn.execute("SELECT COUNT(*) FROM feed_ads WHERE screenshot IS NOT NULL").fetchone()[0] == 2
+
+
+def test_a_second_process_does_not_run_it_again_within_the_interval(db):
+    start_background_retention(db.db_path).join(10)
+
+    script = (
+        "import sys\n"
+        "from taktik.core.database.local.retention import start_background_retention\n"
+        "sys.exit(0 if start_background_retention(sys.argv[1]) is None else 1)\n"
+    )
+    second = subprocess.run([sys.executable, "-c", script, db.db_path], cwd=_REPO_ROOT, timeout=60)
+    assert second.returncode == 0
+
+    conn = db._get_connection()
+    conn.execute("UPDATE retention_state SET last_started_at = datetime('now', '-25 hours')")
+    conn.commit()
+    thread = start_background_retention(db.db_path)
+    assert thread is not None
+    thread.join(10)
@@ -0,0 +1,34 @@
+"""Per-source yields that rank the sources of a multi-source run.
+
+Pinned here: a run's allotted/processed counts fold in per (account, workflow, source), aged
+by the decay so a source that dried up sinks within a few runs; the load answers all the
+sources of a run at once and only for the sources with a history.
+"""
+
+import pytest
+
+from taktik.core.database.source_yields import SourceYields
+
+
+@pytest.fixture(autouse=True)
+def local_db(db, monkeypatch):
+    monkeypatch.setattr(SourceYields, "_db", staticmethod(lambda: db))
+    return db
+
+
+def test_yields_fold_in_with_decay_per_account_and_workflow():
+    assert SourceYields.record(7, "hashtag", {"paris": 20, "lyon": 20}, {"paris": 20, "lyon": 5}) == 2
+    SourceYields.record(7, "hashtag", {"paris": 20}, {"paris": 2}, decay=0.5)
+
+    rates = SourceYields.load(7, "hashtag", ["paris", "lyon", "nice"])
+
+    # paris: (20 * 0.5 + 2) / (20 * 0.5 + 20)
+    assert rates == {"paris": pytest.approx(12 / 30), "lyon": pytest.approx(0.25)}
+    assert SourceYields.load(8, "hashtag", ["paris"]) == {}
+    assert SourceYields.load(7, "post_url", ["paris"]) == {}
+
+
+def test_nothing_is_recorded_without_an_account_or_an_allotment():
+    assert SourceYields.record(None, "hashtag", {"paris": 20}, {"paris": 20}) == 0
+    assert SourceYields.record(7, "hashtag", {"paris": 0}, {}) == 0
+    assert SourceYields.load(7, "hashtag", ["paris"]) == {}
@@ -0,0 +1,96 @@
+"""The session cache must give the SAME skip / follow answers as the queries it replaces.
+
+`TargetDecisionCache` is only a speed-up: every predicate is checked here against the
+database method it stands in for, on the same seeded history and with the same expiry
+windows. Write-through is pinned too — what the session records mid-run must be visible
+to the next check without a reload, or a profile could be processed twice in one session.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from taktik.core.database import target_decision_cache as tdc
+from taktik.core.database.instagram_follow_graph import InstagramFollowGraphService
+from taktik.core.database.instagram_workflow_state import InstagramWorkflowStateService
+from taktik.core.database.target_decision_cache import TargetDecisionCache
+
+
+def _utc(**ago) -> str:
+    return (datetime.now(timezone.utc) - timedelta(**ago)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@pytest.fixture(autouse=True)
+def _no_session_cache():
+    tdc.deactivate_target_decision_cache()
+    yield
+    tdc.deactivate_target_decision_cache()
+
+
+@pytest.fixture
+def seeded(db):
+    account_id, _ = db.get_or_create_account(username="bot", is_bot=True)
+    db.record_interaction(account_id, "fresh", "LIKE", interaction_time=_utc(hours=2))
+    db.record_interaction(account_id, "stale", "LIKE", interaction_time=_utc(days=40))
+    db.record_interaction(account_id, "followed", "FOLLOW", interaction_time=_utc(days=10, hours=1))
+    db.record_interaction(account_id, "failed_follow", "FOLLOW", success=False, interaction_time=_utc(days=3))
+    db.record_filtered_profile(account_id, "filtered_now", "private", "HASHTAG", "cats")
+    db.record_filtered_profile(account_id, "filtered_long_ago", "0 posts", "HASHTAG", "cats")
+    db._get_connection().execute(
+        "UPDATE filtered_profiles SET filtered_at = ? WHERE username = 'filtered_long_ago'",
+        (_utc(days=60),),
+    )
+    db._get_connection().commit()
+    return db, account_id
+
+
+USERNAMES = ["fresh", "stale", "followed", "failed_follow", "filtered_now", "filtered_long_ago", "unknown"]
+
+
+def test_cache_answers_match_the_database_queries(seeded):
+    db, account_id = seeded
+    cache = TargetDecisionCache.load(account_id, db)
+
+    for username in USERNAMES:
+        for hours in (1, 24, 24 * 30, 24 * 60):
+            expected = db.check_profile_processed(account_id, username, hours)["processed"]
+            assert cache.is_processed(username, hours) is expected, (username, hours)
+        for days in (1, 7, 30):
+            assert cache.has_recent_interaction(username, days) is db.check_recent_interaction(username, account_id, days)
+        for max_age in (None, 0, 30, 90):
+            assert cache.is_filtered(username, max_age) is db.is_profile_filtered(username, account_id, max_age), (username, max_age)
+        assert cache.has_bot_follow_record(username) is db.social_graph.has_bot_follow_record(username, account_id)
+        assert cache.get_days_since_follow(username) == db.social_graph.get_days_since_follow(username, account_id)
+
+
+def test_session_writes_are_visible_to_the_next_check(seeded, monkeypatch):
+    db, account_id = seeded
+    monkeypatch.setattr(InstagramFollowGraphService, "_local_db", staticmethod(lambda: db))
+    assert tdc.activate_target_decision_cache(account_id, db) is not None
+
+    assert not tdc.get_target_decision_cache(account_id).is_processed("newcomer", 24)
+    db.record_interaction(account_id, "newcomer", "FOLLOW")
+    db.record_interactions(account_id, "liked", "LIKE", [None, None])
+    db.record_filtered_profile(account_id, "rejected", "too many posts", "HASHTAG", "cats")
+
+    cache = tdc.get_target_decision_cache(account_id)
+    assert cache.is_processed("newcomer", 1) and cache.is_processed("liked", 1)
+    assert InstagramFollowGraphService.has_bot_follow_record("newcomer", account_id)
+    assert InstagramFollowGraphService.get_days_since_follow("newcomer", account_id) == db.social_graph.get_days_since_follow("newcomer", account_id)
+    assert cache.is_filtered("rejected", 30)
+    # Another account never reads this session's snapshot.
+    assert tdc.get_target_decision_cache(account_id + 1) is None
+
+
+def test_workflow_checks_are_answered_without_querying(seeded, monkeypatch):
+    db, account_id = seeded
+    tdc.activate_target_decision_cache(account_id, db)
+
+    def _no_query():
+        raise AssertionError("the session cache should answer this check")
+
+    monkeypatch.setattr(InstagramWorkflowStateService, "_db", staticmethod(_no_query))
+
+    assert InstagramWorkflowStateService.is_profile_skippable("fresh", account_id, 24) == (True, "already_processed")
+    assert InstagramWorkflowStateService.is_profile_skippable("filtered_long_ago", account_id, 24, 30) == (False, "")
+    assert InstagramWorkflowStateService.is_profile_skippable("filtered_long_ago", account_id, 24, None) == (True, "already_filtered")
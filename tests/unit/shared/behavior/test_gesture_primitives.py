@@ -345,3 +345,27 @@ def test_horizontal_velocity_scale_changes_duration(monkeypatch):
     assert _Host(fast_raw)._human_horizontal_swipe("left", velocity_scale=1.2) is True
 
     assert slow_raw.calls[0][4] > fast_raw.calls[0][4]
+
+
+def test_gestures_record_the_travel_and_release_velocity_the_feed_predictor_reads(monkeypatch):
+    """A flick is a single swipe RPC, so it used to record nothing: the feed's landing predictor
+    needs its finger travel and release velocity. A drag that falls back past the paced routes
+    must not carry the pacing mode of an earlier gesture."""
+    _patch_path(monkeypatch)
+    host = _Host(_RawSwipe())
+
+    assert host._strong_flick("up") is True
+
+    flick = host._last_gesture_injection
+    dy = _PATH[0][1] - _PATH[-1][1]
+    assert flick["gesture"] == "flick" and flick["distance_px"] == dy
+    assert abs(flick["velocity_pxs"] - dy * 1000 / flick["duration_ms"]) <= 0.02 * flick["velocity_pxs"]
+    assert "mode" not in flick
+
+    host._last_gesture_injection = {"mode": "device", "events": 40}
+    host.device._device = _RawBare()
+    assert host._long_drag("up") is True
+
+    drag = host._last_gesture_injection
+    assert drag["gesture"] == "drag" and drag["distance_px"] == dy
+    assert "mode" not in drag
@@ -0,0 +1,85 @@
+"""A batch must give back exactly what running each command alone would have.
+
+Batching only pays off if callers keep per-command exit codes and output: a check that
+fails must still read as failed, and `stop_on_error` must leave the dependent command
+unrun (exit code None) rather than silently run it. The scripts are executed by a real
+local `sh`, which is what `adb shell` hands them to on the device.
+"""
+
+import os
+import stat
+import subprocess
+
+import pytest
+
+from taktik.core.shared.device.adb import (
+    AdbShellSession,
+    build_batch_script,
+    parse_batch_output,
+)
+
+MARKER = "__TAKTIK_test"
+
+
+def _run(commands, **kwargs):
+    script = build_batch_script(commands, MARKER, **kwargs)
+    raw = subprocess.run(["sh", "-c", script], capture_output=True, text=True, timeout=10).stdout
+    return parse_batch_output(commands, raw, MARKER)
+
+
+def test_each_command_keeps_its_own_output_and_exit_code():
+    results = _run(["echo one", ["printf", "%s", "two words"], "exit_code() { return 3; }; exit_code"])
+
+    assert [r.exit_code for r in results] == [0, 0, 3]
+    assert [r.output for r in results] == ["one", "two words", ""]
+    assert results[1].command == "printf %s 'two words'"
+
+
+def test_stop_on_error_leaves_later_commands_unrun():
+    results = _run(["false", "echo should-not-run"], stop_on_error=True)
+
+    assert results[0].exit_code == 1
+    assert results[1].exit_code is None
+    assert not results[1].ok
+
+
+def test_lost_transport_reports_every_command_as_unrun():
+    assert [r.exit_code for r in parse_batch_output(["a", "b"], "", MARKER)] == [None, None]
+
+
+@pytest.fixture
+def fake_adb(tmp_path):
+    """An `adb` stand-in: `adb -s <id> shell` becomes an interactive local `sh`."""
+    path = tmp_path / "adb"
+    path.write_text('#!/bin/sh\nexec sh\n')
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="needs a POSIX sh")
+def test_session_reuses_one_shell_across_batches(fake_adb):
+    session = AdbShellSession("dev", adb_command=fake_adb)
+    try:
+        first = session.run_batch(["echo $$", "false", "echo skipped"], stop_on_error=True)
+        second = session.run("echo $$")
+
+        assert [r.exit_code for r in first] == [0, 1, None]
+        # `$$` is the interactive shell's pid: same value means no new process per call.
+        assert first[0].output == second.output
+        assert session.run("echo alive").output == "alive"
+    finally:
+        session.close()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="needs a POSIX sh")
+def test_session_tells_an_unsent_batch_from_an_unacknowledged_one(tmp_path, fake_adb):
+    missing = AdbShellSession("dev", adb_command=str(tmp_path / "no-adb"))
+    assert missing.send_batch(["echo hi"]) is None
+    assert [r.exit_code for r in missing.run_batch(["echo hi"])] == [None]
+
+    session = AdbShellSession("dev", adb_command=fake_adb)
+    try:
+        sent = session.send_batch(["sleep 2"], timeout=0.2)
+        assert [r.exit_code for r in sent] == [None]
+    finally:
+        session.close()
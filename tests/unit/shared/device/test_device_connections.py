@@ -0,0 +1,114 @@
+"""A second workflow in the same process must start warm.
+
+The registry hands back the same uiautomator2 device and adbutils handle for a serial,
+trusts a healthy probe for its TTL, and lets go of anything that failed so the next
+caller reconnects exactly like a cold start.
+"""
+
+from taktik.core.shared.device import adb as adb_module
+from taktik.core.shared.device import manager as manager_module
+from taktik.core.shared.device.connections import DeviceConnectionRegistry
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _U2:
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+        self.info_reads = 0
+
+    @property
+    def info(self):
+        self.info_reads += 1
+        if not self.healthy:
+            raise RuntimeError("uiautomator not responding")
+        return {"displayWidth": 1080, "displayHeight": 2400}
+
+
+def _registry(clock=None, devices=None):
+    connected = []
+
+    def connect(serial):
+        device = (devices or {}).get(serial) or _U2()
+        connected.append(serial)
+        return device
+
+    registry = DeviceConnectionRegistry(
+        health_ttl=60.0,
+        connect_u2=connect,
+        resolve_adb=lambda serial: object(),
+        clock=clock or _Clock(),
+    )
+    return registry, connected
+
+
+def test_u2_device_and_adb_handle_are_reused_per_serial():
+    registry, connected = _registry()
+
+    first = registry.get_u2_device("A")
+    assert registry.get_u2_device("A") is first
+    assert registry.get_u2_device("B") is not first
+    assert connected == ["A", "B"]
+    assert registry.get_adb_device("A") is registry.get_adb_device("A")
+
+
+def test_health_is_trusted_for_its_ttl_only():
+    clock = _Clock()
+    registry, _ = _registry(clock)
+    registry.get_u2_device("A")
+
+    assert registry.is_health_fresh("A") is False
+    assert registry.probe("A") is True
+    assert registry.is_health_fresh("A") is True
+
+    clock.now += 61
+    assert registry.is_health_fresh("A") is False
+
+
+def test_a_failed_probe_forces_a_reconnect():
+    registry, connected = _registry(devices={"A": _U2(healthy=False)})
+    registry.get_u2_device("A")
+
+    assert registry.probe("A") is False
+    registry.get_u2_device("A")
+    assert connected == ["A", "A"]
+
+
+def test_warm_connect_skips_the_atx_verification(monkeypatch):
+    registry, connected = _registry()
+    monkeypatch.setattr(manager_module, "get_connection_registry", lambda: registry)
+    monkeypatch.setattr(registry, "start_keepalive", lambda: None)
+
+    cold = manager_module.DeviceManager("A")
+    assert cold.connect() is True
+    probes_after_cold = cold.device.info_reads
+
+    warm = manager_module.DeviceManager("A")
+    assert warm.connect() is True
+    assert warm.device is cold.device
+    assert warm.device.info_reads == probes_after_cold
+    assert connected == ["A"]
+
+
+def test_run_adb_shell_drops_a_failing_handle(monkeypatch):
+    class _Broken:
+        def shell(self, command):
+            raise ConnectionError("device offline")
+
+    class _Working:
+        def shell(self, command):
+            return "ok"
+
+    handles = [_Broken(), _Working()]
+    registry = DeviceConnectionRegistry(resolve_adb=lambda serial: handles.pop(0))
+    monkeypatch.setattr(adb_module, "get_connection_registry", lambda: registry)
+
+    assert adb_module.run_adb_shell("A", "echo") == ""
+    assert adb_module.run_adb_shell("A", "echo") == "ok"
+    assert adb_module.run_adb_shell("A", "echo") == "ok"
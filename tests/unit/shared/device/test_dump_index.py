@@ -0,0 +1,115 @@
+"""`DumpIndex` must answer exactly what lxml answers — only faster.
+
+The fast path is only worth having if no caller can tell it apart from `tree.xpath`. Each
+selector below is evaluated both ways on the same dump and the element lists compared by
+identity and order; the counters then prove which path served it.
+"""
+
+import pytest
+from lxml import etree
+
+from taktik.core.shared.device.dump_index import (
+    DumpIndex,
+    compile_simple_selector,
+    index_for_xml,
+)
+
+DUMP = """<?xml version='1.0' encoding='UTF-8'?>
+<hierarchy rotation="0">
+  <android.widget.FrameLayout resource-id="" text="" content-desc="" bounds="[0,0][1080,2400]">
+    <android.widget.TextView resource-id="com.instagram.android:id/action_bar_title" text="alice" content-desc="" clickable="false" bounds="[40,100][400,160]"/>
+    <android.widget.Button resource-id="com.instagram.android:id/follow" text="Follow" content-desc="Follow alice" clickable="true" bounds="[40,900][500,980]"/>
+    <android.widget.Button resource-id="com.instagram.android:id/follow" text="Follow" content-desc="" clickable="false" bounds="[540,900][1040,980]"/>
+    <android.widget.TextView resource-id="com.instagram.android:id/bio" text="Rock and roll" content-desc="" bounds="[40,300][1040,420]"/>
+    <android.widget.TextView resource-id="" text="" content-desc="Options" bounds="[980,100][1060,160]"/>
+  </android.widget.FrameLayout>
+</hierarchy>"""
+
+SELECTORS = [
+    '//*[@resource-id="com.instagram.android:id/follow"]',
+    '//android.widget.Button[@text="Follow"]',
+    '//*[@content-desc="Options"]',
+    '//android.widget.TextView',
+    '//*[@resource-id="com.instagram.android:id/follow" and @clickable="true"]',
+    "//*[@text='Rock and roll']",
+    '//*[@text=""]',
+    '//*[@resource-id="com.instagram.android:id/missing"]',
+    '//*[contains(@text, "roll")]',
+    '//*[@resource-id="com.instagram.android:id/bio"]/..',
+]
+
+RAW_DUMP = """<hierarchy rotation="0">
+  <node class="android.widget.FrameLayout" resource-id="" text="" bounds="[0,0][1080,2400]">
+    <node class="android.widget.TextView" resource-id="com.zhiliaoapp.musically:id/x44" text="81%" bounds="[20,80][120,140]"/>
+    <node class="android.widget.Button" resource-id="" text="Allow" bounds="[20,900][500,980]"/>
+  </node>
+</hierarchy>"""
+
+RAW_SELECTORS = [
+    '//node[@class="android.widget.Button"][@text="Allow"]',
+    '//node[@class="android.widget.TextView"]',
+    '//*[@class="android.widget.TextView" and @text="81%"]',
+    '//node[@class="android.widget.Button"][1]',
+]
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_index_matches_lxml_exactly(selector):
+    index = DumpIndex.from_xml(DUMP)
+    tree = etree.fromstring(DUMP.encode("utf-8"))
+
+    expected = [el.attrib.get("bounds") for el in tree.xpath(selector)]
+    got = [el.attrib.get("bounds") for el in index.xpath(selector)]
+
+    assert got == expected
+
+
+@pytest.mark.parametrize("selector", RAW_SELECTORS)
+def test_raw_uiautomator_dump_matches_lxml_exactly(selector):
+    index = DumpIndex.from_xml(RAW_DUMP)
+    tree = etree.fromstring(RAW_DUMP.encode("utf-8"))
+
+    expected = [el.attrib.get("bounds") for el in tree.xpath(selector)]
+    assert [el.attrib.get("bounds") for el in index.xpath(selector)] == expected
+
+
+def test_simple_selectors_never_reach_lxml():
+    index = DumpIndex.from_xml(DUMP)
+
+    index.xpath('//*[@resource-id="com.instagram.android:id/follow"]')
+    index.xpath('//android.widget.Button[@text="Follow" and @clickable="true"]')
+    assert (index.fast_hits, index.fallbacks) == (2, 0)
+
+    index.xpath('//*[contains(@text, "roll")]')
+    assert index.fallbacks == 1
+
+
+def test_compiler_refuses_anything_it_cannot_prove_simple():
+    assert compile_simple_selector('//*[@resource-id="a"]') == ("*", (("resource-id", "a"),))
+    assert compile_simple_selector("//android.widget.EditText") == ("android.widget.EditText", ())
+    assert compile_simple_selector('//*[@text="a" or @text="b"]') is None
+    assert compile_simple_selector('//*[@resource-id="a"]//*[@text="b"]') is None
+    assert compile_simple_selector('(//*[@text="a"])[1]') is None
+    assert compile_simple_selector('//node[@class="a"][2]') is None
+    assert compile_simple_selector('//node[@class="a"][@text="b"]') == (
+        "node", (("class", "a"), ("text", "b"))
+    )
+
+
+def test_nodes_carry_integer_bounds_and_the_snapshot_index_is_shared():
+    index = index_for_xml(DUMP)
+    assert index_for_xml(DUMP) is index
+
+    node = index.find('//*[@text="alice"]')[0]
+    assert node.bounds == (40, 100, 400, 160)
+    assert node.resource_id.endswith(":id/action_bar_title")
+
+
+def test_invalid_xml_and_invalid_xpath():
+    assert DumpIndex.from_xml("not xml") is None
+    assert index_for_xml(None) is None
+
+    index = DumpIndex.from_xml(DUMP)
+    assert index.exists("//*[@text=") is False
+    with pytest.raises(etree.XPathError):
+        index.xpath("//*[@text=")
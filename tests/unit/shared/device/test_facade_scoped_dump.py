@@ -0,0 +1,142 @@
+"""Optional reads ask for a scoped dump, and an old agent must not make them fail.
+
+`get_scoped_xml_dump` prefers the agent's compressed hierarchy, cuts it down to the
+requested subtrees and visible nodes, and degrades to the full dump whenever the agent
+refuses compression or the compressed tree lost the node the reader is after. Readers
+whose usual answer is "not on screen" (the popup scan, the publish progress poll) skip
+compression, so a clean screen costs them a single dump.
+"""
+
+from lxml import etree
+
+from taktik.core.shared.device.dump_index import scope_dump_xml
+from taktik.core.shared.device.facade import BaseDeviceFacade
+
+FULL = """<hierarchy rotation="0">
+  <node resource-id="app:id/root" visible-to-user="true">
+    <node resource-id="app:id/bio_container" visible-to-user="true">
+      <node resource-id="app:id/bio" text="Hello…" visible-to-user="true"/>
+    </node>
+    <node resource-id="app:id/grid" visible-to-user="true">
+      <node resource-id="app:id/tile" visible-to-user="true"/>
+    </node>
+    <node resource-id="app:id/offscreen" text="hidden" visible-to-user="false"/>
+  </node>
+</hierarchy>"""
+
+# Compression dropped the layout-only container.
+COMPRESSED = """<hierarchy rotation="0">
+  <node resource-id="app:id/bio" text="Hello…" visible-to-user="true"/>
+  <node resource-id="app:id/tile" visible-to-user="true"/>
+</hierarchy>"""
+
+
+class _Rpc:
+    def __init__(self, supports_compressed=True):
+        self.supports_compressed = supports_compressed
+        self.calls = []
+
+    def dumpWindowHierarchy(self, compressed, max_depth, **kwargs):
+        self.calls.append(compressed)
+        if not self.supports_compressed:
+            raise RuntimeError("method not found")
+        return COMPRESSED if compressed else FULL
+
+
+class _Device:
+    settings = {"max_depth": 50}
+
+    def __init__(self, supports_compressed=True):
+        self.jsonrpc = _Rpc(supports_compressed)
+        self.full_dumps = 0
+
+    def dump_hierarchy(self):
+        self.full_dumps += 1
+        return FULL
+
+
+def _ids(xml):
+    return [el.get("resource-id") for el in etree.fromstring(xml.encode()).iter() if el.get("resource-id")]
+
+
+def test_compressed_dump_is_scoped_without_a_second_round_trip():
+    raw = _Device()
+    facade = BaseDeviceFacade(raw)
+
+    xml = facade.get_scoped_xml_dump(["app:id/bio"])
+
+    assert _ids(xml) == ["app:id/bio"]
+    assert raw.jsonrpc.calls == [True]
+    assert raw.full_dumps == 0
+
+
+def test_root_lost_by_compression_falls_back_to_the_full_dump():
+    raw = _Device()
+    facade = BaseDeviceFacade(raw)
+
+    xml = facade.get_scoped_xml_dump(["app:id/bio_container"])
+
+    assert _ids(xml) == ["app:id/bio_container", "app:id/bio"]
+    assert raw.full_dumps == 1
+
+
+def test_agent_without_compression_is_asked_once_per_facade():
+    raw = _Device(supports_compressed=False)
+    facade = BaseDeviceFacade(raw)
+
+    first = facade.get_scoped_xml_dump(["app:id/grid"])
+    second = facade.get_scoped_xml_dump(["app:id/grid"])
+
+    assert _ids(first) == _ids(second) == ["app:id/grid", "app:id/tile"]
+    assert raw.jsonrpc.calls == [True]
+    assert raw.full_dumps == 2
+
+
+def test_scope_keeps_the_outermost_root_and_drops_invisible_nodes():
+    xml, found = scope_dump_xml(FULL, ["app:id/root", "app:id/bio"], visible_only=True)
+
+    assert found is True
+    assert "app:id/offscreen" not in _ids(xml)
+    assert _ids(xml).count("app:id/bio") == 1
+    assert etree.fromstring(xml.encode()).tag == "hierarchy"
+
+
+def test_scope_reports_a_missing_root():
+    xml, found = scope_dump_xml(FULL, ["app:id/nowhere"])
+
+    assert found is False
+    assert _ids(xml) == []
+    assert scope_dump_xml("not xml", ["app:id/bio"]) == (None, False)
+
+
+def test_a_transient_failure_does_not_switch_compression_off():
+    raw = _Device()
+    facade = BaseDeviceFacade(raw)
+    raw.jsonrpc.dumpWindowHierarchy = lambda *a, **k: (_ for _ in ()).throw(
+        ConnectionResetError("connection reset by peer"))
+
+    assert facade._get_compressed_xml_dump() is None
+
+    raw.jsonrpc = _Rpc()
+    facade.get_scoped_xml_dump(["app:id/bio"])
+    assert raw.jsonrpc.calls == [True]
+    assert facade.compressed_dumps_active is True
+
+
+def test_a_clean_screen_costs_the_popup_scan_and_the_progress_poll_one_dump_each():
+    from taktik.core.social_media.tiktok.actions.business.workflows._internal.popup_handler import (
+        PopupHandler,
+    )
+    from taktik.core.social_media.tiktok.services.publish.progress import get_publish_progress_percent
+
+    raw = _Device()
+    facade = BaseDeviceFacade(raw)
+    facade._compressed_dump_supported = True
+    handler = PopupHandler(click=None, detection=type("_Detection", (), {"device": facade})())
+
+    assert handler._fast_detect() == set()
+    assert get_publish_progress_percent(facade) is None
+    assert raw.full_dumps == 2 and raw.jsonrpc.calls == []
+
+    raw.dump_hierarchy = lambda: '<hierarchy><node text="58%" bounds="[12,80][66,120]"/></hierarchy>'
+    assert get_publish_progress_percent(facade) == 58
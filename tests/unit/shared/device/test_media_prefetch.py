@@ -0,0 +1,243 @@
+"""Prefetching must hide the transfer without ever changing WHAT gets published.
+
+The flows publish "the most recent gallery item", so the one thing prefetch must never do is
+put a future post's file in the gallery early: staged files stay in a hidden directory until
+`activate()`. Around that, what gets pinned is the saving itself — content already on the
+device is never pushed twice — and the bounds: staging waits for room and respects the
+device's free space, whatever cannot be staged still publishes through a plain push, and an
+activation that stops waiting never pushes a file a second time while it is transferring.
+"""
+
+import os
+import threading
+
+import pytest
+
+from taktik.core.shared.device import media_prefetch, media_store
+from taktik.core.shared.device.adb import ShellResult
+from taktik.core.shared.device.media_prefetch import DEFAULT_STAGING_DIR, MediaPrefetcher
+
+STAGING = DEFAULT_STAGING_DIR
+CAMERA = media_store.DEFAULT_REMOTE_DIR
+
+
+class FakeDevice:
+    """A flat `path -> size` filesystem answering the shell commands the prefetcher sends."""
+
+    def __init__(self, free_bytes=10**12):
+        self.files = {}
+        self.free_bytes = free_bytes
+        self.pushes = []
+        self.direct_pushes = []
+        self.scanned = []
+        self.push_gate = None
+        self.push_started = threading.Event()
+
+    def push(self, device_id, local_path, remote_path, timeout=60):
+        self.push_started.set()
+        if self.push_gate is not None:
+            self.push_gate.wait(5)
+        self.pushes.append(local_path)
+        self.files[remote_path] = os.path.getsize(local_path)
+        return True
+
+    def batch(self, device_id, commands, *, stop_on_error=False, timeout=30):
+        results = []
+        for command in commands:
+            code, out = self._run(command)
+            results.append(ShellResult(str(command), code, out))
+            if stop_on_error and code != 0:
+                break
+        results += [ShellResult(str(c), None, "") for c in commands[len(results):]]
+        return results
+
+    def _run(self, command):
+        if isinstance(command, str):
+            if command.startswith("rm -f") and command.endswith("*.part"):
+                for path in [p for p in self.files if p.endswith(".part")]:
+                    del self.files[path]
+                return 0, ""
+            if command.startswith("stat -c"):
+                listing = [f"{size} {path}" for path, size in self.files.items() if path.startswith(STAGING + "/")]
+                return 0, "\n".join(listing)
+            return 0, ""
+        name, args = command[0], list(command[1:])
+        if name == "stat":
+            return 0, f"{self.free_bytes // 4096} 4096"
+        if name == "mv":
+            src, dst = args[-2], args[-1]
+            if src not in self.files:
+                return 1, "No such file"
+            self.files[dst] = self.files.pop(src)
+        elif name == "cp":
+            self.files[args[1]] = self.files[args[0]]
+        elif name == "rm":
+            for path in args[1:]:
+                self.files.pop(path, None)
+        return 0, ""
+
+    def gallery(self):
+        return sorted(p for p in self.files if p.startswith(CAMERA + "/"))
+
+
+@pytest.fixture
+def device(monkeypatch):
+    fake = FakeDevice()
+    monkeypatch.setattr(media_store, "_adb_push", fake.push)
+    monkeypatch.setattr(media_store, "_adb_shell_batch", fake.batch)
+    monkeypatch.setattr(media_store, "_adb_shell", lambda *a, **k: (0, "", ""))
+    monkeypatch.setattr(
+        media_store, "trigger_media_scan",
+        lambda device_id, remote_path, local_path, log=None: fake.scanned.append(remote_path),
+    )
+    media_prefetch._digest_cache.clear()
+    return fake
+
+
+def _media(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_staged_media_stays_out_of_the_gallery_until_activated(device, tmp_path):
+    first = _media(tmp_path, "a.jpg", b"a" * 10)
+    second = _media(tmp_path, "b.jpg", b"b" * 10)
+
+    with MediaPrefetcher("dev", [first, second]) as prefetcher:
+        remote = prefetcher.activate(first)
+        # The second post is transferring (or done) but must not be the "most recent" item yet.
+        assert device.gallery() == [remote]
+        assert device.scanned == [remote]
+
+        prefetcher.activate(second)
+        assert len(device.gallery()) == 2
+
+    assert sorted(device.pushes) == sorted([first, second])
+    assert not any(p.startswith(STAGING + "/") and not p.endswith(".nomedia") for p in device.files)
+
+
+def test_content_already_on_the_device_is_never_pushed_again(device, tmp_path):
+    path = _media(tmp_path, "clip.mp4", b"video")
+    same_content = _media(tmp_path, "copy.mp4", b"video")
+    digest = media_prefetch.file_digest(path)
+    device.files[f"{STAGING}/{digest}.mp4"] = 5  # left over by an earlier run
+
+    with MediaPrefetcher("dev", [path, same_content]) as prefetcher:
+        a = prefetcher.activate(path)
+        b = prefetcher.activate(same_content)
+
+    assert device.pushes == []
+    assert a != b and a in device.files and b in device.files
+
+
+def test_staging_waits_for_room_before_the_next_transfer(device, tmp_path):
+    first = _media(tmp_path, "a.jpg", b"a" * 100)
+    second = _media(tmp_path, "b.jpg", b"b" * 100)
+
+    prefetcher = MediaPrefetcher("dev", [first, second], max_staged_bytes=150)
+    try:
+        deadline = threading.Event()
+        for _ in range(100):
+            if device.pushes:
+                break
+            deadline.wait(0.01)
+        deadline.wait(0.05)
+        assert device.pushes == [first]
+
+        prefetcher.activate(first)
+        prefetcher.activate(second)
+        assert device.pushes == [first, second]
+    finally:
+        prefetcher.close()
+
+
+def test_low_device_storage_falls_back_to_a_direct_push(device, tmp_path, monkeypatch):
+    device.free_bytes = 100
+    path = _media(tmp_path, "a.jpg", b"a" * 10)
+    monkeypatch.setattr(
+        media_store, "push_media",
+        lambda device_id, local_path, remote_dir, file_prefix: device.direct_pushes.append(local_path) or f"{CAMERA}/direct.jpg",
+    )
+
+    with MediaPrefetcher("dev", [path], min_free_bytes=1000) as prefetcher:
+        assert prefetcher.activate(path) == f"{CAMERA}/direct.jpg"
+
+    assert device.pushes == []
+    assert device.direct_pushes == [path]
+    assert device.scanned == [f"{CAMERA}/direct.jpg"]
+
+
+def test_close_removes_media_staged_for_posts_that_never_ran(device, tmp_path):
+    path = _media(tmp_path, "a.jpg", b"a" * 10)
+    prefetcher = MediaPrefetcher("dev", [path])
+    for _ in range(100):
+        if device.pushes:
+            break
+        threading.Event().wait(0.01)
+    prefetcher.close()
+
+    assert device.pushes == [path]
+    assert [p for p in device.files if not p.endswith(".nomedia")] == []
+
+
+def test_leftovers_from_an_earlier_run_never_block_the_budget(device, tmp_path):
+    # Nothing this run will ever activate: counted against the budget, it would block for good.
+    device.files[f"{STAGING}/{'f' * 32}.mp4"] = 200
+    path = _media(tmp_path, "a.jpg", b"a" * 100)
+
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(remote=_run_one(path)), daemon=True)
+    worker.start()
+    worker.join(5)
+
+    assert not worker.is_alive()
+    assert result["remote"] in device.gallery()
+    assert device.pushes == [path]
+
+
+def _run_one(path):
+    with MediaPrefetcher("dev", [path], max_staged_bytes=150) as prefetcher:
+        return prefetcher.activate(path)
+
+
+def _direct_push(device, monkeypatch):
+    monkeypatch.setattr(
+        media_store, "push_media",
+        lambda device_id, local_path, remote_dir, file_prefix: device.direct_pushes.append(local_path) or f"{CAMERA}/direct.jpg",
+    )
+
+
+def test_a_timed_out_activation_never_pushes_a_file_the_worker_is_transferring(device, tmp_path, monkeypatch):
+    _direct_push(device, monkeypatch)
+    device.push_gate = threading.Event()
+    path = _media(tmp_path, "a.jpg", b"a" * 10)
+
+    with MediaPrefetcher("dev", [path]) as prefetcher:
+        assert device.push_started.wait(5)
+        threading.Timer(0.2, device.push_gate.set).start()
+        remote = prefetcher.activate(path, timeout=0.05)
+
+    assert device.direct_pushes == []
+    assert device.pushes == [path]
+    assert remote in device.gallery()
+
+
+def test_a_timed_out_activation_cancels_a_transfer_that_has_not_started(device, tmp_path, monkeypatch):
+    _direct_push(device, monkeypatch)
+    first = _media(tmp_path, "a.jpg", b"a" * 100)
+    second = _media(tmp_path, "b.jpg", b"b" * 100)
+
+    with MediaPrefetcher("dev", [first, second], max_staged_bytes=150) as prefetcher:
+        for _ in range(100):
+            if device.pushes:
+                break
+            threading.Event().wait(0.01)
+        threading.Event().wait(0.05)
+        # `second` waits for room that only the activation of `first` would free.
+        assert prefetcher.activate(second, timeout=0.05) == f"{CAMERA}/direct.jpg"
+        prefetcher.activate(first)
+        threading.Event().wait(0.05)
+
+    assert device.direct_pushes == [second]
+    assert device.pushes == [first]
@@ -13,6 +13,7 @@ import time
 import pytest
 
 from taktik.core.shared.device import media_store
+from taktik.core.shared.device.adb import ShellResult
 from taktik.core.shared.device.media_store import parse_pushed_timestamp, purge_pushed_media
 
 
@@ -40,12 +41,21 @@ class FakeAdb:
             return 0, "", ""
         return 0, "", ""
 
+    def batch(self, device_id, commands, *, stop_on_error=False, timeout=30):
+        """The deletions travel as one batched shell; answer each command like a single call."""
+        results = []
+        for command in commands:
+            code, out, _ = self(device_id, *command)
+            results.append(ShellResult(" ".join(command), code, out))
+        return results
+
 
 @pytest.fixture
 def adb(monkeypatch):
     def _install(listing):
         fake = FakeAdb(listing)
         monkeypatch.setattr(media_store, "_adb_shell", fake)
+        monkeypatch.setattr(media_store, "_adb_shell_batch", fake.batch)
         return fake
     return _install
 
@@ -0,0 +1,76 @@
+"""Keyboard commands ride the device's persistent shell once the IME is known to be active.
+
+Pinned here: a batched IME check that passed warms the active-IME cache, so the next
+text goes straight to the persistent session; a session that cannot run (no adb
+binary) falls back to the one-shot shell instead of losing the keystrokes; and a command
+the session sent but never acknowledged is reported failed, not typed a second time.
+"""
+
+from taktik.core.shared.device.adb import ShellResult
+from taktik.core.shared.input import taktik_keyboard as kb
+
+
+class _Session:
+    def __init__(self, available=True, acknowledged=True):
+        self.available = available
+        self.acknowledged = acknowledged
+        self.commands = []
+
+    def send_batch(self, commands, **_k):
+        if not self.available:
+            return None
+        self.commands.extend(commands)
+        if not self.acknowledged:
+            return [ShellResult(command, None, "") for command in commands]
+        return [ShellResult(command, 0, "Broadcast completed") for command in commands]
+
+
+def _stub(monkeypatch, session):
+    one_shot = []
+    monkeypatch.setattr(kb, "get_adb_shell_session", lambda _d: session)
+    monkeypatch.setattr(kb, "run_adb_shell", lambda _d, cmd: one_shot.append(cmd) or "Broadcast completed")
+    monkeypatch.setattr(
+        kb, "run_adb_shell_batch",
+        lambda _d, cmds, **_k: [ShellResult(c, 0, "Broadcast completed") for c in cmds],
+    )
+    monkeypatch.setattr(kb.time, "sleep", lambda _s: None)
+    monkeypatch.setattr(kb, "_active_ime_cache", {})
+    return one_shot
+
+
+def test_a_passed_batched_check_warms_the_cache_and_the_next_text_uses_the_session(monkeypatch):
+    session = _Session()
+    one_shot = _stub(monkeypatch, session)
+
+    assert kb.type_with_taktik_keyboard("dev1", "first") is True
+    assert kb._active_ime_cached("dev1")
+    assert session.commands == []
+
+    assert kb.type_with_taktik_keyboard("dev1", "second") is True
+    assert len(session.commands) == 1 and kb.IME_MESSAGE_B64 in session.commands[0]
+    assert one_shot == []
+
+
+def test_an_unavailable_session_falls_back_to_the_one_shot_shell(monkeypatch):
+    one_shot = _stub(monkeypatch, _Session(available=False))
+    kb._active_ime_cache["dev1"] = kb.time.time()
+
+    assert kb.type_with_taktik_keyboard("dev1", "hello") is True
+    assert kb._press_backspace("dev1", 1) is True
+
+    assert len(one_shot) == 2 and one_shot[1] == "input keyevent 67"
+
+
+def test_a_sent_but_unacknowledged_command_is_not_replayed(monkeypatch):
+    session = _Session(acknowledged=False)
+    one_shot = _stub(monkeypatch, session)
+    batches = []
+    monkeypatch.setattr(kb, "run_adb_shell_batch", lambda _d, cmds, **_k: batches.append(cmds) or [])
+    kb._active_ime_cache["dev1"] = kb.time.time()
+
+    assert kb.type_with_taktik_keyboard("dev1", "hello") is False
+    assert kb._press_backspace("dev1", 1) is False
+    assert kb._press_backspace("dev1", 3) is False
+
+    assert len(session.commands) == 1 + 1 + 5
+    assert one_shot == [] and batches == []
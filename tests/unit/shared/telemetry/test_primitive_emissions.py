@@ -8,6 +8,7 @@ they're covered by the sink contract + integration runs, not here.
 import pytest
 
 from taktik.core.shared import input as _input_pkg  # noqa: F401  (ensure package import)
+from taktik.core.shared.device.adb import ShellResult
 from taktik.core.shared.input import taktik_keyboard as kb
 from taktik.core.shared.telemetry import configure_telemetry_sink, clear_telemetry_sink
 
@@ -24,6 +25,10 @@ def test_typing_emits_keystroke_with_length_not_text(monkeypatch, _sink):
     # Simulate a healthy device: keyboard already active, broadcast returns OK.
     monkeypatch.setattr(kb, "is_taktik_keyboard_active", lambda _d: True)
     monkeypatch.setattr(kb, "run_adb_shell", lambda _d, _cmd: "Broadcast completed")
+    monkeypatch.setattr(
+        kb, "run_adb_shell_batch",
+        lambda _d, cmds, **_k: [ShellResult(c, 0, "Broadcast completed") for c in cmds],
+    )
     monkeypatch.setattr(kb.time, "sleep", lambda _s: None)
 
     assert kb.type_with_taktik_keyboard("dev1", "hello secret", delay_mean=80, delay_deviation=30) is True
@@ -39,6 +44,7 @@ def test_typing_emits_keystroke_with_length_not_text(monkeypatch, _sink):
 
 def test_backspace_emits_count(monkeypatch, _sink):
     monkeypatch.setattr(kb, "run_adb_shell", lambda _d, _cmd: "")
+    monkeypatch.setattr(kb, "run_adb_shell_batch", lambda _d, cmds, **_k: [ShellResult(c, 0, "") for c in cmds])
     monkeypatch.setattr(kb.time, "sleep", lambda _s: None)
 
     assert kb._press_backspace("dev1", 2) is True
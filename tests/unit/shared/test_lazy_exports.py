@@ -0,0 +1,21 @@
+"""Package exports resolve on first access and are cached in the package namespace."""
+
+import sys
+
+import pytest
+
+import taktik.core.shared.device as device_pkg
+
+
+def test_an_export_is_imported_on_first_access_and_cached(monkeypatch):
+    monkeypatch.delitem(device_pkg.__dict__, "DumpIndex", raising=False)
+
+    value = device_pkg.DumpIndex
+
+    assert value is sys.modules["taktik.core.shared.device.dump_index"].DumpIndex
+    assert device_pkg.__dict__["DumpIndex"] is value
+
+
+def test_an_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError, match="taktik.core.shared.device"):
+        device_pkg.NotAnExport
@@ -91,6 +91,46 @@ class TestInterleaved:
         assert result["session_stop"] is False
 
 
+class TestScheduling:
+    def test_without_yields_the_operator_order_is_kept(self):
+        run, calls = make_runner({"a": 100, "b": 100})
+        run_distributed(["a", "b"], 50, DISTRIBUTION_BALANCED, run, expected_yield={})
+        assert [c[0] for c in calls] == ["a", "b"]
+
+    def test_best_expected_yield_runs_first_and_untried_sources_rank_as_full(self):
+        run, calls = make_runner({"a": 100, "b": 100, "c": 100})
+        run_distributed(["a", "b", "c"], 60, DISTRIBUTION_BALANCED, run,
+                        expected_yield={"a": 0.2, "b": 0.9})
+        assert [c[0] for c in calls] == ["c", "b", "a"]
+
+    def test_leftover_goes_back_to_the_sources_that_filled_their_share(self):
+        run, calls = make_runner({"a": 100, "b": 100, "c": 5})
+        result = run_distributed(["a", "b", "c"], 60, DISTRIBUTION_BALANCED, run)
+        # c, last, runs dry on its share: the 15 it left used to be lost. They are split
+        # between a and b, and c is never asked again.
+        assert calls == [("a", 20, 20), ("b", 20, 20), ("c", 20, 5), ("a", 8, 8), ("b", 7, 7)]
+        assert result["processed"] == 60
+        assert result["exhausted"] == ["c"]
+        assert result["allotted"] == {"a": 28, "b": 27, "c": 20}
+
+    def test_leftover_rounds_end_when_every_source_is_dry(self):
+        run, _ = make_runner({"a": 12, "b": 5})
+        result = run_distributed(["a", "b"], 60, DISTRIBUTION_BALANCED, run)
+        assert result["per_source"] == {"a": 12, "b": 5}
+        assert sorted(result["exhausted"]) == ["a", "b"]
+
+    def test_sequential_ignores_yields(self):
+        run, calls = make_runner({"a": 100, "b": 100})
+        run_distributed(["a", "b"], 50, DISTRIBUTION_SEQUENTIAL, run, expected_yield={"b": 1.0, "a": 0.1})
+        assert calls == [("a", 50, 50)]
+
+    def test_interleaved_rotates_best_first(self):
+        run, calls = make_runner({"a": 100, "b": 100})
+        run_distributed(["a", "b"], 20, DISTRIBUTION_INTERLEAVED, run, batch_size=10,
+                        expected_yield={"a": 0.3, "b": 0.8})
+        assert [c[0] for c in calls] == ["b", "a"]
+
+
 class TestSessionStop:
     def test_stop_halts_distribution(self):
         run, calls = make_runner({"a": 100, "b": 100}, stop_on="a")
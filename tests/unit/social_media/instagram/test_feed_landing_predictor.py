@@ -0,0 +1,218 @@
+"""The feed advance predicts its landing and confirms it with a targeted probe instead of a dump.
+
+Pinned here: a landing the probe confirms costs no hierarchy dump; a probe that sees nothing to
+confirm falls back to exactly one dump, whose measured landing calibrates the gesture's coast; a
+probe that reads an ad/suggestion label never stands in for the dump the skip logic needs; the
+probe queries the header / like-row resource-ids plus one content-desc query that sees the markers
+on media and id-less nodes, within a fixed RPC budget; and once probes have measured no cheaper
+than dumps, the advance goes straight to the dump.
+"""
+
+import re
+
+import taktik.core.social_media.instagram.actions.atomic.scroll.feed_scroll as fs
+from taktik.core.social_media.instagram.actions.atomic.scroll.feed_scroll import FeedScrollMixin
+
+H = 2000
+# A flick that travels 600 + 0.15 s × 5000 px/s = 1350 px with the seeded coast.
+FLICK = {"gesture": "flick", "distance_px": 600, "velocity_pxs": 5000, "duration_ms": 120}
+
+
+def _anchors(posts, likes=(), probe=False, **extra):
+    anchors = {"headers": [y for y, _ in posts], "posts": list(posts), "likes": list(likes),
+               "ad_tops": [], "sugg_tops": [], "top": 200, "tab": 1840, "on_feed": True,
+               "surface": "feed", "video_band": None}
+    if probe:
+        anchors["probe"] = True
+    anchors.update(extra)
+    return anchors
+
+
+class _Host(FeedScrollMixin):
+    screen_height = H
+
+    def __init__(self, dumps=(), probes=()):
+        self._dumps = list(dumps)
+        self._probes = list(probes)
+        self.dump_calls = 0
+
+        class _Log:
+            def debug(self, *a, **k): pass
+            def error(self, *a, **k): pass
+        self.logger = _Log()
+
+    def _read_feed_anchors(self):
+        self.dump_calls += 1
+        return self._dumps.pop(0)
+
+    def _probe_feed_anchors(self):
+        return self._probes.pop(0) if self._probes else None
+
+    def _strong_flick(self, *_a, **_k):
+        self._last_gesture_injection = dict(FLICK)
+        return True
+
+
+def _host_after(current, **kwargs):
+    host = _Host(**kwargs)
+    host._last_top_username = current[0][1]
+    host._remember_landing_expectation(_anchors(current))
+    return host
+
+
+def _patch(monkeypatch):
+    monkeypatch.setattr(fs.time, "sleep", lambda _s: None)
+    monkeypatch.setattr(fs.random, "uniform", lambda a, b: a)
+    monkeypatch.setattr(fs.random, "choices", lambda modes, weights=None: ["flick"])
+
+
+def test_a_landing_the_probe_confirms_costs_no_dump(monkeypatch):
+    _patch(monkeypatch)
+    # "ben" sat at 1500 px: the flick should bring his header to 150 px (0.075h).
+    host = _host_after([(100, "anna"), (1500, "ben")],
+                       probes=[_anchors([(160, "ben")], likes=[1700], probe=True)])
+
+    res = host.scroll_feed_to_next_post()
+
+    assert host.dump_calls == 0
+    assert res["dumps"] == 0 and res["probes"] == 1
+    assert res["advanced"] is True and res["full_post"] is True
+    assert 0.148 < host._landing_model()["coast"]["flick"] < fs._COAST_SEED_S["flick"]  # 0.148 s measured
+
+
+def test_an_unconfirmed_landing_takes_one_dump_and_calibrates_the_coast(monkeypatch):
+    _patch(monkeypatch)
+    # The probe sees no header; the dump finds "ben" at 90 px → a real coast of 0.162 s.
+    host = _host_after([(100, "anna"), (1500, "ben")],
+                       probes=[_anchors([], probe=True, on_feed=False)],
+                       dumps=[_anchors([(90, "ben")], likes=[1700])])
+
+    res = host.scroll_feed_to_next_post()
+
+    assert host.dump_calls == 1
+    assert res["dumps"] == 1 and res["probes"] == 0
+    coast = host._landing_model()["coast"]["flick"]
+    assert fs._COAST_SEED_S["flick"] < coast < 0.162
+
+
+def test_a_probe_reading_an_ad_label_never_replaces_the_dump(monkeypatch):
+    _patch(monkeypatch)
+    host = _host_after([(100, "anna"), (1500, "ben")],
+                       probes=[_anchors([(150, "brand")], likes=[1700], probe=True, ad_tops=[190])],
+                       dumps=[_anchors([(150, "ben")], likes=[1700])])
+
+    res = host.scroll_feed_to_next_post()
+
+    assert host.dump_calls == 1 and res["probes"] == 0
+
+
+def test_without_a_prediction_the_probe_is_not_trusted():
+    host = _Host()
+    probe = _anchors([(150, "ben")], probe=True)
+
+    assert host._landing_confidence(probe, 0.075) < fs._PROBE_CONFIDENCE_MIN
+    assert host._landing_confidence({**probe, "predicted": 0.3}, 0.075) < fs._PROBE_CONFIDENCE_MIN
+    assert host._landing_confidence({**probe, "predicted": 0.07}, 0.075) >= fs._PROBE_CONFIDENCE_MIN
+    # A full dump keeps its historical score.
+    assert round(host._landing_confidence(_anchors([(150, "ben")]), 0.075), 3) == 0.95
+
+
+class _Raw:
+    """uiautomator2 selector stub: matches nodes like the device does, counting every RPC
+    (`.count` or `.info`) and recording the resource-id patterns."""
+
+    NODES = [
+        {"resourceName": "com.instagram.android:id/row_feed_photo_profile_name",
+         "text": "ben", "bounds": {"top": 150}},
+        {"resourceName": "com.instagram.android:id/secondary_label",
+         "text": "Suggestions", "bounds": {"top": 190}},
+        {"resourceName": "com.instagram.android:id/row_feed_profile_header",
+         "contentDescription": "brand Sponsored", "bounds": {"top": 140}},
+        {"resourceName": "com.instagram.android:id/row_feed_button_like", "bounds": {"top": 1700}},
+    ]
+
+    def __init__(self, nodes=None):
+        self.nodes = self.NODES if nodes is None else nodes
+        self.patterns = set()
+        self.rpcs = 0
+
+    def __call__(self, resourceIdMatches=None, descriptionMatches=None, instance=None):
+        if resourceIdMatches is not None:
+            self.patterns.add(resourceIdMatches)
+            matched = [n for n in self.nodes if re.fullmatch(resourceIdMatches, n.get("resourceName", ""))]
+        else:
+            matched = [n for n in self.nodes
+                       if re.fullmatch(descriptionMatches, n.get("contentDescription", ""))]
+        raw = self
+
+        class _Query:
+            @property
+            def count(self):
+                raw.rpcs += 1
+                return len(matched)
+
+            @property
+            def info(self):
+                raw.rpcs += 1
+                return matched[instance]
+        return _Query()
+
+    def dump_hierarchy(self):
+        raise AssertionError("the probe must not dump the hierarchy")
+
+
+def _probe(nodes=None):
+    host = _Host()
+    host.device = type("_Device", (), {"_device": _Raw(nodes)})()
+    return FeedScrollMixin._probe_feed_anchors(host), host.device._device
+
+
+def test_the_probe_queries_only_the_header_and_like_row_ids():
+    probe, raw = _probe()
+
+    (pattern,) = raw.patterns
+    assert all(rid in pattern for rid in fs.FS.landing_probe_ids)
+    assert probe["probe"] is True and probe["on_feed"] is True
+    assert probe["posts"] == [(150, "ben")] and probe["likes"] == [1700]
+    assert probe["sugg_tops"] == [190] and probe["ad_tops"] == [140]
+
+
+def test_the_probe_sees_markers_on_media_and_id_less_nodes():
+    header = {"resourceName": "com.instagram.android:id/row_feed_photo_profile_name",
+              "text": "brand", "bounds": {"top": 150}}
+
+    probe, _ = _probe([header, {"contentDescription": "Sponsored Photo by brand", "bounds": {"top": 260}}])
+    assert probe["ad_tops"] == [260] and probe["sugg_tops"] == []
+
+    probe, _ = _probe([header, {"resourceName": "com.instagram.android:id/row_feed_photo_imageview",
+                                "contentDescription": "Suggestion Photo de brand", "bounds": {"top": 260}}])
+    assert probe["sugg_tops"] == [260] and probe["ad_tops"] == []
+
+
+def test_the_probe_stays_within_its_rpc_budget():
+    # A dump is one RPC, but it serialises the whole window hierarchy (tens to hundreds of KB of
+    # XML) and the client parses all of it; the probe's element queries each return one node.
+    ids = [{"resourceName": "com.instagram.android:id/row_feed_button_like", "bounds": {"top": 100 * i}}
+           for i in range(1, 15)]
+    marker = {"contentDescription": "Sponsored", "bounds": {"top": 50}}
+
+    _, raw = _probe(ids)
+    assert raw.rpcs == 1 + fs._PROBE_MAX_NODES + 1
+
+    _, raw = _probe(ids + [marker, dict(marker)])
+    assert raw.rpcs == 1 + fs._PROBE_MAX_NODES + 1 + 1
+
+
+def test_a_probe_measured_no_cheaper_than_a_dump_is_skipped(monkeypatch):
+    _patch(monkeypatch)
+    host = _host_after([(100, "anna"), (1500, "ben")],
+                       probes=[_anchors([(160, "ben")], likes=[1700], probe=True)],
+                       dumps=[_anchors([(160, "ben")], likes=[1700])])
+    host._landing_model()["cost_s"] = {"probe": [fs._COST_MIN_SAMPLES, 0.9],
+                                       "dump": [fs._COST_MIN_SAMPLES, 0.6]}
+
+    res = host.scroll_feed_to_next_post()
+
+    assert host.dump_calls == 1 and res["probes"] == 0
+    assert host._probes  # never asked
+    assert host._landing_model()["cost_s"]["dump"][0] == fs._COST_MIN_SAMPLES + 1
@@ -134,7 +134,7 @@ def _no_persistence(monkeypatch):
         host = None
 
         @staticmethod
-        def is_processed(*, hashtag, post_author, post_caption_hash, account_id, hours_limit):
+        def is_processed(*, hashtag, post_author, post_caption_hash, account_id, hours_limit, post_ref=None):
             return post_author in _Service.host._already
 
         @staticmethod
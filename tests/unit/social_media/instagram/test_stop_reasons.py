@@ -183,6 +183,19 @@ def test_only_a_failed_run_is_flagged_as_failed():
     assert sr.manual_stop().family == sr.FAMILY_MANUAL
 
 
+def test_only_source_motives_leave_a_multi_source_run_going():
+    # Under the hashtag / post URL driver, a source that spent its posts or ran out of rows
+    # hands over to the next one; a spent session limit or a manual stop ends everything.
+    assert sr.ends_source_only(sr.posts_cap(1, 1))
+    assert sr.ends_source_only(sr.no_new_post())
+    assert sr.ends_source_only(sr.known_streak(10, 40))
+    assert not sr.ends_source_only(sr.duration_cap(60))
+    assert not sr.ends_source_only(sr.manual_stop())
+    assert not sr.ends_source_only(sr.empty_plan())
+    assert not sr.ends_source_only("posts_cap")  # a bare legacy string carries no scope
+    assert sr.SOURCE_SCOPED_CODES <= {reason.code for reason in _every_reason()}
+
+
 def test_event_fields_stay_additive():
     # `reason` must keep carrying the legacy sentence: a desktop build predating the catalogue
     # reads that field and nothing else.
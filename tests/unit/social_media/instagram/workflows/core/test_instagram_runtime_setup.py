@@ -1,3 +1,5 @@
+import pytest
+
 from taktik.core.social_media.instagram.workflows.core import runtime_setup
 from taktik.core.social_media.instagram.workflows.core.runtime_setup import (
     prepare_instagram_automation_runtime,
@@ -11,7 +13,32 @@ class FakeAutomation:
         self.device = object()
 
 
-def test_prepare_runtime_applies_config_package_version_clone_and_language(monkeypatch):
+@pytest.fixture(autouse=True)
+def catalog_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("TAKTIK_SELECTOR_CATALOG_DIR", str(tmp_path / "catalogs"))
+
+
+@pytest.fixture(autouse=True)
+def ordering_keys(monkeypatch):
+    keys = []
+    monkeypatch.setattr(runtime_setup, "activate_selector_ordering", lambda *key: keys.append(key))
+    return keys
+
+
+def _patch_language(monkeypatch, calls, lang):
+    monkeypatch.setattr(
+        runtime_setup,
+        "detect_language",
+        lambda device: calls.append(("detect", device)) or lang,
+    )
+    monkeypatch.setattr(
+        runtime_setup,
+        "optimize_for_language",
+        lambda detected: calls.append(("language", detected)) or 0,
+    )
+
+
+def test_prepare_runtime_applies_config_package_version_clone_and_language(monkeypatch, ordering_keys):
     calls = []
     logs = []
 
@@ -27,11 +54,7 @@ def test_prepare_runtime_applies_config_package_version_clone_and_language(monke
         "patch_selectors_for_package",
         lambda platform, package: calls.append(("clone", platform, package)) or 1,
     )
-    monkeypatch.setattr(
-        runtime_setup,
-        "detect_and_optimize",
-        lambda device: calls.append(("language", device)) or "fr",
-    )
+    _patch_language(monkeypatch, calls, "fr")
 
     automation = FakeAutomation()
     workflow_config = {"actions": []}
@@ -48,10 +71,12 @@ def test_prepare_runtime_applies_config_package_version_clone_and_language(monke
     assert automation.package_name == "com.instagram.android.c1"
     assert calls == [
         ("active", "com.instagram.android.c1"),
+        ("detect", automation.device),
         ("version", "instagram", "321.0.0"),
         ("clone", "instagram", "com.instagram.android.c1"),
-        ("language", automation.device),
+        ("language", "fr"),
     ]
+    assert ordering_keys == [("instagram", "321.0.0", "com.instagram.android.c1")]
     assert ("info", "Dynamic config applied") in logs
     assert ("info", "Applied 2 selector override(s) for Instagram v321.0.0") in logs
     assert ("info", "Patched 1 selector(s) for clone: com.instagram.android.c1") in logs
@@ -67,7 +92,8 @@ def test_prepare_runtime_uses_official_package_without_clone(monkeypatch):
         "patch_selectors_for_package",
         lambda platform, package: calls.append(("clone", platform, package)) or 1,
     )
-    monkeypatch.setattr(runtime_setup, "detect_and_optimize", lambda device: "en")
+    monkeypatch.setattr(runtime_setup, "detect_language", lambda device: "en")
+    monkeypatch.setattr(runtime_setup, "optimize_for_language", lambda lang: 0)
 
     automation = FakeAutomation()
 
@@ -78,3 +104,25 @@ def test_prepare_runtime_uses_official_package_without_clone(monkeypatch):
 
     assert automation.package_name == "com.instagram.android"
     assert calls == [("active", "com.instagram.android")]
+
+
+def test_second_start_with_the_same_key_loads_the_catalog_instead_of_the_passes(monkeypatch):
+    calls = []
+    logs = []
+    monkeypatch.setattr(runtime_setup, "set_active_package", lambda package: None)
+    monkeypatch.setattr(
+        "taktik.core.compat.selectors.setup.apply_version_overrides",
+        lambda platform, version: calls.append(("version", platform, version)) or 0,
+    )
+    _patch_language(monkeypatch, calls, "en")
+
+    for _ in range(2):
+        prepare_instagram_automation_runtime(
+            automation=FakeAutomation(),
+            workflow_config={},
+            installed_version_provider=lambda: "321.0.0",
+            log=lambda level, message: logs.append((level, message)),
+        )
+
+    assert [call[0] for call in calls] == ["detect", "version", "language", "detect"]
+    assert ("info", "Selector catalog loaded for Instagram v321.0.0 (en)") in logs
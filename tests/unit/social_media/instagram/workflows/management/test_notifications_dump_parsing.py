@@ -13,7 +13,9 @@ from taktik.core.social_media.instagram.workflows.management.notifications.dump_
     find_row_reply_target,
     find_truncated_targets,
     parse_feed_rows,
+    parse_feed_screen,
     parse_request_rows,
+    parse_section_headers,
 )
 
 FRAGMENTS = {
@@ -233,3 +235,17 @@ def test_find_truncated_targets_skips_untruncated():
     assert find_truncated_targets(_root(xml), "activity_feed_newsfeed_story_row") == []
 
 
+
+
+def test_parse_feed_screen_reads_rows_headers_and_truncations_in_one_walk():
+    xml = TRUNC_XML.replace(
+        "<hierarchy>", '<hierarchy><node resource-id="activity_feed_header_row" text="Cette semaine" />'
+    )
+    root = _root(xml)
+    screen = parse_feed_screen(root, "activity_feed_newsfeed_story_row", "activity_feed_header_row", FRAGMENTS)
+
+    assert screen["rows"] == parse_feed_rows(root, "activity_feed_newsfeed_story_row", FRAGMENTS)
+    assert screen["headers"] == parse_section_headers(root, "activity_feed_header_row") == ["Cette semaine"]
+    targets = find_truncated_targets(root, "activity_feed_newsfeed_story_row")
+    assert [{k: t[k] for k in ("key", "region")} for t in screen["truncated"]] == targets
+    assert screen["truncated"][0]["row"] == 0  # alice's row, the first one
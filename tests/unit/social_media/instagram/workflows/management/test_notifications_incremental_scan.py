@@ -0,0 +1,146 @@
+"""Incremental mode of the notifications scan: stop at the previous scan's newest rows.
+
+Pinned here: with nothing new since the mark, a scan costs one dump and no scroll; new
+rows above the mark are kept and the scan stops on the screen where the mark shows up;
+rows below the mark are neither kept nor expanded; an expanded row keeps the text it was
+parsed with, which the next scan's mark is matched against; a mark that never shows up still
+lets the known-notification streak stop the scroll; and every screen is dumped once,
+with or without a mark.
+"""
+
+import pytest
+
+import taktik.core.social_media.instagram.workflows.management.notifications.notifications_workflow as mod
+from taktik.core.social_media.instagram.workflows.management.notifications.notifications_workflow import (
+    NotificationsEngagementWorkflow,
+)
+
+PAGE, STEP = 4, 3
+
+
+def _row(text, truncated=False, expanded=False):
+    if expanded:
+        body = f"{text} commented: nice work on this one"
+    elif truncated:
+        body = f"{text} commented: nice… more"
+    else:
+        body = f"{text} started following you. 2h"
+    return (
+        '<node resource-id="activity_feed_newsfeed_story_row" bounds="[0,0][1080,100]">'
+        f'<node text="{body}" bounds="[100,10][900,90]" /></node>'
+    )
+
+
+class _Device:
+    def __init__(self, feed):
+        self.feed = feed
+        self.top = 0
+        self.dumps = 0
+
+    def dump_hierarchy(self, compressed=False):
+        self.dumps += 1
+        rows = "".join(_row(*entry) for entry in self.feed[self.top:self.top + PAGE])
+        return f"<hierarchy>{rows}</hierarchy>"
+
+
+class _Workflow(NotificationsEngagementWorkflow):
+    def __init__(self, feed):
+        import loguru
+        self.device = _Device(feed)
+        self.logger = loguru.logger.bind(module="test")
+        self._notify_cb = None
+        self.selectors = mod.NOTIFICATION_SELECTORS
+        self._locale_ready = True
+        self.scrolls = 0
+        self.expanded = []
+
+    def ensure_notifications_screen(self):
+        return True
+
+    def _element_exists(self, selectors):
+        return False
+
+    def _tap_show_more(self):
+        return False
+
+    def _scroll_down(self, times=1):
+        self.scrolls += 1
+        self.device.top = min(self.device.top + STEP, max(0, len(self.device.feed) - PAGE))
+
+    def _expand_one_more(self, targets=None):
+        fresh = [t for t in targets if t["key"] not in self.expanded]
+        if fresh:
+            self.expanded.append(fresh[0]["key"])
+            index = self.device.top + fresh[0]["row"]
+            self.device.feed[index] = (self.device.feed[index][0], False, True)
+        return bool(fresh)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(mod.time, "sleep", lambda *_: None)
+
+
+def _mark(*names):
+    return lambda row, below=(): any(row["text"].startswith(name + " ") for name in names)
+
+
+def _names(result):
+    return [item["text"].split(" ")[0] for item in result["items"]]
+
+
+OLD = [(f"old{i}",) for i in range(10)]
+
+
+def test_nothing_new_costs_one_dump():
+    workflow = _Workflow(OLD)
+    result = workflow.scan(high_water=_mark("old0", "old1"))
+
+    assert result["success"] and result["items"] == []
+    assert (workflow.device.dumps, workflow.scrolls) == (1, 0)
+
+
+def test_new_rows_above_the_mark_are_kept_and_the_rest_is_not_expanded():
+    feed = [("new0",), ("new1",), ("old0", True), ("old1", True)] + OLD[2:]
+    workflow = _Workflow(feed)
+    result = workflow.scan(high_water=_mark("old0"))
+
+    assert _names(result) == ["new0", "new1"]
+    assert workflow.expanded == [] and (workflow.device.dumps, workflow.scrolls) == (1, 0)
+
+
+def test_an_expanded_row_keeps_its_parsed_text_for_the_mark():
+    feed = [("new0", True), ("new1",), ("old0",)] + OLD[1:]
+    workflow = _Workflow(feed)
+    result = workflow.scan(high_water=_mark("old0"))
+
+    first = result["items"][0]
+    assert first["text"] == "new0 commented: nice work on this one"
+    assert first["parsed_text"] == "new0 commented: nice… more"
+    assert "parsed_text" not in result["items"][1]
+
+
+def test_the_scan_scrolls_until_the_mark_shows_up():
+    feed = [(f"new{i}",) for i in range(5)] + OLD
+    workflow = _Workflow(feed)
+    result = workflow.scan(high_water=_mark("old0", "old1"))
+
+    assert _names(result) == [f"new{i}" for i in range(5)]
+    assert (workflow.device.dumps, workflow.scrolls) == (2, 1)
+
+
+def test_a_mark_that_never_shows_up_falls_back_to_the_known_streak():
+    workflow = _Workflow(OLD)
+    result = workflow.scan(known_checker=lambda row: True, high_water=_mark("gone"))
+
+    assert result["success"]
+    assert (workflow.device.dumps, workflow.scrolls) == (2, 1)
+
+
+def test_without_a_mark_each_screen_is_dumped_once():
+    workflow = _Workflow(OLD)
+    result = workflow.scan()
+
+    assert _names(result) == [name for (name,) in OLD]
+    # Two screens add nothing at the bottom before the scan gives up: one dump each.
+    assert workflow.device.dumps == workflow.scrolls + 1
@@ -0,0 +1,139 @@
+"""Streaming mode of `_scrape_list`: bounded memory, batched persistence, resumable lists.
+
+Pinned here: the seen set answers membership exactly for recent usernames and within its
+error rate for the rest, and survives a round trip through its state; a streamed run keeps
+no profile dict, links its profiles to the session batch by batch together with the resume
+point; a run cut short keeps that point, and the next run of the same list scrolls back to
+it without capturing anyone twice, finishes the list and clears it.
+"""
+
+import pytest
+
+from taktik.core.social_media.instagram.workflows.scraping import list_scraping
+from taktik.core.social_media.instagram.workflows.scraping.list_scraping import ScrapingListMixin
+from taktik.core.social_media.instagram.workflows.scraping.list_stream import (
+    ProfileStreamSink,
+    ScrapeCheckpoint,
+    SeenSet,
+)
+from taktik.core.social_media.instagram.workflows.scraping.list_strategy import ListScrapingStrategy
+from taktik.core.social_media.instagram.workflows.scraping.persistence import ScrapingPersistenceMixin
+
+FOLLOWERS = [f"user{i:03d}" for i in range(120)]
+PAGE, STEP = 10, 5
+
+
+class _Logger:
+    def info(self, *a, **k): pass
+    def debug(self, *a, **k): pass
+    def warning(self, *a, **k): pass
+    def error(self, *a, **k): pass
+
+
+class _List:
+    """A followers list on screen: PAGE rows, each scroll moves STEP rows down."""
+
+    def __init__(self):
+        self.top = 0
+        self.scrolls = 0
+
+    def strategy(self):
+        return ListScrapingStrategy(
+            get_visible=lambda: [{"username": u, "element": None} for u in FOLLOWERS[self.top:self.top + PAGE]],
+            is_on_list=lambda: True,
+            scroll_down=self.scroll,
+            enable_suggestions_check=False,
+        )
+
+    def scroll(self):
+        self.scrolls += 1
+        self.top = min(self.top + STEP, len(FOLLOWERS) - PAGE)
+
+
+class _Workflow(ScrapingListMixin, ScrapingPersistenceMixin):
+    def __init__(self, db, scraping_id, screen, stop_after=None):
+        self.config = {"rescrape_after_days": 0}
+        self.device = None
+        self.logger = _Logger()
+        self.local_db = db
+        self.scraped_profiles = []
+        self.scraping_session_id = scraping_id
+        self.csv_export_path = None
+        self._save_immediately = True
+        self.stop_after = stop_after
+        self.screen = screen
+        self.captured = []
+        self.captured_at = []
+
+    def _should_continue(self):
+        return self.stop_after is None or len(self.captured) < self.stop_after
+
+    def _pop_profile_picture(self, username, profile_data):
+        self.captured.append(username)
+        self.captured_at.append(self.screen.top)
+        return None, None
+
+
+@pytest.fixture(autouse=True)
+def quiet_device(monkeypatch):
+    monkeypatch.setattr(list_scraping.time, "sleep", lambda *_: None)
+    for emit in ("emit_scraping_profile_visit", "emit_profile_captured", "emit_profile_skipped"):
+        monkeypatch.setattr(list_scraping.IPCEmitter, emit, staticmethod(lambda *a, **k: None))
+
+
+def _run(db, scraping_id, screen, stop_after=None, offset=0):
+    workflow = _Workflow(db, scraping_id, screen, stop_after)
+    sink = ProfileStreamSink("FOLLOWERS", "target", scraping_id=scraping_id, batch_size=10,
+                             local_db=db, total_offset=offset)
+    returned = workflow._scrape_list(max_count=1000, source_type="FOLLOWERS", source_name="target",
+                                     total_available=len(FOLLOWERS), strategy=screen.strategy(), sink=sink)
+    return workflow, sink, returned
+
+
+def _linked(db, scraping_id):
+    return db._get_connection().execute(
+        "SELECT COUNT(*) FROM scraped_profiles WHERE scraping_id = ?", (scraping_id,)
+    ).fetchone()[0]
+
+
+def test_the_seen_set_is_exact_for_recent_names_and_bounded_for_the_rest():
+    seen = SeenSet(capacity=5_000, error_rate=0.01, window=100)
+    for i in range(5_000):
+        seen.add(f"in{i}")
+
+    # The count is distinct names as far as the filter can tell: its own false positives are missed.
+    assert 4_950 <= len(seen) <= 5_000 and len(seen.recent()) == 100
+    assert all(f"in{i}" in seen for i in range(5_000))
+    false_positives = sum(f"out{i}" in seen for i in range(5_000))
+    assert false_positives < 5_000 * 0.03
+
+    restored = SeenSet.from_state(seen.to_state())
+    assert all(f"in{i}" in restored for i in range(0, 5_000, 7))
+    assert restored.recent() == seen.recent() and len(restored) == len(seen)
+
+
+def test_an_interrupted_list_resumes_from_its_checkpoint(db):
+    scraping_id = db.create_scraping_session("followers", "TARGET", "@target")
+
+    first_screen = _List()
+    first, first_sink, returned = _run(db, scraping_id, first_screen, stop_after=30)
+
+    assert returned == [] and first.scraped_profiles == []
+    assert first.captured == FOLLOWERS[:len(first.captured)] and len(first.captured) >= 30
+    assert _linked(db, scraping_id) == first_sink.count == len(first.captured)
+    checkpoint = ScrapeCheckpoint.from_json(db.get_scraping_checkpoint("FOLLOWERS", "target"))
+    assert checkpoint.scraped == len(first.captured) and checkpoint.last_usernames
+
+    second_screen = _List()
+    second, second_sink, _ = _run(db, scraping_id, second_screen, offset=first_sink.count)
+
+    assert not set(first.captured) & set(second.captured)
+    assert first.captured + second.captured == FOLLOWERS
+    assert _linked(db, scraping_id) == len(FOLLOWERS)
+    # Scrolled back to where it stopped before opening anyone.
+    assert second.captured_at[0] >= first_screen.top - STEP
+    assert db.get_scraping_checkpoint("FOLLOWERS", "target") is None
+    total = db._get_connection().execute(
+        "SELECT total_scraped FROM scraping_sessions WHERE scraping_id = ?", (scraping_id,)
+    ).fetchone()[0]
+    assert total == len(FOLLOWERS)
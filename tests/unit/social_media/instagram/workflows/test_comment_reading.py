@@ -0,0 +1,145 @@
+"""Reading comment text from the Litho dump without holding the whole dump.
+
+Pinned here: only the comments RecyclerView section of `dumpsys activity top` is kept, a
+multi-line body does not end it early, and the stream is abandoned once the section
+closes, unless it held no comment record (the Litho rows were not nested under the list),
+in which case the Litho lines of the whole dump are read; one combined pass rebuilds the
+records in order; and `read_visible_comments` takes
+the hierarchy dump and the Litho dump at the same time, then keeps only on-screen authors.
+"""
+
+import time
+from contextlib import contextmanager
+
+from taktik.core.social_media.instagram.workflows.common import comment_reading
+from taktik.core.social_media.instagram.workflows.common.comment_reading import (
+    extract_comments_section,
+    extract_visible_comment_usernames,
+    parse_litho_comments,
+    read_visible_comments,
+)
+
+SYNTH = 'props="{"synthetic":true}"'
+
+DUMPSYS = [
+    "TASK com.instagram.android id=12\n",
+    "  ACTIVITY com.instagram.android/.activity.MainTabActivity\n",
+    '    row_comment_textview_comment text="stale, from the feed behind"\n',
+    "    View Hierarchy:\n",
+    "      androidx.recyclerview.widget.RecyclerView{1 VFED.V... app:id/sticky_header_list}\n",
+    f'        Text text="alice" {SYNTH}\n',
+    '        row_comment_textview_comment text="first line\n',
+    'second line"\n',
+    '        row_comment_textview_like_count text="4"\n',
+    f'        Text text="bob" {SYNTH}\n',
+    '        row_comment_textview_comment text="@alice agreed"\n',
+    f'        Text text="ghost" {SYNTH}\n',
+    '        row_comment_textview_comment text="scrolled away"\n',
+    "      android.widget.FrameLayout{2 V.E...... app:id/layout_comment_composer}\n",
+    '        row_comment_textview_comment text="never read"\n',
+]
+
+HIERARCHY = """<hierarchy>
+  <node class="androidx.recyclerview.widget.RecyclerView" resource-id="com.instagram.android:id/sticky_header_list">
+    <node class="android.widget.Button" text="alice" content-desc="" />
+    <node class="android.widget.ImageView" text="" content-desc="Go to bob's profile" />
+  </node>
+</hierarchy>"""
+
+
+def test_only_the_comments_section_is_kept_and_the_stream_stops_after_it():
+    consumed = []
+
+    def stream():
+        for line in DUMPSYS:
+            consumed.append(line)
+            yield line
+
+    section = extract_comments_section(stream())
+
+    assert "stale" not in section and "never read" not in section
+    assert len(consumed) == DUMPSYS.index(
+        "      android.widget.FrameLayout{2 V.E...... app:id/layout_comment_composer}\n"
+    ) + 1
+    assert parse_litho_comments(section) == [
+        {"username": "alice", "text": "first line\nsecond line", "likes": 4,
+         "is_reply": False, "parent_username": None},
+        {"username": "bob", "text": "@alice agreed", "likes": 0,
+         "is_reply": True, "parent_username": "alice"},
+        {"username": "ghost", "text": "scrolled away", "likes": 0,
+         "is_reply": False, "parent_username": None},
+    ]
+
+
+def test_a_dump_without_the_list_falls_back_to_the_litho_lines():
+    lines = [
+        "  ACTIVITY com.instagram.android/.activity.MainTabActivity\n",
+        "    android.widget.FrameLayout{1 V.E...... app:id/content}\n",
+        f'      Text text="carol" {SYNTH}\n',
+        '      row_comment_textview_comment text="still read"\n',
+    ]
+
+    section = extract_comments_section(lines)
+
+    assert "MainTabActivity" not in section
+    assert [(c["username"], c["text"]) for c in parse_litho_comments(section)] == [("carol", "still read")]
+
+
+def test_litho_rows_not_nested_under_the_list_are_still_read():
+    lines = [
+        "    View Hierarchy:\n",
+        "      androidx.recyclerview.widget.RecyclerView{1 VFED.V... app:id/sticky_header_list}\n",
+        "        android.widget.FrameLayout{2 V.E...... app:id/row}\n",
+        "      android.widget.FrameLayout{3 V.E...... app:id/litho_host}\n",
+        f'      Text text="dave" {SYNTH}\n',
+        '      row_comment_textview_comment text="outside the list"\n',
+    ]
+
+    section = extract_comments_section(lines)
+
+    assert [(c["username"], c["text"]) for c in parse_litho_comments(section)] == [
+        ("dave", "outside the list"),
+    ]
+
+
+def test_visible_usernames_come_from_buttons_and_avatars():
+    assert extract_visible_comment_usernames(HIERARCHY) == {"alice", "bob"}
+
+
+class _Device:
+    serial = "emulator-5554"
+
+    def dump_hierarchy(self):
+        time.sleep(0.2)
+        return HIERARCHY
+
+
+def test_both_sources_are_read_concurrently_and_filtered_to_the_screen(monkeypatch):
+    calls = []
+
+    @contextmanager
+    def stream(device_id, command_args, **_):
+        calls.append((device_id, list(command_args)))
+        time.sleep(0.2)
+        yield iter(DUMPSYS)
+
+    monkeypatch.setattr(comment_reading, "stream_adb_shell_process", stream)
+
+    started = time.monotonic()
+    comments = read_visible_comments(_Device())
+    elapsed = time.monotonic() - started
+
+    assert calls == [("emulator-5554", ["dumpsys", "activity", "top"])]
+    assert [c["username"] for c in comments] == ["alice", "bob"]
+    assert elapsed < 0.35  # 0.2 s each, side by side
+
+
+def test_a_failed_litho_read_yields_nothing(monkeypatch):
+    @contextmanager
+    def stream(*_, **__):
+        raise OSError("adb missing")
+        yield
+
+    monkeypatch.setattr(comment_reading, "stream_adb_shell_process", stream)
+
+    assert read_visible_comments(_Device()) == []
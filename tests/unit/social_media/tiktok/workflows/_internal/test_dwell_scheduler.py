@@ -0,0 +1,79 @@
+"""Per-video side work runs while the bot watches, without changing the watch.
+
+Pinned here: deferred work runs on another thread during the dwell, in submission
+order, and is finished when the dwell returns; the sleep itself is called once and
+untouched; a failing task is contained; and in the For You loop the video callback
+and the stats update happen inside the watch instead of around it.
+"""
+
+import threading
+import time
+
+from taktik.core.social_media.tiktok.actions.business.workflows._internal.dwell import DwellScheduler
+from taktik.core.social_media.tiktok.actions.business.workflows.for_you.workflow import ForYouWorkflow
+
+
+def test_side_work_overlaps_the_dwell_and_is_done_when_it_ends():
+    scheduler = DwellScheduler()
+    ran = []
+
+    def task(name):
+        time.sleep(0.1)
+        ran.append((name, threading.current_thread() is threading.main_thread()))
+
+    scheduler.defer(task, "ipc")
+    scheduler.defer(task, "avatar")
+    waits = []
+
+    started = time.monotonic()
+    result = scheduler.dwell(lambda: waits.append(1) or time.sleep(0.3) or "watched")
+    elapsed = time.monotonic() - started
+
+    assert result == "watched" and waits == [1]
+    assert ran == [("ipc", False), ("avatar", False)]
+    assert elapsed < 0.45  # 0.3 s dwell, not 0.3 + 0.2 s of side work
+    assert len(scheduler) == 0
+
+
+def test_overrunning_work_is_joined_and_a_failure_is_contained():
+    scheduler = DwellScheduler()
+    done = []
+
+    def boom():
+        raise RuntimeError("ipc down")
+
+    scheduler.defer(boom)
+    scheduler.defer(lambda: time.sleep(0.2) or done.append(1))
+
+    scheduler.dwell(lambda: None)
+
+    assert done == [1]
+    assert scheduler.tasks_run == 2
+
+    scheduler.defer(done.append, 2)
+    scheduler.drain()
+    assert done == [1, 2]
+
+
+class _Device:
+    def xpath(self, selector):
+        raise AssertionError(f"unexpected probe: {selector}")
+
+
+def test_the_for_you_callback_and_stats_ride_inside_the_watch(monkeypatch):
+    wf = ForYouWorkflow(_Device())
+    events = []
+    wf.set_on_video_callback(lambda info: events.append(("video", info["author"])))
+    wf.set_on_stats_callback(lambda stats: events.append(("stats", stats["videos_watched"])))
+
+    def watch(duration):
+        time.sleep(0.2)
+        events.append(("watched", duration))
+        return True
+
+    monkeypatch.setattr(wf.scroll, "watch_video", watch)
+    monkeypatch.setattr(wf, "_decide_and_execute_actions", lambda info: events.append(("decide",)))
+
+    wf._process_current_video({"author": "alice", "like_count": "12", "watch_time": 4.2})
+
+    assert events == [("video", "alice"), ("stats", 1), ("watched", 4.2), ("decide",)]
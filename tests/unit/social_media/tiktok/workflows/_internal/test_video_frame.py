@@ -0,0 +1,120 @@
+"""The video loop reads popups, interruptions and the video info from ONE dump.
+
+Pinned here: a ``VideoFrame`` answers every field of ``get_video_info`` from the
+snapshot with the detector's own parsing (content-desc author and counts, sound,
+hashtags, liked / favourited / ad); the loop step of ``BaseVideoWorkflow`` takes a
+single dump and never probes a selector on a plain video; a truncated description is
+the one thing still probed; an open comment sheet is handled from the same snapshot;
+and a frame without a video falls back to the probes.
+"""
+
+import pytest
+
+from taktik.core.social_media.tiktok.actions.atomic.video_frame import VideoFrame
+from taktik.core.social_media.tiktok.actions.business.workflows.for_you.workflow import (
+    ForYouWorkflow,
+)
+from taktik.core.shared.device.dump_index import DumpIndex
+
+PKG = "com.zhiliaoapp.musically"
+
+
+def _video_xml(description="Morning run #run #paris", liked=False, extra=""):
+    return f"""<?xml version='1.0' encoding='UTF-8'?>
+<hierarchy rotation="0">
+  <node class="android.widget.FrameLayout" resource-id="" text="" content-desc="" bounds="[0,0][1080,2400]">
+    <node class="android.widget.ImageView" resource-id="{PKG}:id/yx4" text="" content-desc="alice profile" bounds="[960,900][1060,1000]" />
+    <node class="android.widget.TextView" resource-id="{PKG}:id/desc" text="{description}" content-desc="" bounds="[20,2000][900,2100]" />
+    <node class="android.widget.Button" resource-id="{PKG}:id/nhe" text="" content-desc="Sound: Pretty (Sped Up) by MEYY" bounds="[960,2200][1060,2300]" />
+    <node class="android.widget.Button" resource-id="{PKG}:id/f57" text="" content-desc="Like video. 1.2K likes" selected="{str(liked).lower()}" bounds="[960,1100][1060,1200]">
+      <node class="android.widget.ImageView" resource-id="{PKG}:id/f4u" text="" content-desc="" selected="{str(liked).lower()}" bounds="[960,1100][1060,1180]" />
+    </node>
+    <node class="android.widget.ImageView" resource-id="{PKG}:id/gtn" text="" content-desc="" selected="false" bounds="[960,1400][1060,1500]" />
+    {extra}
+  </node>
+</hierarchy>"""
+
+
+class _NoProbeDevice:
+    """A raw device on which any per-selector probe is a test failure."""
+
+    def xpath(self, selector):
+        raise AssertionError(f"unexpected probe: {selector}")
+
+
+@pytest.fixture
+def workflow():
+    wf = ForYouWorkflow(_NoProbeDevice())
+    dumps = []
+
+    def dump(**_):
+        dumps.append(1)
+        return wf._xml
+
+    wf.detection.device.get_scoped_xml_dump = dump
+    wf._dumps = dumps
+    return wf
+
+
+def test_a_frame_answers_the_whole_video_info():
+    frame = VideoFrame(DumpIndex.from_xml(_video_xml(liked=True)))
+
+    assert frame.is_video_page()
+    assert frame.video_info(include_comment_count=True) == {
+        "author": "alice",
+        "description": "Morning run",
+        "description_text": "Morning run",
+        "hashtags": ["#run", "#paris"],
+        "sound": "Pretty (Sped Up) by MEYY",
+        "like_count": "1.2K",
+        "is_liked": True,
+        "is_favorited": False,
+        "is_ad": False,
+        "comment_count": None,
+    }
+    assert not frame.has_suggestion_page() and not frame.has_comments_section_open()
+
+
+def test_a_plain_video_costs_one_dump_and_no_probe(workflow):
+    workflow._xml = _video_xml()
+
+    info = workflow._read_current_video()
+
+    assert workflow._dumps == [1]
+    assert (info["author"], info["like_count"], info["is_liked"]) == ("alice", "1.2K", False)
+
+
+def test_only_a_truncated_description_is_expanded_by_probe(workflow, monkeypatch):
+    workflow._xml = _video_xml(description="Morning run in the rain…more")
+    expanded = []
+
+    def expand(raw):
+        expanded.append(raw)
+        return "Morning run in the rain along the river #run"
+
+    monkeypatch.setattr(workflow.detection, "_expand_description", expand)
+
+    info = workflow._read_current_video()
+
+    assert expanded == ["Morning run in the rain…more"]
+    assert info["hashtags"] == ["#run"]
+    assert workflow._dumps == [1]
+
+
+def test_an_open_comment_sheet_is_handled_from_the_same_dump(workflow, monkeypatch):
+    workflow._xml = _video_xml(
+        extra=f'<node class="android.widget.FrameLayout" resource-id="{PKG}:id/qx0" text="" content-desc="" bounds="[0,800][1080,2400]" />'
+    )
+    closed = []
+    monkeypatch.setattr(workflow.click, "close_comments_section", lambda: closed.append(1) or True)
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+
+    assert workflow._read_current_video() is None
+    assert closed == [1] and workflow._dumps == [1]
+
+
+def test_a_frame_without_a_video_falls_back_to_the_probes(workflow, monkeypatch):
+    workflow._xml = "<hierarchy><node class='android.widget.FrameLayout' /></hierarchy>"
+    monkeypatch.setattr(workflow.detection, "get_video_info", lambda: {"author": "probed"})
+
+    assert workflow._read_current_video() == {"author": "probed"}
@@ -0,0 +1,148 @@
+"""Delta read of the TikTok DM inbox.
+
+Pinned here: a conversation whose inbox row (name, preview, time) still has the fingerprint
+it was recorded with is not opened at all; a changed one is opened and its messages are
+read from the newest up, stopping at the newest message already on record, each one sent or
+received by the side of the screen its bubble sits on.
+"""
+
+import types
+
+from taktik.core.database.messaging import inbox_fingerprint
+from taktik.core.social_media.tiktok.actions.atomic.dm_actions import DMActions
+from taktik.core.social_media.tiktok.actions.business.workflows.dm import workflow as dm_workflow
+from taktik.core.social_media.tiktok.actions.business.workflows.dm.workflow import (
+    DMConfig,
+    DMStats,
+    DMWorkflow,
+)
+from taktik.core.social_media.tiktok.ui.selectors.surfaces.conversation import CONVERSATION_SELECTORS
+
+_LOGGER = types.SimpleNamespace(
+    info=lambda *a, **k: None,
+    error=lambda *a, **k: None,
+    warning=lambda *a, **k: None,
+    debug=lambda *a, **k: None,
+)
+
+
+_WIDTH = 1080
+# Bubble bounds: ours hug the right edge, the partner's sit after the avatar on the left.
+_SENT = {'left': 600, 'right': 1040}
+_RECEIVED = {'left': 140, 'right': 560}
+_SPANNING = {'left': 140, 'right': 960}
+
+
+class _FakeCollection:
+    def __init__(self, texts, bounds=None):
+        self._texts = texts
+        self._bounds = bounds or [_RECEIVED] * len(texts)
+
+    @property
+    def exists(self):
+        return len(self._texts) > 0
+
+    @property
+    def count(self):
+        return len(self._texts)
+
+    def __getitem__(self, i):
+        return types.SimpleNamespace(info={'text': self._texts[i], 'bounds': self._bounds[i]})
+
+
+class _FakeConversationDevice:
+    def __init__(self, texts, bounds=None):
+        self._device = self
+        self._texts = texts
+        self._bounds = bounds
+        self.info = {'displayWidth': _WIDTH}
+
+    def __call__(self, resourceIdMatches=None, resourceId=None):
+        if 'jay' in (resourceIdMatches or ''):
+            return _FakeCollection(self._texts, self._bounds)
+        return _FakeCollection([])
+
+
+def test_messages_are_read_from_the_newest_up_to_the_last_known_one():
+    dm = DMActions.__new__(DMActions)
+    dm.device = _FakeConversationDevice(["hi", "how are you", "fine", "and you?", "great"])
+    dm.conversation_selectors = CONVERSATION_SELECTORS
+    dm.logger = _LOGGER
+
+    assert [m['text'] for m in dm.get_messages(limit=20, stop_at="fine")] == ["and you?", "great"]
+    assert [m['text'] for m in dm.get_messages(limit=2)] == ["and you?", "great"]
+    assert len(dm.get_messages(limit=20, stop_at="never said")) == 5
+
+
+def test_the_bubble_side_tells_sent_from_received_and_a_spanning_one_stays_unknown():
+    dm = DMActions.__new__(DMActions)
+    dm.device = _FakeConversationDevice(["hi", "hey you", "a long story"], [_RECEIVED, _SENT, _SPANNING])
+    dm.conversation_selectors = CONVERSATION_SELECTORS
+    dm.logger = _LOGGER
+
+    assert [m['is_sent'] for m in dm.get_messages()] == [False, True, None]
+
+    dm.device.info = {}
+    assert {m['is_sent'] for m in dm.get_messages()} == {None}
+
+
+class _FakeInboxDM:
+    def __init__(self, items):
+        self._items = items
+        self.opened = []
+        self.stop_at = {}
+
+    def is_on_inbox_page(self):
+        return True
+
+    def get_inbox_items(self):
+        return [dict(item) for item in self._items]
+
+    def scroll_inbox(self, direction):
+        pass
+
+    def click_conversation(self, name):
+        self.opened.append(name)
+        self._current = name
+        return True
+
+    def close_sticker_suggestion(self):
+        pass
+
+    def get_conversation_info(self):
+        return {'name': self._current}
+
+    def get_messages(self, limit=20, stop_at=None):
+        self.stop_at[self._current] = stop_at
+        return [{'text': 'new one', 'type': 'text', 'is_sent': False}]
+
+    def go_back_to_inbox(self):
+        return True
+
+
+def test_only_the_conversations_whose_inbox_row_moved_are_opened(monkeypatch):
+    monkeypatch.setattr(dm_workflow.time, "sleep", lambda *_: None)
+    items = [
+        {'type': 'conversation', 'name': 'alice', 'last_message': 'see you', 'timestamp': '2h'},
+        {'type': 'conversation', 'name': 'Bob', 'last_message': 'new one', 'timestamp': 'now'},
+    ]
+    wf = DMWorkflow.__new__(DMWorkflow)
+    wf.dm = _FakeInboxDM(items)
+    wf.config = DMConfig(max_conversations=5, delay_between_conversations=0)
+    wf.stats = DMStats()
+    wf.logger = _LOGGER
+    wf._handle_popups = lambda **kw: None
+    wf._send_stats_update = lambda: None
+    wf._on_conversation_callback = None
+    wf._on_progress_callback = None
+    wf.set_known_threads({
+        'alice': {'fingerprint': inbox_fingerprint('alice', 'see you', '2h'), 'recent_texts': ['see you']},
+        'bob': {'fingerprint': inbox_fingerprint('bob', 'old', '1d'), 'recent_texts': ['old', 'older']},
+    })
+
+    conversations = wf.read_conversations()
+
+    assert wf.dm.opened == ['Bob']
+    assert wf.dm.stop_at == {'Bob': 'old'}
+    assert wf.stats.conversations_unchanged == 1
+    assert conversations[0].inbox_fingerprint == inbox_fingerprint('Bob', 'new one', 'now')